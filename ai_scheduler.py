@@ -0,0 +1,135 @@
+# ai_scheduler.py - Zombie AI level-of-detail scheduler
+"""
+جدولة ذكاء الزومبي حسب مستوى التفصيل (LOD):
+- الزومبي الظاهر على الشاشة أو القريب من لاعب يتحدث كل إطار
+- البعيد يتحدث كل 2 / 4 / 8 إطارات مع تمرير الوقت المتراكم (dt) كاملاً؛ الخطوة الواحدة
+  بحد MAX_STEP_DT والباقي يُحمل لتحديث في الإطار التالي (لا يبطئ الزومبي عند انخفاض FPS)
+- ميزانية زمنية لكل إطار (ms): ما لا يتسع يتأجل للإطار التالي بأولوية أعلى
+مشترك بين اللعب الفردي والمضيف في اللعب الجماعي.
+"""
+
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import pygame
+
+# (أقصى مسافة لأقرب لاعب بالبكسل, كل كم إطار يتم التحديث)
+DEFAULT_LODS: Tuple[Tuple[float, int], ...] = (
+    (700.0, 1),
+    (1300.0, 2),
+    (2200.0, 4),
+    (float("inf"), 8),
+)
+
+# حد أعلى لخطوة التحديث الواحدة حتى لا يقفز الزومبي البعيد عبر الجدران الرفيعة
+# (ما زاد عنه يُحمل؛ والمحمول بحد MAX_STEP_DT × فترة LOD حتى لا يتراكم بلا نهاية تحت ~7 FPS)
+MAX_STEP_DT = 0.15
+
+
+class _AgentState:
+    __slots__ = ("acc_dt", "waited", "lod")
+
+    def __init__(self):
+        self.acc_dt = 0.0
+        self.waited = 0
+        self.lod = 0
+
+
+class AIScheduler:
+    """يوزع تحديثات الذكاء على الإطارات ضمن ميزانية زمنية"""
+
+    def __init__(self, budget_ms: float = 4.0, lods: Sequence[Tuple[float, int]] = DEFAULT_LODS,
+                 view_margin: int = 96):
+        self.budget_ms = float(budget_ms)
+        self.lods = tuple(lods)
+        self.view_margin = view_margin
+        self._states: Dict[int, _AgentState] = {}
+        # إحصائيات آخر إطار
+        self.ran_per_lod: List[int] = [0] * len(self.lods)
+        self.agents_per_lod: List[int] = [0] * len(self.lods)
+        self.deferred = 0
+        self.last_ms = 0.0
+
+    def reset(self):
+        self._states.clear()
+
+    def _lod_for(self, x: float, y: float, players: Sequence[Tuple[float, float]],
+                 view: Optional[pygame.Rect]) -> int:
+        if view is not None and view.collidepoint(x, y):
+            return 0
+        best = float("inf")
+        for px, py in players:
+            d = (px - x) ** 2 + (py - y) ** 2
+            if d < best:
+                best = d
+        best **= 0.5
+        for lod, (max_dist, _interval) in enumerate(self.lods):
+            if best <= max_dist:
+                return lod
+        return len(self.lods) - 1
+
+    def run(self, agents: Iterable, players: Sequence[Tuple[float, float]], dt: float,
+            update_fn: Callable[[object, float], None],
+            idle_fn: Optional[Callable[[object, float], None]] = None,
+            view: Optional[pygame.Rect] = None):
+        """
+        تحديث الزومبي المستحقين هذا الإطار.
+        update_fn(agent, step_dt): التحديث الكامل بالوقت المتراكم منذ آخر تحديث
+        idle_fn(agent, dt): تحديث رخيص لغير المستحقين (مثل حركة التمايل)
+        view: مستطيل الكاميرا في إحداثيات العالم (الظاهر = LOD 0 دائماً)
+        """
+        start = time.perf_counter()
+        budget_s = self.budget_ms / 1000.0
+        if view is not None:
+            view = view.inflate(self.view_margin * 2, self.view_margin * 2)
+
+        n_lods = len(self.lods)
+        self.ran_per_lod = [0] * n_lods
+        self.agents_per_lod = [0] * n_lods
+        states: Dict[int, _AgentState] = {}
+        due = []
+        idle = []
+        for agent in agents:
+            key = id(agent)
+            st = self._states.get(key) or _AgentState()
+            states[key] = st
+            st.acc_dt += dt
+            st.waited += 1
+            st.lod = self._lod_for(agent.x + agent.w / 2, agent.y + agent.h / 2, players, view)
+            self.agents_per_lod[st.lod] += 1
+            interval = self.lods[st.lod][1]
+            if st.waited >= interval:
+                # الأولوية: الأكثر تأخراً نسبة لفترته أولاً، ثم الأقرب (LOD أقل)
+                due.append((-(st.waited / interval), st.lod, agent, st))
+            else:
+                idle.append(agent)
+        # نسيان الزومبي الذين لم يعودوا موجودين
+        self._states = states
+
+        due.sort(key=lambda item: (item[0], item[1]))
+        deferred = 0
+        for i, (_prio, lod, agent, st) in enumerate(due):
+            # LOD 0 لا يؤجل أبداً (أمام اللاعب مباشرة)؛ الباقي حسب الميزانية
+            if lod > 0 and i > 0 and (time.perf_counter() - start) > budget_s:
+                deferred += 1
+                idle.append(agent)
+                continue
+            step = min(st.acc_dt, MAX_STEP_DT)
+            update_fn(agent, step)
+            interval = self.lods[lod][1]
+            st.acc_dt = min(st.acc_dt - step, MAX_STEP_DT * interval)
+            # باقي وقت (FPS منخفض): مستحق مرة أخرى في الإطار التالي حتى يلحق
+            st.waited = interval - 1 if st.acc_dt > 0.0 else 0
+            self.ran_per_lod[lod] += 1
+
+        if idle_fn is not None:
+            for agent in idle:
+                idle_fn(agent, dt)
+
+        self.deferred = deferred
+        self.last_ms = (time.perf_counter() - start) * 1000.0
+
+    def stats_text(self) -> str:
+        """ملخص قصير للعرض: عدد المحدَّثين/الكل لكل LOD"""
+        parts = [f"L{i}:{ran}/{total}" for i, (ran, total) in
+                 enumerate(zip(self.ran_per_lod, self.agents_per_lod))]
+        return f"AI {' '.join(parts)} def:{self.deferred} {self.last_ms:.1f}ms"
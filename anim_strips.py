@@ -0,0 +1,188 @@
+# anim_strips.py - Pre-rendered animation strips for Zombie Shooter
+"""
+رسوم متحركة مسبقة الرسم بدل إعادة رسم البدائيات كل إطار:
+- AnimStrip: FRAMES إطاراً لدورة كاملة (الطور 0..2π) مع إزاحة رسم لكل إطار
+- strip(key, builder): كل نوع يُرسم مرة واحدة ويُشارك بين كل الكائنات من نفس النوع
+- baked(key, builder): سطح ثابت واحد (صور الصندوق المحجّمة، بديله المرسوم، تسمية الباب)
+- pickup_strip(kind): الحقيبة الطبية وصناديق الذخيرة مع الطفو والظل (مشترك بين الفردي والجماعي)
+- الرسم بعدها blit واحد للإطار المناسب: strip.blit(screen, phase, (x, y))
+"""
+
+import math
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+from fonts import get_font
+
+FRAMES = 32
+TAU = 2 * math.pi
+
+Offset = Tuple[int, int]
+
+
+class AnimStrip:
+    """إطارات دورة واحدة؛ frame(phase) يختار الإطار حسب الطور (بالراديان)"""
+
+    def __init__(self, frames: List[pygame.Surface], offsets: List[Offset]):
+        self.frames = frames
+        self.offsets = offsets
+        self.n = len(frames)
+
+    @classmethod
+    def build(cls, fn: Callable[[float], Tuple[pygame.Surface, Offset]], n: int = FRAMES) -> "AnimStrip":
+        frames, offsets = [], []
+        for k in range(n):
+            surf, (ox, oy) = fn(TAU * k / n)
+            # 🔥 قص الحواف الشفافة (أقل ذاكرة وأقل بكسلات في كل blit)
+            box = surf.get_bounding_rect()
+            if box.size != surf.get_size() and box.w and box.h:
+                surf = surf.subsurface(box).copy()
+                ox, oy = ox + box.x, oy + box.y
+            frames.append(surf)
+            offsets.append((ox, oy))
+        return cls(frames, offsets)
+
+    def index(self, phase: float) -> int:
+        return int(phase / TAU * self.n) % self.n
+
+    def frame(self, phase: float) -> Tuple[pygame.Surface, Offset]:
+        k = self.index(phase)
+        return self.frames[k], self.offsets[k]
+
+    def blit(self, screen: pygame.Surface, phase: float, pos: Tuple[float, float], special_flags: int = 0):
+        surf, (ox, oy) = self.frame(phase)
+        screen.blit(surf, (int(pos[0]) + ox, int(pos[1]) + oy), special_flags=special_flags)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(s.get_width() * s.get_height() * s.get_bytesize() for s in self.frames)
+
+
+_STRIPS: Dict[tuple, AnimStrip] = {}
+_BAKED: Dict[tuple, Optional[pygame.Surface]] = {}
+
+
+def strip(key: tuple, builder: Callable[[float], Tuple[pygame.Surface, Offset]], n: int = FRAMES) -> AnimStrip:
+    s = _STRIPS.get(key)
+    if s is None:
+        s = _STRIPS[key] = AnimStrip.build(builder, n)
+    return s
+
+
+def baked(key: tuple, builder: Callable[[], Optional[pygame.Surface]]) -> Optional[pygame.Surface]:
+    """سطح ثابت يُبنى مرة واحدة (None يُخزن أيضاً: صورة غير موجودة لا تُبحث كل مرة)"""
+    if key in _BAKED:
+        return _BAKED[key]
+    surf = _BAKED[key] = builder()
+    return surf
+
+
+def cache_bytes() -> int:
+    total = sum(s.nbytes for s in _STRIPS.values())
+    total += sum(s.get_width() * s.get_height() * s.get_bytesize() for s in _BAKED.values() if s is not None)
+    return total
+
+
+# ---------- الالتقاطات (Pickups) ----------
+_PICKUP_W, _PICKUP_H = 40, 30
+_PAD = 16   # مساحة للمقبض والظل والطفو حول الصندوق
+
+
+def _draw_pickup(surf: pygame.Surface, kind: str, dx: int, dy: int, ground_y: float, shadow_sin: float):
+    """نفس رسم Pickup.draw القديم؛ (dx, dy) أعلى يسار الصندوق و ground_y موضع الظل"""
+    w, h = _PICKUP_W, _PICKUP_H
+    if kind == "medkit":
+        # 🏥 حقيبة إسعافات احترافية
+        case_color = (240, 240, 245)
+        cross_color = (220, 20, 60)
+        handle_color = (60, 60, 60)
+        shadow_color = (180, 180, 190)
+
+        shadow_width = w + int(shadow_sin * 4)
+        pygame.draw.ellipse(surf, (0, 0, 0), (dx + (w - shadow_width) // 2, ground_y + 10, shadow_width, 8))
+        pygame.draw.rect(surf, shadow_color, (dx + 4, dy - 4, w, h), border_radius=6)
+        rect = pygame.Rect(dx, dy, w, h)
+        pygame.draw.rect(surf, case_color, rect, border_radius=6)
+        pygame.draw.rect(surf, (200, 200, 210), rect, width=2, border_radius=6)
+        pygame.draw.rect(surf, handle_color, (dx + w//2 - 6, dy - 8, 12, 8), border_radius=2)
+        pygame.draw.rect(surf, (0, 0, 0), (dx + w//2 - 4, dy - 6, 8, 4))
+        cw, ch = 8, 20
+        cx, cy = dx + w//2, dy + h//2
+        pygame.draw.rect(surf, cross_color, (cx - cw//2, cy - ch//2, cw, ch), border_radius=2)
+        pygame.draw.rect(surf, cross_color, (cx - ch//2, cy - cw//2, ch, cw), border_radius=2)
+        pygame.draw.ellipse(surf, (255, 255, 255), (dx + 4, dy + 4, 12, 8))
+
+    elif kind == "shotgun_ammo" or kind == "grenade_ammo":
+        # 📦 صندوق ذخيرة عسكري 3D
+        if kind == "shotgun_ammo":
+            main_color = (180, 40, 40); light_color = (220, 60, 60); dark_color = (120, 30, 30)
+            icon_color = (255, 200, 50); label = "SHELLS"
+        else:
+            main_color = (50, 80, 50); light_color = (70, 100, 70); dark_color = (30, 50, 30)
+            icon_color = (200, 200, 200); label = "NADES"
+
+        shadow_width = w + int(shadow_sin * 2)
+        pygame.draw.ellipse(surf, (0, 0, 0), (dx + (w - shadow_width) // 2, ground_y + 5, shadow_width, 8))
+        pygame.draw.rect(surf, dark_color, (dx + 4, dy - 4, w, h), border_radius=4)
+        rect = pygame.Rect(dx, dy, w, h)
+        pygame.draw.rect(surf, main_color, rect, border_radius=4)
+        pygame.draw.rect(surf, light_color, rect, width=2, border_radius=4)
+        corner_len = 8; corner_color = (180, 180, 180)
+        pygame.draw.line(surf, corner_color, (dx, dy), (dx + corner_len, dy), 2)
+        pygame.draw.line(surf, corner_color, (dx, dy), (dx, dy + corner_len), 2)
+        pygame.draw.line(surf, corner_color, (dx + w, dy + h), (dx + w - corner_len, dy + h), 2)
+        pygame.draw.line(surf, corner_color, (dx + w, dy + h), (dx + w, dy + h - corner_len), 2)
+
+        text_surf = get_font(9, bold=True).render(label, True, icon_color)
+        text_rect = text_surf.get_rect(center=rect.center)
+        pygame.draw.rect(surf, (0, 0, 0), text_rect.inflate(4, 2), border_radius=2)
+        surf.blit(text_surf, text_rect)
+
+    else:
+        # 📦 صندوق غامض (Mystery Crate)
+        box_color = (100, 80, 60); tape_color = (200, 180, 140)
+        pygame.draw.ellipse(surf, (0, 0, 0), (dx + 2, dy + h + 2, w - 4, 8))
+        rect = pygame.Rect(dx, dy, w, h)
+        pygame.draw.rect(surf, box_color, rect, border_radius=4)
+        pygame.draw.rect(surf, (80, 60, 40), rect, width=2, border_radius=4)
+        pygame.draw.line(surf, tape_color, (dx + w//2, dy), (dx + w//2, dy + h), 4)
+        pygame.draw.line(surf, tape_color, (dx, dy + h//2), (dx + w, dy + h//2), 4)
+
+
+def pickup_strip(kind: str, shadow_freq: int = 1) -> AnimStrip:
+    """
+    دورة طفو كاملة لنوع التقاط: الطور = طور الطفو (sin(phase) * 4 بكسل)،
+    وتذبذب عرض الظل بتردد shadow_freq من تردد الطفو
+    """
+    def build(phase: float):
+        bob = math.sin(phase) * 4.0
+        surf = pygame.Surface((_PICKUP_W + _PAD * 2, _PICKUP_H + _PAD * 3), pygame.SRCALPHA)
+        _draw_pickup(surf, kind, _PAD, _PAD + int(bob), _PAD + _PICKUP_H, math.sin(phase * shadow_freq))
+        return surf, (-_PAD, -_PAD)
+
+    return strip(("pickup", kind, shadow_freq), build)
+
+
+# ---------- تسمية مخزنة ----------
+def label_sprite(text: str, size: int, color: Tuple[int, int, int], bg: Tuple[int, int, int],
+                 border: Optional[Tuple[int, int, int]] = None, glow: Optional[Tuple[int, int, int]] = None,
+                 pad: Tuple[int, int] = (8, 4)) -> pygame.Surface:
+    """نص فوق خلفية مستديرة (مع إطار وتوهج اختياريين) - يُرسم مرة واحدة لكل نص"""
+    def build():
+        font = pygame.font.Font(None, size)
+        text_surf = font.render(text, True, color)
+        tw, th = text_surf.get_size()
+        surf = pygame.Surface((tw + pad[0] * 2, th + pad[1] * 2), pygame.SRCALPHA)
+        box = surf.get_rect()
+        pygame.draw.rect(surf, bg, box, border_radius=6)
+        if border is not None:
+            pygame.draw.rect(surf, border, box, width=1, border_radius=6)
+        if glow is not None:
+            text_glow = font.render(text, True, glow)
+            for ox, oy in ((1, 1), (-1, 1), (1, -1), (-1, -1)):
+                surf.blit(text_glow, (pad[0] + ox, pad[1] + oy))
+        surf.blit(text_surf, pad)
+        return surf
+
+    return baked(("label", text, size, color, bg, border, glow, pad), build)
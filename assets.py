@@ -0,0 +1,181 @@
+# assets.py - Background asset preloader for Zombie Shooter
+"""
+تحميل أصول اللعب في الخلفية أثناء عرض القائمة:
+- خيط عامل يفك ترميز الصور (pygame.image.load) والأصوات (mixer.Sound)
+- convert_alpha يتم على الخيط الرئيسي فقط (poll/finish) ثم يُخزن في كاش util
+- progress / done / current للعرض، و draw_progress لشريط التحميل
+- wait(): شاشة تحميل قصيرة إذا دخل اللاعب اللعبة قبل انتهاء التحميل
+"""
+
+import os
+import threading
+import time
+from typing import List, Optional, Tuple
+
+import pygame
+
+import util
+
+_IMAGE_EXT = (".png", ".jpg", ".jpeg", ".bmp")
+_SOUND_EXT = (".wav", ".ogg", ".mp3")
+
+
+def _list_dir(directory: str, exts: Tuple[str, ...]) -> List[str]:
+    try:
+        return sorted(n for n in os.listdir(directory) if n.lower().endswith(exts))
+    except OSError:
+        return []
+
+
+class AssetPreloader:
+    """فك الترميز في خيط عامل، والتحويل للعرض على الخيط الرئيسي"""
+
+    def __init__(self, images: Optional[List[str]] = None, sounds: Optional[List[str]] = None):
+        self.images = images if images is not None else _list_dir(util.IMG_DIR, _IMAGE_EXT)
+        self.sounds = sounds if sounds is not None else _list_dir(util.SND_DIR, _SOUND_EXT)
+        self.total = len(self.images) + len(self.sounds)
+        self.loaded = 0           # فك ترميز (الخيط العامل)
+        self.queued = 0           # صور تنتظر convert_alpha
+        self.converted = 0        # convert_alpha (الخيط الرئيسي)
+        self.current = ""
+        self.errors: List[str] = []
+        self._decoded: List[Tuple[str, pygame.Surface]] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.started_at = 0.0
+        self.elapsed = 0.0
+
+    # ---------- الحالة ----------
+    @property
+    def started(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def decoding(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def done(self) -> bool:
+        if not self.started or self.decoding:
+            return False
+        with self._lock:
+            return not self._decoded
+
+    @property
+    def progress(self) -> float:
+        """0..1: فك الترميز + التحويل (التحويل يُحسب كجزء صغير)"""
+        if self.total == 0:
+            return 1.0
+        work = self.loaded + self.converted * 0.25
+        return min(1.0, work / (self.total + self.queued * 0.25))
+
+    # ---------- الخيط العامل ----------
+    def start(self) -> bool:
+        if self.started:
+            return False
+        try:
+            # الخالط يُهيأ على الخيط الرئيسي قبل تحميل الأصوات في الخلفية
+            if self.sounds and not pygame.mixer.get_init():
+                pygame.mixer.init()
+        except Exception:
+            self.sounds = []
+            self.total = len(self.images)
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="AssetPreloader", daemon=True)
+        self._thread.start()
+        return True
+
+    def _run(self):
+        for name in self.images:
+            self.current = name
+            if name not in util._IMAGES:
+                try:
+                    surf = pygame.image.load(os.path.join(util.IMG_DIR, name))
+                    with self._lock:
+                        self._decoded.append((name, surf))
+                        self.queued += 1
+                except Exception:
+                    self.errors.append(name)
+            self.loaded += 1
+        for name in self.sounds:
+            self.current = name
+            if name not in util._SOUNDS:
+                try:
+                    util._SOUNDS[name] = pygame.mixer.Sound(os.path.join(util.SND_DIR, name))
+                except Exception:
+                    self.errors.append(name)
+            self.loaded += 1
+        self.current = ""
+
+    # ---------- الخيط الرئيسي ----------
+    def poll(self, budget_ms: float = 4.0) -> bool:
+        """تحويل الصور الجاهزة (convert_alpha) ضمن ميزانية زمنية؛ يرجع True عند الانتهاء"""
+        if not self.started:
+            return False
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        while True:
+            with self._lock:
+                if not self._decoded:
+                    break
+                name, surf = self._decoded.pop(0)
+            if name not in util._IMAGES:
+                try:
+                    util._IMAGES[name] = surf.convert_alpha()
+                except pygame.error:
+                    util._IMAGES[name] = surf
+            self.converted += 1
+            if time.perf_counter() > deadline:
+                break
+        if self.done and not self.elapsed:
+            self.elapsed = time.perf_counter() - self.started_at
+            print(f"[ASSETS] {self.total} assets preloaded in {self.elapsed * 1000:.0f} ms"
+                  + (f" ({len(self.errors)} failed)" if self.errors else ""))
+        return self.done
+
+    def finish(self):
+        """انتظار الخيط ثم تحويل كل ما تبقى (بدون عرض)"""
+        if not self.started:
+            self.start()
+        self._thread.join()
+        while not self.poll(budget_ms=1000.0):
+            pass
+
+    def draw_progress(self, screen: pygame.Surface, rect: pygame.Rect, label: bool = True):
+        """شريط تحميل بسيط بألوان القائمة"""
+        pygame.draw.rect(screen, (35, 12, 12), rect, border_radius=6)
+        fill = rect.inflate(-4, -4)
+        fill.width = int(fill.width * self.progress)
+        if fill.width > 0:
+            pygame.draw.rect(screen, (180, 40, 40), fill, border_radius=5)
+        pygame.draw.rect(screen, (140, 50, 50), rect, width=2, border_radius=6)
+        if label:
+            text = f"Loading {self.progress * 100:3.0f}%"
+            if self.current:
+                text += f"  {self.current[:32]}"
+            util.draw_text(screen, text, (rect.x, rect.y - 22), size=16, color=(200, 180, 180))
+
+    def wait(self, screen: pygame.Surface, clock: pygame.time.Clock):
+        """شاشة تحميل حتى اكتمال التحميل (فورية إذا انتهى أثناء القائمة)"""
+        if not self.started:
+            self.start()
+        W, H = screen.get_size()
+        bar = pygame.Rect(W // 2 - 220, H // 2 + 20, 440, 22)
+        while not self.poll(budget_ms=12.0):
+            for e in pygame.event.get(pygame.QUIT):
+                pygame.event.post(e)     # يُعالج في حلقة اللعبة
+                self.finish()
+                return
+            screen.fill((15, 5, 8))
+            util.draw_shadow_text(screen, "Loading...", (W // 2 - 80, H // 2 - 50), size=36,
+                                  color=(180, 30, 30))
+            self.draw_progress(screen, bar)
+            pygame.display.flip()
+            clock.tick(60)
+
+
+PRELOADER = AssetPreloader()
+
+
+def start_preload() -> AssetPreloader:
+    PRELOADER.start()
+    return PRELOADER
@@ -0,0 +1,216 @@
+# background.py - Chunked, lazily generated level background
+"""
+خلفية المستوى كبلاطات (tiles) بدل سطح واحد بحجم العالم (~30MB):
+- الأشكال (بقع، نجوم، شقوق) تُولد مرة واحدة كمصفوفات numpy (بذرة = رقم المستوى)
+- كل بلاطة تُرسم عند أول ظهور لها فقط، وتُخزن في LRU محدود بميزانية ذاكرة
+- النجوم وخطوط الشبكة تُرسم دفعة واحدة عبر pygame.surfarray (بدون حلقة لكل نجمة)
+- draw() يرسم فقط البلاطات التي تتقاطع مع الكاميرا
+- عدد الأشكال يتبع إعداد الجودة (background_detail في settings.py)
+- ZS_BG_BUDGET_MB لتغيير ميزانية الكاش (افتراضياً 16MB)
+"""
+
+import os
+from collections import OrderedDict
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from settings import game_settings
+
+TILE = 256
+BUDGET_MB = float(os.environ.get("ZS_BG_BUDGET_MB", "16") or 16)
+# عدد الأشكال في عالم 3200×2400 (يتناسب مع المساحة في العوالم الأكبر)
+_REF_AREA = 3200 * 2400
+_GRID_TILE = 80
+
+
+def _disk_offsets(r: int) -> Tuple[np.ndarray, np.ndarray]:
+    """إزاحات بكسلات دائرة ممتلئة بنصف قطر r"""
+    d = np.arange(-r, r + 1)
+    dx, dy = np.meshgrid(d, d, indexing="ij")
+    inside = dx * dx + dy * dy <= r * r
+    return dx[inside], dy[inside]
+
+
+_DISKS = {r: _disk_offsets(r) for r in (1, 2, 3)}
+
+
+class TiledBackground:
+    """خلفية مقسمة لبلاطات تُولد عند الطلب"""
+
+    def __init__(self, level: int, world_w: int, world_h: int, base_col: Tuple[int, int, int],
+                 tile: int = TILE, budget_mb: float = BUDGET_MB, detail: Optional[float] = None):
+        self.level = level
+        self.detail = game_settings.quality("background_detail") if detail is None else float(detail)
+        self.world_w = world_w
+        self.world_h = world_h
+        self.base_col = tuple(base_col)
+        self.tile = tile
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self.cols = (world_w + tile - 1) // tile
+        self.rows = (world_h + tile - 1) // tile
+        self._tiles: "OrderedDict[Tuple[int, int], pygame.Surface]" = OrderedDict()
+        self.cache_bytes = 0
+        # إحصائيات
+        self.generated = 0
+        self.evicted = 0
+        self._shapes: Dict[str, np.ndarray] = {}
+        self._generate_shapes()
+
+    # ---------- الأشكال ----------
+    def _count(self, n: int) -> int:
+        return max(1, round(n * self.detail * self.world_w * self.world_h / _REF_AREA))
+
+    def _generate_shapes(self):
+        rng = np.random.default_rng(self.level)  # نفس البذرة لنفس المستوى
+        W, H = self.world_w, self.world_h
+        base = np.array(self.base_col, dtype=np.int16)
+        if self.level == 3:  # غابة - بقع عشب
+            n = self._count(400)
+            darken = rng.integers(5, 21, n)
+            self._shapes = {
+                "x": rng.integers(0, W + 1, n), "y": rng.integers(0, H + 1, n),
+                "r": rng.integers(15, 46, n),
+                "col": np.clip(base[None, :] - darken[:, None], 0, 255).astype(np.uint8),
+            }
+        elif self.level == 4:  # فضاء - نجوم
+            n = self._count(1000)
+            bright = rng.integers(150, 256, n).astype(np.uint8)
+            self._shapes = {
+                "x": rng.integers(0, W + 1, n), "y": rng.integers(0, H + 1, n),
+                "r": rng.integers(1, 4, n),
+                "col": np.repeat(bright[:, None], 3, axis=1),
+            }
+        elif self.level == 5:  # بركان - شقوق
+            n = self._count(150)
+            x1 = rng.integers(0, W + 1, n)
+            y1 = rng.integers(0, H + 1, n)
+            angle = rng.uniform(0, 2 * np.pi, n)
+            length = rng.integers(50, 201, n)
+            self._shapes = {
+                "x1": x1, "y1": y1,
+                "x2": x1 + (np.cos(angle) * length).astype(np.int64),
+                "y2": y1 + (np.sin(angle) * length).astype(np.int64),
+                "w": rng.integers(2, 6, n),
+            }
+
+    # ---------- رسم بلاطة ----------
+    def _tile_rect(self, tx: int, ty: int) -> pygame.Rect:
+        x0, y0 = tx * self.tile, ty * self.tile
+        return pygame.Rect(x0, y0, min(self.tile, self.world_w - x0), min(self.tile, self.world_h - y0))
+
+    def render_tile(self, tx: int, ty: int) -> pygame.Surface:
+        """رسم بلاطة واحدة من الصفر (بدون كاش)"""
+        rect = self._tile_rect(tx, ty)
+        display = pygame.display.get_surface()
+        surf = pygame.Surface(rect.size, 0, display) if display is not None else pygame.Surface(rect.size)
+        surf.fill(self.base_col)
+        x0, y0, x1, y1 = rect.left, rect.top, rect.right, rect.bottom
+        s = self._shapes
+
+        if self.level == 2:  # مدينة - شبكة بلاط
+            gx = np.arange(-(-x0 // _GRID_TILE) * _GRID_TILE, x1, _GRID_TILE) - x0
+            gy = np.arange(-(-y0 // _GRID_TILE) * _GRID_TILE, y1, _GRID_TILE) - y0
+            try:
+                px = pygame.surfarray.pixels3d(surf)
+                px[gx, :] = (100, 100, 100)
+                px[:, gy] = (100, 100, 100)
+                del px
+            except (ValueError, pygame.error):
+                for x in gx.tolist():
+                    pygame.draw.line(surf, (100, 100, 100), (x, 0), (x, rect.h), 1)
+                for y in gy.tolist():
+                    pygame.draw.line(surf, (100, 100, 100), (0, y), (rect.w, y), 1)
+
+        elif self.level == 3:
+            x, y, r = s["x"], s["y"], s["r"]
+            hit = np.flatnonzero((x + r >= x0) & (x - r < x1) & (y + r >= y0) & (y - r < y1))
+            for i in hit.tolist():
+                pygame.draw.circle(surf, s["col"][i].tolist(), (int(x[i]) - x0, int(y[i]) - y0), int(r[i]))
+
+        elif self.level == 4:
+            self._stamp_stars(surf, rect)
+
+        elif self.level == 5:
+            ax, ay, bx, by, w = s["x1"], s["y1"], s["x2"], s["y2"], s["w"]
+            hit = np.flatnonzero((np.maximum(ax, bx) + w >= x0) & (np.minimum(ax, bx) - w < x1) &
+                                 (np.maximum(ay, by) + w >= y0) & (np.minimum(ay, by) - w < y1))
+            for i in hit.tolist():
+                pygame.draw.line(surf, (20, 10, 10), (int(ax[i]) - x0, int(ay[i]) - y0),
+                                 (int(bx[i]) - x0, int(by[i]) - y0), int(w[i]))
+        return surf
+
+    def _stamp_stars(self, surf: pygame.Surface, rect: pygame.Rect):
+        """كل نجوم البلاطة في عملية numpy واحدة لكل نصف قطر"""
+        s = self._shapes
+        x, y, r = s["x"], s["y"], s["r"]
+        near = (x + 3 >= rect.left) & (x - 3 < rect.right) & (y + 3 >= rect.top) & (y - 3 < rect.bottom)
+        try:
+            px = pygame.surfarray.pixels3d(surf)
+        except (ValueError, pygame.error):
+            for i in np.flatnonzero(near).tolist():
+                pygame.draw.circle(surf, s["col"][i].tolist(), (int(x[i]) - rect.left, int(y[i]) - rect.top), int(r[i]))
+            return
+        for radius, (ox, oy) in _DISKS.items():
+            idx = np.flatnonzero(near & (r == radius))
+            if idx.size == 0:
+                continue
+            cx = ((x[idx] - rect.left)[:, None] + ox[None, :]).ravel()
+            cy = ((y[idx] - rect.top)[:, None] + oy[None, :]).ravel()
+            col = np.repeat(s["col"][idx], ox.size, axis=0)
+            inside = (cx >= 0) & (cx < rect.w) & (cy >= 0) & (cy < rect.h)
+            px[cx[inside], cy[inside]] = col[inside]
+        del px
+
+    # ---------- الكاش ----------
+    def get_tile(self, tx: int, ty: int) -> pygame.Surface:
+        key = (tx, ty)
+        surf = self._tiles.get(key)
+        if surf is not None:
+            self._tiles.move_to_end(key)
+            return surf
+        surf = self.render_tile(tx, ty)
+        self._tiles[key] = surf
+        self.cache_bytes += surf.get_width() * surf.get_height() * surf.get_bytesize()
+        self.generated += 1
+        return surf
+
+    def _trim(self, keep: int):
+        """إخراج الأقدم حتى نعود تحت الميزانية (مع إبقاء بلاطات الإطار الحالي)"""
+        while self.cache_bytes > self.budget_bytes and len(self._tiles) > keep:
+            _key, surf = self._tiles.popitem(last=False)
+            self.cache_bytes -= surf.get_width() * surf.get_height() * surf.get_bytesize()
+            self.evicted += 1
+
+    def clear(self):
+        self._tiles.clear()
+        self.cache_bytes = 0
+
+    def _tile_range(self, x: int, y: int, w: int, h: int) -> Iterator[Tuple[int, int]]:
+        t = self.tile
+        tx0 = max(0, x // t)
+        ty0 = max(0, y // t)
+        tx1 = min(self.cols - 1, (x + w - 1) // t)
+        ty1 = min(self.rows - 1, (y + h - 1) // t)
+        for ty in range(ty0, ty1 + 1):
+            for tx in range(tx0, tx1 + 1):
+                yield tx, ty
+
+    # ---------- الرسم ----------
+    def draw(self, screen: pygame.Surface, x: int, y: int, w: int, h: int):
+        """رسم الجزء (x, y, w, h) من العالم على الشاشة عند (0, 0)"""
+        t = self.tile
+        n = 0
+        for tx, ty in self._tile_range(x, y, w, h):
+            screen.blit(self.get_tile(tx, ty), (tx * t - x, ty * t - y))
+            n += 1
+        self._trim(n)
+
+    def warm_steps(self, x: int, y: int, w: int, h: int) -> Iterator[None]:
+        """توليد بلاطات منطقة مسبقاً (بلاطة لكل خطوة) - للتحضير المسبق للمستوى"""
+        for tx, ty in self._tile_range(x, y, w, h):
+            if (tx, ty) not in self._tiles:
+                self.get_tile(tx, ty)
+                self._trim(1)
+                yield
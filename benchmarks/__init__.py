@@ -0,0 +1 @@
+# benchmarks - Micro-benchmarks for Zombie Shooter hot paths
@@ -0,0 +1,84 @@
+# bench_bullets.py - قياس أداء تحديث الرصاص (القائمة القديمة مقابل BulletPool)
+"""
+يشغّل 5000 رصاصة حية ويقارن:
+- legacy: قائمة WeaponBullet مع list.remove (الطريقة القديمة)
+- pool: BulletPool بمصفوفات numpy مع swap-remove
+
+التشغيل:  python benchmarks/bench_bullets.py [--bullets 5000] [--frames 300]
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from weapons import WeaponBullet, BulletPool, WeaponType  # noqa: E402
+
+DT = 1.0 / 60.0
+
+
+def _random_bullet(rng):
+    angle = rng.uniform(0, 6.283)
+    wtype = rng.choice((WeaponType.PISTOL, WeaponType.SHOTGUN, WeaponType.GRENADE))
+    return dict(
+        x=rng.uniform(0, 3200), y=rng.uniform(0, 2400),
+        vx=math.cos(angle), vy=math.sin(angle),
+        weapon_type=wtype, speed=400.0, lifetime=rng.uniform(0.2, 3.0),
+        damage=1, radius=5, is_grenade=(wtype == WeaponType.GRENADE),
+        fuse_time=1.2 if wtype == WeaponType.GRENADE else 0.0,
+        explosion_radius=120 if wtype == WeaponType.GRENADE else 0,
+    )
+
+
+def bench_legacy(n, frames, seed):
+    rng = random.Random(seed)
+    bullets = [WeaponBullet(**_random_bullet(rng)) for _ in range(n)]
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        for b in bullets[:]:
+            b.update(DT)
+            if not b.alive:
+                bullets.remove(b)
+        # إعادة التعبئة للحفاظ على عدد ثابت من الرصاص الحي
+        while len(bullets) < n:
+            bullets.append(WeaponBullet(**_random_bullet(rng)))
+    return time.perf_counter() - t0
+
+
+def bench_pool(n, frames, seed):
+    rng = random.Random(seed)
+    pool = BulletPool(n)
+    for _ in range(n):
+        pool.spawn(**_random_bullet(rng))
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        pool.step(DT)
+        pool.compact()
+        while len(pool) < n:
+            pool.spawn(**_random_bullet(rng))
+    return time.perf_counter() - t0
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Bullet update benchmark")
+    ap.add_argument("--bullets", type=int, default=5000)
+    ap.add_argument("--frames", type=int, default=300)
+    ap.add_argument("--seed", type=int, default=1234)
+    args = ap.parse_args(argv)
+
+    legacy = bench_legacy(args.bullets, args.frames, args.seed)
+    pool = bench_pool(args.bullets, args.frames, args.seed)
+    per_legacy = legacy / args.frames * 1000.0
+    per_pool = pool / args.frames * 1000.0
+    print(f"bullets={args.bullets} frames={args.frames}")
+    print(f"legacy list : {per_legacy:8.3f} ms/frame")
+    print(f"BulletPool  : {per_pool:8.3f} ms/frame  (x{per_legacy / max(per_pool, 1e-9):.1f})")
+
+
+if __name__ == "__main__":
+    main()
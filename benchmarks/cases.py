@@ -0,0 +1,298 @@
+# cases.py - قياسات الدوال الساخنة (بأحجام واقعية وأحجام ضغط)
+"""
+كل قياس يجهز بياناته مرة واحدة ثم يرجع دالة بدون معاملات للقياس.
+الأحجام الواقعية مأخوذة من LEVELS (حتى 9 زومبي فردي / 18 جماعي)،
+وأحجام الضغط أكبر بكثير لكشف التعقيد (O(n²) وما شابه).
+"""
+
+import pickle
+import random
+
+import pygame
+
+from benchmarks.harness import case
+
+WORLD_W, WORLD_H = 3200, 2400
+_screen = None
+
+
+def screen() -> pygame.Surface:
+    """نافذة وهمية (SDL_VIDEODRIVER=dummy) مطلوبة لـ convert/convert_alpha"""
+    global _screen
+    if _screen is None:
+        pygame.init()
+        _screen = pygame.display.set_mode((1280, 720))
+    return _screen
+
+
+def _walls(level: int = 6):
+    from walls import create_walls_for_level
+    return create_walls_for_level(level, WORLD_W, WORLD_H, tile=64)
+
+
+def _stress_walls(n: int = 500, seed: int = 7):
+    rng = random.Random(seed)
+    return [pygame.Rect(rng.randint(0, WORLD_W - 64), rng.randint(0, WORLD_H - 64),
+                        rng.randint(8, 64), rng.randint(8, 64)) for _ in range(n)]
+
+
+def _probe_rects(n: int = 200, seed: int = 3):
+    rng = random.Random(seed)
+    return [pygame.Rect(rng.randint(0, WORLD_W), rng.randint(0, WORLD_H), 36, 36) for _ in range(n)]
+
+
+# ============== walls.collide_rect_list ==============
+@case("walls.collide_rect_list[level6 x200]", group="walls")
+def _collide_level():
+    from walls import collide_rect_list
+    walls, probes = _walls(6), _probe_rects()
+    return lambda: [collide_rect_list(r, walls) for r in probes]
+
+
+@case("walls.collide_rect_list[500 walls x200]", group="walls", size="stress")
+def _collide_stress():
+    from walls import collide_rect_list
+    walls, probes = _stress_walls(), _probe_rects()
+    return lambda: [collide_rect_list(r, walls) for r in probes]
+
+
+# ============== raycast_clear ==============
+def _ray_pairs(n: int, seed: int = 11):
+    rng = random.Random(seed)
+    return [(pygame.Vector2(rng.uniform(0, WORLD_W), rng.uniform(0, WORLD_H)),
+             pygame.Vector2(rng.uniform(0, WORLD_W), rng.uniform(0, WORLD_H))) for _ in range(n)]
+
+
+@case("game.raycast_clear[level6 x20]", group="raycast")
+def _ray_game():
+    screen()
+    from game import raycast_clear
+    walls, pairs = _walls(6), _ray_pairs(20)
+    return lambda: [raycast_clear(a, b, walls) for a, b in pairs]
+
+
+@case("multiplayer_game.raycast_clear[level6 x20]", group="raycast")
+def _ray_mp():
+    screen()
+    from multiplayer_game import raycast_clear
+    walls, pairs = _walls(6), _ray_pairs(20)
+    return lambda: [raycast_clear(a, b, walls) for a, b in pairs]
+
+
+@case("game.raycast_clear[500 walls x20]", group="raycast", size="stress")
+def _ray_game_stress():
+    screen()
+    from game import raycast_clear
+    walls, pairs = _stress_walls(), _ray_pairs(20)
+    return lambda: [raycast_clear(a, b, walls) for a, b in pairs]
+
+
+# ============== Zombie AI ==============
+def _zombies(cls, n: int, level: int = 6, seed: int = 5, with_id: bool = False):
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        x, y = rng.uniform(200, 1400), rng.uniform(200, 1000)
+        out.append(cls(x, y, level, i) if with_id else cls(x, y, level))
+    return out
+
+
+def _zombie_pass(zombies, update, walls):
+    player = pygame.Vector2(800, 600)
+
+    def run():
+        for z in zombies:
+            nearby = [o for o in zombies if o is not z and abs(o.x - z.x) < 72 and abs(o.y - z.y) < 72]
+            update(z, player, walls, 1 / 60, nearby)
+    return run
+
+
+@case("game.Zombie.update[9 zombies]", group="ai")
+def _zombie_update():
+    screen()
+    from game import Zombie
+    return _zombie_pass(_zombies(Zombie, 9), Zombie.update, _walls(6))
+
+
+@case("game.Zombie.update[200 zombies]", group="ai", size="stress")
+def _zombie_update_stress():
+    screen()
+    from game import Zombie
+    return _zombie_pass(_zombies(Zombie, 200), Zombie.update, _walls(6))
+
+
+@case("multiplayer_game.Zombie.update_host[18 zombies]", group="ai")
+def _zombie_host():
+    screen()
+    from multiplayer_game import Zombie
+    return _zombie_pass(_zombies(Zombie, 18, with_id=True), Zombie.update_host, _walls(6))
+
+
+@case("multiplayer_game.Zombie.update_host[200 zombies]", group="ai", size="stress")
+def _zombie_host_stress():
+    screen()
+    from multiplayer_game import Zombie
+    return _zombie_pass(_zombies(Zombie, 200, with_id=True), Zombie.update_host, _walls(6))
+
+
+# ============== Weapons ==============
+@case("WeaponManager.fire[shotgun]", group="weapons")
+def _fire():
+    from weapons import WeaponManager, WeaponType
+    wm = WeaponManager(1)
+    wm.switch_weapon(WeaponType.SHOTGUN)
+
+    def run():
+        wm.cooldowns[WeaponType.SHOTGUN] = 0.0
+        wm.ammo[WeaponType.SHOTGUN] = 30
+        wm.fire(100, 100, 400, 300)
+        if len(wm.bullets) > 500:
+            wm.bullets.clear()
+    return run
+
+
+def _weapon_update(n_bullets: int):
+    from weapons import WeaponManager, WeaponType
+    wm = WeaponManager(1)
+    rng = random.Random(9)
+
+    def refill():
+        while len(wm.bullets) < n_bullets:
+            wm.bullets.spawn(rng.uniform(0, WORLD_W), rng.uniform(0, WORLD_H), 1.0, 0.0,
+                             WeaponType.PISTOL, 500.0, rng.uniform(0.5, 1.2), 1, 5)
+
+    def run():
+        refill()
+        wm.update(1 / 60)
+    return run
+
+
+@case("WeaponManager.update[100 bullets]", group="weapons")
+def _wm_update():
+    return _weapon_update(100)
+
+
+@case("WeaponManager.update[5000 bullets]", group="weapons", size="stress")
+def _wm_update_stress():
+    return _weapon_update(5000)
+
+
+# ============== Explosion / particles ==============
+@case("ExplosionEffect.update", group="effects")
+def _explosion_update():
+    from weapons import ExplosionEffect
+    effects = [ExplosionEffect(640, 360, 120)]
+
+    def run():
+        if not effects[0].alive:
+            effects[0] = ExplosionEffect(640, 360, 120)
+        effects[0].update(1 / 60)
+    return run
+
+
+@case("ExplosionEffect.draw", group="effects")
+def _explosion_draw():
+    scr = screen()
+    from weapons import ExplosionEffect
+    exp = ExplosionEffect(640, 360, 120)
+    for _ in range(10):
+        exp.update(1 / 60)
+    return lambda: exp.draw(scr, (0, 0))
+
+
+def _blood_draw(n: int):
+    scr = screen()
+    from game import BloodParticle, Camera
+    cam = Camera(WORLD_W, WORLD_H, 1280, 720)
+    rng = random.Random(4)
+    parts = [BloodParticle(rng.uniform(0, 1280), rng.uniform(0, 720)) for _ in range(n)]
+
+    def run():
+        for pfx in parts:
+            pfx.draw(scr, cam)
+    return run
+
+
+@case("game.BloodParticle.draw[50]", group="effects")
+def _blood():
+    return _blood_draw(50)
+
+
+@case("game.BloodParticle.draw[1000]", group="effects", size="stress")
+def _blood_stress():
+    return _blood_draw(1000)
+
+
+# ============== Network snapshot ==============
+def _game_state(n_zombies: int, n_pickups: int):
+    screen()
+    import multiplayer_game as mg
+    gs = mg.GameState()
+    rng = random.Random(2)
+    for i in range(n_zombies):
+        gs.zombies[i] = mg.Zombie(rng.uniform(0, WORLD_W), rng.uniform(0, WORLD_H), 3, i)
+    for i in range(n_pickups):
+        gs.pickups[i] = mg.Pickup(rng.uniform(0, WORLD_W), rng.uniform(0, WORLD_H), "medkit", i)
+    for i in range(4):
+        gs.crates[i] = mg.SpeedCrate(rng.uniform(0, WORLD_W), rng.uniform(0, WORLD_H), i)
+    gs.door = mg.LevelDoor(1600, 1200, 3)
+    gs.level = 3
+    return gs
+
+
+@case("GameState.to_dict[18 zombies]", group="network")
+def _to_dict():
+    gs = _game_state(18, 6)
+    return gs.to_dict
+
+
+@case("GameState.to_dict[300 zombies]", group="network", size="stress")
+def _to_dict_stress():
+    gs = _game_state(300, 40)
+    return gs.to_dict
+
+
+def _pickle_roundtrip(gs):
+    def run():
+        msg = {"type": "full_game_state", "game_state": gs.to_dict(), "timestamp": 0.0}
+        return pickle.loads(pickle.dumps(msg))
+    return run
+
+
+@case("pickle roundtrip full_game_state[18 zombies]", group="network")
+def _pickle():
+    return _pickle_roundtrip(_game_state(18, 6))
+
+
+@case("pickle roundtrip full_game_state[300 zombies]", group="network", size="stress")
+def _pickle_stress():
+    return _pickle_roundtrip(_game_state(300, 40))
+
+
+# ============== Background generation ==============
+def _bg_case(level: int):
+    def setup():
+        screen()
+        from game import generate_background_effects
+        effects = {}
+        return lambda: generate_background_effects(level, effects, WORLD_W, WORLD_H)
+    return setup
+
+
+for _level in range(1, 7):
+    case(f"game.generate_background_effects[level{_level}]", group="background")(_bg_case(_level))
+
+
+def _tile_case(level: int):
+    def setup():
+        screen()
+        from game import LEVEL_COLORS
+        from background import TiledBackground
+        bg = TiledBackground(level, WORLD_W, WORLD_H, LEVEL_COLORS[level])
+        # بلاطة في وسط العالم (بدون كاش: أسوأ حالة عند أول ظهور)
+        return lambda: bg.render_tile(bg.cols // 2, bg.rows // 2)
+    return setup
+
+
+for _level in range(1, 7):
+    case(f"background.render_tile[level{_level}]", group="background")(_tile_case(_level))
@@ -0,0 +1,203 @@
+# compare.py - خط أساس لكل جهاز + بوابة كشف التراجع في الأداء
+"""
+الاستخدام:
+    python -m benchmarks.run --out new.json
+    python -m benchmarks.compare save new.json          # حفظ خط الأساس لهذا الجهاز
+    python -m benchmarks.compare check new.json         # مقارنة (exit 1 عند التراجع)
+    python -m benchmarks.compare check --run            # تشغيل القياسات ثم المقارنة
+
+- خط الأساس يُحفظ في benchmarks/baselines/<profile>.json (profile = معرّف الجهاز)
+- الطريقة الافتراضية: الوسيط + MAD؛ التراجع = نسبة الوسيطين > 1 + threshold
+  والفرق أكبر من k × الضجيج (MAD مجمّع)
+- --method bootstrap: فترة ثقة 95% لنسبة الوسيطين؛ التراجع = الحد الأدنى للفترة > 1 + threshold
+- المسارات الساخنة (HOT_PATHS) فقط توقف البوابة؛ الباقي تحذير (--all لإيقاف الكل)
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+from typing import Dict, List, Optional, Tuple
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+# أجزاء من أسماء القياسات التي يجب ألا تتراجع
+HOT_PATHS = (
+    "collide_rect_list",
+    "raycast_clear",
+    "Zombie.update",
+    "WeaponManager.update",
+    "GameState.to_dict",
+    "pickle roundtrip",
+)
+
+EXIT_OK = 0
+EXIT_REGRESSION = 1
+EXIT_NO_BASELINE = 2
+
+MAD_SCALE = 1.4826   # MAD -> انحراف معياري تقريبي للتوزيع الطبيعي
+
+
+def _load(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def baseline_path(profile: str, directory: str = BASELINE_DIR) -> str:
+    return os.path.join(directory, f"{profile}.json")
+
+
+def save_baseline(data: Dict, directory: str = BASELINE_DIR) -> str:
+    path = baseline_path(data["meta"]["profile"], directory)
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    return path
+
+
+# ============== الإحصاء ==============
+def mad(samples: List[float]) -> float:
+    med = statistics.median(samples)
+    return statistics.median(abs(s - med) for s in samples)
+
+
+def mad_verdict(base: List[float], new: List[float], threshold: float, k: float) -> Tuple[float, bool]:
+    """(نسبة الوسيطين، هل هو تراجع)"""
+    mb, mn = statistics.median(base), statistics.median(new)
+    ratio = mn / mb if mb > 0 else float("inf")
+    noise = MAD_SCALE * (mad(base) ** 2 + mad(new) ** 2) ** 0.5
+    return ratio, ratio > 1.0 + threshold and (mn - mb) > k * noise
+
+
+def bootstrap_ci(base: List[float], new: List[float], iterations: int = 2000,
+                 confidence: float = 0.95, seed: int = 0) -> Tuple[float, float]:
+    """فترة ثقة لنسبة median(new) / median(base) بإعادة المعاينة"""
+    rng = random.Random(seed)
+    ratios = []
+    nb, nn = len(base), len(new)
+    for _ in range(iterations):
+        mb = statistics.median(rng.choices(base, k=nb))
+        mn = statistics.median(rng.choices(new, k=nn))
+        ratios.append(mn / mb if mb > 0 else float("inf"))
+    ratios.sort()
+    lo = ratios[int((1.0 - confidence) / 2 * iterations)]
+    hi = ratios[min(iterations - 1, int((1.0 + confidence) / 2 * iterations))]
+    return lo, hi
+
+
+def is_hot(name: str) -> bool:
+    return any(part in name for part in HOT_PATHS)
+
+
+def compare(base: Dict, new: Dict, threshold: float = 0.10, method: str = "mad",
+            k: float = 3.0, gate_all: bool = False) -> Tuple[List[Dict], bool]:
+    """يرجع (صفوف التقرير، هل فشلت البوابة)"""
+    rows = []
+    failed = False
+    base_res = base.get("results", {})
+    for name, res in new.get("results", {}).items():
+        ref = base_res.get(name)
+        if ref is None:
+            rows.append({"name": name, "status": "new"})
+            continue
+        b, n = ref["samples"], res["samples"]
+        row = {"name": name, "base": statistics.median(b), "new": statistics.median(n)}
+        if method == "bootstrap":
+            lo, hi = bootstrap_ci(b, n)
+            row["ratio"] = row["new"] / row["base"] if row["base"] > 0 else float("inf")
+            row["ci"] = (lo, hi)
+            regressed = lo > 1.0 + threshold
+            improved = hi < 1.0 - threshold
+        else:
+            row["ratio"], regressed = mad_verdict(b, n, threshold, k)
+            _r, improved = mad_verdict(n, b, threshold, k)
+        gated = gate_all or is_hot(name)
+        if regressed:
+            row["status"] = "REGRESSION" if gated else "slower"
+            failed = failed or gated
+        elif improved:
+            row["status"] = "faster"
+        else:
+            row["status"] = "ok"
+        rows.append(row)
+    return rows, failed
+
+
+def _fmt(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f}ms"
+    return f"{seconds * 1e6:.2f}us"
+
+
+def print_report(rows: List[Dict]):
+    for row in rows:
+        if row["status"] == "new":
+            print(f"  {'new':<10} {row['name']}")
+            continue
+        extra = ""
+        if "ci" in row:
+            extra = f"  ci[{row['ci'][0]:.2f}, {row['ci'][1]:.2f}]"
+        print(f"  {row['status']:<10} {row['name']:<55} {_fmt(row['base']):>11} -> "
+              f"{_fmt(row['new']):>11}  x{row['ratio']:.2f}{extra}")
+
+
+# ============== CLI ==============
+def _results_from_args(args) -> Dict:
+    if args.run:
+        from benchmarks.run import run
+        return run(args.filter, args.size, args.repeat)
+    if not args.results:
+        raise SystemExit("results JSON path or --run is required")
+    return _load(args.results)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark baselines and regression gate")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    for name in ("save", "check"):
+        p = sub.add_parser(name)
+        p.add_argument("results", nargs="?", help="ملف نتائج من benchmarks.run")
+        p.add_argument("--run", action="store_true", help="تشغيل القياسات بدلاً من قراءة ملف")
+        p.add_argument("--filter", default="")
+        p.add_argument("--size", choices=("realistic", "stress"), default="")
+        p.add_argument("--repeat", type=int, default=15)
+        p.add_argument("--baseline-dir", default=BASELINE_DIR)
+        if name == "check":
+            p.add_argument("--baseline", help="ملف خط أساس محدد (بدلاً من ملف الجهاز)")
+            p.add_argument("--threshold", type=float, default=0.10, help="أقصى تباطؤ مسموح (0.10 = 10%%)")
+            p.add_argument("--method", choices=("mad", "bootstrap"), default="mad")
+            p.add_argument("--k", type=float, default=3.0, help="عدد وحدات الضجيج (MAD) المطلوبة")
+            p.add_argument("--all", action="store_true", help="كل القياسات توقف البوابة وليس الساخنة فقط")
+    args = ap.parse_args(argv)
+
+    data = _results_from_args(args)
+    if args.cmd == "save":
+        path = save_baseline(data, args.baseline_dir)
+        print(f"[BENCH] baseline ({len(data['results'])} results) -> {path}")
+        return EXIT_OK
+
+    path = args.baseline or baseline_path(data["meta"]["profile"], args.baseline_dir)
+    if not os.path.exists(path):
+        print(f"[BENCH] no baseline for profile {data['meta']['profile']} ({path}); run 'save' first")
+        return EXIT_NO_BASELINE
+    base = _load(path)
+    if base["meta"].get("profile") != data["meta"].get("profile"):
+        print(f"[BENCH] warning: baseline profile {base['meta'].get('profile')} "
+              f"!= current {data['meta'].get('profile')}")
+    print(f"[BENCH] baseline {base['meta'].get('git_commit')} vs {data['meta'].get('git_commit')} "
+          f"(method={args.method}, threshold={args.threshold:.0%})")
+    rows, failed = compare(base, data, args.threshold, args.method, args.k, args.all)
+    print_report(rows)
+    if failed:
+        print("[BENCH] FAILED: hot path regression")
+        return EXIT_REGRESSION
+    print("[BENCH] OK")
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+# harness.py - أدوات القياس المشتركة لمجموعة benchmarks
+"""
+- Case: تعريف قياس (اسم + دالة تجهيز ترجع الدالة المراد قياسها)
+- time_case: تشغيل تمهيدي ثم عدة عينات، كل عينة = متوسط زمن الاستدعاء
+- environment(): بيانات البيئة (بايثون، pygame، SDL، numpy، المعالج، git...)
+"""
+
+import hashlib
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+@dataclass
+class Case:
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    group: str = ""
+    size: str = "realistic"          # realistic | stress
+    tags: List[str] = field(default_factory=list)
+
+
+CASES: List[Case] = []
+
+
+def case(name: str, group: str = "", size: str = "realistic"):
+    """مُزخرف لتسجيل قياس: الدالة المزخرفة هي دالة التجهيز"""
+    def deco(setup):
+        CASES.append(Case(name=name, setup=setup, group=group, size=size))
+        return setup
+    return deco
+
+
+def _autorange(fn: Callable[[], object], min_time: float) -> int:
+    """عدد الاستدعاءات في العينة الواحدة حتى تتجاوز min_time"""
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - t0 >= min_time or number >= 1 << 20:
+            return number
+        number *= 2
+
+
+def time_case(c: Case, repeat: int = 15, min_time: float = 0.01, warmup: int = 2) -> Dict:
+    fn = c.setup()
+    for _ in range(warmup):
+        fn()
+    number = _autorange(fn, min_time)
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - t0) / number)
+    return {
+        "group": c.group,
+        "size": c.size,
+        "number": number,
+        "repeat": repeat,
+        "unit": "s",
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "min": min(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "samples": samples,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True, timeout=5)
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def machine_profile() -> str:
+    """معرّف ثابت للجهاز/البيئة (لفصل خطوط الأساس بين الأجهزة)"""
+    key = "|".join([platform.system(), platform.machine(), platform.processor(),
+                    str(os.cpu_count()), platform.python_implementation(),
+                    ".".join(platform.python_version_tuple()[:2])])
+    return hashlib.sha1(key.encode()).hexdigest()[:10]
+
+
+def environment() -> Dict:
+    import pygame
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "hostname": platform.node(),
+        "pygame": pygame.version.ver,
+        "sdl": ".".join(map(str, pygame.get_sdl_version())),
+        "numpy": numpy_version,
+        "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+        "git_commit": _git_commit(),
+        "profile": machine_profile(),
+    }
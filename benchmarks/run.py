@@ -0,0 +1,61 @@
+# run.py - تشغيل مجموعة القياسات وحفظ النتائج JSON
+"""
+التشغيل (بدون نافذة):
+    SDL_VIDEODRIVER=dummy python -m benchmarks.run --out bench.json
+    python -m benchmarks.run --filter raycast --size realistic --repeat 5
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks.harness import CASES, environment, time_case
+import benchmarks.cases  # noqa: F401  (تسجيل القياسات)
+
+
+def _fmt(seconds: float) -> str:
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:9.3f} ms"
+    return f"{seconds * 1e6:9.2f} us"
+
+
+def run(filter_text: str = "", size: str = "", repeat: int = 15, min_time: float = 0.01,
+        quiet: bool = False) -> dict:
+    results = {}
+    for c in CASES:
+        if filter_text and filter_text.lower() not in c.name.lower():
+            continue
+        if size and c.size != size:
+            continue
+        res = time_case(c, repeat=repeat, min_time=min_time)
+        results[c.name] = res
+        if not quiet:
+            print(f"{c.name:<55} median {_fmt(res['median'])}  (±{_fmt(res['stdev']).strip()})", flush=True)
+    return {"meta": environment(), "results": results}
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Zombie Shooter micro-benchmarks")
+    ap.add_argument("--out", help="ملف JSON للنتائج (افتراضياً: الطباعة فقط)")
+    ap.add_argument("--filter", default="", help="تشغيل القياسات التي يحتوي اسمها على هذا النص")
+    ap.add_argument("--size", choices=("realistic", "stress"), default="")
+    ap.add_argument("--repeat", type=int, default=15)
+    ap.add_argument("--min-time", type=float, default=0.01, help="أقل زمن لكل عينة (ثواني)")
+    ap.add_argument("--list", action="store_true", help="عرض أسماء القياسات فقط")
+    args = ap.parse_args(argv)
+
+    if args.list:
+        for c in CASES:
+            print(f"{c.group:<11} {c.size:<10} {c.name}")
+        return 0
+
+    data = run(args.filter, args.size, args.repeat, args.min_time)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        print(f"[BENCH] {len(data['results'])} results -> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+# scene.py - مشهد ضغط صناعي لقياس تكلفة الرسم فقط
+"""
+يبني مشهداً صناعياً ويرسمه بكود الرسم الحقيقي على سطح خارج الشاشة:
+- N زومبي، M من كل نوع Pickup، K انفجار متزامن، P جزيئات دم، والباب النشط
+- المحاكاة مجمدة تقريباً (تحديث التأثيرات فقط لتبقى حية) - نقيس الرسم وحده
+- الرسم يمر بتمرير الرؤية (culling.CULL) ودفعات السبرايت (sprite_batch.BATCH) مثل حلقة اللعبة؛
+  --spread 4 يوزع الكيانات خارج الكاميرا
+- التقرير: ms لكل إطار لكل فئة رسم (متوسط + p95) مرتبة من الأغلى
+
+    SDL_VIDEODRIVER=dummy python -m benchmarks.scene --zombies 200 --explosions 8 --blood 600
+    python -m benchmarks.scene --explosions 8 --render-scale 0.5   # طبقة المؤثرات المصغرة (render_scale)
+    python -m benchmarks.scene --level 5 --frames 600 --out scene.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+import pygame
+
+from benchmarks.harness import environment
+from benchmarks.cases import WORLD_W, WORLD_H, screen
+
+PICKUP_KINDS = ("medkit", "shotgun_ammo", "grenade_ammo")
+
+
+class StressScene:
+    """مشهد ثابت الحجم: الكيانات موزعة داخل منطقة الكاميرا (أو العالم كله مع spread)"""
+
+    def __init__(self, level: int = 1, zombies: int = 50, pickups: int = 5, explosions: int = 4,
+                 blood: int = 200, crates: int = 3, spread: float = 1.0, seed: int = 1):
+        import game
+        import multiplayer_game as mg
+        from walls import create_walls_for_level
+        from weapons import ExplosionEffect, draw_explosions
+        from collision import SpatialHash
+        from culling import CULL
+        from sprite_batch import BATCH
+
+        self.g = game
+        self.level = level
+        self.rng = random.Random(seed)
+        random.seed(seed)
+        view_w, view_h = game.WINDOW_W, game.WINDOW_H
+        self.surface = pygame.Surface((view_w, view_h)).convert()
+        self.cam = game.Camera(WORLD_W, WORLD_H, view_w, view_h)
+        self.cam.x, self.cam.y = (WORLD_W - view_w) / 2, (WORLD_H - view_h) / 2
+
+        # المنطقة التي توزع فيها الكيانات: الكاميرا × spread (1 = كل شيء ظاهر)
+        area = self.cam.view_rect().inflate(int(view_w * (spread - 1)), int(view_h * (spread - 1)))
+        self.area = area.clip(pygame.Rect(0, 0, WORLD_W, WORLD_H))
+
+        self.walls = create_walls_for_level(level, WORLD_W, WORLD_H, tile=64)
+        self.wall_grid = SpatialHash.from_rects(self.walls)
+        self.cull = CULL
+        self.batch = BATCH
+        self.bg = {}
+        game.generate_background_effects(level, self.bg, WORLD_W, WORLD_H)
+        self.wall_style = game.LEVEL_WALL_STYLES.get(level, game.DEFAULT_WALL_STYLE)
+
+        self.zombies = [game.Zombie(*self._pos(), level) for _ in range(zombies)]
+        # Pickup الفردي معرّف داخل run_game؛ نستخدم نسخة multiplayer_game (نفس الرسم)
+        self.pickups = [mg.Pickup(*self._pos(), kind, i)
+                        for i, kind in enumerate(k for k in PICKUP_KINDS for _ in range(pickups))]
+        self.crates = [game.SpeedCrate(*self._pos()) for _ in range(crates)]
+        self.blood = [game.BloodParticle(*self._pos()) for _ in range(blood)]
+        self._explosion_cls = ExplosionEffect
+        self._draw_explosions = draw_explosions
+        self.explosions = [self._new_explosion() for _ in range(explosions)]
+        dx, dy = self.area.center
+        self.door = game.LevelDoor(dx, dy, level)
+        self.door.activate()
+
+        self.categories: Dict[str, Callable[[], None]] = {
+            "background": self.draw_background,
+            "walls": self.draw_walls,
+            "blood": self.draw_blood,
+            "pickups": self.draw_pickups,
+            "crates": self.draw_crates,
+            "zombies": self.draw_zombies,
+            "door": self.draw_door,
+            "explosions": self.draw_explosions,
+        }
+
+    def _pos(self):
+        return (self.rng.uniform(self.area.left, self.area.right - 40),
+                self.rng.uniform(self.area.top, self.area.bottom - 40))
+
+    def _new_explosion(self):
+        x, y = self._pos()
+        exp = self._explosion_cls(x, y, self.rng.uniform(80, 140))
+        # بداية عشوائية في دورة الانفجار حتى لا تتزامن كلها
+        for _ in range(self.rng.randint(0, 20)):
+            exp.update(1 / 60)
+        return exp
+
+    # ---------- فئات الرسم (نفس استدعاءات حلقة اللعبة) ----------
+    def draw_background(self):
+        self.g.draw_level_background(self.surface, self.level, self.cam, self.bg)
+
+    def draw_walls(self):
+        fill_col, edge_col, inner_col = (self.wall_style["fill"], self.wall_style["edge"],
+                                         self.wall_style["inner"])
+        for r in self.cull.walls(self.wall_grid, self.walls):
+            sr = self.cam.apply_rect(r)
+            pygame.draw.rect(self.surface, fill_col, sr, border_radius=8)
+            pygame.draw.rect(self.surface, edge_col, sr, width=2, border_radius=8)
+            inner = sr.inflate(-6, -6)
+            if inner.w > 0 and inner.h > 0:
+                pygame.draw.rect(self.surface, inner_col, inner, width=1, border_radius=6)
+
+    def draw_blood(self):
+        for pfx in self.cull.items("blood", self.blood, 8, 8):
+            pfx.draw(self.surface, self.cam, self.batch)
+        self.batch.flush(self.surface, "blood")
+
+    def draw_pickups(self):
+        for pk in self.cull.items("pickups", self.pickups, 48, 48):
+            pk.draw(self.surface, self.cam)
+
+    def draw_crates(self):
+        for cr in self.cull.items("crates", self.crates, self.g.CRATE_H * 2, self.g.CRATE_H):
+            cr.draw(self.surface, self.cam)
+
+    def draw_zombies(self):
+        for en in self.cull.items("zombies", self.zombies, self.g.ZOMBIE_SIZE, self.g.ZOMBIE_SIZE):
+            en.draw(self.surface, self.cam, self.batch)
+        self.batch.flush(self.surface, "zombies", "zombie_ui")
+
+    def draw_door(self):
+        self.door.draw(self.surface, self.cam)
+
+    def draw_explosions(self):
+        self._draw_explosions(self.surface, self.explosions, (int(self.cam.x), int(self.cam.y)))
+
+    # ---------- إبقاء المشهد حياً (خارج القياس) ----------
+    def tick(self, dt: float):
+        for i, exp in enumerate(self.explosions):
+            exp.update(dt)
+            if not exp.alive:
+                self.explosions[i] = self._new_explosion()
+        for pfx in self.blood:
+            pfx.age = (pfx.age + dt) % pfx.life
+        self.door.update(dt)
+
+    def run(self, frames: int = 300, dt: float = 1 / 60) -> Dict[str, np.ndarray]:
+        times = {name: np.zeros(frames) for name in self.categories}
+        times["total"] = np.zeros(frames)
+        for f in range(frames):
+            self.tick(dt)
+            frame_start = time.perf_counter()
+            self.cull.begin(self.cam)
+            self.batch.begin_frame()
+            for name, fn in self.categories.items():
+                t0 = time.perf_counter()
+                fn()
+                times[name][f] = (time.perf_counter() - t0) * 1000.0
+            times["total"][f] = (time.perf_counter() - frame_start) * 1000.0
+        return times
+
+
+def summarize(times: Dict[str, np.ndarray]) -> List[Dict]:
+    total = float(times["total"].mean()) or 1.0
+    rows = []
+    for name, arr in times.items():
+        rows.append({"category": name, "mean_ms": float(arr.mean()),
+                     "p95_ms": float(np.percentile(arr, 95)),
+                     "share": float(arr.mean()) / total})
+    rows.sort(key=lambda r: (r["category"] == "total", -r["mean_ms"]))
+    return rows
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Render-only stress scene")
+    ap.add_argument("--level", type=int, default=1)
+    ap.add_argument("--zombies", type=int, default=50)
+    ap.add_argument("--pickups", type=int, default=5, help="العدد من كل نوع")
+    ap.add_argument("--explosions", type=int, default=4)
+    ap.add_argument("--blood", type=int, default=200)
+    ap.add_argument("--crates", type=int, default=3)
+    ap.add_argument("--spread", type=float, default=1.0, help="مساحة التوزيع نسبة لحجم الشاشة")
+    ap.add_argument("--frames", type=int, default=300)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--render-scale", type=float, default=1.0, help="دقة طبقة المؤثرات (1 / 0.75 / 0.5)")
+    ap.add_argument("--out", help="حفظ التقرير JSON")
+    args = ap.parse_args(argv)
+
+    screen()
+    from render_scale import RENDER_SCALE
+    RENDER_SCALE.pin(args.render_scale)
+    scene = StressScene(args.level, args.zombies, args.pickups, args.explosions, args.blood,
+                        args.crates, args.spread, args.seed)
+    scene.run(min(30, args.frames))          # تسخين (كاش الخطوط والصور)
+    rows = summarize(scene.run(args.frames))
+
+    print(f"[SCENE] level {args.level}: {args.zombies} zombies, {args.pickups}x{len(PICKUP_KINDS)} pickups, "
+          f"{args.explosions} explosions, {args.blood} blood, {args.frames} frames, {RENDER_SCALE.label()}")
+    for r in rows:
+        print(f"  {r['category']:<11} {r['mean_ms']:8.3f} ms/frame  p95 {r['p95_ms']:8.3f}  {r['share']:6.1%}")
+    print(f"[SCENE] visible: {scene.cull.summary()}")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"meta": environment(), "scene": vars(args), "categories": rows}, f, indent=2)
+        print(f"[SCENE] report -> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
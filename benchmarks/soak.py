@@ -0,0 +1,164 @@
+# soak.py - اختبار تحمّل: لعب المستويات الستة في حلقة مع مراقبة الذاكرة
+"""
+يشغّل run_game الحقيقي بدون نافذة ويمرّ بكل المستويات مرات متتالية:
+- الباب يُفتح تلقائياً بعد --frames-per-level إطار ويُلمس اللاعب (انتقال مستوى حقيقي)
+- بعد المستوى 6 تُختار "إعادة" من شاشة النصر فتبدأ دورة جديدة
+- إطلاق نار وقنابل آلي لتوليد دم وانفجارات (اللاعب محمي من الزومبي)
+- memory.MONITOR يأخذ لقطة عند كل انتقال؛ الفشل (exit 1) إذا نمت RSS بعد
+  دورة الإحماء الأولى أكثر من --max-growth-mb
+
+    SDL_VIDEODRIVER=dummy python -m benchmarks.soak --cycles 3
+    ZS_MEMORY=1 python -m benchmarks.soak --cycles 2   # مع أكثر المواقع نمواً (tracemalloc)
+"""
+
+import argparse
+import gc
+import random
+import sys
+
+import pygame
+
+from benchmarks.cases import WORLD_W, WORLD_H, screen
+
+LEVELS_PER_CYCLE = 6
+
+
+class _FixedClock:
+    """ساعة بدون حد FPS لكن بـ dt ثابت (اللعبة تقرأ get_time)"""
+
+    def __init__(self, dt_ms: int = 16):
+        self._clock = pygame.time.Clock()
+        self.dt_ms = dt_ms
+
+    def tick(self, framerate: int = 0) -> int:
+        self._clock.tick()
+        return self.dt_ms
+
+    def get_time(self) -> int:
+        return self.dt_ms
+
+    def get_rawtime(self) -> int:
+        # زمن العمل الفعلي (لـ RENDER_SCALE) وليس dt الثابت
+        return self._clock.get_rawtime()
+
+    def get_fps(self) -> float:
+        return self._clock.get_fps()
+
+
+def _install(game, frames_per_level: int, state: dict):
+    """ربط اللعبة بالسكربت: باب تلقائي، نصر = إعادة، إدخال آلي"""
+    base_door = game.LevelDoor
+
+    class SoakDoor(base_door):
+        def __init__(self, x, y, level):
+            self.born = state["frame"]
+            super().__init__(x, y, level)
+
+        @property
+        def active(self) -> bool:
+            return self._active or state["frame"] - self.born >= frames_per_level
+
+        @active.setter
+        def active(self, value: bool):
+            self._active = value
+
+        @property
+        def rect(self) -> pygame.Rect:
+            # الباب النشط يغطي العالم كله: اللاعب يدخله فوراً
+            if self.active:
+                return pygame.Rect(0, 0, WORLD_W, WORLD_H)
+            return pygame.Rect(-10000, -10000, 1, 1)
+
+    class SoakLeaderboard(game.LeaderboardManager):
+        def is_high_score(self, score):
+            return False
+
+    class SoakPlayer(game.Player):
+        # اللاعب لا يتضرر من الزومبي حتى لا تنتهي الدورة بـ Game Over
+        def is_shielded(self) -> bool:
+            return True
+
+    game.LevelDoor = SoakDoor
+    game.Player = SoakPlayer
+    game.LeaderboardManager = SoakLeaderboard
+    game.show_victory_screen = lambda *a, **k: "restart"
+
+    rng = random.Random(1)
+    orig_flip = pygame.display.flip
+
+    def flip():
+        state["frame"] += 1
+        n = state["frame"]
+        if n % 4 == 0:
+            pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1,
+                                                 pos=(rng.randint(0, 1279), rng.randint(0, 719))))
+        if n % 120 == 60:
+            for key in (pygame.K_3, pygame.K_SPACE, pygame.K_1):
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode=""))
+        if n % 120 == 0:
+            # شاشة Game Over تنتظر ENTER؛ في اللعب العادي يُتجاهل
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, mod=0, unicode=""))
+        if state["stop"]:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        orig_flip()
+
+    pygame.display.flip = flip
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Memory soak test over all levels")
+    ap.add_argument("--cycles", type=int, default=3, help="عدد مرات المرور بالمستويات الستة")
+    ap.add_argument("--frames-per-level", type=int, default=240)
+    ap.add_argument("--max-growth-mb", type=float, default=48.0,
+                    help="أقصى نمو مسموح لـ RSS بعد دورة الإحماء")
+    args = ap.parse_args(argv)
+
+    scr = screen()
+    import game
+    from memory import MONITOR
+
+    state = {"frame": 0, "stop": False}
+    _install(game, args.frames_per_level, state)
+    clock = _FixedClock()
+    target = args.cycles * LEVELS_PER_CYCLE
+
+    def level_snapshots():
+        return [r for r in MONITOR.history if r["label"].startswith("level ")]
+
+    # إيقاف اللعبة عند الوصول لعدد الانتقالات المطلوب (بعد آخر لقطة)
+    orig_snapshot = MONITOR.snapshot
+
+    def snapshot(label, verbose=True):
+        gc.collect()
+        report = orig_snapshot(label, verbose)
+        if len(level_snapshots()) >= target + 1:
+            state["stop"] = True
+        return report
+
+    MONITOR.snapshot = snapshot
+
+    result = "start"
+    while result == "start" and not state["stop"]:
+        result = game.run_game(scr, clock, "soak")
+
+    snaps = level_snapshots()
+    if len(snaps) <= LEVELS_PER_CYCLE:
+        print(f"[SOAK] only {len(snaps)} level transitions; need more than one cycle")
+        return 2
+    # المقارنة من نهاية دورة الإحماء (الكاش، الخطوط، الصور محملة)
+    warm = snaps[LEVELS_PER_CYCLE]["rss"]
+    peak = max(r["rss"] for r in snaps[LEVELS_PER_CYCLE:])
+    last = snaps[-1]["rss"]
+    growth_mb = (peak - warm) / (1024 * 1024)
+    print(f"[SOAK] {len(snaps) - 1} transitions, {state['frame']} frames: "
+          f"rss warm {warm / 2**20:.1f}MB  peak {peak / 2**20:.1f}MB  last {last / 2**20:.1f}MB  "
+          f"growth {growth_mb:+.1f}MB (limit {args.max_growth_mb:.0f}MB)")
+    if growth_mb > args.max_growth_mb:
+        print("[SOAK] FAILED: resident memory is not bounded")
+        return 1
+    print("[SOAK] OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
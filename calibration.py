@@ -0,0 +1,119 @@
+# calibration.py - First-run graphics calibration for Zombie Shooter
+"""
+معايرة جودة الرسوميات عند أول تشغيل:
+- مشهد قصير خارج الشاشة بكود الرسم الحقيقي (خلفية، زومبي، دم، انفجارات) بجودة High
+- الوسيط (median) لزمن رسم الإطار يحدد الإعداد: High / Medium / Low
+- النتيجة تُحفظ في settings.json (performance.preset / calibrated / calibration_ms)
+  ولا تُعاد المعايرة إلا بحذف calibrated أو ZS_CALIBRATE=force
+- ZS_CALIBRATE=0 لتخطي المعايرة (مثلاً في الاختبارات الآلية)
+"""
+
+import os
+import random
+import statistics
+import time
+from typing import List, Optional
+
+import pygame
+
+from settings import game_settings
+
+FRAMES = 45
+WARMUP_FRAMES = 10
+# حدود زمن الرسم (ms) لكل إعداد - الباقي من ميزانية 16.7ms للمنطق والـ HUD
+THRESHOLDS = (("high", 7.0), ("medium", 12.0))
+
+
+def needs_calibration() -> bool:
+    mode = os.environ.get("ZS_CALIBRATE", "")
+    if mode == "0":
+        return False
+    return mode == "force" or not game_settings.calibrated
+
+
+def choose_preset(frame_ms: float) -> str:
+    for name, limit in THRESHOLDS:
+        if frame_ms <= limit:
+            return name
+    return "low"
+
+
+def measure(frames: int = FRAMES, level: int = 4, zombies: int = 30, blood: int = 150,
+            explosions: int = 3, seed: int = 7) -> float:
+    """الوسيط لزمن رسم إطار المشهد التجريبي (ms) بجودة High"""
+    import game
+    from weapons import ExplosionEffect
+
+    previous = game_settings.quality_preset
+    game_settings.set_quality_preset("high")   # 🔥 نقيس دائماً أثقل إعداد
+    try:
+        rng = random.Random(seed)
+        view_w, view_h = game.WINDOW_W, game.WINDOW_H
+        world_w, world_h = view_w * 2, view_h * 2
+        surface = pygame.Surface((view_w, view_h))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        cam = game.Camera(world_w, world_h, view_w, view_h)
+        cam.x, cam.y = view_w / 2, view_h / 2
+        area = cam.view_rect()
+
+        def pos():
+            return rng.uniform(area.left, area.right - 40), rng.uniform(area.top, area.bottom - 40)
+
+        bg = {}
+        game.generate_background_effects(level, bg, world_w, world_h)
+        enemies = [game.Zombie(*pos(), level) for _ in range(zombies)]
+        particles = [game.BloodParticle(*pos()) for _ in range(blood)]
+        booms = [ExplosionEffect(*pos(), rng.uniform(80, 140)) for _ in range(explosions)]
+        off = (int(cam.x), int(cam.y))
+
+        samples: List[float] = []
+        for f in range(WARMUP_FRAMES + frames):
+            for i, exp in enumerate(booms):
+                exp.update(1 / 60)
+                if not exp.alive:
+                    booms[i] = ExplosionEffect(*pos(), rng.uniform(80, 140))
+            for pfx in particles:
+                pfx.age = (pfx.age + 1 / 60) % pfx.life
+            start = time.perf_counter()
+            game.draw_level_background(surface, level, cam, bg)
+            for pfx in particles:
+                pfx.draw(surface, cam)
+            for en in enemies:
+                en.draw(surface, cam)
+            for exp in booms:
+                exp.draw(surface, off)
+            if f >= WARMUP_FRAMES:
+                samples.append((time.perf_counter() - start) * 1000.0)
+        return statistics.median(samples)
+    finally:
+        game_settings.set_quality_preset(previous)
+
+
+def _draw_notice(screen: pygame.Surface):
+    from util import draw_text
+    W, H = screen.get_size()
+    screen.fill((15, 5, 8))
+    draw_text(screen, "Optimizing graphics for your system...", (W // 2 - 190, H // 2 - 14),
+              size=24, color=(230, 200, 200))
+    pygame.display.flip()
+
+
+def run(screen: Optional[pygame.Surface] = None) -> Optional[str]:
+    """تشغيل المعايرة (إذا لزمت) وحفظ الإعداد المختار؛ يرجع اسم الإعداد"""
+    if not needs_calibration():
+        return None
+    if screen is not None:
+        _draw_notice(screen)
+    try:
+        frame_ms = measure()
+    except Exception as e:
+        # فشل المعايرة لا يمنع اللعب: نبقي الإعداد الحالي ونحاول في التشغيل القادم
+        print(f"[QUALITY] Calibration failed: {e}")
+        return None
+    preset = choose_preset(frame_ms)
+    game_settings.set_calibration(preset, frame_ms)
+    game_settings.save()
+    print(f"[QUALITY] Calibration: {frame_ms:.1f} ms/frame -> {preset}")
+    pygame.event.pump()
+    return preset
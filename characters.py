@@ -4,6 +4,33 @@ from typing import Dict, Optional, Tuple
 import math
 import pygame
 from util import load_image, load_image_to_height, COLORS, clamp
+from settings import game_settings
+from anim_strips import AnimStrip, baked, strip as anim_strip
+
+
+# 🔥 سبرايتات تأثيرات الكوماندوز (تُرسم مرة واحدة ثم blit فقط)
+def _shield_strip(shield_radius: int, glow_layers: int) -> AnimStrip:
+    """دورة نبض الدرع (الطور = shield_timer * 10)؛ الإزاحة من مركز الشخصية"""
+    def build(phase: float):
+        pulse = 0.8 + 0.2 * math.sin(phase)
+        alpha = int(100 * pulse)
+        c = shield_radius + 5
+        shield_surf = pygame.Surface((shield_radius * 2 + 10, shield_radius * 2 + 10), pygame.SRCALPHA)
+        if glow_layers >= 2:  # الجودة المنخفضة: الإطار فقط
+            pygame.draw.circle(shield_surf, (50, 150, 255, alpha), (c, c), int(shield_radius * pulse))
+        pygame.draw.circle(shield_surf, (100, 200, 255, alpha + 50), (c, c), int(shield_radius * pulse), 3)
+        return shield_surf, (-c, -c)
+    return anim_strip(("shield", shield_radius, glow_layers), build)
+
+
+def _dash_puff(i: int) -> pygame.Surface:
+    """نقطة الذيل رقم i (الحجم والشفافية يتناقصان مع البعد)"""
+    def build():
+        trail_surf = pygame.Surface((10, 10), pygame.SRCALPHA)
+        pygame.draw.circle(trail_surf, (255, 200, 50, int(150 * (1 - i / 5))), (5, 5), 5 - i)
+        return trail_surf
+    return baked(("dash_puff", i), build)
+
 
 @dataclass
 class Player:
@@ -232,36 +259,23 @@ class Player:
     
     def _draw_commando_effects(self, screen: pygame.Surface):
         """رسم التأثيرات الخاصة بالجندي"""
-        # رسم الدرع إذا كان نشطاً
+        glow_layers = game_settings.quality("glow_layers")
+        # رسم الدرع إذا كان نشطاً (إطار جاهز من دورة النبض بدل سطح جديد كل إطار)
         if self.shield_active:
             center_x = int(self.x + self.w // 2)
             center_y = int(self.y + self.h // 2)
             shield_radius = max(self.w, self.h) // 2 + 10
-            
-            # تأثير نبض الدرع
-            pulse = 0.8 + 0.2 * math.sin(self.shield_timer * 10)
-            alpha = int(100 * pulse)
-            
-            # رسم الدرع (دائرة شفافة زرقاء)
-            shield_surf = pygame.Surface((shield_radius * 2 + 10, shield_radius * 2 + 10), pygame.SRCALPHA)
-            pygame.draw.circle(shield_surf, (50, 150, 255, alpha),
-                             (shield_radius + 5, shield_radius + 5), int(shield_radius * pulse))
-            pygame.draw.circle(shield_surf, (100, 200, 255, alpha + 50),
-                             (shield_radius + 5, shield_radius + 5), int(shield_radius * pulse), 3)
-            screen.blit(shield_surf, (center_x - shield_radius - 5, center_y - shield_radius - 5))
+            _shield_strip(shield_radius, glow_layers).blit(screen, self.shield_timer * 10, (center_x, center_y))
         
         # رسم تأثير الاندفاع
         if self.is_dashing:
             # خط سريع خلف الشخصية
             trail_length = 30
             dx, dy = self.dash_direction
-            for i in range(5):
-                alpha = int(150 * (1 - i / 5))
+            for i in range(max(1, round(5 * glow_layers / 4))):
                 trail_x = int(self.x + self.w // 2 - dx * trail_length * (i + 1) / 5)
                 trail_y = int(self.y + self.h // 2 - dy * trail_length * (i + 1) / 5)
-                trail_surf = pygame.Surface((10, 10), pygame.SRCALPHA)
-                pygame.draw.circle(trail_surf, (255, 200, 50, alpha), (5, 5), 5 - i)
-                screen.blit(trail_surf, (trail_x - 5, trail_y - 5))
+                screen.blit(_dash_puff(i), (trail_x - 5, trail_y - 5))
     
     def update_abilities(self, dt: float):
         """تحديث قدرات الجندي الخاصة"""
@@ -0,0 +1,164 @@
+# collision.py - Swept collision helpers for Zombie Shooter
+"""
+اختبارات الاصطدام المستمر (Swept):
+- SpatialHash: شبكة تقسيم مكاني (broadphase) للجدران والزومبي
+- segment_rect_t: تقاطع قطعة مستقيمة مع مستطيل (Liang-Barsky)
+- sweep_first_hit: أول جسم تصطدم به الرصاصة بين موقعها السابق والحالي
+- resolve_explosion: ضرر الانفجار للأهداف القريبة فقط مع حجب الجدران
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+import pygame
+
+
+class SpatialHash:
+    """شبكة خلايا ثابتة الحجم: كل خلية تحمل العناصر التي تلمسها"""
+
+    def __init__(self, cell_size: int = 128):
+        self.cell_size = int(cell_size)
+        self.cells: Dict[Tuple[int, int], List] = {}
+        self.rects: Dict[int, pygame.Rect] = {}
+        self.items: Dict[int, object] = {}
+
+    def clear(self):
+        self.cells.clear()
+        self.rects.clear()
+        self.items.clear()
+
+    def _cell_range(self, left: float, top: float, right: float, bottom: float):
+        cs = self.cell_size
+        return (int(left // cs), int(top // cs), int(right // cs), int(bottom // cs))
+
+    def insert(self, item, rect: pygame.Rect):
+        key = id(item)
+        self.items[key] = item
+        self.rects[key] = rect
+        cx0, cy0, cx1, cy1 = self._cell_range(rect.left, rect.top, rect.right, rect.bottom)
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                self.cells.setdefault((cx, cy), []).append(key)
+
+    def query_box(self, left: float, top: float, right: float, bottom: float) -> List[Tuple[object, pygame.Rect]]:
+        """كل العناصر في الخلايا التي يلمسها الصندوق (بدون تكرار)"""
+        seen = set()
+        out = []
+        cx0, cy0, cx1, cy1 = self._cell_range(left, top, right, bottom)
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                for key in self.cells.get((cx, cy), ()):
+                    if key not in seen:
+                        seen.add(key)
+                        out.append((self.items[key], self.rects[key]))
+        return out
+
+    def query_rect(self, rect: pygame.Rect) -> List[Tuple[object, pygame.Rect]]:
+        return self.query_box(rect.left, rect.top, rect.right, rect.bottom)
+
+    @classmethod
+    def from_rects(cls, rects: Iterable[pygame.Rect], cell_size: int = 128) -> "SpatialHash":
+        grid = cls(cell_size)
+        for r in rects:
+            grid.insert(r, r)
+        return grid
+
+
+def segment_rect_t(x0: float, y0: float, x1: float, y1: float,
+                   rect: pygame.Rect, pad: float = 0.0) -> Optional[float]:
+    """زمن الدخول t في [0, 1] للقطعة (x0,y0)->(x1,y1) داخل المستطيل الموسّع بـ pad، أو None"""
+    left = rect.left - pad
+    right = rect.right + pad
+    top = rect.top - pad
+    bottom = rect.bottom + pad
+    dx = x1 - x0
+    dy = y1 - y0
+    t_enter, t_exit = 0.0, 1.0
+    for p, q in ((-dx, x0 - left), (dx, right - x0), (-dy, y0 - top), (dy, bottom - y0)):
+        if p == 0:
+            # موازية لهذا الضلع وخارجه
+            if q < 0:
+                return None
+            continue
+        r = q / p
+        if p < 0:
+            if r > t_exit:
+                return None
+            if r > t_enter:
+                t_enter = r
+        else:
+            if r < t_enter:
+                return None
+            if r < t_exit:
+                t_exit = r
+    return t_enter
+
+
+def sweep_first_hit(x0: float, y0: float, x1: float, y1: float, grid: SpatialHash,
+                    pad: float = 0.0,
+                    accept: Optional[Callable[[object], bool]] = None) -> Tuple[Optional[float], object]:
+    """أول عنصر في الشبكة تقطعه الحركة من (x0,y0) إلى (x1,y1): يرجع (t, item) أو (None, None)"""
+    best_t = None
+    best_item = None
+    left, right = (x0, x1) if x0 <= x1 else (x1, x0)
+    top, bottom = (y0, y1) if y0 <= y1 else (y1, y0)
+    for item, rect in grid.query_box(left - pad, top - pad, right + pad, bottom + pad):
+        if accept is not None and not accept(item):
+            continue
+        t = segment_rect_t(x0, y0, x1, y1, rect, pad)
+        if t is not None and (best_t is None or t < best_t):
+            best_t = t
+            best_item = item
+    return best_t, best_item
+
+
+def line_of_sight(x0: float, y0: float, x1: float, y1: float, wall_grid: SpatialHash) -> bool:
+    """هل الخط بين النقطتين خالٍ من الجدران؟"""
+    t, _ = sweep_first_hit(x0, y0, x1, y1, wall_grid)
+    return t is None
+
+
+def resolve_explosion(ex: float, ey: float, radius: float, damage: int,
+                      grid: SpatialHash, targets, wall_grid: Optional[SpatialHash] = None
+                      ) -> Tuple[List[Tuple[object, int]], List[object]]:
+    """
+    تطبيق ضرر انفجار على الأهداف داخل نصف القطر فقط (عبر الشبكة المكانية).
+    - grid: مفاتيح الأهداف مع مستطيلاتها، targets[key] يرجع الهدف (list أو dict)
+    - الضرر يتناقص خطياً مع المسافة من مركز الهدف (حساب مجمع بـ numpy)
+    - wall_grid (اختياري): الجدار بين الانفجار والهدف يحجب الضرر
+    يرجع (hits, kills): hits = [(key, dmg)]، kills = مفاتيح الأهداف التي ماتت بهذا الانفجار
+    """
+    keys = []
+    centers = []
+    for key, rect in grid.query_box(ex - radius, ey - radius, ex + radius, ey + radius):
+        try:
+            target = targets[key]
+        except (KeyError, IndexError):
+            continue
+        if getattr(target, "hp", 0) <= 0:
+            continue
+        keys.append(key)
+        centers.append(rect.center)
+    if not keys:
+        return [], []
+
+    pts = np.asarray(centers, dtype=np.float64)
+    dist = np.hypot(pts[:, 0] - ex, pts[:, 1] - ey)
+    dmg = (damage * (1.0 - dist / radius)).astype(np.int64)
+    in_range = np.flatnonzero(dist < radius)
+
+    hits = []
+    kills = []
+    for k in in_range.tolist():
+        cx, cy = centers[k]
+        if wall_grid is not None and not line_of_sight(ex, ey, cx, cy, wall_grid):
+            continue
+        key = keys[k]
+        amount = int(dmg[k])
+        target = targets[key]
+        target.hp -= amount
+        hits.append((key, amount))
+        if target.hp <= 0:
+            kills.append(key)
+    return hits, kills
@@ -0,0 +1,71 @@
+# culling.py - Camera visibility pass for Zombie Shooter
+"""
+تمرير رؤية واحد لكل إطار قبل الرسم (بدلاً من رسم كل العالم 3200×2400):
+- CULL.begin(cam) مرة واحدة: مستطيل الكاميرا + هامش للتوهج والظلال وشريط الصحة
+- CULL.walls(wall_grid, walls): الجدران من الشبكة المكانية الثابتة للمستوى (بنفس ترتيب الرسم)
+- CULL.items("zombies", enemies, w, h): الكيانات المتحركة باختبار مستطيل مباشر
+  (تتحرك كل إطار، فبناء فهرس لها يكلف نفس O(n) الاختبار نفسه)
+- CULL.stats: عدد المرسوم / الإجمالي لكل فئة في الإطار الأخير
+الرصاص والانفجارات تُقص داخل weapons.py مقابل حجم الشاشة نفسه.
+مشترك بين اللعب الفردي والجماعي.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+import pygame
+
+MARGIN = 48
+
+
+class ViewCuller:
+    """يحدد ما يتقاطع مع الكاميرا من كل فئة رسم"""
+
+    def __init__(self, margin: int = MARGIN):
+        self.margin = margin
+        self.view = pygame.Rect(0, 0, 0, 0)
+        self.stats: Dict[str, Tuple[int, int]] = {}
+        self._wall_src = None
+        self._wall_order: Dict[int, int] = {}
+
+    def begin(self, cam) -> pygame.Rect:
+        """بداية الإطار: مستطيل الرؤية في إحداثيات العالم"""
+        self.view = cam.view_rect().inflate(self.margin * 2, self.margin * 2)
+        self.stats = {}
+        return self.view
+
+    def walls(self, grid, walls: List[pygame.Rect]) -> List[pygame.Rect]:
+        """الجدران الظاهرة من SpatialHash، مرتبة كما في قائمة المستوى (التداخل يُرسم كما كان)"""
+        if self._wall_src is not grid:   # شبكة جديدة = مستوى جديد (قائمة الجدران تُستبدل في مكانها)
+            self._wall_src = grid
+            self._wall_order = {id(r): i for i, r in enumerate(walls)}
+        order = self._wall_order
+        view = self.view
+        hits = [r for r, _rect in grid.query_rect(view) if view.colliderect(r)]
+        hits.sort(key=lambda r: order.get(id(r), 0))
+        self.stats["walls"] = (len(hits), len(walls))
+        return hits
+
+    def items(self, name: str, items: Iterable, w: int = 64, h: int = 64) -> List:
+        """العناصر (x, y أعلى يسار) التي يتقاطع صندوقها w×h مع الرؤية"""
+        left = self.view.left - w
+        top = self.view.top - h
+        right = self.view.right
+        bottom = self.view.bottom
+        total = 0
+        out = []
+        for it in items:
+            total += 1
+            if left < it.x < right and top < it.y < bottom:
+                out.append(it)
+        self.stats[name] = (len(out), total)
+        return out
+
+    def contains(self, x: float, y: float, w: int = 64, h: int = 64) -> bool:
+        v = self.view
+        return v.left - w < x < v.right and v.top - h < y < v.bottom
+
+    def summary(self) -> str:
+        return "  ".join(f"{name} {shown}/{total}" for name, (shown, total) in self.stats.items())
+
+
+CULL = ViewCuller()
@@ -0,0 +1,120 @@
+# fonts.py - Cached font resolution for Zombie Shooter
+"""
+طبقة الخطوط: بديل pygame.font.SysFont بدون تعداد خطوط النظام عند كل تشغيل
+- الترتيب: خط مرفق في fonts/ (مثل fonts/arial.ttf و fonts/arial-bold.ttf)
+  ← المسار المحفوظ في cache/fonts.json ← match_font (مرة واحدة فقط ثم يُحفظ)
+  ← خط pygame الافتراضي إذا لم يوجد الخط
+- get_font(size, bold) يرجع كائن Font مخزناً (لا إنشاء خط جديد عند كل رسم)
+"""
+
+import json
+import os
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+FONT_DIR = "fonts"
+CACHE_FILE = os.path.join("cache", "fonts.json")
+DEFAULT_FAMILY = "arial"
+
+_resolved: Dict[str, Optional[Tuple[str, bool]]] = {}   # "arial|b" -> (path, fake_bold) / None
+_fonts: Dict[Tuple[str, int, bool], pygame.font.Font] = {}
+_disk: Optional[Dict] = None
+
+
+def _key(family: str, bold: bool) -> str:
+    return f"{family.lower()}|{'b' if bold else 'r'}"
+
+
+def _bundled(family: str, bold: bool) -> Optional[Tuple[str, bool]]:
+    """خط مرفق مع اللعبة في fonts/"""
+    family = family.lower()
+    names = ([f"{family}-bold.ttf", f"{family}bd.ttf", f"{family}_bold.ttf"] if bold else []) + \
+            [f"{family}.ttf", f"{family}-regular.ttf"]
+    for i, name in enumerate(names):
+        path = os.path.join(FONT_DIR, name)
+        if os.path.isfile(path):
+            # ملف عادي لخط عريض = تعريض صناعي (set_bold)
+            return path, bold and i >= len(names) - 2
+    return None
+
+
+def _load_disk() -> Dict:
+    global _disk
+    if _disk is None:
+        try:
+            with open(CACHE_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            _disk = data if data.get("pygame") == pygame.version.ver else {}
+        except (OSError, ValueError):
+            _disk = {}
+        _disk.setdefault("pygame", pygame.version.ver)
+        _disk.setdefault("fonts", {})
+    return _disk
+
+
+def _save_disk():
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(_disk, f, indent=2)
+    except OSError as e:
+        print(f"[FONT] Could not save font cache: {e}")
+
+
+def _match_system(family: str, bold: bool) -> Optional[Tuple[str, bool]]:
+    """البحث في خطوط النظام (مكلف: fontconfig على لينكس) - مرة واحدة لكل خط"""
+    try:
+        path = pygame.font.match_font(family, bold=bold)
+        if not path:
+            return None
+        fake_bold = bold and path == pygame.font.match_font(family, bold=False)
+        return path, fake_bold
+    except Exception:
+        return None
+
+
+def resolve(family: str = DEFAULT_FAMILY, bold: bool = False) -> Optional[Tuple[str, bool]]:
+    """(مسار الملف، تعريض صناعي) أو None لخط pygame الافتراضي"""
+    key = _key(family, bold)
+    if key in _resolved:
+        return _resolved[key]
+    found = _bundled(family, bold)
+    if found is None:
+        disk = _load_disk()["fonts"]
+        if key in disk:
+            entry = disk[key]
+            if entry is None:
+                found = None
+            elif os.path.isfile(entry[0]):
+                found = (entry[0], bool(entry[1]))
+            else:
+                entry = None
+                del disk[key]
+            if key in disk:
+                _resolved[key] = found
+                return found
+        found = _match_system(family, bold)
+        disk[key] = list(found) if found else None
+        _save_disk()
+    _resolved[key] = found
+    return found
+
+
+def get_font(size: int, bold: bool = False, family: str = DEFAULT_FAMILY) -> pygame.font.Font:
+    """Font مخزن لكل (الخط، الحجم، العرض) - بديل SysFont"""
+    cache_key = (family, size, bold)
+    font = _fonts.get(cache_key)
+    if font is not None:
+        return font
+    found = resolve(family, bold)
+    try:
+        font = pygame.font.Font(found[0] if found else None, size)
+        fake_bold = found[1] if found else bold
+    except (OSError, pygame.error):
+        font = pygame.font.Font(None, size)
+        fake_bold = bold
+    if fake_bold:
+        font.set_bold(True)
+    _fonts[cache_key] = font
+    return font
@@ -6,11 +6,22 @@ import pygame
 
 from util import (
     draw_text, draw_shadow_text, clamp, COLORS,
-    load_image_to_height, load_sound, Button, Slider, Dropdown
+    load_image, load_image_to_height, load_sound, Button, Dropdown
 )
 from settings import game_settings, AVAILABLE_RESOLUTIONS
+from fonts import get_font
 from walls import create_walls_for_level, collide_rect_list
-from walls import create_walls_for_level, collide_rect_list
+from collision import SpatialHash, sweep_first_hit, resolve_explosion
+from culling import CULL
+from sprite_batch import BATCH, SpriteBatch, circle_sprite, text_sprite, bar_sprite
+from hud import HudLayer, Widget, ability_panel, cooldown_bar, hearts, shadow_text
+from anim_strips import AnimStrip, baked, label_sprite, pickup_strip, strip as anim_strip
+from scene_layers import DirtyRects
+from ai_scheduler import AIScheduler
+from visibility import VisibilitySet
+from profiler import FrameProfiler
+from render_scale import RENDER_SCALE
+from memory import MONITOR, surface_bytes
 # from bullet import Bullet  <-- REMOVED
 from characters import Player
 from characters import Player
@@ -18,15 +29,15 @@ from characters import Player
 # 🔥 === استيراد الأنظمة الجديدة ===
 from weapons import WeaponManager, WeaponType, WEAPON_STATS, AmmoPickup
 from minimap import Minimap
+from level_prep import LevelPrefetcher
+from background import TiledBackground
 from skins import (
-    SKINS, SKIN_ORDER, DEFAULT_SKIN, get_skin_names, get_skin_data,
-    get_skin_color, get_next_skin, get_prev_skin, apply_skin_tint,
-    draw_skin_selector, get_clicked_skin, draw_player_indicator
+    SKINS, SKIN_ORDER, get_skin_names,
+    get_skin_color, apply_skin_tint,
+    draw_player_indicator
 )
 from leaderboard import LeaderboardManager, show_leaderboard, show_name_input
-
-# 🔥 متغير عام لتخزين المظهر المختار
-CURRENT_SKIN = DEFAULT_SKIN
+import menu  # 🔥 القائمة الرئيسية في menu.py (خفيفة للبدء السريع)؛ هنا المظهر المختار فقط
 
 # ---------------- Window / World ----------------
 WINDOW_W, WINDOW_H = 1280, 720
@@ -83,6 +94,10 @@ class Camera:
         self.shake_offset_x = 0.0
         self.shake_offset_y = 0.0
 
+    def view_rect(self) -> pygame.Rect:
+        """المنطقة الظاهرة من العالم"""
+        return pygame.Rect(int(self.x), int(self.y), self.view_w, self.view_h)
+
     def follow(self, target_rect: pygame.Rect, lerp: float = 0.15):
         tx = target_rect.centerx - self.view_w // 2
         ty = target_rect.centery - self.view_h // 2
@@ -123,420 +138,6 @@ class Camera:
         return (int(x - self.x) + int(self.shake_offset_x), 
             int(y - self.y) + int(self.shake_offset_y))
 
-# ---------- Animated HORROR menu background ----------
-class MenuBackground:
-    def __init__(self, screen: pygame.Surface):
-        self.W, self.H = screen.get_size()
-        # 🔥 HORROR THEME - Dark cemetery/haunted layers
-        self.layers = [
-            {"y": int(self.H * 0.72), "speed": 6, "color": (25, 10, 10)},    # Blood-stained darkness
-            {"y": int(self.H * 0.78), "speed": 12, "color": (18, 8, 8)},     # Deep crimson shadows
-            {"y": int(self.H * 0.85), "speed": 20, "color": (12, 5, 5)},     # Abyssal black-red
-        ]
-        self._build_skyline()
-        # 🔥 Blood-red fog
-        self.fog = [self._make_fog(0.20), self._make_fog(0.15)]
-        self.fog_x = [0.0, -self.W * 0.4]
-        self.fog_v = [8.0, 14.0]
-        # 🔥 Eerie flickering lights instead of search beams
-        self.beams = [
-            {"x": self.W * 0.24, "w": 180, "ang": 0.0, "vang": 0.4, "alpha": 40},
-            {"x": self.W * 0.72, "w": 200, "ang": 0.7, "vang": -0.3, "alpha": 35},
-        ]
-        z = (load_image_to_height("zombie_left.png", 160) or
-             load_image_to_height("zombie_right.png", 160) or
-             load_image_to_height("zombie_up.png", 160) or
-             load_image_to_height("zombie_down.png", 160))
-        self.ghost_img = None
-        if z:
-            # 🔥 Create eerie red-tinted ghost
-            g = pygame.Surface(z.get_size(), pygame.SRCALPHA)
-            g.blit(z, (0, 0))
-            g.fill((180, 50, 50, 80), special_flags=pygame.BLEND_RGBA_MULT)
-            self.ghost_img = g
-        self.ghosts = self._spawn_ghosts(8) if self.ghost_img else []
-        
-        # 🔥 Darker, blood-red vignette
-        self.vignette = pygame.Surface((self.W, self.H), pygame.SRCALPHA)
-        pygame.draw.rect(self.vignette, (0, 0, 0, 160), self.vignette.get_rect())
-        pygame.draw.rect(self.vignette, (0, 0, 0, 0), (80, 80, self.W - 160, self.H - 160))
-        
-        # 🔥 Blood spots/splatters
-        self.blood_spots = self._create_blood_spots()
-        
-        # 🔥 Lightning flash timer
-        self.lightning_timer = 0.0
-        self.lightning_active = False
-        self.lightning_alpha = 0
-
-    def _build_skyline(self):
-        rng = random.Random(666)  # 🔥 Evil seed
-        for L in self.layers:
-            yb = L["y"]; blocks = []; x = -80
-            while x < self.W + 80:
-                # 🔥 Tombstone/ruins-like shapes
-                w = rng.randint(30, 90); h = rng.randint(80, 280)
-                blocks.append(pygame.Rect(x, yb - h, w, h))
-                x += w + rng.randint(15, 35)
-            L["blocks"] = blocks; L["offset"] = 0.0
-
-    def _make_fog(self, alpha: float) -> pygame.Surface:
-        s = pygame.Surface((int(self.W * 1.4), int(self.H * 0.5)), pygame.SRCALPHA)
-        rng = random.Random(13 if alpha < 0.18 else 17)  # 🔥 Superstitious numbers
-        for _ in range(250):
-            r = rng.randint(50, 140)
-            x = rng.randint(-50, s.get_width() - 50)
-            y = rng.randint(0, s.get_height() - 30)
-            a = int(255 * alpha * rng.uniform(0.5, 1.0))
-            # 🔥 Blood red mist
-            pygame.draw.circle(s, (120, 20, 20, a), (x, y), r)
-        return s
-
-    def _spawn_ghosts(self, n: int):
-        rng = random.Random(13); res = []
-        for _ in range(n):
-            res.append({"x": rng.randint(-60, self.W - 60),
-                        "y": rng.randint(30, int(self.H * 0.55)),
-                        "vx": rng.choice([-1, 1]) * rng.uniform(5, 15),
-                        "alpha": rng.randint(40, 100)})  # 🔥 Variable opacity
-        return res
-    
-    def _create_blood_spots(self):
-        """Create random blood splatter positions"""
-        rng = random.Random(31)
-        spots = []
-        for _ in range(15):
-            spots.append({
-                "x": rng.randint(0, self.W),
-                "y": rng.randint(0, self.H),
-                "size": rng.randint(10, 40),
-                "alpha": rng.randint(30, 80)
-            })
-        return spots
-
-    def draw(self, screen: pygame.Surface, dt: float):
-        W, H = self.W, self.H
-        
-        # 🔥 HORROR gradient - Deep black to blood red
-        for i in range(H):
-            t = i / max(H - 1, 1)
-            # Top: Near black (5, 0, 0) | Bottom: Deep blood red (30, 5, 5)
-            r = int(5 + 25 * t)
-            g = int(0 + 5 * t)
-            b = int(5 + 3 * t)
-            pygame.draw.line(screen, (r, g, b), (0, i), (W, i))
-        
-        # 🔥 Blood spots background effect
-        for spot in self.blood_spots:
-            spot_surf = pygame.Surface((spot["size"]*2, spot["size"]*2), pygame.SRCALPHA)
-            pygame.draw.circle(spot_surf, (100, 10, 10, spot["alpha"]), 
-                             (spot["size"], spot["size"]), spot["size"])
-            screen.blit(spot_surf, (spot["x"] - spot["size"], spot["y"] - spot["size"]))
-        
-        # 🔥 Tombstone/ruins silhouettes
-        for L in self.layers:
-            L["offset"] = (L["offset"] - L["speed"] * dt) % (W + 40)
-            ox = -L["offset"]
-            for r in L["blocks"]:
-                rr = r.move(ox, 0)
-                pygame.draw.rect(screen, L["color"], rr)
-                pygame.draw.rect(screen, L["color"], rr.move(W + 40, 0))
-                
-        # 🔥 Eerie red flickering lights (instead of search beams)
-        for b in self.beams:
-            b["ang"] += b["vang"] * dt
-            flicker = 0.7 + 0.3 * math.sin(b["ang"] * 5) + random.uniform(-0.1, 0.1)
-            ang = math.sin(b["ang"]) * 0.8
-            
-            # 🔥 Blood red light cone
-            poly = [(b["x"] - 8, self.layers[0]["y"] - 4),
-                    (b["x"] + 8, self.layers[0]["y"] - 4),
-                    (b["x"] + math.cos(ang) * b["w"], self.layers[0]["y"] - 200 + math.sin(ang) * 70)]
-            cone = pygame.Surface((W, H), pygame.SRCALPHA)
-            cone_alpha = int(b["alpha"] * flicker)
-            pygame.draw.polygon(cone, (180, 30, 30, cone_alpha), poly)
-            screen.blit(cone, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
-            
-        # 🔥 Blood red fog
-        for i, fog in enumerate(self.fog):
-            self.fog_x[i] = (self.fog_x[i] + self.fog_v[i] * dt) % fog.get_width()
-            x = -self.fog_x[i]; y = int(H * 0.40) + i * 35
-            screen.blit(fog, (x, y)); screen.blit(fog, (x + fog.get_width(), y))
-            
-        # 🔥 Haunting ghosts with flickering opacity
-        if self.ghost_img:
-            for g in self.ghosts:
-                g["x"] += g["vx"] * dt
-                if g["x"] < -140: g["x"] = W + 60
-                if g["x"] > W + 60: g["x"] = -140
-                
-                # 🔥 Flickering ghost effect
-                flicker = int(g["alpha"] * (0.8 + 0.2 * math.sin(g["x"] * 0.05)))
-                ghost_copy = self.ghost_img.copy()
-                ghost_copy.set_alpha(flicker)
-                screen.blit(ghost_copy, (int(g["x"]), int(g["y"])))
-        
-        # 🔥 Random lightning flash
-        self.lightning_timer += dt
-        if self.lightning_timer > random.uniform(4.0, 8.0):
-            self.lightning_timer = 0.0
-            self.lightning_active = True
-            self.lightning_alpha = 180
-            
-        if self.lightning_active:
-            lightning_surf = pygame.Surface((W, H), pygame.SRCALPHA)
-            lightning_surf.fill((200, 180, 180, self.lightning_alpha))
-            screen.blit(lightning_surf, (0, 0))
-            self.lightning_alpha -= 15
-            if self.lightning_alpha <= 0:
-                self.lightning_active = False
-        
-        # 🔥 Dark vignette overlay
-        screen.blit(self.vignette, (0, 0))
-
-# ---------------- Menus ----------------
-
-
-def main_menu(screen: pygame.Surface, clock: pygame.time.Clock, version: str) -> str | None:
-    global CURRENT_SKIN
-    bg = MenuBackground(screen)
-    
-    # 🔥 أضف هذا السطر - تعريف cx و cy
-    cx, cy = WINDOW_W // 2, WINDOW_H // 2
-    
-    # الأزرار الأصلية - تم إعادة ترتيبها
-    start_btn = Button(pygame.Rect(cx - 120, cy - 110, 240, 48), "Single Player")
-    howto_btn = Button(pygame.Rect(cx - 120, cy - 55, 240, 42), "How to Play")
-    skins_btn = Button(pygame.Rect(cx - 120, cy - 5, 240, 42), "🎨 Select Skin")
-    leaderboard_btn = Button(pygame.Rect(cx - 120, cy + 45, 240, 42), "🏆 Leaderboard")
-    multiplayer_btn = Button(pygame.Rect(cx - 120, cy + 95, 240, 42), "👥 Multiplayer")
-    settings_btn = Button(pygame.Rect(cx - 120, cy + 145, 240, 42), "⚙️ Settings")
-    quit_btn  = Button(pygame.Rect(cx - 120, cy + 195, 240, 42), "Quit")
-    
-    # Settings panel UI components
-    music_slider = None
-    sfx_slider = None
-    resolution_dropdown = None
-    settings_back_btn = None
-
-    mode = "menu"  # "menu" | "howto" | "skins" | "settings"
-    while True:
-        dt = clock.get_time() / 1000.0
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT: return None
-            if e.type == pygame.KEYDOWN:
-                if mode == "menu":
-                    if e.key == pygame.K_RETURN: return "start"
-                    if e.key == pygame.K_ESCAPE: return None
-                    if e.key == pygame.K_l: return "leaderboard"
-                elif mode == "skins":
-                    if e.key == pygame.K_ESCAPE: mode = "menu"
-                    # تغيير المظهر بالأسهم
-                    if e.key == pygame.K_LEFT:
-                        CURRENT_SKIN = get_prev_skin(CURRENT_SKIN)
-                    if e.key == pygame.K_RIGHT:
-                        CURRENT_SKIN = get_next_skin(CURRENT_SKIN)
-                elif mode == "settings":
-                    if e.key == pygame.K_ESCAPE:
-                        game_settings.save()
-                        mode = "menu"
-                else:
-                    if e.key == pygame.K_ESCAPE: mode = "menu"
-            if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
-                if mode == "menu":
-                    if start_btn.hit(e.pos): return "start"
-                    if howto_btn.hit(e.pos):  mode = "howto"
-                    if skins_btn.hit(e.pos):  mode = "skins"
-                    if leaderboard_btn.hit(e.pos): return "leaderboard"
-                    if quit_btn.hit(e.pos):   return None
-                    # 🔥 معالجة زر Multiplayer
-                    if multiplayer_btn.hit(e.pos): return "multiplayer"
-                    # 🔥 معالجة زر Settings
-                    if settings_btn.hit(e.pos):
-                        mode = "settings"
-                        # Initialize settings UI
-                        panel_x = cx - 280
-                        music_slider = Slider(
-                            pygame.Rect(panel_x + 140, cy - 60, 280, 18),
-                            value=game_settings.music_volume,
-                            label="Music Volume"
-                        )
-                        sfx_slider = Slider(
-                            pygame.Rect(panel_x + 140, cy + 10, 280, 18),
-                            value=game_settings.sfx_volume,
-                            label="SFX Volume"
-                        )
-                        settings_back_btn = Button(pygame.Rect(cx - 80, cy + 100, 160, 44), "Back")
-                elif mode == "skins":
-                    # التحقق من النقر على المظاهر
-                    clicked_skin = get_clicked_skin(e.pos, cx, cy + 50)
-                    if clicked_skin:
-                        CURRENT_SKIN = clicked_skin
-                    # النقر خارج منطقة المظاهر للخروج
-                    selector_rect = pygame.Rect(cx - 200, cy, 400, 150)
-                    if not selector_rect.collidepoint(e.pos):
-                        mode = "menu"
-                elif mode == "settings":
-                    # Settings panel events
-                    if settings_back_btn and settings_back_btn.hit(e.pos):
-                        # Save settings before going back
-                        game_settings.save()
-                        mode = "menu"
-                else:
-                    mode = "menu"
-            
-            # Handle slider events for settings mode
-            if mode == "settings":
-                if music_slider:
-                    if music_slider.handle_event(e):
-                        game_settings.set_music_volume(music_slider.value)
-                if sfx_slider:
-                    if sfx_slider.handle_event(e):
-                        game_settings.set_sfx_volume(sfx_slider.value)
-
-        bg.draw(screen, dt)
-        
-        # Modern Title Rendering
-        title = "Zombie Shooter"
-             
-        # Draw Title with Glow - CLEAR READABLE VERSION
-        # Center the title
-        title_font = pygame.font.SysFont("arial", 56, bold=True)
-        
-        # 🔥 BLACK OUTLINE for maximum readability
-        outline_surf = title_font.render(title, True, (0, 0, 0))
-        title_rect = outline_surf.get_rect(center=(WINDOW_W // 2, 80))
-        for ox, oy in [(-3, 0), (3, 0), (0, -3), (0, 3), (-2, -2), (2, 2), (-2, 2), (2, -2)]:
-            screen.blit(outline_surf, (title_rect.x + ox, title_rect.y + oy))
-        
-        # 🔥 BRIGHT RED GLOW behind text
-        glow_surf = title_font.render(title, True, (200, 40, 40))
-        for offset in [(-1, -1), (1, 1), (-1, 1), (1, -1)]:
-            screen.blit(glow_surf, (title_rect.x + offset[0], title_rect.y + offset[1]))
-        
-        # 🔥 MAIN TITLE - Bright white/cream for clarity
-        title_surf = title_font.render(title, True, (255, 240, 240))
-        screen.blit(title_surf, title_rect)
-        
-        if mode == "menu":
-            start_btn.draw(screen)
-            howto_btn.draw(screen)
-            skins_btn.draw(screen)
-            leaderboard_btn.draw(screen)
-            multiplayer_btn.draw(screen)
-            settings_btn.draw(screen)
-            quit_btn.draw(screen)
-            
-            # 🔥 عرض المظهر الحالي في الزاوية
-            skin_data = get_skin_data(CURRENT_SKIN)
-            skin_text = f"Skin: {skin_data['name']}"
-            draw_text(screen, skin_text, (WINDOW_W - 180, 28), size=20, color=skin_data['color'])
-            
-        elif mode == "skins":
-            _draw_skins_panel(screen, cx, cy)
-        elif mode == "settings":
-            _draw_settings_panel(screen, cx, cy, music_slider, sfx_slider, settings_back_btn)
-        else:
-            _draw_howto_panel(screen)
-
-        pygame.display.flip()
-        clock.tick(FPS)
-
-        
-
-def _draw_howto_panel(screen: pygame.Surface):
-    # 🔥 HORROR THEME - Dark panel with blood red accents
-    rect = pygame.Rect(WINDOW_W//2 - 360, WINDOW_H//2 - 200, 720, 380)
-    pygame.draw.rect(screen, (20, 10, 12, 245), rect, border_radius=10)
-    pygame.draw.rect(screen, (180, 50, 50), rect, width=3, border_radius=10)
-    draw_shadow_text(screen, "How to Survive", (rect.x+20, rect.y+16), size=32, color=(255, 100, 100))
-    y = rect.y + 60
-    lines = [
-        "Move: Z/Q/S/D or WASD or Arrow Keys",
-        "Shoot: Space or Left Mouse | Right Mouse (Shotgun)",
-        "",
-        "WEAPONS:",
-        "  [1] Pistol - Unlimited ammo, fast fire",
-        "  [2] Shotgun - 5 pellets spread, needs ammo",
-        "  [3] Grenade - Area damage, limited supply",
-        "",
-        "[M] Toggle Mini-map | [H] Toggle HUD | [ESC] Pause",
-        "Open Speed Chests for a temporary speed boost!",
-        "Find and enter the DOOR to escape this nightmare!",
-    ]
-    for line in lines:
-        # 🔥 BRIGHT text colors for readability
-        if "WEAPONS" in line:
-            color = (255, 120, 120)  # Bright red for section header
-        else:
-            color = (240, 235, 235)  # Near-white for body text
-        draw_text(screen, line, (rect.x+20, y), size=20, color=color)
-        y += 28
-    draw_text(screen, "Press ESC to go back", (rect.x+20, rect.y+rect.h-42), size=20, color=(200, 180, 180))
-
-def _draw_skins_panel(screen: pygame.Surface, cx: int, cy: int):
-    """🔥 HORROR THEME - رسم لوحة اختيار المظاهر"""
-    global CURRENT_SKIN
-    
-    # 🔥 Dark horror panel with blood red border
-    rect = pygame.Rect(cx - 280, cy - 100, 560, 280)
-    pygame.draw.rect(screen, (20, 10, 12, 245), rect, border_radius=12)
-    pygame.draw.rect(screen, (180, 50, 50), rect, width=3, border_radius=12)
-    
-    # 🔥 Horror title - BRIGHT for readability
-    draw_shadow_text(screen, "Choose Your Character", (cx - 140, cy - 80), size=30, color=(255, 100, 100))
-    
-    # رسم المظاهر
-    draw_skin_selector(screen, CURRENT_SKIN, cx, cy + 10)
-    
-    # معلومات المظهر المختار - BRIGHT text
-    skin_data = get_skin_data(CURRENT_SKIN)
-    info_text = f"Selected: {skin_data['name']} - {skin_data['description']}"
-    draw_text(screen, info_text, (cx - 200, cy + 110), size=20, color=(240, 230, 230))
-    
-    # تعليمات - READABLE
-    draw_text(screen, "Click to select | [Arrow Keys] Navigate | [ESC] Back", 
-             (cx - 200, cy + 145), size=18, color=(200, 180, 180))
-
-def _draw_settings_panel(screen: pygame.Surface, cx: int, cy: int, 
-                         music_slider, sfx_slider, back_btn):
-    """🔥 HORROR THEME - Settings panel with volume controls"""
-    # Dark horror panel with blood red border
-    rect = pygame.Rect(cx - 300, cy - 120, 600, 280)
-    panel_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-    pygame.draw.rect(panel_surf, (20, 10, 12, 245), panel_surf.get_rect(), border_radius=12)
-    screen.blit(panel_surf, (rect.x, rect.y))
-    pygame.draw.rect(screen, (180, 50, 50), rect, width=3, border_radius=12)
-    
-    # Title
-    draw_shadow_text(screen, "⚙️ Settings", (cx - 60, rect.y + 20), size=32, color=(255, 100, 100))
-    
-    # Draw sliders
-    if music_slider:
-        music_slider.draw(screen)
-    if sfx_slider:
-        sfx_slider.draw(screen)
-    
-    # Key bindings display (read-only)
-    key_y = cy + 60
-    draw_text(screen, "Key Bindings:", (rect.x + 30, key_y), size=18, color=(255, 120, 120), bold=True)
-    key_y += 28
-    key_info = [
-        "Move: W/Z/S/D or Arrow Keys",
-        "Shoot: SPACE | Weapons: 1/2/3"
-    ]
-    for line in key_info:
-        draw_text(screen, line, (rect.x + 40, key_y), size=16, color=(200, 190, 190))
-        key_y += 22
-    
-    # Back button
-    if back_btn:
-        back_btn.draw(screen)
-    
-    # Instructions
-    draw_text(screen, "Settings are saved automatically", 
-             (cx - 110, rect.y + rect.height - 30), size=14, color=(160, 150, 150))
-
 # ---------------- Helpers ----------------
 def normalized(x: float, y: float) -> tuple[float, float]:
     L = math.hypot(x, y) or 1.0
@@ -549,8 +150,11 @@ class SpeedCrate:
     """صندوق سرعة: مغلق -> يُفتح عند الالتقاط -> يظهر مفتوحًا لحظات ثم يختفي."""
     def __init__(self, x: float, y: float):
         self.x, self.y = float(x), float(y)
-        self.img_closed = load_image_to_height("chest_closed.png", CRATE_H)
-        self.img_opened = load_image_to_height("chest_opened.png", CRATE_H)
+        # 🔥 الصور المحجّمة مشتركة بين كل الصناديق (بدل smoothscale لكل صندوق جديد)
+        self.img_closed = baked(("image", "chest_closed.png", CRATE_H),
+                                lambda: load_image_to_height("chest_closed.png", CRATE_H))
+        self.img_opened = baked(("image", "chest_opened.png", CRATE_H),
+                                lambda: load_image_to_height("chest_opened.png", CRATE_H))
         if self.img_closed:
             self.w, self.h = self.img_closed.get_width(), self.img_closed.get_height()
         else:
@@ -559,6 +163,19 @@ class SpeedCrate:
         self.open = False
         self.open_timer = 0.0
 
+    def _plain(self) -> pygame.Surface:
+        """الصندوق البديل (بدون صور) مرسوم مرة واحدة"""
+        def build():
+            surf = pygame.Surface((self.w, self.h), pygame.SRCALPHA)
+            r = surf.get_rect()
+            pygame.draw.rect(surf, (120, 85, 40), r, border_radius=6)
+            pygame.draw.rect(surf, (220, 200, 160), r, width=2, border_radius=6)
+            cx, cy = r.center
+            bolt = [(cx, cy-12), (cx+6, cy), (cx-1, cy), (cx+1, cy+14), (cx-8, cy)]
+            pygame.draw.polygon(surf, (255, 230, 80), bolt)
+            return surf
+        return baked(("crate", self.w, self.h), build)
+
     @property
     def rect(self) -> pygame.Rect:
         return pygame.Rect(int(self.x), int(self.y), self.w, self.h)
@@ -583,12 +200,50 @@ class SpeedCrate:
         elif (not self.open) and self.img_closed:
             screen.blit(self.img_closed, (dx, dy))
         else:
-            r = pygame.Rect(dx, dy, self.w, self.h)
-            pygame.draw.rect(screen, (120, 85, 40), r, border_radius=6)
-            pygame.draw.rect(screen, (220, 200, 160), r, width=2, border_radius=6)
-            cx, cy = r.center
-            bolt = [(cx, cy-12), (cx+6, cy), (cx-1, cy), (cx+1, cy+14), (cx-8, cy)]
-            pygame.draw.polygon(screen, (255, 230, 80), bolt)
+            screen.blit(self._plain(), (dx, dy))
+
+
+# ---------------- Commando Effect Sprites ----------------
+def _shield_strip(shield_radius: int, glow_layers: int) -> AnimStrip:
+    """🔥 دورة نبض الدرع (الطور = shield_timer * 8) بطبقات حسب الجودة؛ الإزاحة من مركز اللاعب"""
+    def build(phase: float):
+        pulse = 0.85 + 0.15 * math.sin(phase)
+        alpha = int(120 * pulse)
+        c = shield_radius + 10
+        shield_surf = pygame.Surface((shield_radius * 2 + 20, shield_radius * 2 + 20), pygame.SRCALPHA)
+        # طبقة خارجية متوهجة
+        if glow_layers >= 4:
+            pygame.draw.circle(shield_surf, (50, 150, 255, alpha // 2), (c, c), int(shield_radius * pulse) + 8)
+        # الدرع الرئيسي
+        if glow_layers >= 2:
+            pygame.draw.circle(shield_surf, (50, 150, 255, alpha), (c, c), int(shield_radius * pulse))
+        # حدود الدرع
+        pygame.draw.circle(shield_surf, (150, 220, 255, min(255, alpha + 80)), (c, c), int(shield_radius * pulse), 3)
+        # خط داخلي
+        if glow_layers >= 3:
+            pygame.draw.circle(shield_surf, (200, 240, 255, alpha // 2), (c, c), int(shield_radius * pulse * 0.7), 2)
+        return shield_surf, (-c, -c)
+    return anim_strip(("shield_sp", shield_radius, glow_layers), build)
+
+
+def _dash_puff(i: int) -> pygame.Surface:
+    """نقطة ذيل الاندفاع رقم i (لون ذهبي/برتقالي متوهج، تصغر وتبهت مع البعد)"""
+    def build():
+        alpha = int(200 * (1 - i / 8))
+        size = 12 - i
+        trail_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(trail_surf, (255, 200, 50, alpha), (size, size), size)
+        pygame.draw.circle(trail_surf, (255, 150, 0, alpha // 2), (size, size), size + 3)
+        return trail_surf
+    return baked(("dash_puff_sp", i), build)
+
+
+def _dash_glow(w: int, h: int) -> pygame.Surface:
+    def build():
+        glow_surf = pygame.Surface((w + 30, h + 30), pygame.SRCALPHA)
+        pygame.draw.ellipse(glow_surf, (255, 200, 50, 100), (0, 0, w + 30, h + 30))
+        return glow_surf
+    return baked(("dash_glow", w, h), build)
 
 
 # ---------------- Door Navigation System ----------------
@@ -798,94 +453,88 @@ class LevelDoor:
             pygame.draw.rect(screen, (0, 0, 0, 180), bg_rect, border_radius=3)
             screen.blit(dist_surface, dist_rect)
         
+    def _look(self) -> str:
+        if self.img is None:
+            return "plain"
+        return "open" if self.img is self.img_open else "closed"
+
+    def _door_strip(self) -> AnimStrip:
+        """🔥 دورة الوميض والنبض كاملة مرسومة مسبقاً (الطور = glow_timer)؛ تُشارك بين كل الأبواب"""
+        img, w, h = self.img, self.w, self.h
+
+        def build(phase: float):
+            glow_intensity = (math.sin(phase) + 1) * 0.4 + 0.3
+            pulse_scale = 1.0 + math.sin(phase * 3) * 0.1  # تأثير نبض
+            if img is not None:
+                frame = img.copy()
+                current_size = img.get_size()
+                ox = oy = 0
+                if pulse_scale != 1.0:
+                    new_size = (int(current_size[0] * pulse_scale), int(current_size[1] * pulse_scale))
+                    frame = pygame.transform.scale(frame, new_size)
+                    # تعديل الموضع للحفاظ على المركز
+                    ox = -((new_size[0] - current_size[0]) // 2)
+                    oy = -((new_size[1] - current_size[1]) // 2)
+                # تأثير الوميض الذهبي
+                glow_surf = pygame.Surface(frame.get_size(), pygame.SRCALPHA)
+                glow_surf.fill((255, 255, 150, int(150 * glow_intensity)))
+                frame.blit(glow_surf, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+                return frame, (ox, oy)
+
+            # 🔥 باب بدائي محسن (النبض يكبّر الباب من زاويته العليا كما كان)
+            frame = pygame.Surface((int(w * 1.1) + 1, int(h * 1.1) + 1), pygame.SRCALPHA)
+            door_rect = pygame.Rect(0, 0, int(w * pulse_scale), int(h * pulse_scale))
+            pygame.draw.rect(frame, (160, 120, 60), door_rect, border_radius=10)
+            pygame.draw.rect(frame, (80, 60, 30), door_rect, width=3, border_radius=10)
+            for i in range(3):
+                pygame.draw.rect(frame, (100, 80, 40), (15, 20 + i*30, w - 30, 2))
+            handle_pos = (w - 25, h // 2)
+            pygame.draw.circle(frame, (255, 255, 100), handle_pos, 10)
+            pygame.draw.circle(frame, (255, 200, 50), handle_pos, 6)
+            return frame, (0, 0)
+
+        return anim_strip(("door", self._look(), w, h), build)
+
+    def _halo_strip(self) -> AnimStrip:
+        """هالة الباب (تُدمج بـ BLEND_RGBA_ADD فتبقى شريطاً منفصلاً عن الباب)"""
+        door = self._door_strip()
+        w, h = self.w, self.h
+        halo_radius = max(w, h) * 0.8
+
+        def build(phase: float):
+            glow_intensity = (math.sin(phase) + 1) * 0.4 + 0.3
+            halo_surf = pygame.Surface((int(halo_radius*2), int(halo_radius*2)), pygame.SRCALPHA)
+            pygame.draw.circle(halo_surf, (255, 255, 100, int(80 * glow_intensity)),
+                               (int(halo_radius), int(halo_radius)), int(halo_radius))
+            ox, oy = door.frame(phase)[1]
+            return halo_surf, (int(ox + w//2 - halo_radius), int(oy + h//2 - halo_radius))
+
+        return anim_strip(("door_halo", self._look(), w, h), build)
+
     def draw(self, screen: pygame.Surface, cam: Camera):
         if not self.active:
             return
-            
+
         dx, dy = cam.apply_xy(self.x, self.y)
-        door_rect = pygame.Rect(dx, dy, self.w, self.h)
-        
-        # 🔥 تأثير الوميض المحسن
-        glow_intensity = (math.sin(self.glow_timer) + 1) * 0.4 + 0.3
-        pulse_scale = 1.0 + math.sin(self.glow_timer * 3) * 0.1  # تأثير نبض
-        
+        dx, dy = int(dx), int(dy)
+
+        # 🔥 وميض + نبض: إطار جاهز من الشريط بدل نسخ الصورة وتحجيمها كل إطار
+        frame, (ox, oy) = self._door_strip().frame(self.glow_timer)
         if self.img:
-            # نسخ الصورة وتطبيق التأثيرات
-            img_copy = self.img.copy()
-            current_size = self.img.get_size()
-            
-            # تطبيق تأثير النبض
-            if pulse_scale != 1.0:
-                new_size = (int(current_size[0] * pulse_scale), int(current_size[1] * pulse_scale))
-                img_copy = pygame.transform.scale(img_copy, new_size)
-                # تعديل الموضع للحفاظ على المركز
-                dx = dx - (new_size[0] - current_size[0]) // 2
-                dy = dy - (new_size[1] - current_size[1]) // 2
-            
-            # تأثير الوميض الذهبي
-            glow_surf = pygame.Surface(img_copy.get_size(), pygame.SRCALPHA)
-            glow_color = (255, 255, 150, int(150 * glow_intensity))
-            glow_surf.fill(glow_color)
-            img_copy.blit(glow_surf, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-            
-            # تأثير هالة حول الباب
-            halo_radius = max(self.w, self.h) * 0.8
-            halo_surf = pygame.Surface((int(halo_radius*2), int(halo_radius*2)), pygame.SRCALPHA)
-            halo_color = (255, 255, 100, int(80 * glow_intensity))
-            pygame.draw.circle(halo_surf, halo_color, 
-                             (int(halo_radius), int(halo_radius)), 
-                             int(halo_radius))
-            screen.blit(halo_surf, 
-                       (dx + self.w//2 - halo_radius, dy + self.h//2 - halo_radius),
-                       special_flags=pygame.BLEND_RGBA_ADD)
-            
-            screen.blit(img_copy, (dx, dy))
-        else:
-            # 🔥 رسم باب بدائي محسن
-            door_color = (160, 120, 60)  # بني ذهبي
-            glow_color = (255, 255, 150, int(255 * glow_intensity))
-            
-            # الباب الأساسي مع تأثير النبض
-            door_rect = pygame.Rect(dx, dy, int(self.w * pulse_scale), int(self.h * pulse_scale))
-            pygame.draw.rect(screen, door_color, door_rect, border_radius=10)
-            pygame.draw.rect(screen, (80, 60, 30), door_rect, width=3, border_radius=10)
-            
-            # تفاصيل الباب
-            detail_color = (100, 80, 40)
-            for i in range(3):
-                pygame.draw.rect(screen, detail_color, 
-                               (dx + 15, dy + 20 + i*30, self.w - 30, 2))
-            
-            # مقبض الباب متوهج
-            handle_pos = (dx + self.w - 25, dy + self.h // 2)
-            pygame.draw.circle(screen, (255, 255, 100), handle_pos, 10)
-            pygame.draw.circle(screen, (255, 200, 50), handle_pos, 6)
-        
+            self._halo_strip().blit(screen, self.glow_timer, (dx, dy), special_flags=pygame.BLEND_RGBA_ADD)
+        screen.blit(frame, (dx + ox, dy + oy))
+
         # 🔥 رسم جزيئات المنارة
         for particle in self.beacon_particles:
             p_alpha = 255 * (1 - particle['timer'] / particle['lifetime'])
             p_color = (*particle['color'][:3], int(p_alpha))
             p_x, p_y = cam.apply_xy(particle['x'], particle['y'])
             pygame.draw.circle(screen, p_color, (int(p_x), int(p_y)), int(particle['size']))
-        
-        # 🔥 نص المستوى التالي محسن
-        level_text = f"LEVEL {self.level + 1}"
-        font = pygame.font.Font(None, 26)
-        text_surf = font.render(level_text, True, (255, 255, 200))
-        text_rect = text_surf.get_rect(center=(dx + self.w//2, dy - 25))
-        
-        # خلفية متطورة للنص
-        text_bg = pygame.Rect(text_rect.x - 8, text_rect.y - 4, 
-                            text_rect.width + 16, text_rect.height + 8)
-        pygame.draw.rect(screen, (0, 0, 0, 200), text_bg, border_radius=6)
-        pygame.draw.rect(screen, (255, 255, 100), text_bg, width=1, border_radius=6)
-        
-        # تأثير توهج للنص
-        text_glow = font.render(level_text, True, (255, 255, 100, 100))
-        for offset in [(1,1), (-1,1), (1,-1), (-1,-1)]:
-            screen.blit(text_glow, (text_rect.x + offset[0], text_rect.y + offset[1]))
-        
-        screen.blit(text_surf, text_rect)
+
+        # 🔥 نص المستوى التالي (الخلفية والإطار والتوهج مرسومة مرة واحدة)
+        label = label_sprite(f"LEVEL {self.level + 1}", 26, (255, 255, 200), (0, 0, 0),
+                             border=(255, 255, 100), glow=(255, 255, 100))
+        screen.blit(label, label.get_rect(center=(dx + ox + self.w//2, dy + oy - 25)))
         
 
 # ---------------- Zombie (نوع واحد فقط مع نظام المستويات) ----------------
@@ -905,6 +554,19 @@ def raycast_clear(a: pygame.Vector2, b: pygame.Vector2, walls: list[pygame.Rect]
             return False
     return True
 
+# 🔥 جدول الرؤية المحسوب مسبقاً للمستوى الحالي (يُضبط عند تحميل المستوى)
+LEVEL_PVS: VisibilitySet | None = None
+
+def has_line_of_sight(a: pygame.Vector2, b: pygame.Vector2, walls: list[pygame.Rect]) -> bool:
+    """
+    خط الرؤية: جدول PVS يرفض الأزواج التي حُجبت كل خطوط العينة بين خليتيهما، والباقي بالاختبار الدقيق.
+    الرفض تقريبي: فتحة ضيقة بين خطوط العينة قد تُرى منها النقطتان (~0.2-0.6% من الرفض)،
+    فيفوت الزومبي أحياناً لاعباً ظاهراً - مقبول مقابل تخطي raycast لمعظم الأزواج المحجوبة.
+    """
+    if LEVEL_PVS is not None and LEVEL_PVS.query(a.x, a.y, b.x, b.y) is False:
+        return False
+    return raycast_clear(a, b, walls)
+
 class Zombie:
     """نوع واحد من الزومبي مع زيادة القوة حسب المستوى."""
     def __init__(self, x: float, y: float, level: int = 1):
@@ -979,7 +641,7 @@ class Zombie:
                 sep_y += dy * inv
 
         center = pygame.Vector2(self.x + self.w/2, self.y + self.h/2)
-        can_see = raycast_clear(center, player_pos, walls)
+        can_see = has_line_of_sight(center, player_pos, walls)
 
         if can_see:
             target = player_pos
@@ -1006,13 +668,16 @@ class Zombie:
 
         self.bob_t += dt * 6.0
 
-    def draw(self, screen: pygame.Surface, cam: Camera):
+    def draw(self, screen: pygame.Surface, cam: Camera, batch: SpriteBatch | None = None):
+        """مع batch تُضاف السبرايتات لطبقتي zombies / zombie_ui بدل الرسم الفوري"""
         dx, dy = cam.apply_xy(self.x, self.y)
+        body = []
+        ui = []
         
         # رسم الزومبي
         if self.sprite:
             off = math.sin(self.bob_t) * 1.5
-            screen.blit(self.sprite, (dx, dy + off))
+            body.append((self.sprite, (dx, dy + off)))
         else:
             # لون يتغير حسب المستوى (أفتح مع زيادة المستوى)
             base_color = (90, 160, 220)
@@ -1026,23 +691,19 @@ class Zombie:
             pygame.draw.rect(screen, color, r, border_radius=6)
             pygame.draw.rect(screen, (30, 30, 30), r, width=2, border_radius=6)
         
-        # رسم شريط الصحة
+        # رسم شريط الصحة (سبرايت مشترك لكل نسبة)
         if self.hp < self.max_hp:
-            bar_width = self.w
-            bar_height = 6
-            health_ratio = self.hp / self.max_hp
+            ui.append((bar_sprite(self.w, 6, self.hp / self.max_hp), (dx, dy - 10)))
             
-            # خلفية الشريط
-            pygame.draw.rect(screen, (50, 50, 50), (dx, dy - 10, bar_width, bar_height))
-            # الشريط الأخضر للصحة
-            pygame.draw.rect(screen, (0, 255, 0), (dx, dy - 10, bar_width * health_ratio, bar_height))
-            
-        # عرض مستوى الزومبي فوقه
-        level_text = f"Lv{self.level}"
-        font = pygame.font.Font(None, 20)
-        text_surf = font.render(level_text, True, (255, 255, 255))
-        text_rect = text_surf.get_rect(center=(dx + self.w//2, dy - 20))
-        screen.blit(text_surf, text_rect)
+        # عرض مستوى الزومبي فوقه (النص مخزن لكل مستوى بدل إنشاء خط كل إطار)
+        text_surf = text_sprite(f"Lv{self.level}", 20, (255, 255, 255))
+        ui.append((text_surf, text_surf.get_rect(center=(dx + self.w//2, dy - 20))))
+        
+        if batch is None:
+            screen.blits(body + ui, doreturn=False)
+        else:
+            batch.layer("zombies").extend(body)
+            batch.layer("zombie_ui").extend(ui)
 
 # ---------------- Blood FX ----------------
 class BloodParticle:
@@ -1070,14 +731,17 @@ class BloodParticle:
     def alive(self) -> bool:
         return self.age < self.life
 
-    def draw(self, screen: pygame.Surface, cam: Camera):
+    def draw(self, screen: pygame.Surface, cam: Camera, batch: SpriteBatch | None = None):
         if not self.alive: return
         alpha = max(0, 255 * (1.0 - self.age / self.life))
-        color = (self.col[0], self.col[1], self.col[2], int(alpha))
-        surf = pygame.Surface((int(self.r*2)+2, int(self.r*2)+2), pygame.SRCALPHA)
-        pygame.draw.circle(surf, color, (surf.get_width()//2, surf.get_height()//2), int(self.r))
+        size = int(self.r*2)+2
+        surf = circle_sprite(size, int(self.r), self.col, alpha)  # 🔥 سبرايت مشترك بدل Surface جديد
         dx, dy = cam.apply_xy(self.x, self.y)
-        screen.blit(surf, (dx - surf.get_width()//2, dy - surf.get_height()//2))
+        dest = (dx - size//2, dy - size//2)
+        if batch is None:
+            screen.blit(surf, dest)
+        else:
+            batch.layer("blood").append((surf, dest))
 
 # ---------------- Levels (difficulty) ----------------
 # ---------------- Levels (difficulty) ----------------
@@ -1218,6 +882,58 @@ class GameOverScene:
         self.bright_overlay = pygame.Surface((self.W, self.H))
         self.bright_overlay.fill((255, 255, 255))
         self.bright_overlay.set_alpha(30)  # 🔥 زيادة شفافية الطبقة المضيئة
+        
+        # 🔥 طبقات ثابتة + تحديث الأجزاء المتغيرة فقط بعد اكتمال التعتيم
+        self._build_layers()
+        self.dirty = DirtyRects((self.W, self.H))
+        self._settled = False
+    
+    def _build_layers(self):
+        """الخلفية (base)، النصوص الثابتة (texts) وعنوان GAME OVER"""
+        W, H = self.W, self.H
+        
+        # 🔥 خلفية أقل ظلمة
+        self.base = pygame.Surface((W, H))
+        self.base.fill((50, 20, 20))
+        if self.bg_image:
+            self.base.blit(self.bg_image, (self.bg_x, self.bg_y))
+            # 🔥 طبقة شبه شفافة فوق الصورة ثم الطبقة المضيئة
+            overlay = pygame.Surface((W, H))
+            overlay.fill((0, 0, 0))
+            overlay.set_alpha(80)
+            self.base.blit(overlay, (0, 0))
+            self.base.blit(self.bright_overlay, (0, 0))
+        else:
+            # خلفية بديلة - جعلها أفتح
+            self.base.fill((60, 30, 30))
+        
+        title_y = H // 3 - 50
+        
+        # 🔥 نص GAME OVER وظله
+        font_large = pygame.font.Font(None, 72)
+        self.title_surf = font_large.render("GAME OVER", True, (255, 50, 50))
+        self.title_rect = self.title_surf.get_rect(center=(W//2, title_y))
+        self.title_shadow = font_large.render("GAME OVER", True, (150, 0, 0))
+        self.title_shadow_rect = self.title_shadow.get_rect(center=(W//2 + 3, title_y + 3))
+        self.title_area = self.title_rect.union(self.title_shadow_rect)
+        
+        # الرسالة الثانوية، الإحصائيات وتعليمات التحكم
+        self.texts = pygame.Surface((W, H), pygame.SRCALPHA)
+        font_medium = pygame.font.Font(None, 32)
+        sub_surf = font_medium.render("The zombies got you...", True, (240, 240, 240))
+        self.texts.blit(sub_surf, sub_surf.get_rect(center=(W//2, title_y + 60)))
+        
+        stats_surf = font_medium.render(f"Score: {self.score}  |  Level: {self.level}", True, (255, 255, 180))
+        stats_rect = stats_surf.get_rect(center=(W//2, title_y + 120))
+        stats_bg = pygame.Rect(stats_rect.x - 15, stats_rect.y - 8, stats_rect.width + 30, stats_rect.height + 16)
+        # الشفافية في اللون لا تؤثر على الشاشة المعتمة: الخلفية سوداء معتمة كما كانت
+        pygame.draw.rect(self.texts, (0, 0, 0), stats_bg, border_radius=10)
+        pygame.draw.rect(self.texts, (150, 150, 150), stats_bg, width=2, border_radius=10)
+        self.texts.blit(stats_surf, stats_rect)
+        
+        controls_text = "Press R to Play Again  |  Press M for Main Menu  |  Press ESC to Quit"
+        controls_surf = pygame.font.Font(None, 20).render(controls_text, True, (200, 200, 200))
+        self.texts.blit(controls_surf, controls_surf.get_rect(center=(W//2, H - 40)))
     
     def _create_blood_particles(self):
         """إنشاء جزيئات دم متناثرة"""
@@ -1240,29 +956,56 @@ class GameOverScene:
             self.fade_surface.set_alpha(min(self.fade_alpha, 120))
     
     def draw(self):
-        """رسم شاشة Game Over"""
+        """
+        رسم شاشة Game Over: أثناء التعتيم تُرسم الشاشة كاملة من الطبقات المخزنة،
+        وبعد اكتماله يُعاد رسم المناطق المتغيرة فقط (الجزيئات، العنوان المتقطع، الأزرار)
+        """
         screen = self.screen
         
-        # 🔥 خلفية أقل ظلمة
-        screen.fill((50, 20, 20))  # 🔥 تغيير من (30, 0, 0) إلى لون أفتح
+        # 🔥 جعل الأزرار أكثر إشراقاً
+        self.play_again_btn.color = (100, 100, 180)  # 🔥 أزرق أفتح
+        self.play_again_btn.hover_color = (120, 120, 210)
+        self.menu_btn.color = (180, 100, 100)  # 🔥 أحمر أفتح
+        self.menu_btn.hover_color = (210, 120, 120)
         
-        # رسم الخلفية
-        if self.bg_image:
-            screen.blit(self.bg_image, (self.bg_x, self.bg_y))
-            
-            # 🔥 طبقة شبه شفافة فوق الصورة - جعلها أخف
-            overlay = pygame.Surface((self.W, self.H))
-            overlay.fill((0, 0, 0))
-            overlay.set_alpha(80)  # 🔥 تقليل من 120 إلى 80
-            screen.blit(overlay, (0, 0))
-            
-            # 🔥 إضافة طبقة مضيئة فوق الصورة
-            screen.blit(self.bright_overlay, (0, 0))
+        settled = self.fade_alpha >= 120
+        if settled and self._settled:
+            # المستطيلات المتغيرة (توهج الأزرار يصل إلى 10 بكسل حول الزر)
+            rects = [self.title_area,
+                     self.play_again_btn.rect.inflate(24, 24),
+                     self.menu_btn.rect.inflate(24, 24)]
+            if not self.bg_image:
+                for particle in self.blood_particles:
+                    size = particle['size']
+                    rects.append(pygame.Rect(particle['x'] - size - 1, particle['y'] - size - 1, size * 2 + 3, size * 2 + 3))
+            for r in rects:
+                screen.blit(self.base, r, r)
+            self._draw_dynamic(screen)
+            for r in rects:
+                screen.blit(self.texts, r, r)
+            self.play_again_btn.draw(screen)
+            self.menu_btn.draw(screen)
+            for r in rects:
+                screen.blit(self.fade_surface, r, r)
+            self.dirty.extend(rects)
         else:
-            # خلفية بديلة - جعلها أفتح
-            screen.fill((60, 30, 30))  # 🔥 لون أفتح من الأحمر الداكن
-            
-            # رسم جزيئات الدم
+            screen.blit(self.base, (0, 0))
+            self._draw_dynamic(screen)
+            screen.blit(self.texts, (0, 0))
+            
+            # رسم الأزرار
+            self.play_again_btn.draw(screen)
+            self.menu_btn.draw(screen)
+            
+            # تأثير التعتيم - جعله أخف
+            if self.fade_alpha > 0:
+                screen.blit(self.fade_surface, (0, 0))
+            self.dirty.full()
+        self._settled = settled
+    
+    def _draw_dynamic(self, screen):
+        """جزيئات الدم (بدون صورة خلفية) ونص GAME OVER المتقطع"""
+        if not self.bg_image:
             for particle in self.blood_particles:
                 alpha = particle['alpha'] + int(50 * math.sin(self.animation_timer * particle['speed']))
                 alpha = max(0, min(255, alpha))
@@ -1270,66 +1013,14 @@ class GameOverScene:
                 pos = (particle['x'], particle['y'])
                 pygame.draw.circle(screen, color, pos, particle['size'])
         
-        # 🔥 رسم نص GAME OVER كبير مع تأثير أكثر إشراقاً
-        title_y = self.H // 3 - 50
-        
         # تأثير النص المتقطع
         if int(self.animation_timer * 3) % 3 != 0:
-            font_large = pygame.font.Font(None, 72)
-            
-            # 🔥 جعل النص أكثر إشراقاً
-            main_color = (255, 50, 50)  # 🔥 أحمر أكثر إشراقاً
-            shadow_color = (150, 0, 0)   # 🔥 ظل أفتح
-            
-            text_surf = font_large.render("GAME OVER", True, main_color)
-            text_rect = text_surf.get_rect(center=(self.W//2, title_y))
-            
-            # تأثير ظل للنص
-            shadow_surf = font_large.render("GAME OVER", True, shadow_color)
-            shadow_rect = shadow_surf.get_rect(center=(self.W//2 + 3, title_y + 3))
-            screen.blit(shadow_surf, shadow_rect)
-            screen.blit(text_surf, text_rect)
-        
-        # رسالة ثانوية - جعلها أكثر وضوحاً
-        font_medium = pygame.font.Font(None, 32)
-        sub_text = "The zombies got you..."
-        sub_surf = font_medium.render(sub_text, True, (240, 240, 240))  # 🔥 لون أبيض نقي
-        sub_rect = sub_surf.get_rect(center=(self.W//2, title_y + 60))
-        screen.blit(sub_surf, sub_rect)
-        
-        # عرض الإحصائيات - جعل الخلفية أقل ظلمة
-        stats_y = title_y + 120
-        stats_text = f"Score: {self.score}  |  Level: {self.level}"
-        stats_surf = font_medium.render(stats_text, True, (255, 255, 180))  # 🔥 لون أكثر إشراقاً
-        
-        stats_rect = stats_surf.get_rect(center=(self.W//2, stats_y))
-        
-        # خلفية للإحصائيات - جعلها أكثر شفافية
-        stats_bg = pygame.Rect(stats_rect.x - 15, stats_rect.y - 8, stats_rect.width + 30, stats_rect.height + 16)
-        pygame.draw.rect(screen, (0, 0, 0, 120), stats_bg, border_radius=10)  # 🔥 تقليل العتامة
-        pygame.draw.rect(screen, (150, 150, 150), stats_bg, width=2, border_radius=10)  # 🔥 حدود أفتح
-        screen.blit(stats_surf, stats_rect)
-        
-        # 🔥 جعل الأزرار أكثر إشراقاً
-        self.play_again_btn.color = (100, 100, 180)  # 🔥 أزرق أفتح
-        self.play_again_btn.hover_color = (120, 120, 210)
-        self.menu_btn.color = (180, 100, 100)  # 🔥 أحمر أفتح
-        self.menu_btn.hover_color = (210, 120, 120)
-        
-        # رسم الأزرار
-        self.play_again_btn.draw(screen)
-        self.menu_btn.draw(screen)
-        
-        # تعليمات التحكم - جعلها أكثر وضوحاً
-        controls_y = self.H - 40
-        controls_text = "Press R to Play Again  |  Press M for Main Menu  |  Press ESC to Quit"
-        controls_surf = pygame.font.Font(None, 20).render(controls_text, True, (200, 200, 200))  # 🔥 لون أفتح
-        controls_rect = controls_surf.get_rect(center=(self.W//2, controls_y))
-        screen.blit(controls_surf, controls_rect)
-        
-        # تأثير التعتيم - جعله أخف
-        if self.fade_alpha > 0:
-            screen.blit(self.fade_surface, (0, 0))
+            screen.blit(self.title_shadow, self.title_shadow_rect)
+            screen.blit(self.title_surf, self.title_rect)
+    
+    def present(self):
+        """عرض الإطار: flip كامل أثناء التعتيم ثم display.update للمناطق المتغيرة فقط"""
+        self.dirty.present()
     
     def handle_event(self, event) -> str | None:
         """معالجة الأحداث والاختيارات"""
@@ -1384,7 +1075,7 @@ def show_game_over_screen(screen: pygame.Surface, clock: pygame.time.Clock, scor
         game_over_scene.update(dt)
         game_over_scene.draw()
         
-        pygame.display.flip()
+        game_over_scene.present()
         clock.tick(FPS)
     
     return "menu"
@@ -1674,80 +1365,22 @@ def show_victory_screen(screen: pygame.Surface, clock: pygame.time.Clock, score:
 def generate_background_effects(level: int, effects_dict: dict, W: int, H: int):
     """
     ينشئ ويخزن المؤثرات البرمجية (نجوم، شقوق، بقع) للخلفية.
-    🔥 يرسمها مسبقاً على سطح واحد كبير لتحقيق أقصى أداء.
+    🔥 خلفية مقسمة لبلاطات تُرسم عند أول ظهور فقط (background.TiledBackground)
     """
     effects_dict.clear() # تنظيف المؤثرات القديمة
-    rng = random.Random(level) # استخدام نفس البذرة لنفس المستوى
-
-    # 1. إنشاء "اللوحة" الكبيرة
-    # استخدم convert() لزيادة سرعة الرسم (blit) لاحقاً
-    bg_surf = pygame.Surface((W, H)).convert() 
-
-    # 2. ملء اللون الأساسي
-    base_col = LEVEL_COLORS.get(level, (166, 98, 42))
-    bg_surf.fill(base_col)
-
-    # 3. رسم المؤثرات الثابتة على "اللوحة"
-    if level == 2: # مدينة - شبكة بلاط
-        tile_size = 80
-        grid_color = (100, 100, 100)
-        for x in range(0, W, tile_size):
-            pygame.draw.line(bg_surf, grid_color, (x, 0), (x, H), 1)
-        for y in range(0, H, tile_size):
-            pygame.draw.line(bg_surf, grid_color, (0, y), (W, y), 1)
-
-    elif level == 3: # غابة
-        for _ in range(400): # 400 بقعة عشب
-            x = rng.randint(0, W)
-            y = rng.randint(0, H)
-            r = rng.randint(15, 45) # نصف قطر
-            col_darken = rng.randint(5, 20)
-            col = (
-                max(0, LEVEL_COLORS[3][0] - col_darken),
-                max(0, LEVEL_COLORS[3][1] - col_darken),
-                max(0, LEVEL_COLORS[3][2] - col_darken)
-            )
-            pygame.draw.circle(bg_surf, col, (x, y), r)
-
-    elif level == 4: # فضاء
-        for _ in range(1000): # 1000 نجمة
-            x = rng.randint(0, W)
-            y = rng.randint(0, H)
-            r = rng.randint(1, 3) # حجم النجمة
-            brightness = rng.randint(150, 255)
-            col = (brightness, brightness, brightness)
-            pygame.draw.circle(bg_surf, col, (x, y), r)
-
-    elif level == 5: # بركان
-        crack_color = (20, 10, 10) # لون الشقوق (أسود مائل للأحمر)
-        for _ in range(150): # 150 شرخ
-            x1 = rng.randint(0, W)
-            y1 = rng.randint(0, H)
-            angle = rng.uniform(0, 2 * math.pi)
-            length = rng.randint(50, 200)
-            x2 = x1 + int(math.cos(angle) * length)
-            y2 = y1 + int(math.sin(angle) * length)
-            width = rng.randint(2, 5)
-            pygame.draw.line(bg_surf, crack_color, (x1, y1), (x2, y2), width)
-
-    # 4. تخزين "اللوحة" الجاهزة
-    effects_dict["pre_rendered_bg"] = bg_surf
+    effects_dict["tiled_bg"] = TiledBackground(level, W, H, LEVEL_COLORS.get(level, (166, 98, 42)))
 
 # 🔥 --- (جديد) --- دالة لرسم الخلفية البرمجية ---
 # 🔥 --- (جديد ومحسن) --- دالة لرسم الخلفية البرمجية ---
 def draw_level_background(screen: pygame.Surface, level: int, cam: Camera, effects_dict: dict):
     """
-    يرسم الخلفية: يستخدم "اللوحة" المرسومة مسبقاً.
+    يرسم الخلفية: البلاطات التي تتقاطع مع الكاميرا فقط.
     """
-    # 1. احصل على "اللوحة" المرسومة مسبقاً
-    bg_surf = effects_dict.get("pre_rendered_bg")
-
-    if bg_surf:
-        # 2. احسب الجزء المرئي فقط من "اللوحة" بناءً على الكاميرا
-        visible_area = pygame.Rect(int(cam.x), int(cam.y), WINDOW_W, WINDOW_H)
+    tiled_bg = effects_dict.get("tiled_bg")
 
-        # 3. ارسم ذلك الجزء فقط على الشاشة (هذا سريع جداً!)
-        screen.blit(bg_surf, (0, 0), area=visible_area)
+    if tiled_bg:
+        # 🔥 البلاطات غير المولدة تُرسم الآن وتُخزن (LRU محدود بالذاكرة)
+        tiled_bg.draw(screen, int(cam.x), int(cam.y), WINDOW_W, WINDOW_H)
     else:
         # (كود احتياطي إذا فشل التحميل)
         current_bg_color = LEVEL_COLORS.get(level, (166, 98, 42)) 
@@ -1758,9 +1391,8 @@ def load_game_over_image():
     global GAME_OVER_IMAGE
     try:
         path = os.path.join("images", "360_F_693042027_th0Yf1aofOwdQdabsMVLRtNieakvmDGr.jpg")
-        if os.path.isfile(path):
-            # تحميل الصورة وتحويلها
-            img = pygame.image.load(path).convert_alpha() # استخدم convert_alpha للصور الشفافة
+        img = load_image(os.path.basename(path))  # 🔥 من كاش assets إن كان محملاً مسبقاً
+        if img:
             
             # 🔥 --- (التعديل هنا) ---
             # استخدمنا WINDOW_W و WINDOW_H بدلاً من SCREEN_W و SCREEN_H
@@ -1776,7 +1408,17 @@ def load_game_over_image():
 # ---------------- Game Loop ----------------
 # ---------------- Game Loop ----------------
 def run_game(screen: pygame.Surface, clock: pygame.time.Clock, version: str = "", *, character: str = "player") -> str | None:
-    global CURRENT_SKIN
+    """حلقة اللعب الفردي؛ الغلاف يضمن تنظيف المحلل والمؤشرات عند أي خروج (return أو استثناء)"""
+    prof = FrameProfiler.from_env("sp")  # 🔥 قياس مراحل الإطار (F3)
+    try:
+        return _run_game(screen, clock, version, character=character, prof=prof)
+    finally:
+        prof.close()
+        MONITOR.set_gauges({})  # 🔥 المؤشرات lambdas تمسك متغيرات الحلقة (المشهد كله) بعد الخروج
+
+
+def _run_game(screen: pygame.Surface, clock: pygame.time.Clock, version: str, *, character: str,
+              prof: FrameProfiler) -> str | None:
     _maybe_music()
     
     # 🔥 --- (جديد) --- تحميل صورة Game Over مرة واحدة ---
@@ -1807,6 +1449,21 @@ def run_game(screen: pygame.Surface, clock: pygame.time.Clock, version: str = ""
     show_hud = True
     show_minimap = True  # 🔥 إظهار الخريطة المصغرة
 
+    # 🔥 HUD محفوظ: كل ويدجت يُعاد رسمه فقط عند تغير قيمته
+    hud_x, hud_y = 16, 14
+    hud = HudLayer()
+    hud.add("kills", Widget((hud_x, hud_y), lambda k, g: shadow_text(f"Kills: {k}/{g}", size=28)))
+    hud.add("level", Widget((hud_x+180, hud_y), lambda n: shadow_text(f"Level: {n}", size=28)))
+    hud.add("score", Widget((hud_x+310, hud_y), lambda n: shadow_text(f"Score: {n}", size=28)))
+    hud.add("door", Widget((hud_x, hud_y + 90),
+                           lambda: shadow_text("DOOR ACTIVE! Find the glowing door!", size=22, color=(255, 255, 0)))).set()
+    hud.add("hearts", Widget((hud_x, hud_y + 34), lambda h, m: hearts(h, m, heart_img)))
+    ability_x, ability_y = WINDOW_W - 180, WINDOW_H - 120  # الجانب الأيمن من الشاشة
+    hud.add("abilities", Widget((ability_x - 10, ability_y - 10), ability_panel))
+    hud.add("dash_bar", Widget((ability_x, ability_y + 42), cooldown_bar))
+    hud.add("shield_bar", Widget((ability_x, ability_y + 77), cooldown_bar))
+    fps_widget = Widget((WINDOW_W-100, 10), lambda n: get_font(18).render(f"{n:02d} FPS", True, (220,220,220)))
+
     # 🔥 === نظام الأسلحة الجديد ===
     weapon_manager = WeaponManager(player_id=1)
     
@@ -1831,11 +1488,12 @@ def run_game(screen: pygame.Surface, clock: pygame.time.Clock, version: str = ""
 
     
     walls = create_walls_for_level(level_no, WORLD_W, WORLD_H, tile=64)
+    wall_grid = SpatialHash.from_rects(walls)  # 🔥 broadphase للجدران (ثابتة طوال المستوى)
 
     p_spawn_x, p_spawn_y = find_free_spawn(walls, WORLD_W, WORLD_H, 36, 36)
     # 🔥 إنشاء اللاعب مع المظهر المختار
-    skin_color = get_skin_color(CURRENT_SKIN)
-    enable_skin = (CURRENT_SKIN != "none")
+    skin_color = get_skin_color(menu.CURRENT_SKIN)
+    enable_skin = (menu.CURRENT_SKIN != "none")
     p = Player(x=p_spawn_x, y=p_spawn_y, speed=base_speed, skin_color=skin_color, sprite_prefix=character, enable_skin=enable_skin)
 
     # كاميرا
@@ -1844,7 +1502,7 @@ def run_game(screen: pygame.Surface, clock: pygame.time.Clock, version: str = ""
 
     # كائنات
     enemies: list[Zombie] = []
-    enemies: list[Zombie] = []
+    ai_sched = AIScheduler(budget_ms=4.0)  # 🔥 جدولة ذكاء الزومبي حسب البعد (LOD)
     # bullets: list[Bullet] = []  <-- REMOVED, usage replaced by weapon_manager.bullets
     pickups: list["Pickup"] = []
     pickups: list["Pickup"] = []
@@ -1865,100 +1523,58 @@ def run_game(screen: pygame.Surface, clock: pygame.time.Clock, version: str = ""
         def draw(self, screen: pygame.Surface, cam: Camera):
             if not self.alive: return
             
-            # 🔥 حركة طفو
+            # 🔥 حركة طفو: إطار مرسوم مسبقاً من شريط النوع (blit واحد بدل ~15 أمر رسم)
             t = pygame.time.get_ticks() / 1000.0
-            bob_offset = math.sin(t * 3) * 4.0
-            
             dx, dy = cam.apply_xy(self.x, self.y)
-            dx = int(dx)
-            dy = int(dy + bob_offset)
-            
-            w, h = 40, 30
-            
-            if self.kind == "medkit":
-                # 🏥 حقيبة إسعافات احترافية
-                case_color = (240, 240, 245)
-                cross_color = (220, 20, 60)
-                handle_color = (60, 60, 60)
-                shadow_color = (180, 180, 190)
-                
-                shadow_width = w + int(math.sin(t*3)*4)
-                pygame.draw.ellipse(screen, (0, 0, 0, 60), (dx + (w-shadow_width)//2, dy + h + 10 - bob_offset, shadow_width, 8))
-                pygame.draw.rect(screen, shadow_color, (dx + 4, dy - 4, w, h), border_radius=6)
-                rect = pygame.Rect(dx, dy, w, h)
-                pygame.draw.rect(screen, case_color, rect, border_radius=6)
-                pygame.draw.rect(screen, (200, 200, 210), rect, width=2, border_radius=6)
-                pygame.draw.rect(screen, handle_color, (dx + w//2 - 6, dy - 8, 12, 8), border_radius=2)
-                pygame.draw.rect(screen, (0,0,0), (dx + w//2 - 4, dy - 6, 8, 4))
-                cw, ch = 8, 20
-                cx, cy = dx + w//2, dy + h//2
-                pygame.draw.rect(screen, cross_color, (cx - cw//2, cy - ch//2, cw, ch), border_radius=2)
-                pygame.draw.rect(screen, cross_color, (cx - ch//2, cy - cw//2, ch, cw), border_radius=2)
-                pygame.draw.ellipse(screen, (255, 255, 255), (dx + 4, dy + 4, 12, 8))
-
-            elif self.kind == "shotgun_ammo" or self.kind == "grenade_ammo":
-                # 📦 صندوق ذخيرة عسكري 3D
-                if self.kind == "shotgun_ammo":
-                    main_color = (180, 40, 40); light_color = (220, 60, 60); dark_color = (120, 30, 30)
-                    icon_color = (255, 200, 50); label = "SHELLS"
-                else:
-                    main_color = (50, 80, 50); light_color = (70, 100, 70); dark_color = (30, 50, 30)
-                    icon_color = (200, 200, 200); label = "NADES"
-
-                shadow_width = w + int(math.sin(t*3)*2)
-                pygame.draw.ellipse(screen, (0, 0, 0, 80), (dx + (w-shadow_width)//2, dy + h + 5 - bob_offset, shadow_width, 8))
-                pygame.draw.rect(screen, dark_color, (dx + 4, dy - 4, w, h), border_radius=4)
-                rect = pygame.Rect(dx, dy, w, h)
-                pygame.draw.rect(screen, main_color, rect, border_radius=4)
-                pygame.draw.rect(screen, light_color, rect, width=2, border_radius=4)
-                corner_len = 8; corner_color = (180, 180, 180)
-                pygame.draw.line(screen, corner_color, (dx, dy), (dx + corner_len, dy), 2)
-                pygame.draw.line(screen, corner_color, (dx, dy), (dx, dy + corner_len), 2)
-                pygame.draw.line(screen, corner_color, (dx + w, dy + h), (dx + w - corner_len, dy + h), 2)
-                pygame.draw.line(screen, corner_color, (dx + w, dy + h), (dx + w, dy + h - corner_len), 2)
-                
-                font = pygame.font.SysFont("arial", 9, bold=True)
-                text_surf = font.render(label, True, icon_color)
-                text_rect = text_surf.get_rect(center=rect.center)
-                pygame.draw.rect(screen, (0, 0, 0, 100), text_rect.inflate(4, 2), border_radius=2)
-                screen.blit(text_surf, text_rect)
-            
-            else:
-                # 📦 صندوق غامض (Mystery Crate)
-                box_color = (100, 80, 60); tape_color = (200, 180, 140)
-                pygame.draw.ellipse(screen, (0, 0, 0, 80), (dx + 2, dy + h + 2, w - 4, 8))
-                rect = pygame.Rect(dx, dy, w, h)
-                pygame.draw.rect(screen, box_color, rect, border_radius=4)
-                pygame.draw.rect(screen, (80, 60, 40), rect, width=2, border_radius=4)
-                pygame.draw.line(screen, tape_color, (dx + w//2, dy), (dx + w//2, dy + h), 4)
-                pygame.draw.line(screen, tape_color, (dx, dy + h//2), (dx + w, dy + h//2), 4)
+            pickup_strip(self.kind).blit(screen, t * 3, (dx, dy))
 
     # مؤقتات
     spawn_t = 0.0
     pk_timer = 0.0
     crate_t = 0.0
 
+    # 🔥 تحضير المستوى التالي في الخلفية (ميزانية ~2ms لكل إطار)
+    prefetch = LevelPrefetcher(
+        WORLD_W, WORLD_H,
+        level_color=lambda lvl: LEVEL_COLORS.get(lvl, (166, 98, 42)),
+        spawn_fn=lambda w: find_free_spawn(w, WORLD_W, WORLD_H, p.w, p.h),
+        door_fn=lambda w, x, y: find_door_location(w, x, y, WORLD_W, WORLD_H),
+        minimap=minimap,
+        view_size=(WINDOW_W, WINDOW_H),
+    )
+
     def reset_level(new_level: int):
-        nonlocal enemies, pickups, kills, walls, spawn_t, pk_timer, crate_t, boost_t, health, damage_cd, level_door
+        nonlocal enemies, pickups, kills, walls, wall_grid, spawn_t, pk_timer, crate_t, boost_t, health, damage_cd, level_door
+        # 🔥 لقطة ذاكرة عند كل انتقال مستوى (قبل التنظيف: المؤشرات تعكس نهاية المستوى السابق)
+        MONITOR.snapshot(f"level {new_level}")
         enemies = []; pickups = []; crates.clear(); blood_fx.clear()
+        ai_sched.reset()
         weapon_manager.bullets.clear(); weapon_manager.explosions.clear()
         kills = 0; spawn_t = 0.0; pk_timer = 0.0; crate_t = 0.0; boost_t = 0.0
         health = hearts_max; damage_cd = 0.0
-        walls[:] = create_walls_for_level(new_level, WORLD_W, WORLD_H, tile=64)
-        px, py = find_free_spawn(walls, WORLD_W, WORLD_H, p.w, p.h)
-        p.x, p.y = px, py
+        # 🔥 بيانات المستوى محضّرة مسبقاً أثناء اللعب (بدون توقف عند الباب)
+        prep = prefetch.take(new_level)
+        walls[:] = prep.walls
+        wall_grid = prep.wall_grid
+        global LEVEL_PVS
+        LEVEL_PVS = prep.pvs
+        p.x, p.y = prep.spawn
         
         # 🔥 إنشاء الباب في موقع عشوائي
-        door_x, door_y = find_door_location(walls, p.x, p.y, WORLD_W, WORLD_H)
-        level_door = LevelDoor(door_x, door_y, new_level)
+        level_door = LevelDoor(prep.door[0], prep.door[1], new_level)
         
         cam.follow(p.rect, lerp=1.0)  # قفز للموضع الجديد
         
-        # 🔥 --- أنشئ مؤثرات الخلفية لهذا المستوى ---
-        generate_background_effects(new_level, BG_EFFECTS, WORLD_W, WORLD_H)
+        # 🔥 مؤثرات الخلفية لهذا المستوى (مرسومة مسبقاً)
+        BG_EFFECTS.clear()
+        BG_EFFECTS["tiled_bg"] = prep.background
         
         # 🔥 تحديث جدران الخريطة المصغرة
-        minimap.set_walls(walls)
+        minimap.set_walls(walls, prep.minimap_walls)
+        
+        # 🔥 بدء تحضير المستوى التالي على دفعات
+        if new_level + 1 in LEVELS:
+            prefetch.start(new_level + 1)
 
     def spawn_enemy():
         params = LEVELS[level_no]
@@ -2057,6 +1673,16 @@ def run_game(screen: pygame.Surface, clock: pygame.time.Clock, version: str = ""
             if not collide_rect_list(cr.rect, walls):
                 crates.append(cr); break
 
+    # 🔥 مؤشرات الذاكرة (تُقرأ مع كل لقطة)
+    MONITOR.set_gauges({
+        "enemies": lambda: len(enemies),
+        "blood_fx": lambda: len(blood_fx),
+        "explosions": lambda: len(weapon_manager.explosions),
+        "bullets": lambda: len(weapon_manager.bullets),
+        "bg_bytes": lambda: surface_bytes(BG_EFFECTS),
+        "prefetch_bytes": lambda: surface_bytes(prefetch.pending.background if prefetch.pending else None),
+    })
+
     # 🔥 تهيئة الباب في المستوى الأول
     reset_level(level_no)
     
@@ -2068,6 +1694,7 @@ def run_game(screen: pygame.Surface, clock: pygame.time.Clock, version: str = ""
 
     running = True
     while running:
+        prof.begin_frame()
 
         # 🔥 --- (جديد) --- منطق شاشة Game Over ---
         # إذا كانت اللعبة "Game Over"، اعرض الشاشة وتوقف عن تحديث اللعبة
@@ -2107,9 +1734,12 @@ def run_game(screen: pygame.Surface, clock: pygame.time.Clock, version: str = ""
         goal_kills = params["goal_kills"]
 
         # -------- Events --------
+        prof.phase("input")
         for e in pygame.event.get():
             if e.type == pygame.QUIT:
                 return None
+            if prof.handle_event(e) or MONITOR.handle_event(e):
+                continue
             if e.type == pygame.KEYDOWN:
                 if e.key == pygame.K_ESCAPE:
                     return "menu"
@@ -2183,6 +1813,7 @@ def run_game(screen: pygame.Surface, clock: pygame.time.Clock, version: str = ""
         if (0 <= new_rect_y.top) and (new_rect_y.bottom <= WORLD_H) and not collide_rect_list(new_rect_y, walls):
             p.y = new_rect_y.y
 
+        prof.phase("update")
         spawn_t += dt
         if spawn_t >= params["spawn_every"] and len(enemies) < params["max_alive"] and kills < goal_kills:
             spawn_t = 0.0
@@ -2204,11 +1835,23 @@ def run_game(screen: pygame.Surface, clock: pygame.time.Clock, version: str = ""
             if len(crates) < 4 and random.random() < 0.5:
                 spawn_crate()
 
+        prof.phase("ai")
         player_center = pygame.Vector2(p.x + p.w/2, p.y + p.h/2)
-        for i, en in enumerate(enemies):
-            nearby = [other for j, other in enumerate(enemies)
-                      if j != i and (abs(other.x - en.x) < 72 and abs(other.y - en.y) < 72)]
-            en.update(player_center, walls, dt, nearby)
+        # 🔥 الجيران من شبكة مكانية بدلاً من مقارنة كل زومبي بالكل
+        neighbor_grid = SpatialHash(128)
+        for en in enemies:
+            neighbor_grid.insert(en, en.rect)
+
+        def _ai_update(en, step_dt):
+            nearby = [other for other, _r in neighbor_grid.query_box(en.x - 72, en.y - 72, en.x + 72, en.y + 72)
+                      if other is not en and abs(other.x - en.x) < 72 and abs(other.y - en.y) < 72]
+            en.update(player_center, walls, step_dt, nearby)
+
+        def _ai_idle(en, idle_dt):
+            en.bob_t += idle_dt * 6.0
+
+        ai_sched.run(enemies, [(player_center.x, player_center.y)], dt,
+                     _ai_update, _ai_idle, view=cam.view_rect())
 
         dead_indices = set()
         # 🔥 === معالجة اصطدام الرصاص (النظام الجديد) ===
@@ -2218,25 +1861,27 @@ def run_game(screen: pygame.Surface, clock: pygame.time.Clock, version: str = ""
         
         # سنقوم بتحديث المدير هنا، ثم نرسمه لاحقاً.
         # (تم إزالة استدعاء update من قسم HUD لتجنب التكرار)
+        prof.phase("weapons")
         explosions = weapon_manager.update(dt)
 
+        # 🔥 شبكة مكانية للزومبي (للانفجارات والرصاص) - تُبنى مرة واحدة كل إطار
+        prof.phase("collisions")
+        zombie_grid = SpatialHash(128)
+        for idx, en in enumerate(enemies):
+            zombie_grid.insert(idx, en.rect)
+
         # معالجة الانفجارات (ضرر الزومبي واللاعب)
         for ex, ey, radius, damage, _owner_id in explosions:
-            # 1. ضرر الزومبي
-            for en in enemies[:]:
-                if en.hp > 0:
-                    dist = math.sqrt((en.x - ex)**2 + (en.y - ey)**2)
-                    if dist < radius:
-                        dmg = int(damage * (1 - dist/radius))
-                        en.hp -= dmg
-                        if en.hp <= 0:
-                            dead_indices.add(enemies.index(en))
-                            # (Logic copied from below to ensure consistency)
-                            kills += 1
-                            total_kills += 1
-                            score += 15 + (en.level * 5)
-                            for _ in range(12):
-                                blood_fx.append(BloodParticle(en.x + en.w/2, en.y + en.h/2))
+            # 1. ضرر الزومبي: فقط من داخل نصف القطر، والجدران تحجب الضرر
+            _hits, killed = resolve_explosion(ex, ey, radius, damage, zombie_grid, enemies, wall_grid)
+            for idx in killed:
+                en = enemies[idx]
+                dead_indices.add(idx)
+                kills += 1
+                total_kills += 1
+                score += 15 + (en.level * 5)
+                for _ in range(game_settings.scale_count(12, "blood_particles")):
+                    blood_fx.append(BloodParticle(en.x + en.w/2, en.y + en.h/2))
             
             # 2. ضرر اللاعب (اختياري، يمكن إضافته هنا)
             p_dist = math.sqrt((p.x + p.w/2 - ex)**2 + (p.y + p.h/2 - ey)**2)
@@ -2247,39 +1892,43 @@ def run_game(screen: pygame.Surface, clock: pygame.time.Clock, version: str = ""
                 cam.trigger_shake(15.0)
 
         # معالجة اصطدام الرصاص المباشر
+        # 🔥 اختبار مستمر (swept): القطعة من الموقع السابق للحالي ضد الجدران والزومبي
+        # حتى لا تقفز الرصاصة فوق زومبي أو جدار رفيع عند انخفاض معدل الإطارات
         for b in weapon_manager.bullets:
             if not b.alive: continue
+            x0, y0, x1, y1 = b.prev_x, b.prev_y, b.x, b.y
             
             # 1. اصطدام بالجدران
-            b_rect = pygame.Rect(int(b.x)-3, int(b.y)-3, 6, 6)
-            if collide_rect_list(b_rect, walls):
+            t_wall, _ = sweep_first_hit(x0, y0, x1, y1, wall_grid, pad=3)
+            
+            # 2. اصطدام بالأعداء (القنابل لا تنفجر باللمس، تنفجر بالوقت)
+            t_hit, idx = (None, None)
+            if not b.is_grenade:
+                t_hit, idx = sweep_first_hit(x0, y0, x1, y1, zombie_grid,
+                                             accept=lambda i: i not in dead_indices)
+            
+            if t_wall is not None and (t_hit is None or t_wall <= t_hit):
                 b.alive = False
                 continue
                 
-            # 2. اصطدام بالأعداء
-            for idx, en in enumerate(enemies):
-                if en.rect.collidepoint(int(b.x), int(b.y)):
-                    # إذا كانت قنبلة، لا تنفجر باللمس (أو يمكن جعلها تنفجر)
-                    # حالياً القنابل تنفجر بالوقت.
-                    if b.is_grenade:
-                        continue # القنبلة ترتد أو تمر (أو يمكن تفعيلها)
-                        
-                    en.hp -= b.damage
-                    b.alive = False
-                    if snd_hit: snd_hit.play()
-                    if en.hp <= 0:
-                        dead_indices.add(idx)
-                        kills += 1
-                        total_kills += 1
-                        score += 10 + (en.level * 5)
-                        ex, ey = en.x + en.w/2, en.y + en.h/2
-                        for _ in range(16):
-                            blood_fx.append(BloodParticle(ex, ey))
-                    break
+            if t_hit is not None:
+                en = enemies[idx]
+                en.hp -= b.damage
+                b.alive = False
+                if snd_hit: snd_hit.play()
+                if en.hp <= 0:
+                    dead_indices.add(idx)
+                    kills += 1
+                    total_kills += 1
+                    score += 10 + (en.level * 5)
+                    ex, ey = en.x + en.w/2, en.y + en.h/2
+                    for _ in range(game_settings.scale_count(16, "blood_particles")):
+                        blood_fx.append(BloodParticle(ex, ey))
         if dead_indices:
             enemies = [en for i, en in enumerate(enemies) if i not in dead_indices]
 
         # 🔥 تفعيل الباب عندما يقتل اللاعب عدد كافي من الزومبي
+        prof.phase("gameplay")
         if level_door and not level_door.active and kills >= goal_kills:
             level_door.activate()
             if snd_door: snd_door.play()
@@ -2394,9 +2043,11 @@ def run_game(screen: pygame.Surface, clock: pygame.time.Clock, version: str = ""
         # 🔥 --- (تنظيف) --- تم إزالة كود الرسم القديم المكرر ---
 
         # 🔥 --- (جديد) --- رسم الخلفية البرمجية المذهلة ---
+        prof.phase("background")
         draw_level_background(screen, level_no, cam, BG_EFFECTS)
 
         # 🔥 --- (مُعدل) --- رسم الجدران بالألوان الديناميكية ---
+        prof.phase("entities")
         
         # احصل على أسلوب الألوان الصحيح لهذا المستوى
         wall_style = LEVEL_WALL_STYLES.get(level_no, DEFAULT_WALL_STYLE)
@@ -2404,13 +2055,12 @@ def run_game(screen: pygame.Surface, clock: pygame.time.Clock, version: str = ""
         edge_col = wall_style["edge"]
         inner_col = wall_style["inner"]
 
-        for r in walls:
+        # 🔥 تمرير الرؤية: الجدران من الشبكة المكانية، والكيانات مقابل مستطيل الكاميرا
+        CULL.begin(cam)
+        BATCH.begin_frame()
+        for r in CULL.walls(wall_grid, walls):
             sr = cam.apply_rect(r)
             
-            # تحسين: لا ترسم الجدران البعيدة عن الشاشة
-            if not sr.colliderect(screen.get_rect()):
-                continue
-            
             # ارسم الجدار بالألوان الصحيحة
             pygame.draw.rect(screen, fill_col, sr, border_radius=8)
             pygame.draw.rect(screen, edge_col, sr, width=2, border_radius=8)
@@ -2419,13 +2069,15 @@ def run_game(screen: pygame.Surface, clock: pygame.time.Clock, version: str = ""
                 pygame.draw.rect(screen, inner_col, inner, width=1, border_radius=6)
 
        
-        for pfx in blood_fx:
-            pfx.draw(screen, cam)
+        for pfx in CULL.items("blood", blood_fx, 8, 8):
+            pfx.draw(screen, cam, BATCH)
+        BATCH.flush(screen, "blood")
 
        
-        for pk in pickups: pk.draw(screen, cam)
-        for cr in crates:  cr.draw(screen, cam)
-        for en in enemies: en.draw(screen, cam)
+        for pk in CULL.items("pickups", pickups, 48, 48): pk.draw(screen, cam)
+        for cr in CULL.items("crates", crates, CRATE_H * 2, CRATE_H):  cr.draw(screen, cam)
+        for en in CULL.items("zombies", enemies, ZOMBIE_SIZE, ZOMBIE_SIZE): en.draw(screen, cam, BATCH)
+        BATCH.flush(screen, "zombies", "zombie_ui")
         
         # 🔥 رسم الباب
         if level_door:
@@ -2471,107 +2123,55 @@ def run_game(screen: pygame.Surface, clock: pygame.time.Clock, version: str = ""
         
         # 🔥 === رسم تأثيرات الكوماندوز ===
         if p.sprite_prefix == "commando":
+            glow_layers = game_settings.quality("glow_layers")  # 🔥 حسب جودة الرسوميات (1-4)
             player_screen_x, player_screen_y = cam.apply_xy(p.x, p.y)
             player_center_x = int(player_screen_x + p.w // 2)
             player_center_y = int(player_screen_y + p.h // 2)
             
-            # رسم الدرع إذا كان نشطاً
+            # رسم الدرع إذا كان نشطاً (إطار من دورة النبض المرسومة مسبقاً)
             if p.shield_active:
                 shield_radius = max(p.w, p.h) // 2 + 15
-                
-                # تأثير نبض الدرع
-                pulse = 0.85 + 0.15 * math.sin(p.shield_timer * 8)
-                alpha = int(120 * pulse)
-                
-                # رسم الدرع (دائرة شفافة زرقاء متوهجة)
-                shield_surf = pygame.Surface((shield_radius * 2 + 20, shield_radius * 2 + 20), pygame.SRCALPHA)
-                # طبقة خارجية متوهجة
-                pygame.draw.circle(shield_surf, (50, 150, 255, alpha // 2),
-                                 (shield_radius + 10, shield_radius + 10), int(shield_radius * pulse) + 8)
-                # الدرع الرئيسي
-                pygame.draw.circle(shield_surf, (50, 150, 255, alpha),
-                                 (shield_radius + 10, shield_radius + 10), int(shield_radius * pulse))
-                # حدود الدرع
-                pygame.draw.circle(shield_surf, (150, 220, 255, min(255, alpha + 80)),
-                                 (shield_radius + 10, shield_radius + 10), int(shield_radius * pulse), 3)
-                # خط داخلي
-                pygame.draw.circle(shield_surf, (200, 240, 255, alpha // 2),
-                                 (shield_radius + 10, shield_radius + 10), int(shield_radius * pulse * 0.7), 2)
-                screen.blit(shield_surf, (player_center_x - shield_radius - 10, player_center_y - shield_radius - 10))
+                _shield_strip(shield_radius, glow_layers).blit(
+                    screen, p.shield_timer * 8, (player_center_x, player_center_y))
             
             # رسم تأثير الاندفاع
             if p.is_dashing:
                 dash_dx, dash_dy = p.dash_direction
                 trail_length = 50
                 
-                # رسم ذيل متلاشي خلف الشخصية
-                for i in range(8):
-                    alpha = int(200 * (1 - i / 8))
+                # رسم ذيل متلاشي خلف الشخصية (نقاط مخزنة لكل حجم/شفافية)
+                for i in range(max(1, round(8 * glow_layers / 4))):
                     size = 12 - i
                     trail_x = int(player_center_x - dash_dx * trail_length * (i + 1) / 8)
                     trail_y = int(player_center_y - dash_dy * trail_length * (i + 1) / 8)
-                    
-                    trail_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                    # لون ذهبي/برتقالي متوهج
-                    pygame.draw.circle(trail_surf, (255, 200, 50, alpha), (size, size), size)
-                    pygame.draw.circle(trail_surf, (255, 150, 0, alpha // 2), (size, size), size + 3)
-                    screen.blit(trail_surf, (trail_x - size, trail_y - size))
+                    screen.blit(_dash_puff(i), (trail_x - size, trail_y - size))
                 
                 # وميض حول اللاعب أثناء الاندفاع
-                glow_surf = pygame.Surface((p.w + 30, p.h + 30), pygame.SRCALPHA)
-                pygame.draw.ellipse(glow_surf, (255, 200, 50, 100), (0, 0, p.w + 30, p.h + 30))
-                screen.blit(glow_surf, (player_screen_x - 15, player_screen_y - 15))
+                if glow_layers >= 2:
+                    screen.blit(_dash_glow(p.w, p.h), (player_screen_x - 15, player_screen_y - 15))
 
         # HUD
+        prof.phase("hud")
         if show_hud:
-            hud_x, hud_y = 16, 14
-            draw_shadow_text(screen, f"Kills: {kills}/{goal_kills}", (hud_x, hud_y), size=28, color=(0,0,0))
-            draw_shadow_text(screen, f"Level: {level_no}", (hud_x+180, hud_y), size=28, color=(0,0,0))
-            draw_shadow_text(screen, f"Score: {score}", (hud_x+310, hud_y), size=28, color=(0,0,0))
-            
+            hud["kills"].set(kills, goal_kills)
+            hud["level"].set(level_no)
+            hud["score"].set(score)
             # 🔥 رسالة الباب
-            if level_door and level_door.active:
-                draw_shadow_text(screen, "DOOR ACTIVE! Find the glowing door!", (hud_x, hud_y + 90), size=22, color=(255, 255, 0))
-            
-            # Hearts
-            hx = hud_x; hy = hud_y + 34
-            for i in range(hearts_max):
-                if heart_img:
-                    img = heart_img.copy()
-                    if i >= health:
-                        img.fill((255,255,255,120), special_flags=pygame.BLEND_RGBA_MULT)
-                    screen.blit(img, (hx + i*(img.get_width()+6), hy))
-                else:
-                    r = pygame.Rect(hx + i*28, hy, 22, 22)
-                    col = (230,60,60) if i < health else (120,60,60)
-                    pygame.draw.rect(screen, col, r, border_radius=5)
-                    pygame.draw.rect(screen, (30,30,30), r, width=1, border_radius=5)
-            
-            # 🔥 === واجهة الأسلحة الجديدة ===
-            weapon_manager.draw_hud(screen, 16, WINDOW_H - 80)
-            
+            hud["door"].visible = bool(level_door and level_door.active)
+            hud["hearts"].set(health, hearts_max)
+
             # 🔥 === واجهة قدرات الكوماندوز ===
-            if p.sprite_prefix == "commando":
+            is_commando = p.sprite_prefix == "commando"
+            for name in ("abilities", "dash_bar", "shield_bar"):
+                hud[name].visible = is_commando
+            if is_commando:
                 ability_status = p.get_ability_status()
-                ability_x = WINDOW_W - 180  # الجانب الأيمن من الشاشة
-                ability_y = WINDOW_H - 120
-                
-                # خلفية شبه شفافة للقدرات
-                ability_bg = pygame.Surface((170, 110), pygame.SRCALPHA)
-                ability_bg.fill((0, 0, 0, 150))
-                pygame.draw.rect(ability_bg, (255, 200, 0), (0, 0, 170, 110), width=2, border_radius=8)
-                screen.blit(ability_bg, (ability_x - 10, ability_y - 10))
-                
-                # عنوان
-                draw_shadow_text(screen, "⚡ ABILITIES", (ability_x, ability_y - 5), size=16, color=(255, 200, 0))
-                
+                bar_width = 140
+
                 # === قدرة الاندفاع (Dash) ===
-                dash_y = ability_y + 20
                 dash_ready = ability_status.get("dash_ready", False)
                 dash_cd = ability_status.get("dash_cooldown", 0)
                 is_dashing = ability_status.get("is_dashing", False)
-                
-                # لون الحالة
                 if is_dashing:
                     dash_color = (255, 200, 50)  # أصفر ذهبي أثناء الاندفاع
                     dash_text = "DASHING!"
@@ -2581,34 +2181,15 @@ def run_game(screen: pygame.Surface, clock: pygame.time.Clock, version: str = ""
                 else:
                     dash_color = (150, 150, 150)  # رمادي = انتظار
                     dash_text = f"Wait {dash_cd:.1f}s"
-                
-                # رسم أيقونة الاندفاع (سهم)
-                pygame.draw.polygon(screen, dash_color, [
-                    (ability_x, dash_y + 10),
-                    (ability_x + 15, dash_y + 5),
-                    (ability_x + 15, dash_y + 15)
-                ])
-                draw_shadow_text(screen, f"DASH: {dash_text}", (ability_x + 22, dash_y), size=14, color=dash_color)
-                
-                # شريط cooldown للاندفاع
-                bar_width = 140
-                bar_height = 6
-                bar_x = ability_x
-                bar_y = dash_y + 22
-                pygame.draw.rect(screen, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height), border_radius=3)
                 if dash_ready or is_dashing:
-                    pygame.draw.rect(screen, dash_color, (bar_x, bar_y, bar_width, bar_height), border_radius=3)
+                    dash_fill = bar_width
                 else:
-                    fill_ratio = 1 - (dash_cd / 2.5)  # 2.5 ثواني cooldown
-                    pygame.draw.rect(screen, dash_color, (bar_x, bar_y, int(bar_width * fill_ratio), bar_height), border_radius=3)
-                
+                    dash_fill = int(bar_width * (1 - dash_cd / 2.5))  # 2.5 ثواني cooldown
+
                 # === قدرة الدرع (Shield) ===
-                shield_y = ability_y + 55
                 shield_ready = ability_status.get("shield_ready", False)
                 shield_cd = ability_status.get("shield_cooldown", 0)
                 shield_active = ability_status.get("shield_active", False)
-                
-                # لون الحالة
                 if shield_active:
                     shield_color = (50, 150, 255)  # أزرق ساطع = نشط
                     shield_text = "ACTIVE!"
@@ -2618,25 +2199,23 @@ def run_game(screen: pygame.Surface, clock: pygame.time.Clock, version: str = ""
                 else:
                     shield_color = (150, 150, 150)  # رمادي = انتظار
                     shield_text = f"Wait {shield_cd:.1f}s"
-                
-                # رسم أيقونة الدرع (دائرة)
-                pygame.draw.circle(screen, shield_color, (ability_x + 8, shield_y + 8), 8, width=2)
-                draw_shadow_text(screen, f"SHIELD: {shield_text}", (ability_x + 22, shield_y), size=14, color=shield_color)
-                
-                # شريط cooldown للدرع
-                bar_y = shield_y + 22
-                pygame.draw.rect(screen, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height), border_radius=3)
                 if shield_ready:
-                    pygame.draw.rect(screen, shield_color, (bar_x, bar_y, bar_width, bar_height), border_radius=3)
+                    shield_fill = bar_width
                 elif shield_active:
-                    # شريط المدة المتبقية
-                    shield_timer = p.shield_timer
-                    remaining_ratio = 1 - (shield_timer / 2.0)  # 2 ثواني مدة
-                    pygame.draw.rect(screen, shield_color, (bar_x, bar_y, int(bar_width * remaining_ratio), bar_height), border_radius=3)
+                    shield_fill = int(bar_width * (1 - p.shield_timer / 2.0))  # المدة المتبقية (2 ثانية)
                 else:
-                    fill_ratio = 1 - (shield_cd / 10.0)  # 10 ثواني cooldown
-                    pygame.draw.rect(screen, shield_color, (bar_x, bar_y, int(bar_width * fill_ratio), bar_height), border_radius=3)
-            
+                    shield_fill = int(bar_width * (1 - shield_cd / 10.0))  # 10 ثواني cooldown
+
+                # الويدجتات تتعلّم متسخة فقط عند تغير النص أو بكسل من الشريط
+                hud["abilities"].set(dash_text, dash_color, shield_text, shield_color)
+                hud["dash_bar"].set(dash_fill, dash_color)
+                hud["shield_bar"].set(shield_fill, shield_color)
+
+            hud.draw(screen)
+
+            # 🔥 === واجهة الأسلحة الجديدة ===
+            weapon_manager.draw_hud(screen, 16, WINDOW_H - 80)
+
             # 🔥 تحديث نظام الأسلحة (تم نقله للأعلى)
             # explosions = weapon_manager.update(dt) <--- MOVED UP
             # (تمت معالجة الانفجارات في حلقة التحديث الرئيسية)
@@ -2646,26 +2225,37 @@ def run_game(screen: pygame.Surface, clock: pygame.time.Clock, version: str = ""
             weapon_manager.draw_explosions(screen, (int(cam.x), int(cam.y)))
             
             # FPS
-            draw_text(screen, f"{int(clock.get_fps()):02d} FPS", (WINDOW_W-100, 10), size=18, color=(220,220,220))
+            fps_widget.set(int(clock.get_fps()))
+            fps_widget.draw(screen)
+            if RENDER_SCALE.scale < 1.0:
+                draw_text(screen, RENDER_SCALE.label(), (WINDOW_W-300, 10), size=14, color=(170,170,170))
+            if prof.visible:  # سطر تشخيص LOD مع طبقة F3 فقط
+                draw_text(screen, ai_sched.stats_text(), (WINDOW_W-300, 30), size=14, color=(170,170,170))
             
             # 🔥 === الخريطة المصغرة ===
             if show_minimap:
-                # تحويل الزومبي لقاموس للخريطة
-                zombies_dict = {i: en for i, en in enumerate(enemies) if en.hp > 0}
+                # الخريطة تتجاهل الزومبي الميتين (بدون بناء قاموس كل إطار)
                 minimap.draw(
                     screen,
                     (p.x, p.y),
                     {},  # لا يوجد لاعبون آخرون في وضع اللاعب الفردي
-                    zombies_dict,
+                    enemies,
                     level_door,
                     walls
                 )
             
             if level_door:
                 level_door.draw_navigation(screen, p.x, p.y)
+        prof.draw(screen)
         
+        prof.phase("flip")
         pygame.display.flip()
+        prof.phase("prefetch")
+        prefetch.step()
+        prof.phase("idle")
         clock.tick(FPS)
+        RENDER_SCALE.update(clock.get_rawtime())  # 🔥 دقة المؤثرات حسب زمن العمل الفعلي
+        prof.end_frame()
 
 # (باقي الملف: _draw_center_panel, _wait_enter_or_quit, etc.)
 # ---------------- Victory Scene ----------------
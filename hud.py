@@ -0,0 +1,128 @@
+# hud.py - Retained-mode HUD widgets for Zombie Shooter
+"""
+واجهة HUD محفوظة (retained) بدل إعادة رسم كل النصوص والأشكال كل إطار:
+- Widget: سطح مخزن + حالة؛ widget.set(...) يعلّمه متسخاً فقط إذا تغيرت القيم
+  (القتلى، النقاط، المستوى، الصحة، الذخيرة، التبريد...) ويُعاد رسمه عند الرسم التالي
+- HudLayer: شجرة الويدجتات بترتيب الرسم؛ layer.draw(screen) = blit واحد لكل ويدجت ظاهر
+- layer.renders: عدد الويدجتات التي أُعيد رسمها في الإطار الأخير (0 في الإطارات الهادئة)
+- دوال رسم جاهزة: shadow_text (نفس draw_shadow_text)، hearts، ability_panel، cooldown_bar
+"""
+
+from typing import Callable, Dict, Optional, Tuple
+
+import pygame
+
+from fonts import get_font
+
+_UNSET = object()
+
+
+class Widget:
+    """سطح HUD يُعاد رسمه فقط عند تغير حالته"""
+
+    def __init__(self, pos: Tuple[int, int], render: Callable[..., pygame.Surface]):
+        self.pos = pos
+        self.render = render
+        self.visible = True
+        self.surface: Optional[pygame.Surface] = None
+        self._state = _UNSET
+        self.dirty = True
+
+    def set(self, *state):
+        if state != self._state:
+            self._state = state
+            self.dirty = True
+
+    def draw(self, screen: pygame.Surface) -> bool:
+        """يرجع True إذا أعيد رسم السطح"""
+        rebuilt = False
+        if self.dirty and self._state is not _UNSET:
+            self.surface = self.render(*self._state)
+            self.dirty = False
+            rebuilt = True
+        if self.surface is not None:
+            screen.blit(self.surface, self.pos)
+        return rebuilt
+
+
+class HudLayer:
+    """ويدجتات بالاسم وبترتيب الإضافة"""
+
+    def __init__(self):
+        self.widgets: Dict[str, Widget] = {}
+        self.renders = 0
+
+    def add(self, name: str, widget: Widget) -> Widget:
+        self.widgets[name] = widget
+        return widget
+
+    def __getitem__(self, name: str) -> Widget:
+        return self.widgets[name]
+
+    def draw(self, screen: pygame.Surface):
+        renders = 0
+        for widget in self.widgets.values():
+            if widget.visible and widget.draw(screen):
+                renders += 1
+        self.renders = renders
+
+
+# ---------- دوال رسم الويدجتات ----------
+def shadow_text(text: str, size: int = 32, color=(0, 0, 0), shadow=(235, 235, 235),
+                offset: int = 2, bold: bool = True) -> pygame.Surface:
+    """مثل util.draw_shadow_text لكن إلى سطح شفاف (يُرسم مرة واحدة لكل قيمة)"""
+    font = get_font(size, bold=bold)
+    srf_sh = font.render(text, True, shadow)
+    srf = font.render(text, True, color)
+    surf = pygame.Surface((srf.get_width() + offset, srf.get_height() + offset), pygame.SRCALPHA)
+    surf.blit(srf_sh, (offset, offset))
+    surf.blit(srf, (0, 0))
+    return surf
+
+
+def hearts(health: int, hearts_max: int, heart_img: Optional[pygame.Surface]) -> pygame.Surface:
+    """صف القلوب: المفقودة باهتة (صورة) أو داكنة (مربعات بديلة)"""
+    if heart_img:
+        step = heart_img.get_width() + 6
+        surf = pygame.Surface((max(1, step * hearts_max), heart_img.get_height()), pygame.SRCALPHA)
+        faded = heart_img.copy()
+        faded.fill((255, 255, 255, 120), special_flags=pygame.BLEND_RGBA_MULT)
+        for i in range(hearts_max):
+            surf.blit(heart_img if i < health else faded, (i * step, 0))
+        return surf
+    surf = pygame.Surface((max(1, 28 * hearts_max), 22), pygame.SRCALPHA)
+    for i in range(hearts_max):
+        r = pygame.Rect(i * 28, 0, 22, 22)
+        col = (230, 60, 60) if i < health else (120, 60, 60)
+        pygame.draw.rect(surf, col, r, border_radius=5)
+        pygame.draw.rect(surf, (30, 30, 30), r, width=1, border_radius=5)
+    return surf
+
+
+def ability_panel(dash_text: str, dash_color, shield_text: str, shield_color) -> pygame.Surface:
+    """لوحة قدرات الكوماندوز (الخلفية، العنوان، الأيقونات، الحالات) بدون أشرطة التبريد"""
+    title = shadow_text("⚡ ABILITIES", size=16, color=(255, 200, 0))
+    dash = shadow_text(f"DASH: {dash_text}", size=14, color=dash_color)
+    shield = shadow_text(f"SHIELD: {shield_text}", size=14, color=shield_color)
+    # النص الطويل يتجاوز حافة الخلفية كما كان يُرسم على الشاشة مباشرة
+    width = max(170, 32 + dash.get_width(), 32 + shield.get_width())
+    surf = pygame.Surface((width, 110), pygame.SRCALPHA)
+    surf.fill((0, 0, 0, 150), (0, 0, 170, 110))
+    pygame.draw.rect(surf, (255, 200, 0), (0, 0, 170, 110), width=2, border_radius=8)
+    surf.blit(title, (10, 5))
+    # الاندفاع: سهم + الحالة
+    pygame.draw.polygon(surf, dash_color, [(10, 40), (25, 35), (25, 45)])
+    surf.blit(dash, (32, 30))
+    # الدرع: دائرة + الحالة
+    pygame.draw.circle(surf, shield_color, (18, 73), 8, width=2)
+    surf.blit(shield, (32, 65))
+    return surf
+
+
+def cooldown_bar(fill: int, color, width: int = 140, height: int = 6) -> pygame.Surface:
+    """شريط تبريد بحواف مستديرة (fill بالبكسل)"""
+    surf = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(surf, (50, 50, 50), (0, 0, width, height), border_radius=3)
+    if fill > 0:
+        pygame.draw.rect(surf, color, (0, 0, min(width, fill), height), border_radius=3)
+    return surf
@@ -0,0 +1,155 @@
+# level_prep.py - Incremental next-level preparation for Zombie Shooter
+"""
+تحضير المستوى التالي أثناء لعب المستوى الحالي:
+- كل البيانات الثابتة للمستوى (الجدران، الشبكة المكانية، PVS، الخلفية،
+  طبقة جدران الخريطة المصغرة، موقع البداية والباب) تُبنى كمولّد خطوات صغيرة
+- prefetch.step() كل إطار ضمن ميزانية زمنية (ms) على الخيط الرئيسي
+- prefetch.take(level) عند الباب: يرجع البيانات الجاهزة (أو يكمل الباقي فوراً)
+- الخلفية: TiledBackground (background.py) مع توليد بلاطات منطقة البداية مسبقاً
+مشترك بين اللعب الفردي والجماعي.
+"""
+
+import time
+from typing import Callable, Generator, List, Optional, Tuple
+
+import pygame
+
+from walls import create_walls_for_level
+from collision import SpatialHash
+from visibility import VisibilitySet
+from background import TiledBackground
+
+
+def run_steps(gen: Generator):
+    """تشغيل مولّد خطوات حتى النهاية وإرجاع قيمته النهائية"""
+    while True:
+        try:
+            next(gen)
+        except StopIteration as stop:
+            return stop.value
+
+
+class PreparedLevel:
+    """كل ما يحتاجه الانتقال لمستوى جديد، جاهز للتبديل"""
+
+    def __init__(self, level: int):
+        self.level = level
+        self.walls: List[pygame.Rect] = []
+        self.wall_grid: Optional[SpatialHash] = None
+        self.pvs: Optional[VisibilitySet] = None
+        self.background: Optional[TiledBackground] = None
+        self.minimap_walls: Optional[pygame.Surface] = None
+        self.spawn: Optional[Tuple[float, float]] = None
+        self.door: Optional[Tuple[float, float]] = None
+
+
+class LevelPrefetcher:
+    """
+    يبني PreparedLevel للمستوى التالي على دفعات أثناء اللعب.
+    - level_color(level): لون أرضية المستوى
+    - spawn_fn(walls) -> (x, y): موقع بداية اللاعب
+    - door_fn(walls, x, y) -> (x, y): موقع الباب (اختياري)
+    - minimap: لرسم طبقة الجدران مسبقاً (اختياري)
+    - view_size: حجم الكاميرا لتوليد بلاطات الخلفية حول نقطة البداية
+    """
+
+    def __init__(self, world_w: int, world_h: int, level_color: Callable[[int], Tuple[int, int, int]],
+                 spawn_fn: Callable, door_fn: Optional[Callable] = None, minimap=None,
+                 budget_ms: float = 2.0, tile: int = 64, view_size: Tuple[int, int] = (1280, 720)):
+        self.world_w = world_w
+        self.world_h = world_h
+        self.level_color = level_color
+        self.spawn_fn = spawn_fn
+        self.door_fn = door_fn
+        self.minimap = minimap
+        self.budget_ms = float(budget_ms)
+        self.tile = tile
+        self.view_w, self.view_h = view_size
+        self.current: Optional[PreparedLevel] = None   # المستوى المعروض الآن (لإعادة المحاولة)
+        self.pending: Optional[PreparedLevel] = None   # المستوى قيد التحضير
+        self._steps: Optional[Generator] = None
+        self.steps_done = 0
+        # إحصائيات آخر انتقال
+        self.last_take_ms = 0.0
+        self.last_take_hit = False
+
+    # ---------- البناء ----------
+    def _place(self, prep: PreparedLevel):
+        prep.spawn = self.spawn_fn(prep.walls)
+        if self.door_fn is not None:
+            prep.door = self.door_fn(prep.walls, prep.spawn[0], prep.spawn[1])
+
+    def _build(self, prep: PreparedLevel) -> Generator:
+        W, H = self.world_w, self.world_h
+        prep.walls = create_walls_for_level(prep.level, W, H, tile=self.tile)
+        yield
+        prep.wall_grid = SpatialHash.from_rects(prep.walls)
+        yield
+        prep.pvs = yield from VisibilitySet.for_level_steps(prep.level, prep.walls, W, H)
+        yield
+        if self.minimap is not None:
+            prep.minimap_walls = self.minimap.render_walls_surface(prep.walls)
+            yield
+        self._place(prep)
+        yield
+        prep.background = TiledBackground(prep.level, W, H, self.level_color(prep.level))
+        yield
+        # 🔥 البلاطات التي ستظهر أول إطار (الكاميرا متمركزة على اللاعب ومحصورة في العالم)
+        vx = max(0, min(W - self.view_w, int(prep.spawn[0]) - self.view_w // 2))
+        vy = max(0, min(H - self.view_h, int(prep.spawn[1]) - self.view_h // 2))
+        yield from prep.background.warm_steps(vx, vy, self.view_w, self.view_h)
+
+    def start(self, level: int):
+        """بدء تحضير مستوى (يلغي أي تحضير سابق لمستوى آخر)"""
+        if self.pending is not None and self.pending.level == level:
+            return
+        self.pending = PreparedLevel(level)
+        self._steps = self._build(self.pending)
+        self.steps_done = 0
+
+    def cancel(self):
+        self.pending = None
+        self._steps = None
+
+    @property
+    def ready(self) -> bool:
+        return self.pending is not None and self._steps is None
+
+    def step(self, budget_ms: Optional[float] = None) -> bool:
+        """تنفيذ خطوات ضمن الميزانية؛ True عندما يكون المستوى جاهزاً"""
+        if self._steps is None:
+            return self.pending is not None
+        deadline = time.perf_counter() + (self.budget_ms if budget_ms is None else budget_ms) / 1000.0
+        while True:
+            try:
+                next(self._steps)
+            except StopIteration:
+                self._steps = None
+                return True
+            self.steps_done += 1
+            if time.perf_counter() >= deadline:
+                return False
+
+    # ---------- التبديل ----------
+    def take(self, level: int) -> PreparedLevel:
+        """بيانات المستوى: المحضّر مسبقاً، أو الحالي (إعادة)، أو بناء فوري"""
+        start = time.perf_counter()
+        self.last_take_hit = True
+        if self.pending is not None and self.pending.level == level:
+            if self._steps is not None:
+                run_steps(self._steps)   # إكمال ما تبقى (إذا وصل اللاعب للباب بسرعة)
+                self._steps = None
+                self.last_take_hit = False
+            prep = self.pending
+            self.pending = None
+        elif self.current is not None and self.current.level == level:
+            # 🔥 إعادة نفس المستوى (Game Over / Restart): البيانات الثابتة لم تتغير
+            prep = self.current
+            self._place(prep)
+        else:
+            self.last_take_hit = False
+            prep = PreparedLevel(level)
+            run_steps(self._build(prep))
+        self.current = prep
+        self.last_take_ms = (time.perf_counter() - start) * 1000.0
+        return prep
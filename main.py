@@ -1,4 +1,5 @@
 # main.py - COMPLETE VERSION WITH HAMACHI SUPPORT
+import startup  # 🔥 أول استيراد: بداية قياس زمن البدء
 import pygame
 import sys
 import os
@@ -6,21 +7,28 @@ import socket
 import subprocess
 import re
 
+startup.mark("pygame imported")
+
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from game import main_menu, run_game
-from multiplayer_game import run_multiplayer_game
-from network import NetworkManager
+# 🔥 مسار القائمة فقط قبل أول إطار؛ اللعب الفردي/الجماعي/الشبكة/المتصدرين تُحمّل عند أول استخدام
+from menu import main_menu
 from skins import draw_skin_selector, get_clicked_skin, DEFAULT_SKIN
+from profiler import start_sampler_from_env
+import assets
+import calibration
 
-# Import leaderboard
-try:
-    from leaderboard import show_leaderboard
-except ImportError:
-    def show_leaderboard(screen, clock, highlight_rank=-1):
+startup.mark("menu imported")
+
+
+def show_leaderboard(screen, clock, highlight_rank=-1):
+    try:
+        leaderboard = startup.load("leaderboard")
+    except ImportError:
         print("Leaderboard module not found")
         return True
+    return leaderboard.show_leaderboard(screen, clock, highlight_rank)
 
 # Initialize Pygame
 pygame.init()
@@ -41,6 +49,8 @@ try:
 except Exception:
     pass
 
+startup.mark("window ready")
+
 def get_hamachi_ip():
     """Try to automatically detect Hamachi IP address"""
     try:
@@ -90,7 +100,7 @@ def multiplayer_menu(screen, clock, version=""):
     """Enhanced Multiplayer menu with Hamachi IP detection and Skin Selection"""
     from util import Button, draw_text, draw_shadow_text
     
-    network = NetworkManager()
+    network = startup.load("network").NetworkManager()
     selected_option = None
     server_ip = ""
     input_active = False
@@ -303,6 +313,8 @@ def multiplayer_menu(screen, clock, version=""):
         player_id = network.player_id
         print(f"[START] Starting multiplayer as Player {player_id} | Skin: {selected_skin}")
         
+        assets.PRELOADER.wait(screen, clock)
+        run_multiplayer_game = startup.load("multiplayer_game").run_multiplayer_game
         result = run_multiplayer_game(screen, clock, network, player_id, version, selected_skin, character_type="player")
         network.disconnect()
         return result
@@ -315,6 +327,9 @@ def main():
     version = "v1.0 - Multiplayer"
     current_screen = "menu"
     
+    # 🔥 مُعايِن المكدس عند الطلب (ZS_SAMPLE=<ثواني>)
+    start_sampler_from_env()
+
     print("=" * 60)
     print("[GAME] ZOMBIE SHOOTER - Starting Game...")
     print("=" * 60)
@@ -322,6 +337,9 @@ def main():
     print("[NET] For multiplayer: Both players need Hamachi")
     print("=" * 60)
     
+    # 🔥 أول تشغيل فقط: اختيار جودة الرسوميات حسب أداء الجهاز (ZS_CALIBRATE=0 للتخطي)
+    calibration.run(screen)
+    
     while True:
         try:
             if current_screen == "menu":
@@ -344,6 +362,8 @@ def main():
                 print("[PLAY] Single Player Mode Started")
                 # شاشة اختيار بسيطة للشخصية (Classic vs Commando)
                 selected_char = show_character_select(screen, clock)
+                assets.PRELOADER.wait(screen, clock)
+                run_game = startup.load("game").run_game
                 result = run_game(screen, clock, version, character=selected_char)
                 if result == "menu":
                     current_screen = "menu"
@@ -0,0 +1,180 @@
+# memory.py - Per-level memory monitor for Zombie Shooter
+"""
+مراقبة الذاكرة عبر الجلسة:
+- لقطة عند كل انتقال مستوى (MONITOR.snapshot) وعند الطلب (F5)
+- ZS_MEMORY=1 يفعّل tracemalloc (أو ZS_MEMORY=<عمق المكدس>)؛ بدونه تُسجل RSS والمؤشرات فقط
+- كل لقطة تقارن بالسابقة حسب الملف/السطر وتطبع أكثر المواقع نمواً
+- gauges: أحجام القوائم الحية (الدم، الانفجارات، اللاعبين البعيدين...) وحجم أسطح الخلفية
+- counters: أحداث مكلفة مثل إعادة إنشاء كائن Player
+- ZS_MEMORY_LOG=path لحفظ كل لقطة كسطر JSON
+ملاحظة: بكسلات أسطح pygame تُحجز داخل SDL ولا يراها tracemalloc - لذلك نسجل RSS أيضاً.
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+import pygame
+
+SNAPSHOT_KEY = pygame.K_F5
+
+# ملفات لا نريدها في التقرير (ضجيج الأداة نفسها والاستيراد)
+_IGNORED = (
+    tracemalloc.__file__,
+    __file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>",
+)
+
+
+def rss_bytes() -> int:
+    """الذاكرة المقيمة الحالية للعملية (0 إذا تعذر القياس)"""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+        return int(psutil.Process().memory_info().rss)
+    except Exception:
+        pass
+    try:
+        import resource
+        # ru_maxrss = الذروة (KB على لينكس، bytes على macOS) - أفضل من لا شيء
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return int(peak if sys.platform == "darwin" else peak * 1024)
+    except Exception:
+        return 0
+
+
+def surface_bytes(obj) -> int:
+    """مجموع أحجام بكسلات الأسطح داخل dict/list (مثل BG_EFFECTS) أو كاش بلاطات"""
+    if isinstance(obj, pygame.Surface):
+        return obj.get_width() * obj.get_height() * obj.get_bytesize()
+    if isinstance(getattr(obj, "cache_bytes", None), int):
+        return obj.cache_bytes   # كاش بلاطات (مثل TiledBackground)
+    if isinstance(obj, dict):
+        return sum(surface_bytes(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sum(surface_bytes(v) for v in obj)
+    return 0
+
+
+def _mb(n: float) -> str:
+    return f"{n / (1024 * 1024):.1f}MB"
+
+
+class MemoryMonitor:
+    """لقطات ذاكرة مع مقارنة بالسابقة"""
+
+    def __init__(self, trace_frames: int = 0, top: int = 10, log_path: Optional[str] = None):
+        self.trace_frames = trace_frames
+        self.top = top
+        self.log_path = log_path
+        self.history: List[Dict] = []
+        self.gauges: Dict[str, Callable[[], int]] = {}
+        self.counters: Dict[str, int] = {}
+        self._last: Optional[tracemalloc.Snapshot] = None
+        if trace_frames > 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(trace_frames)
+
+    @classmethod
+    def from_env(cls) -> "MemoryMonitor":
+        value = os.environ.get("ZS_MEMORY", "")
+        try:
+            frames = int(value) if value else 0
+        except ValueError:
+            frames = 1
+        return cls(trace_frames=frames, log_path=os.environ.get("ZS_MEMORY_LOG") or None)
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def set_gauges(self, gauges: Dict[str, Callable[[], int]]):
+        """استبدال المؤشرات (كل حلقة لعب تسجل مؤشراتها عند البداية وتمسحها بـ {} عند الخروج)"""
+        self.gauges = dict(gauges)
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def _read_gauges(self) -> Dict[str, int]:
+        out = {}
+        for name, fn in self.gauges.items():
+            try:
+                out[name] = int(fn())
+            except Exception:
+                out[name] = -1
+        return out
+
+    def snapshot(self, label: str, verbose: bool = True) -> Dict:
+        report = {
+            "label": label,
+            "time": time.time(),
+            "rss": rss_bytes(),
+            "gauges": self._read_gauges(),
+            "counters": dict(self.counters),
+            "traced": None,
+            "top": [],
+        }
+        if self.tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            report["traced"] = {"current": current, "peak": peak}
+            snap = tracemalloc.take_snapshot().filter_traces(
+                [tracemalloc.Filter(False, pattern) for pattern in _IGNORED])
+            if self._last is not None:
+                stats = snap.compare_to(self._last, "lineno")
+                report["top"] = [
+                    {"where": f"{os.path.basename(s.traceback[0].filename)}:{s.traceback[0].lineno}",
+                     "size_diff": s.size_diff, "count_diff": s.count_diff, "size": s.size}
+                    for s in stats[:self.top] if s.size_diff > 0
+                ]
+            self._last = snap
+        self.history.append(report)
+        if verbose:
+            self._print(report)
+        if self.log_path:
+            self._write(report)
+        return report
+
+    def _print(self, report: Dict):
+        prev = self.history[-2] if len(self.history) > 1 else None
+        delta = f" ({report['rss'] - prev['rss']:+,} B)" if prev else ""
+        line = f"[MEMORY] {report['label']}: rss {_mb(report['rss'])}{delta}"
+        if report["traced"]:
+            line += f"  traced {_mb(report['traced']['current'])} peak {_mb(report['traced']['peak'])}"
+        print(line)
+        if report["gauges"]:
+            print("[MEMORY]   " + "  ".join(f"{k}={v}" for k, v in report["gauges"].items()))
+        if report["counters"]:
+            print("[MEMORY]   " + "  ".join(f"{k}={v}" for k, v in report["counters"].items()))
+        for row in report["top"]:
+            print(f"[MEMORY]   +{row['size_diff']:>10,} B {row['count_diff']:+6} blocks  {row['where']}")
+
+    def _write(self, report: Dict):
+        try:
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(report) + "\n")
+        except OSError as e:
+            print(f"[MEMORY] Cannot write {self.log_path}: {e}")
+            self.log_path = None
+
+    def handle_event(self, e) -> bool:
+        if e.type == pygame.KEYDOWN and e.key == SNAPSHOT_KEY:
+            self.snapshot("manual")
+            return True
+        return False
+
+    def growth(self, since: int = 0) -> int:
+        """نمو RSS من اللقطة رقم since حتى آخر لقطة"""
+        if len(self.history) <= since:
+            return 0
+        return self.history[-1]["rss"] - self.history[since]["rss"]
+
+
+MONITOR = MemoryMonitor.from_env()
@@ -0,0 +1,516 @@
+# menu.py - Main menu for Zombie Shooter
+"""
+القائمة الرئيسية وخلفيتها المتحركة.
+وحدة خفيفة عمداً: هي كل ما يُستورد قبل أول إطار (game و multiplayer_game تُحمّل عند أول استخدام).
+"""
+from __future__ import annotations
+import math
+import random
+import pygame
+
+from util import draw_text, draw_shadow_text, load_image_to_height, Button, Slider, Dropdown
+from settings import game_settings, QUALITY_NAMES
+from fonts import get_font
+from scene_layers import vertical_gradient
+from skins import (
+    DEFAULT_SKIN, get_skin_data, get_next_skin, get_prev_skin,
+    draw_skin_selector, get_clicked_skin
+)
+import startup
+import assets
+
+WINDOW_W, WINDOW_H = 1280, 720
+FPS = 60
+
+# 🔥 متغير عام لتخزين المظهر المختار (يقرأه game و multiplayer_game)
+CURRENT_SKIN = DEFAULT_SKIN
+
+_MENU_BG = None
+_SKYLINE_KEY = (255, 0, 255)
+
+# ---------- Animated HORROR menu background ----------
+class MenuBackground:
+    def __init__(self, screen: pygame.Surface):
+        self.W, self.H = screen.get_size()
+        # 🔥 HORROR THEME - Dark cemetery/haunted layers
+        self.layers = [
+            {"y": int(self.H * 0.72), "speed": 6, "color": (25, 10, 10)},    # Blood-stained darkness
+            {"y": int(self.H * 0.78), "speed": 12, "color": (18, 8, 8)},     # Deep crimson shadows
+            {"y": int(self.H * 0.85), "speed": 20, "color": (12, 5, 5)},     # Abyssal black-red
+        ]
+        self._build_skyline()
+        # 🔥 Blood-red fog (تُبنى بعد أول إطار - انظر _deferred)
+        self.fog = []
+        self.fog_x = [0.0, -self.W * 0.4]
+        self.fog_v = [8.0, 14.0]
+        # 🔥 Eerie flickering lights instead of search beams
+        self.beams = [
+            {"x": self.W * 0.24, "w": 180, "ang": 0.0, "vang": 0.4, "alpha": 40},
+            {"x": self.W * 0.72, "w": 200, "ang": 0.7, "vang": -0.3, "alpha": 35},
+        ]
+        self.ghost_img = None
+        self.ghosts = []
+        # 🔥 التهيئة الثقيلة مؤجلة: خطوة واحدة لكل إطار بعد ظهور القائمة
+        # (عدد طبقات الضباب حسب جودة الرسوميات)
+        fog_layers = [lambda: self.fog.append(self._make_fog(0.20)),
+                      lambda: self.fog.append(self._make_fog(0.15))]
+        self._deferred = fog_layers[:game_settings.quality("menu_fog_layers")] + [self._load_ghosts]
+        
+        # 🔥 Darker, blood-red vignette
+        self.vignette = pygame.Surface((self.W, self.H), pygame.SRCALPHA)
+        pygame.draw.rect(self.vignette, (0, 0, 0, 160), self.vignette.get_rect())
+        pygame.draw.rect(self.vignette, (0, 0, 0, 0), (80, 80, self.W - 160, self.H - 160))
+        self.vignette_edges = [pygame.Rect(0, 0, self.W, 80), pygame.Rect(0, self.H - 80, self.W, 80),
+                               pygame.Rect(0, 80, 80, self.H - 160), pygame.Rect(self.W - 80, 80, 80, self.H - 160)]
+        
+        # 🔥 Blood spots/splatters
+        self.blood_spots = self._create_blood_spots()
+        # 🔥 الطبقة الثابتة (التدرج + بقع الدم) مرسومة مرة واحدة
+        self.static = self._build_static()
+        
+        # 🔥 أسطح مخروط الضوء بحجم مداه فقط (بدل سطح بحجم الشاشة لكل ضوء كل إطار)
+        for b in self.beams:
+            b["origin"] = (int(b["x"]) - 9, self.layers[0]["y"] - 272)
+            b["surf"] = pygame.Surface((b["w"] + 19, 270), pygame.SRCALPHA)
+        
+        # 🔥 Lightning flash timer
+        self.lightning_timer = 0.0
+        self.lightning_active = False
+        self.lightning_alpha = 0
+        self.flash = pygame.Surface((self.W, self.H))
+        self.flash.fill((200, 180, 180))
+
+    def _build_skyline(self):
+        rng = random.Random(666)  # 🔥 Evil seed
+        for L in self.layers:
+            yb = L["y"]; blocks = []; x = -80
+            while x < self.W + 80:
+                # 🔥 Tombstone/ruins-like shapes
+                w = rng.randint(30, 90); h = rng.randint(80, 280)
+                blocks.append(pygame.Rect(x, yb - h, w, h))
+                x += w + rng.randint(15, 35)
+            L["blocks"] = blocks; L["offset"] = 0.0
+            L["strip"], L["strip_pos"] = self._bake_layer(blocks, L["color"])
+
+    def _bake_layer(self, blocks, color):
+        """🔥 كل طبقة شواهد (مع نسختها المكررة بعد W+40) في سطح واحد بلون شفاف (colorkey)"""
+        period = self.W + 40
+        x0 = min(r.left for r in blocks)
+        top = min(r.top for r in blocks)
+        x1 = max(r.right for r in blocks) + period
+        bottom = max(r.bottom for r in blocks)
+        strip = pygame.Surface((x1 - x0, bottom - top))
+        strip.fill(_SKYLINE_KEY)
+        for r in blocks:
+            strip.fill(color, r.move(-x0, -top))
+            strip.fill(color, r.move(period - x0, -top))
+        strip.set_colorkey(_SKYLINE_KEY, pygame.RLEACCEL)
+        return strip, (x0, top)
+
+    def _make_fog(self, alpha: float) -> pygame.Surface:
+        s = pygame.Surface((int(self.W * 1.4), int(self.H * 0.5)), pygame.SRCALPHA)
+        rng = random.Random(13 if alpha < 0.18 else 17)  # 🔥 Superstitious numbers
+        for _ in range(250):
+            r = rng.randint(50, 140)
+            x = rng.randint(-50, s.get_width() - 50)
+            y = rng.randint(0, s.get_height() - 30)
+            a = int(255 * alpha * rng.uniform(0.5, 1.0))
+            # 🔥 Blood red mist
+            pygame.draw.circle(s, (120, 20, 20, a), (x, y), r)
+        return s
+
+    def _load_ghosts(self):
+        z = (load_image_to_height("zombie_left.png", 160) or
+             load_image_to_height("zombie_right.png", 160) or
+             load_image_to_height("zombie_up.png", 160) or
+             load_image_to_height("zombie_down.png", 160))
+        if z:
+            # 🔥 Create eerie red-tinted ghost
+            g = pygame.Surface(z.get_size(), pygame.SRCALPHA)
+            g.blit(z, (0, 0))
+            g.fill((180, 50, 50, 80), special_flags=pygame.BLEND_RGBA_MULT)
+            self.ghost_img = g
+            self.ghosts = self._spawn_ghosts(8)
+
+    def _spawn_ghosts(self, n: int):
+        rng = random.Random(13); res = []
+        for _ in range(n):
+            res.append({"x": rng.randint(-60, self.W - 60),
+                        "y": rng.randint(30, int(self.H * 0.55)),
+                        "vx": rng.choice([-1, 1]) * rng.uniform(5, 15),
+                        "alpha": rng.randint(40, 100)})  # 🔥 Variable opacity
+        return res
+    
+    def _create_blood_spots(self):
+        """Create random blood splatter positions"""
+        rng = random.Random(31)
+        spots = []
+        for _ in range(15):
+            spots.append({
+                "x": rng.randint(0, self.W),
+                "y": rng.randint(0, self.H),
+                "size": rng.randint(10, 40),
+                "alpha": rng.randint(30, 80)
+            })
+        return spots
+
+    def _build_static(self) -> pygame.Surface:
+        """التدرج وبقع الدم لا يتحركان: سطح واحد يُنسخ كل إطار"""
+        W, H = self.W, self.H
+
+        def row_color(i: int):
+            t = i / max(H - 1, 1)
+            # Top: Near black (5, 0, 0) | Bottom: Deep blood red (30, 5, 5)
+            return int(5 + 25 * t), int(0 + 5 * t), int(5 + 3 * t)
+
+        # 🔥 HORROR gradient - Deep black to blood red
+        static = vertical_gradient(W, H, row_color).copy()
+        
+        # 🔥 Blood spots background effect
+        for spot in self.blood_spots:
+            spot_surf = pygame.Surface((spot["size"]*2, spot["size"]*2), pygame.SRCALPHA)
+            pygame.draw.circle(spot_surf, (100, 10, 10, spot["alpha"]), 
+                             (spot["size"], spot["size"]), spot["size"])
+            static.blit(spot_surf, (spot["x"] - spot["size"], spot["y"] - spot["size"]))
+        return static
+
+    def draw(self, screen: pygame.Surface, dt: float):
+        W, H = self.W, self.H
+        if self._deferred:
+            self._deferred.pop(0)()
+        
+        screen.blit(self.static, (0, 0))
+        
+        # 🔥 Tombstone/ruins silhouettes (blit واحد لكل طبقة بدل مستطيلين لكل شاهد)
+        for L in self.layers:
+            L["offset"] = (L["offset"] - L["speed"] * dt) % (W + 40)
+            ox = -L["offset"]
+            x0, top = L["strip_pos"]
+            screen.blit(L["strip"], (x0 + int(ox), top))
+                
+        # 🔥 Eerie red flickering lights (instead of search beams)
+        for b in self.beams:
+            b["ang"] += b["vang"] * dt
+            flicker = 0.7 + 0.3 * math.sin(b["ang"] * 5) + random.uniform(-0.1, 0.1)
+            ang = math.sin(b["ang"]) * 0.8
+            
+            # 🔥 Blood red light cone (إحداثيات محلية داخل سطح المخروط)
+            ox, oy = b["origin"]
+            poly = [(b["x"] - 8 - ox, self.layers[0]["y"] - 4 - oy),
+                    (b["x"] + 8 - ox, self.layers[0]["y"] - 4 - oy),
+                    (b["x"] + math.cos(ang) * b["w"] - ox, self.layers[0]["y"] - 200 + math.sin(ang) * 70 - oy)]
+            cone = b["surf"]
+            cone.fill((0, 0, 0, 0))
+            cone_alpha = int(b["alpha"] * flicker)
+            pygame.draw.polygon(cone, (180, 30, 30, cone_alpha), poly)
+            screen.blit(cone, (ox, oy), special_flags=pygame.BLEND_PREMULTIPLIED)
+            
+        # 🔥 Blood red fog
+        for i, fog in enumerate(self.fog):
+            self.fog_x[i] = (self.fog_x[i] + self.fog_v[i] * dt) % fog.get_width()
+            x = -self.fog_x[i]; y = int(H * 0.40) + i * 35
+            screen.blit(fog, (x, y)); screen.blit(fog, (x + fog.get_width(), y))
+            
+        # 🔥 Haunting ghosts with flickering opacity
+        if self.ghost_img:
+            for g in self.ghosts:
+                g["x"] += g["vx"] * dt
+                if g["x"] < -140: g["x"] = W + 60
+                if g["x"] > W + 60: g["x"] = -140
+                
+                # 🔥 Flickering ghost effect
+                flicker = int(g["alpha"] * (0.8 + 0.2 * math.sin(g["x"] * 0.05)))
+                self.ghost_img.set_alpha(flicker)
+                screen.blit(self.ghost_img, (int(g["x"]), int(g["y"])))
+        
+        # 🔥 Random lightning flash (معطل في الجودة المنخفضة)
+        self.lightning_timer += dt
+        if self.lightning_timer > random.uniform(4.0, 8.0) and game_settings.quality("menu_lightning"):
+            self.lightning_timer = 0.0
+            self.lightning_active = True
+            self.lightning_alpha = 180
+            
+        if self.lightning_active:
+            self.flash.set_alpha(self.lightning_alpha)
+            screen.blit(self.flash, (0, 0))
+            self.lightning_alpha -= 15
+            if self.lightning_alpha <= 0:
+                self.lightning_active = False
+        
+        # 🔥 Dark vignette overlay (الحواف فقط - الداخل شفاف تماماً)
+        for r in self.vignette_edges:
+            screen.blit(self.vignette, r, r)
+
+# ---------------- Menus ----------------
+
+
+def _menu_background(screen: pygame.Surface) -> MenuBackground:
+    """خلفية القائمة تُبنى مرة واحدة وتُعاد عند الرجوع للقائمة"""
+    global _MENU_BG
+    if _MENU_BG is None or (_MENU_BG.W, _MENU_BG.H) != screen.get_size():
+        _MENU_BG = MenuBackground(screen)
+    return _MENU_BG
+
+
+def main_menu(screen: pygame.Surface, clock: pygame.time.Clock, version: str) -> str | None:
+    global CURRENT_SKIN
+    bg = _menu_background(screen)
+    
+    # 🔥 أضف هذا السطر - تعريف cx و cy
+    cx, cy = WINDOW_W // 2, WINDOW_H // 2
+    
+    # الأزرار الأصلية - تم إعادة ترتيبها
+    start_btn = Button(pygame.Rect(cx - 120, cy - 110, 240, 48), "Single Player")
+    howto_btn = Button(pygame.Rect(cx - 120, cy - 55, 240, 42), "How to Play")
+    skins_btn = Button(pygame.Rect(cx - 120, cy - 5, 240, 42), "🎨 Select Skin")
+    leaderboard_btn = Button(pygame.Rect(cx - 120, cy + 45, 240, 42), "🏆 Leaderboard")
+    multiplayer_btn = Button(pygame.Rect(cx - 120, cy + 95, 240, 42), "👥 Multiplayer")
+    settings_btn = Button(pygame.Rect(cx - 120, cy + 145, 240, 42), "⚙️ Settings")
+    quit_btn  = Button(pygame.Rect(cx - 120, cy + 195, 240, 42), "Quit")
+    
+    # Settings panel UI components
+    music_slider = None
+    sfx_slider = None
+    resolution_dropdown = None
+    quality_dropdown = None
+    settings_back_btn = None
+
+    mode = "menu"  # "menu" | "howto" | "skins" | "settings"
+    while True:
+        dt = clock.get_time() / 1000.0
+        for e in pygame.event.get():
+            if e.type == pygame.QUIT: return None
+            if e.type == pygame.KEYDOWN:
+                if mode == "menu":
+                    if e.key == pygame.K_RETURN: return "start"
+                    if e.key == pygame.K_ESCAPE: return None
+                    if e.key == pygame.K_l: return "leaderboard"
+                elif mode == "skins":
+                    if e.key == pygame.K_ESCAPE: mode = "menu"
+                    # تغيير المظهر بالأسهم
+                    if e.key == pygame.K_LEFT:
+                        CURRENT_SKIN = get_prev_skin(CURRENT_SKIN)
+                    if e.key == pygame.K_RIGHT:
+                        CURRENT_SKIN = get_next_skin(CURRENT_SKIN)
+                elif mode == "settings":
+                    if e.key == pygame.K_ESCAPE:
+                        game_settings.save()
+                        mode = "menu"
+                else:
+                    if e.key == pygame.K_ESCAPE: mode = "menu"
+            if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
+                if mode == "menu":
+                    if start_btn.hit(e.pos): return "start"
+                    if howto_btn.hit(e.pos):  mode = "howto"
+                    if skins_btn.hit(e.pos):  mode = "skins"
+                    if leaderboard_btn.hit(e.pos): return "leaderboard"
+                    if quit_btn.hit(e.pos):   return None
+                    # 🔥 معالجة زر Multiplayer
+                    if multiplayer_btn.hit(e.pos): return "multiplayer"
+                    # 🔥 معالجة زر Settings
+                    if settings_btn.hit(e.pos):
+                        mode = "settings"
+                        # Initialize settings UI
+                        panel_x = cx - 280
+                        music_slider = Slider(
+                            pygame.Rect(panel_x + 140, cy - 60, 280, 18),
+                            value=game_settings.music_volume,
+                            label="Music Volume"
+                        )
+                        sfx_slider = Slider(
+                            pygame.Rect(panel_x + 140, cy + 10, 280, 18),
+                            value=game_settings.sfx_volume,
+                            label="SFX Volume"
+                        )
+                        quality_dropdown = Dropdown(
+                            pygame.Rect(cx + 140, cy + 80, 140, 30),
+                            [name.capitalize() for name in QUALITY_NAMES],
+                            selected_index=QUALITY_NAMES.index(game_settings.quality_preset),
+                            label="Graphics Quality"
+                        )
+                        settings_back_btn = Button(pygame.Rect(cx - 80, cy + 100, 160, 44), "Back")
+                elif mode == "skins":
+                    # التحقق من النقر على المظاهر
+                    clicked_skin = get_clicked_skin(e.pos, cx, cy + 50)
+                    if clicked_skin:
+                        CURRENT_SKIN = clicked_skin
+                    # النقر خارج منطقة المظاهر للخروج
+                    selector_rect = pygame.Rect(cx - 200, cy, 400, 150)
+                    if not selector_rect.collidepoint(e.pos):
+                        mode = "menu"
+                elif mode == "settings":
+                    # Settings panel events
+                    if settings_back_btn and settings_back_btn.hit(e.pos):
+                        # Save settings before going back
+                        game_settings.save()
+                        mode = "menu"
+                else:
+                    mode = "menu"
+            
+            # Handle slider events for settings mode
+            if mode == "settings":
+                if music_slider:
+                    if music_slider.handle_event(e):
+                        game_settings.set_music_volume(music_slider.value)
+                if sfx_slider:
+                    if sfx_slider.handle_event(e):
+                        game_settings.set_sfx_volume(sfx_slider.value)
+                if quality_dropdown:
+                    if quality_dropdown.handle_event(e):
+                        game_settings.set_quality_preset(QUALITY_NAMES[quality_dropdown.selected_index])
+                        game_settings.save()
+
+        bg.draw(screen, dt)
+        
+        # Modern Title Rendering
+        title = "Zombie Shooter"
+             
+        # Draw Title with Glow - CLEAR READABLE VERSION
+        # Center the title
+        title_font = get_font(56, bold=True)
+        
+        # 🔥 BLACK OUTLINE for maximum readability
+        outline_surf = title_font.render(title, True, (0, 0, 0))
+        title_rect = outline_surf.get_rect(center=(WINDOW_W // 2, 80))
+        for ox, oy in [(-3, 0), (3, 0), (0, -3), (0, 3), (-2, -2), (2, 2), (-2, 2), (2, -2)]:
+            screen.blit(outline_surf, (title_rect.x + ox, title_rect.y + oy))
+        
+        # 🔥 BRIGHT RED GLOW behind text
+        glow_surf = title_font.render(title, True, (200, 40, 40))
+        for offset in [(-1, -1), (1, 1), (-1, 1), (1, -1)]:
+            screen.blit(glow_surf, (title_rect.x + offset[0], title_rect.y + offset[1]))
+        
+        # 🔥 MAIN TITLE - Bright white/cream for clarity
+        title_surf = title_font.render(title, True, (255, 240, 240))
+        screen.blit(title_surf, title_rect)
+        
+        if mode == "menu":
+            start_btn.draw(screen)
+            howto_btn.draw(screen)
+            skins_btn.draw(screen)
+            leaderboard_btn.draw(screen)
+            multiplayer_btn.draw(screen)
+            settings_btn.draw(screen)
+            quit_btn.draw(screen)
+            
+            # 🔥 عرض المظهر الحالي في الزاوية
+            skin_data = get_skin_data(CURRENT_SKIN)
+            skin_text = f"Skin: {skin_data['name']}"
+            draw_text(screen, skin_text, (WINDOW_W - 180, 28), size=20, color=skin_data['color'])
+            
+        elif mode == "skins":
+            _draw_skins_panel(screen, cx, cy)
+        elif mode == "settings":
+            _draw_settings_panel(screen, cx, cy, music_slider, sfx_slider, settings_back_btn, quality_dropdown)
+        else:
+            _draw_howto_panel(screen)
+
+        # 🔥 الأصول تُحمّل في الخلفية أثناء القائمة (التحويل هنا على الخيط الرئيسي)
+        if assets.PRELOADER.started and not assets.PRELOADER.poll():
+            assets.PRELOADER.draw_progress(screen, pygame.Rect(20, WINDOW_H - 28, 220, 10), label=False)
+
+        pygame.display.flip()
+        startup.first_frame()
+        # البدء بعد أول إطار حتى لا ينافس الخيط العامل ظهور القائمة
+        if not assets.PRELOADER.started:
+            assets.start_preload()
+        clock.tick(FPS)
+
+        
+
+def _draw_howto_panel(screen: pygame.Surface):
+    # 🔥 HORROR THEME - Dark panel with blood red accents
+    rect = pygame.Rect(WINDOW_W//2 - 360, WINDOW_H//2 - 200, 720, 380)
+    pygame.draw.rect(screen, (20, 10, 12, 245), rect, border_radius=10)
+    pygame.draw.rect(screen, (180, 50, 50), rect, width=3, border_radius=10)
+    draw_shadow_text(screen, "How to Survive", (rect.x+20, rect.y+16), size=32, color=(255, 100, 100))
+    y = rect.y + 60
+    lines = [
+        "Move: Z/Q/S/D or WASD or Arrow Keys",
+        "Shoot: Space or Left Mouse | Right Mouse (Shotgun)",
+        "",
+        "WEAPONS:",
+        "  [1] Pistol - Unlimited ammo, fast fire",
+        "  [2] Shotgun - 5 pellets spread, needs ammo",
+        "  [3] Grenade - Area damage, limited supply",
+        "",
+        "[M] Toggle Mini-map | [H] Toggle HUD | [ESC] Pause",
+        "Open Speed Chests for a temporary speed boost!",
+        "Find and enter the DOOR to escape this nightmare!",
+    ]
+    for line in lines:
+        # 🔥 BRIGHT text colors for readability
+        if "WEAPONS" in line:
+            color = (255, 120, 120)  # Bright red for section header
+        else:
+            color = (240, 235, 235)  # Near-white for body text
+        draw_text(screen, line, (rect.x+20, y), size=20, color=color)
+        y += 28
+    draw_text(screen, "Press ESC to go back", (rect.x+20, rect.y+rect.h-42), size=20, color=(200, 180, 180))
+
+def _draw_skins_panel(screen: pygame.Surface, cx: int, cy: int):
+    """🔥 HORROR THEME - رسم لوحة اختيار المظاهر"""
+    global CURRENT_SKIN
+    
+    # 🔥 Dark horror panel with blood red border
+    rect = pygame.Rect(cx - 280, cy - 100, 560, 280)
+    pygame.draw.rect(screen, (20, 10, 12, 245), rect, border_radius=12)
+    pygame.draw.rect(screen, (180, 50, 50), rect, width=3, border_radius=12)
+    
+    # 🔥 Horror title - BRIGHT for readability
+    draw_shadow_text(screen, "Choose Your Character", (cx - 140, cy - 80), size=30, color=(255, 100, 100))
+    
+    # رسم المظاهر
+    draw_skin_selector(screen, CURRENT_SKIN, cx, cy + 10)
+    
+    # معلومات المظهر المختار - BRIGHT text
+    skin_data = get_skin_data(CURRENT_SKIN)
+    info_text = f"Selected: {skin_data['name']} - {skin_data['description']}"
+    draw_text(screen, info_text, (cx - 200, cy + 110), size=20, color=(240, 230, 230))
+    
+    # تعليمات - READABLE
+    draw_text(screen, "Click to select | [Arrow Keys] Navigate | [ESC] Back", 
+             (cx - 200, cy + 145), size=18, color=(200, 180, 180))
+
+def _draw_settings_panel(screen: pygame.Surface, cx: int, cy: int, 
+                         music_slider, sfx_slider, back_btn, quality_dropdown=None):
+    """🔥 HORROR THEME - Settings panel with volume controls"""
+    # Dark horror panel with blood red border
+    rect = pygame.Rect(cx - 300, cy - 120, 600, 280)
+    panel_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
+    pygame.draw.rect(panel_surf, (20, 10, 12, 245), panel_surf.get_rect(), border_radius=12)
+    screen.blit(panel_surf, (rect.x, rect.y))
+    pygame.draw.rect(screen, (180, 50, 50), rect, width=3, border_radius=12)
+    
+    # Title
+    draw_shadow_text(screen, "⚙️ Settings", (cx - 60, rect.y + 20), size=32, color=(255, 100, 100))
+    
+    # Draw sliders
+    if music_slider:
+        music_slider.draw(screen)
+    if sfx_slider:
+        sfx_slider.draw(screen)
+    
+    # Key bindings display (read-only)
+    key_y = cy + 60
+    draw_text(screen, "Key Bindings:", (rect.x + 30, key_y), size=18, color=(255, 120, 120), bold=True)
+    key_y += 28
+    key_info = [
+        "Move: W/Z/S/D or Arrow Keys",
+        "Shoot: SPACE | Weapons: 1/2/3"
+    ]
+    for line in key_info:
+        draw_text(screen, line, (rect.x + 40, key_y), size=16, color=(200, 190, 190))
+        key_y += 22
+    
+    # Back button
+    if back_btn:
+        back_btn.draw(screen)
+    
+    # Graphics quality (drawn last so the open list overlays the panel)
+    if quality_dropdown:
+        quality_dropdown.draw(screen)
+    
+    # Instructions
+    draw_text(screen, "Settings are saved automatically", 
+             (cx - 110, rect.y + rect.height - 30), size=14, color=(160, 150, 150))
@@ -4,22 +4,32 @@
 - عرض موقع اللاعبين والأعداء والباب
 - تبديل العرض بمفتاح M
 - خلفية شبه شفافة
+- 🔥 سطح مركّب دائم: الخلفية + الجدران طبقة ثابتة، والعلامات المتحركة
+  (الزومبي، اللاعبون الآخرون، الباب) تُحدّث بمعدل REFRESH_HZ فقط
+- 🔥 فوق HEATMAP_THRESHOLD زومبي: خريطة كثافة (numpy bincount) بدل نقطة لكل زومبي
+- العنوان ودليل الألوان وعلامة اللاعب المحلي مرسومة مرة واحدة
 """
 
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional, Union
 import math
+import numpy as np
 import pygame
 
 # ============== Constants ==============
 MINIMAP_SIZE = 180        # حجم الخريطة
 MINIMAP_MARGIN = 15       # هامش من حافة الشاشة
 TOGGLE_KEY = pygame.K_m   # مفتاح التبديل
+REFRESH_HZ = 10           # معدل تحديث العلامات المتحركة
+HEATMAP_THRESHOLD = 60    # عدد الزومبي الذي تبدأ عنده خريطة الكثافة
+HEAT_CELL = 4             # حجم خلية الكثافة بالبكسل على الخريطة
+HEAT_SATURATION = 6       # عدد الزومبي في الخلية لأقصى كثافة
 
 # ============== Minimap ==============
 class Minimap:
     """نظام الخريطة المصغرة"""
     
-    def __init__(self, world_w: int, world_h: int, screen_w: int, screen_h: int, size: int = MINIMAP_SIZE):
+    def __init__(self, world_w: int, world_h: int, screen_w: int, screen_h: int, size: int = MINIMAP_SIZE,
+                 refresh_hz: float = REFRESH_HZ, heatmap_threshold: int = HEATMAP_THRESHOLD):
         self.world_w = world_w
         self.world_h = world_h
         self.screen_w = screen_w
@@ -51,9 +61,49 @@ class Minimap:
         self.walls_surface: Optional[pygame.Surface] = None
         self.walls_dirty = True
         
+        # 🔥 التحديث المخفّض وخريطة الكثافة
+        self.refresh_ms = 1000.0 / refresh_hz if refresh_hz > 0 else 0.0
+        self.heatmap_threshold = heatmap_threshold
+        self.heatmap = False           # هل آخر تحديث استخدم خريطة الكثافة
+        self.refreshes = 0             # عدد مرات إعادة تركيب الخريطة
+        self._last_refresh: Optional[int] = None
+        self._base: Optional[pygame.Surface] = None       # الخلفية + الجدران
+        self.map_surface = pygame.Surface((self.map_width, self.map_height), pygame.SRCALPHA)
+        self._heat_w = -(-self.map_width // HEAT_CELL)
+        self._heat_h = -(-self.map_height // HEAT_CELL)
+        self._heat_small = pygame.Surface((self._heat_w, self._heat_h), pygame.SRCALPHA)
+        self._build_chrome()
+    
+    def _build_chrome(self):
+        """العنوان، دليل الألوان، الحدود وعلامة اللاعب المحلي (ثابتة)"""
+        self.title_surf = pygame.font.Font(None, 18).render("MINIMAP [M]", True, (150, 150, 150))
+        
+        # دليل الألوان (مختصر): لاعب محلي، لاعب آخر، زومبي، الباب
+        self.legend_surf = pygame.Surface((130, 12), pygame.SRCALPHA)
+        pygame.draw.circle(self.legend_surf, (50, 100, 255), (8, 6), 4)
+        pygame.draw.circle(self.legend_surf, (50, 255, 50), (48, 6), 4)
+        pygame.draw.circle(self.legend_surf, (255, 50, 50), (88, 6), 4)
+        pygame.draw.rect(self.legend_surf, (255, 200, 50), (120, 2, 8, 8))
+        
+        self.border_surf = pygame.Surface((self.map_width, self.map_height), pygame.SRCALPHA)
+        pygame.draw.rect(self.border_surf, (100, 100, 120),
+                        (0, 0, self.map_width, self.map_height),
+                        width=2, border_radius=8)
+        
+        # اللاعب المحلي (نقطة زرقاء مع توهج) - تُرسم كل إطار لأنها تتبع اللاعب
+        self.player_marker = pygame.Surface((15, 15), pygame.SRCALPHA)
+        pygame.draw.circle(self.player_marker, (100, 150, 255, 150), (7, 7), 7)
+        pygame.draw.circle(self.player_marker, (50, 100, 255), (7, 7), 5)
+        pygame.draw.circle(self.player_marker, (200, 220, 255), (7, 7), 3)
+        
     def toggle(self):
         """تبديل ظهور الخريطة"""
         self.visible = not self.visible
+        self.invalidate()
+    
+    def invalidate(self):
+        """فرض إعادة تركيب العلامات في الرسم التالي"""
+        self._last_refresh = None
     
     def handle_event(self, event) -> bool:
         """معالجة الأحداث"""
@@ -68,17 +118,20 @@ class Minimap:
         map_y = int(world_y * self.scale_y)
         return (self.x + map_x, self.y + map_y)
     
-    def set_walls(self, walls: List[pygame.Rect]):
-        """تعيين الجدران لرسمها مسبقاً"""
+    def set_walls(self, walls: List[pygame.Rect], surface: Optional[pygame.Surface] = None):
+        """تعيين الجدران لرسمها مسبقاً (أو سطح جاهز من render_walls_surface)"""
+        self._base = None
+        self.invalidate()
+        if surface is not None:
+            self.walls_surface = surface
+            self.walls_dirty = False
+            return
         self.walls_dirty = True
         self._render_walls(walls)
     
-    def _render_walls(self, walls: List[pygame.Rect]):
-        """رسم الجدران على سطح منفصل"""
-        if not self.walls_dirty:
-            return
-            
-        self.walls_surface = pygame.Surface((self.map_width, self.map_height), pygame.SRCALPHA)
+    def render_walls_surface(self, walls: List[pygame.Rect]) -> pygame.Surface:
+        """رسم الجدران على سطح منفصل بدون تغيير حالة الخريطة (للتحضير المسبق)"""
+        surface = pygame.Surface((self.map_width, self.map_height), pygame.SRCALPHA)
         
         for wall in walls:
             # تحويل الجدار
@@ -87,45 +140,59 @@ class Minimap:
             ww = max(1, int(wall.width * self.scale_x))
             wh = max(1, int(wall.height * self.scale_y))
             
-            pygame.draw.rect(self.walls_surface, (80, 60, 40, 255), 
+            pygame.draw.rect(surface, (80, 60, 40, 255), 
                            (wx, wy, ww, wh))
-        
-        self.walls_dirty = False
+        return surface
     
-    def draw(self, screen: pygame.Surface, 
-             player_pos: Tuple[float, float],
-             other_players: Dict[int, Dict],
-             zombies: Dict[int, object],
-             door: Optional[object] = None,
-             walls: Optional[List[pygame.Rect]] = None):
-        """
-        رسم الخريطة المصغرة
-        
-        Args:
-            player_pos: موقع اللاعب المحلي (x, y)
-            other_players: قاموس اللاعبين الآخرين
-            zombies: قاموس الزومبي
-            door: الباب (إذا كان موجوداً ونشطاً)
-            walls: قائمة الجدران (لرسمها مسبقاً)
-        """
-        if not self.visible:
+    def _render_walls(self, walls: List[pygame.Rect]):
+        """رسم الجدران على سطح منفصل"""
+        if not self.walls_dirty:
             return
-        
-        # تحديث الجدران إذا لزم الأمر
-        if walls and self.walls_dirty:
-            self._render_walls(walls)
-        
-        # إنشاء سطح الخريطة
-        map_surface = pygame.Surface((self.map_width, self.map_height), pygame.SRCALPHA)
-        
-        # خلفية
-        pygame.draw.rect(map_surface, (20, 25, 35, self.alpha), 
+            
+        self.walls_surface = self.render_walls_surface(walls)
+        self.walls_dirty = False
+        self._base = None
+    
+    def _render_base(self) -> pygame.Surface:
+        """الخلفية شبه الشفافة + الجدران"""
+        base = pygame.Surface((self.map_width, self.map_height), pygame.SRCALPHA)
+        pygame.draw.rect(base, (20, 25, 35, self.alpha), 
                         (0, 0, self.map_width, self.map_height),
                         border_radius=8)
-        
-        # الجدران
         if self.walls_surface:
-            map_surface.blit(self.walls_surface, (0, 0))
+            base.blit(self.walls_surface, (0, 0))
+        return base
+    
+    def _draw_heatmap(self, map_surface: pygame.Surface, points: List[Tuple[float, float]]):
+        """كثافة الزومبي لكل خلية HEAT_CELL بكسل: أحمر شفاف ← أصفر معتم"""
+        xy = np.array(points, dtype=np.float32)
+        gx = np.clip((xy[:, 0] * (self.scale_x / HEAT_CELL)).astype(np.int32), 0, self._heat_w - 1)
+        gy = np.clip((xy[:, 1] * (self.scale_y / HEAT_CELL)).astype(np.int32), 0, self._heat_h - 1)
+        counts = np.bincount(gx * self._heat_h + gy, minlength=self._heat_w * self._heat_h)
+        density = np.minimum(counts.reshape(self._heat_w, self._heat_h) / HEAT_SATURATION, 1.0)
+        
+        heat = self._heat_small
+        rgb = pygame.surfarray.pixels3d(heat)
+        rgb[..., 0] = 255
+        rgb[..., 1] = (50 + 170 * density).astype(np.uint8)
+        rgb[..., 2] = 50
+        del rgb
+        alpha = pygame.surfarray.pixels_alpha(heat)
+        alpha[...] = np.where(counts.reshape(self._heat_w, self._heat_h) > 0,
+                              90 + 165 * density, 0).astype(np.uint8)
+        del alpha
+        scaled = pygame.transform.smoothscale(heat, (self._heat_w * HEAT_CELL, self._heat_h * HEAT_CELL))
+        map_surface.blit(scaled, (0, 0))
+    
+    def _compose(self, other_players: Dict[int, Dict],
+                 zombies: Union[Dict[int, object], Iterable[object]],
+                 door: Optional[object]):
+        """إعادة تركيب سطح الخريطة الدائم (الجدران + الباب + الزومبي + اللاعبون الآخرون)"""
+        if self._base is None:
+            self._base = self._render_base()
+        map_surface = self.map_surface
+        map_surface.fill((0, 0, 0, 0))
+        map_surface.blit(self._base, (0, 0))
         
         # الباب (إذا كان نشطاً)
         if door and hasattr(door, 'active') and door.active:
@@ -141,12 +208,15 @@ class Minimap:
                            (door_map_x, door_map_y, door_size, door_size),
                            border_radius=2)
         
-        # الزومبي (نقاط حمراء)
-        for z_id, zombie in zombies.items():
-            if hasattr(zombie, 'hp') and zombie.hp > 0:
-                zx = int(zombie.x * self.scale_x)
-                zy = int(zombie.y * self.scale_y)
-                pygame.draw.circle(map_surface, (255, 50, 50), (zx, zy), 3)
+        # الزومبي: نقاط حمراء، أو خريطة كثافة للحشود الكبيرة
+        items = zombies.values() if isinstance(zombies, dict) else zombies
+        points = [(z.x, z.y) for z in items if getattr(z, 'hp', 0) > 0]
+        self.heatmap = len(points) > self.heatmap_threshold
+        if self.heatmap:
+            self._draw_heatmap(map_surface, points)
+        else:
+            for zx, zy in points:
+                pygame.draw.circle(map_surface, (255, 50, 50), (int(zx * self.scale_x), int(zy * self.scale_y)), 3)
         
         # اللاعبون الآخرون (نقاط خضراء)
         for other_id, other_data in other_players.items():
@@ -156,43 +226,52 @@ class Minimap:
                 # نقطة خضراء مع حدود
                 pygame.draw.circle(map_surface, (50, 255, 50), (ox, oy), 5)
                 pygame.draw.circle(map_surface, (200, 255, 200), (ox, oy), 5, 1)
+        self.refreshes += 1
+    
+    def draw(self, screen: pygame.Surface, 
+             player_pos: Tuple[float, float],
+             other_players: Dict[int, Dict],
+             zombies: Union[Dict[int, object], Iterable[object]],
+             door: Optional[object] = None,
+             walls: Optional[List[pygame.Rect]] = None):
+        """
+        رسم الخريطة المصغرة
         
-        # اللاعب المحلي (نقطة زرقاء)
-        px = int(player_pos[0] * self.scale_x)
-        py = int(player_pos[1] * self.scale_y)
-        # نقطة زرقاء مع توهج
-        pygame.draw.circle(map_surface, (100, 150, 255, 150), (px, py), 7)
-        pygame.draw.circle(map_surface, (50, 100, 255), (px, py), 5)
-        pygame.draw.circle(map_surface, (200, 220, 255), (px, py), 3)
-        
-        # الحدود
-        pygame.draw.rect(map_surface, (100, 100, 120),
-                        (0, 0, self.map_width, self.map_height),
-                        width=2, border_radius=8)
-        
-        # رسم على الشاشة
-        screen.blit(map_surface, (self.x, self.y))
-        
-        # عنوان الخريطة
-        font = pygame.font.Font(None, 18)
-        title_surf = font.render("MINIMAP [M]", True, (150, 150, 150))
-        screen.blit(title_surf, (self.x + 5, self.y - 18))
+        Args:
+            player_pos: موقع اللاعب المحلي (x, y)
+            other_players: قاموس اللاعبين الآخرين
+            zombies: قاموس الزومبي (أو قائمة؛ الموتى hp <= 0 يُتجاهلون)
+            door: الباب (إذا كان موجوداً ونشطاً)
+            walls: قائمة الجدران (لرسمها مسبقاً)
+        """
+        if not self.visible:
+            return
         
-        # دليل الألوان (مختصر)
-        legend_y = self.y + self.map_height + 5
-        legend_font = pygame.font.Font(None, 14)
+        # تحديث الجدران إذا لزم الأمر
+        if walls and self.walls_dirty:
+            self._render_walls(walls)
         
-        # لاعب محلي
-        pygame.draw.circle(screen, (50, 100, 255), (self.x + 8, legend_y + 6), 4)
+        # 🔥 العلامات المتحركة تُعاد تركيبها بمعدل REFRESH_HZ فقط
+        now = pygame.time.get_ticks()
+        if self._base is None or self._last_refresh is None or now - self._last_refresh >= self.refresh_ms:
+            self._compose(other_players, zombies, door)
+            self._last_refresh = now
         
-        # لاعب آخر
-        pygame.draw.circle(screen, (50, 255, 50), (self.x + 48, legend_y + 6), 4)
+        # رسم على الشاشة
+        screen.blit(self.map_surface, (self.x, self.y))
         
-        # زومبي
-        pygame.draw.circle(screen, (255, 50, 50), (self.x + 88, legend_y + 6), 4)
+        # اللاعب المحلي (كل إطار، مقصوص داخل الخريطة كما كان)
+        px = int(player_pos[0] * self.scale_x)
+        py = int(player_pos[1] * self.scale_y)
+        prev_clip = screen.get_clip()
+        screen.set_clip(prev_clip.clip((self.x, self.y, self.map_width, self.map_height)))
+        screen.blit(self.player_marker, (self.x + px - 7, self.y + py - 7))
+        screen.set_clip(prev_clip)
         
-        # الباب
-        pygame.draw.rect(screen, (255, 200, 50), (self.x + 120, legend_y + 2, 8, 8))
+        # الحدود والعنوان ودليل الألوان
+        screen.blit(self.border_surf, (self.x, self.y))
+        screen.blit(self.title_surf, (self.x + 5, self.y - 18))
+        screen.blit(self.legend_surf, (self.x, self.y + self.map_height + 5))
         
     def draw_simple(self, screen: pygame.Surface, 
                     player_x: float, player_y: float,
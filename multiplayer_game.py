@@ -4,8 +4,21 @@ import pygame
 import time
 import math
 import random
+from typing import Optional
 from util import Button, clamp, draw_shadow_text, draw_text, load_sound, load_image_to_height
-from walls import create_walls_for_level, collide_rect_list
+from walls import collide_rect_list
+from collision import SpatialHash, sweep_first_hit, resolve_explosion
+from culling import CULL
+from sprite_batch import BATCH, SpriteBatch, circle_sprite, text_sprite, bar_sprite
+from anim_strips import AnimStrip, baked, label_sprite, pickup_strip, strip as anim_strip
+from scene_layers import vertical_gradient
+from ai_scheduler import AIScheduler
+from visibility import VisibilitySet
+from level_prep import LevelPrefetcher
+from background import TiledBackground
+from profiler import FrameProfiler
+from render_scale import RENDER_SCALE
+from memory import MONITOR, surface_bytes
 
 from characters import Player
 
@@ -18,9 +31,9 @@ from settings import game_settings
 FEATURES_ENABLED = True
 
 def get_current_skin():
-    """الحصول على المظهر المختار من game.py"""
+    """الحصول على المظهر المختار من القائمة الرئيسية (menu.py)"""
     try:
-        from game import CURRENT_SKIN
+        from menu import CURRENT_SKIN
         return CURRENT_SKIN
     except ImportError:
         return DEFAULT_SKIN
@@ -39,7 +52,7 @@ LEVEL_COLORS = {
     5: (140, 60, 40),   # المستوى 5: صهارة حمراء/أرض محروقة (Burning Magma)
     6: (30, 30, 30),    # المستوى 6: هاوية/مواجهة نهائية سوداء (Abyss/Final Arena)
 }
-BG_EFFECTS = {} # (سيحتوي على الخلفيات المرسومة مسبقاً)
+BG_EFFECTS = {} # (سيحتوي على خلفية البلاطات)
 
 # ------------- Music -------------
 def _maybe_music():
@@ -62,6 +75,10 @@ class Camera:
         self.x, self.y = 0.0, 0.0
         # (يمكن إضافة متغيرات اهتزاز الشاشة هنا إذا أردت)
 
+    def view_rect(self) -> pygame.Rect:
+        """المنطقة الظاهرة من العالم"""
+        return pygame.Rect(int(self.x), int(self.y), self.view_w, self.view_h)
+
     def follow(self, target_rect: pygame.Rect, lerp: float = 0.15):
         tx = target_rect.centerx - self.view_w // 2
         ty = target_rect.centery - self.view_h // 2
@@ -82,8 +99,11 @@ class SpeedCrate:
     def __init__(self, x: float, y: float, crate_id: int = 0):
         self.id = crate_id
         self.x, self.y = float(x), float(y)
-        self.img_closed = load_image_to_height("chest_closed.png", CRATE_H)
-        self.img_opened = load_image_to_height("chest_opened.png", CRATE_H)
+        # 🔥 الصور المحجّمة مشتركة بين كل الصناديق
+        self.img_closed = baked(("image", "chest_closed.png", CRATE_H),
+                                lambda: load_image_to_height("chest_closed.png", CRATE_H))
+        self.img_opened = baked(("image", "chest_opened.png", CRATE_H),
+                                lambda: load_image_to_height("chest_opened.png", CRATE_H))
         if self.img_closed:
             self.w, self.h = self.img_closed.get_width(), self.img_closed.get_height()
         else:
@@ -91,6 +111,14 @@ class SpeedCrate:
         self.alive = True
         self.open = False
         self.open_timer = 0.0
+    def _plain(self) -> pygame.Surface:
+        def build():
+            surf = pygame.Surface((self.w, self.h), pygame.SRCALPHA)
+            r = surf.get_rect()
+            pygame.draw.rect(surf, (120, 85, 40), r, border_radius=6)
+            pygame.draw.rect(surf, (220, 200, 160), r, width=2, border_radius=6)
+            return surf
+        return baked(("crate_mp", self.w, self.h), build)
     @property
     def rect(self) -> pygame.Rect:
         return pygame.Rect(int(self.x), int(self.y), self.w, self.h)
@@ -112,9 +140,7 @@ class SpeedCrate:
         elif (not self.open) and self.img_closed:
             screen.blit(self.img_closed, (dx, dy))
         else:
-            r = pygame.Rect(dx, dy, self.w, self.h)
-            pygame.draw.rect(screen, (120, 85, 40), r, border_radius=6)
-            pygame.draw.rect(screen, (220, 200, 160), r, width=2, border_radius=6)
+            screen.blit(self._plain(), (dx, dy))
     def to_dict(self):
         return { 'id': self.id, 'x': self.x, 'y': self.y, 'alive': self.alive, 'open': self.open }
     @staticmethod
@@ -214,66 +240,70 @@ class LevelDoor:
             pygame.draw.rect(screen, (0, 0, 0, 180), bg_rect, border_radius=3)
             screen.blit(dist_surface, dist_rect)
         
-    def draw(self, screen: pygame.Surface, cam: Camera):
-        """رسم باب بسيط وجميل - محسّن للأداء"""
-        dx, dy = cam.apply_xy(self.x, self.y)
-        center_x = dx + self.w // 2
-        center_y = dy + self.h // 2
-        
-        if self.active:
-            # === الباب النشط: بوابة متوهجة بسيطة ===
-            pulse = 1.0 + math.sin(self.glow_timer * 3) * 0.1
-            ring_radius = int((self.w // 2 + 5) * pulse)
-            
-            # توهج بسيط (دائرة واحدة فقط)
-            glow_surf = pygame.Surface((ring_radius * 3, ring_radius * 3), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, (100, 200, 255, 80), (ring_radius * 3 // 2, ring_radius * 3 // 2), ring_radius)
-            screen.blit(glow_surf, (center_x - ring_radius * 3 // 2, center_y - ring_radius * 3 // 2))
-            
+    def _portal_strip(self) -> AnimStrip:
+        """🔥 البوابة المتوهجة (نبض + 4 جزيئات) لدورة glow_timer كاملة - تُرسم مرة واحدة"""
+        w, h = self.w, self.h
+
+        def build(phase: float):
+            pulse = 1.0 + math.sin(phase * 3) * 0.1
+            ring_radius = int((w // 2 + 5) * pulse)
+            size = ring_radius * 3
+            c = size // 2
+            frame = pygame.Surface((size, size), pygame.SRCALPHA)
+            # توهج بسيط (دائرة واحدة فقط) - شفافيته تبقى في الإطار وتُمزج عند الرسم
+            pygame.draw.circle(frame, (100, 200, 255, 80), (c, c), ring_radius)
             # المركز (دائرة واحدة متوهجة)
-            pygame.draw.circle(screen, (80, 150, 255), (center_x, center_y), ring_radius - 5)
-            pygame.draw.circle(screen, (150, 220, 255), (center_x, center_y), ring_radius - 10)
-            
+            pygame.draw.circle(frame, (80, 150, 255), (c, c), ring_radius - 5)
+            pygame.draw.circle(frame, (150, 220, 255), (c, c), ring_radius - 10)
             # الحلقة الخارجية
-            pygame.draw.circle(screen, (100, 200, 255), (center_x, center_y), ring_radius, 4)
-            
+            pygame.draw.circle(frame, (100, 200, 255), (c, c), ring_radius, 4)
             # 4 جزيئات فقط (بدلاً من 8)
             for i in range(4):
-                angle = self.glow_timer * 2 + i * (math.pi / 2)
-                px = center_x + int(math.cos(angle) * (ring_radius + 8))
-                py = center_y + int(math.sin(angle) * (ring_radius + 8))
-                pygame.draw.circle(screen, (200, 240, 255), (px, py), 3)
-            
-            # نص المستوى
-            font = pygame.font.Font(None, 26)
-            text_surf = font.render(f"LEVEL {self.level + 1}", True, (255, 255, 200))
-            text_rect = text_surf.get_rect(center=(center_x, dy - 20))
-            pygame.draw.rect(screen, (0, 0, 50), text_rect.inflate(16, 8), border_radius=6)
-            screen.blit(text_surf, text_rect)
-        else:
-            # === الباب المغلق: بسيط وسريع ===
-            door_rect = pygame.Rect(dx, dy, self.w, self.h)
-            
+                angle = phase * 2 + i * (math.pi / 2)
+                px = c + int(math.cos(angle) * (ring_radius + 8))
+                py = c + int(math.sin(angle) * (ring_radius + 8))
+                pygame.draw.circle(frame, (200, 240, 255), (px, py), 3)
+            return frame, (w // 2 - c, h // 2 - c)
+
+        return anim_strip(("portal", w, h), build)
+
+    def _closed_door(self) -> pygame.Surface:
+        """الباب المغلق ثابت: سطح واحد مخزن"""
+        w, h = self.w, self.h
+
+        def build():
+            surf = pygame.Surface((w + 3, h + 3), pygame.SRCALPHA)
+            door_rect = pygame.Rect(0, 0, w, h)
             # ظل
-            pygame.draw.rect(screen, (20, 15, 10), door_rect.move(3, 3), border_radius=6)
-            
+            pygame.draw.rect(surf, (20, 15, 10), door_rect.move(3, 3), border_radius=6)
             # الباب (لون واحد)
-            pygame.draw.rect(screen, (70, 50, 35), door_rect, border_radius=6)
-            
+            pygame.draw.rect(surf, (70, 50, 35), door_rect, border_radius=6)
             # إطار
-            pygame.draw.rect(screen, (40, 28, 18), door_rect, 3, border_radius=6)
-            
+            pygame.draw.rect(surf, (40, 28, 18), door_rect, 3, border_radius=6)
             # لوحتين بسيطتين
-            panel1 = pygame.Rect(dx + 6, dy + 6, self.w - 12, self.h // 2 - 9)
-            panel2 = pygame.Rect(dx + 6, dy + self.h // 2 + 3, self.w - 12, self.h // 2 - 9)
-            pygame.draw.rect(screen, (55, 40, 28), panel1, 2, border_radius=3)
-            pygame.draw.rect(screen, (55, 40, 28), panel2, 2, border_radius=3)
-            
+            panel1 = pygame.Rect(6, 6, w - 12, h // 2 - 9)
+            panel2 = pygame.Rect(6, h // 2 + 3, w - 12, h // 2 - 9)
+            pygame.draw.rect(surf, (55, 40, 28), panel1, 2, border_radius=3)
+            pygame.draw.rect(surf, (55, 40, 28), panel2, 2, border_radius=3)
             # مقبض
-            pygame.draw.circle(screen, (90, 70, 45), (dx + self.w - 14, center_y), 5)
+            pygame.draw.circle(surf, (90, 70, 45), (w - 14, h // 2), 5)
+            return surf
 
+        return baked(("door_closed_mp", w, h), build)
 
+    def draw(self, screen: pygame.Surface, cam: Camera):
+        """رسم باب بسيط وجميل - إطارات مرسومة مسبقاً"""
+        dx, dy = cam.apply_xy(self.x, self.y)
 
+        if self.active:
+            # === الباب النشط: بوابة متوهجة ===
+            self._portal_strip().blit(screen, self.glow_timer, (dx, dy))
+            # نص المستوى
+            label = label_sprite(f"LEVEL {self.level + 1}", 26, (255, 255, 200), (0, 0, 50))
+            screen.blit(label, label.get_rect(center=(dx + self.w // 2, dy - 20)))
+        else:
+            # === الباب المغلق ===
+            screen.blit(self._closed_door(), (dx, dy))
 
     def to_dict(self):
         return {
@@ -285,6 +315,10 @@ class LevelDoor:
 
 # ---------------- Zombie (OPTIMIZED) ----------------
 ZOMBIE_SIZE = 96
+# 🔥 إيقاع زومبي المضيف: الحلقة القديمة حدّثت كل زومبي كل 3 إطارات بـ dt إطار واحد،
+# أي الحركة والمؤقتات بثلث الوقت الفعلي. الجدولة تمرر الوقت المتراكم كاملاً، لذلك نحافظ على
+# السرعة الفعلية القديمة هنا (رفعها لـ 1.0 = نفس سرعة الفردي: تغيير توازن منفصل)
+HOST_ZOMBIE_PACE = 1 / 3
 def raycast_clear(a: pygame.Vector2, b: pygame.Vector2, walls: list[pygame.Rect], step: float = 32.0) -> bool:
     d = b - a
     dist = d.length() or 1.0
@@ -297,6 +331,19 @@ def raycast_clear(a: pygame.Vector2, b: pygame.Vector2, walls: list[pygame.Rect]
         if collide_rect_list(test, walls):
             return False
     return True
+# 🔥 جدول الرؤية المحسوب مسبقاً للمستوى الحالي (يُضبط عند تحميل المستوى)
+LEVEL_PVS: VisibilitySet | None = None
+
+def has_line_of_sight(a: pygame.Vector2, b: pygame.Vector2, walls: list[pygame.Rect]) -> bool:
+    """
+    خط الرؤية: جدول PVS يرفض الأزواج التي حُجبت كل خطوط العينة بين خليتيهما، والباقي بالاختبار الدقيق.
+    الرفض تقريبي: فتحة ضيقة بين خطوط العينة قد تُرى منها النقطتان (~0.2-0.6% من الرفض)،
+    فيفوت الزومبي أحياناً لاعباً ظاهراً - مقبول مقابل تخطي raycast لمعظم الأزواج المحجوبة.
+    """
+    if LEVEL_PVS is not None and LEVEL_PVS.query(a.x, a.y, b.x, b.y) is False:
+        return False
+    return raycast_clear(a, b, walls)
+
 class Zombie:
     def __init__(self, x: float, y: float, level: int = 1, zombie_id: int = 0):
         self.id = zombie_id
@@ -347,7 +394,11 @@ class Zombie:
         if dy != 0:
             ry = pygame.Rect(int(self.x), r.y + int(dy), r.w, r.h)
             if not collide_rect_list(ry, walls): self.y += dy
-    def update_host(self, player_pos: pygame.Vector2, walls: list[pygame.Rect], dt: float, neighbors: list["Zombie"]):
+    def update_host(self, player_pos: pygame.Vector2, walls: list[pygame.Rect], dt: float, neighbors: list["Zombie"],
+                    pace: float = 1.0):
+        """pace: نسبة الوقت المطبقة على الحركة ومؤقتات الذكاء (التمايل بالوقت الفعلي)"""
+        bob_dt = dt
+        dt *= pace
         spd = self.speed * 60.0 * dt
         sep_x = sep_y = 0.0
         for other in neighbors:
@@ -362,7 +413,7 @@ class Zombie:
         self.raycast_timer -= dt
         if self.raycast_timer <= 0:
             self.raycast_timer = 0.3
-            self.can_see_player = raycast_clear(center, player_pos, walls)
+            self.can_see_player = has_line_of_sight(center, player_pos, walls)
         if self.can_see_player:
             target = player_pos
             self.waypoint = None
@@ -385,42 +436,39 @@ class Zombie:
         dir_y /= norm
         self._slide_move(dir_x * spd, 0, walls)
         self._slide_move(0, dir_y * spd, walls)
-        self.bob_t += dt * 6.0
+        self.bob_t += bob_dt * 6.0
         self.lerp_target_x = self.x
         self.lerp_target_y = self.y
     def update_client(self, dt: float):
         self.bob_t += dt * 6.0
         self.x += (self.lerp_target_x - self.x) * dt * 10.0
         self.y += (self.lerp_target_y - self.y) * dt * 10.0
-    def draw(self, screen: pygame.Surface, cam: Camera):
+    def draw(self, screen: pygame.Surface, cam: Camera, batch: Optional[SpriteBatch] = None):
+        """مع batch تُضاف السبرايتات لطبقتي zombies / zombie_ui بدل الرسم الفوري"""
         dx, dy = cam.apply_xy(self.x, self.y)
+        body = []
+        ui = []
         if self.sprite:
             off = math.sin(self.bob_t) * 1.5
-            screen.blit(self.sprite, (dx, dy + off))
+            body.append((self.sprite, (dx, dy + off)))
         else:
             r = pygame.Rect(dx, dy, self.w, self.h)
             pygame.draw.rect(screen, (90, 160, 220), r, border_radius=6)
         
-        # 🔥 عرض مستوى الزومبي فوق رأسه
-        level_text = f"LVL{self.level}"
-        font = pygame.font.Font(None, 18)
-        text_surf = font.render(level_text, True, (255, 255, 100))
-        text_rect = text_surf.get_rect(center=(dx + self.w//2, dy - 20))
-        
-        # خلفية شبه شفافة للنص لتحسين الوضوح
-        bg_rect = text_rect.inflate(6, 2)
-        bg_surf = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-        bg_surf.fill((0, 0, 0, 160))
-        screen.blit(bg_surf, bg_rect.topleft)
-        screen.blit(text_surf, text_rect)
+        # 🔥 عرض مستوى الزومبي فوق رأسه (النص مع خلفيته الشفافة مخزن لكل مستوى)
+        label = text_sprite(f"LVL{self.level}", 18, (255, 255, 100), bg=(0, 0, 0, 160), pad=(6, 2))
+        ui.append((label, label.get_rect(center=(dx + self.w//2, dy - 20))))
         
         # عرض شريط الصحة (إذا كان مصاباً)
         if self.hp < self.max_hp:
-            health_ratio = self.hp / self.max_hp
             # رفع شريط الصحة قليلاً لإفساح المجال للنص
-            health_y = dy - 35
-            pygame.draw.rect(screen, (50, 50, 50), (dx, health_y, self.w, 6))
-            pygame.draw.rect(screen, (0, 255, 0), (dx, health_y, self.w * health_ratio, 6))
+            ui.append((bar_sprite(self.w, 6, self.hp / self.max_hp), (dx, dy - 35)))
+        
+        if batch is None:
+            screen.blits(body + ui, doreturn=False)
+        else:
+            batch.layer("zombies").extend(body)
+            batch.layer("zombie_ui").extend(ui)
     def to_dict(self):
         return { 'id': self.id, 'x': self.x, 'y': self.y, 'hp': self.hp, 'level': self.level }
     @staticmethod
@@ -453,14 +501,17 @@ class BloodParticle:
     @property
     def alive(self) -> bool:
         return self.age < self.life
-    def draw(self, screen: pygame.Surface, cam: Camera):
+    def draw(self, screen: pygame.Surface, cam: Camera, batch: Optional[SpriteBatch] = None):
         if not self.alive: return
         alpha = max(0, 255 * (1.0 - self.age / self.life))
-        color = (self.col[0], self.col[1], self.col[2], int(alpha))
-        surf = pygame.Surface((int(self.r*2)+2, int(self.r*2)+2), pygame.SRCALPHA)
-        pygame.draw.circle(surf, color, (surf.get_width()//2, surf.get_height()//2), int(self.r))
+        size = int(self.r*2)+2
+        surf = circle_sprite(size, int(self.r), self.col, alpha)  # 🔥 سبرايت مشترك بدل Surface جديد
         dx, dy = cam.apply_xy(self.x, self.y)
-        screen.blit(surf, (dx - surf.get_width()//2, dy - surf.get_height()//2))
+        dest = (dx - size//2, dy - size//2)
+        if batch is None:
+            screen.blit(surf, dest)
+        else:
+            batch.layer("blood").append((surf, dest))
 
 # ---------------- Pickup ----------------
 class Pickup:
@@ -475,109 +526,11 @@ class Pickup:
     def draw(self, screen: pygame.Surface, cam: Camera):
         if not self.alive: return
         
-        # 🔥 حركة طفو
+        # 🔥 حركة طفو: إطار مرسوم مسبقاً من شريط النوع (ظل صناديق الذخيرة يتذبذب بثلاثة أضعاف تردد الطفو)
         t = time.time() * 4.0
-        bob_offset = math.sin(t) * 4.0
-        
         dx, dy = cam.apply_xy(self.x, self.y)
-        dx = int(dx)
-        dy = int(dy + bob_offset)
-        
-        w, h = 40, 30
-        
-        if self.kind == "medkit":
-            # 🏥 حقيبة إسعافات احترافية (Medical Case)
-            # الألوان
-            case_color = (240, 240, 245)    # أبيض
-            cross_color = (220, 20, 60)     # أحمر
-            handle_color = (60, 60, 60)     # رمادي غامق
-            shadow_color = (180, 180, 190)  # ظل الحقيبة
-            
-            # الظل على الأرض
-            shadow_width = w + int(math.sin(t)*4)
-            pygame.draw.ellipse(screen, (0, 0, 0, 60), 
-                              (dx + (w-shadow_width)//2, dy + h + 10 - bob_offset, shadow_width, 8))
-            
-            # جسم الحقيبة (3D Look)
-            # الوجه الخلفي/الجانبي
-            pygame.draw.rect(screen, shadow_color, (dx + 4, dy - 4, w, h), border_radius=6)
-            # الوجه الأمامي
-            rect = pygame.Rect(dx, dy, w, h)
-            pygame.draw.rect(screen, case_color, rect, border_radius=6)
-            pygame.draw.rect(screen, (200, 200, 210), rect, width=2, border_radius=6)
-            
-            # المقبض في الأعلى
-            pygame.draw.rect(screen, handle_color, (dx + w//2 - 6, dy - 8, 12, 8), border_radius=2)
-            pygame.draw.rect(screen, (0,0,0), (dx + w//2 - 4, dy - 6, 8, 4)) # فراغ المقبض
-            
-            # الصليب الأحمر (Red Cross)
-            cw, ch = 8, 20
-            cx, cy = dx + w//2, dy + h//2
-            pygame.draw.rect(screen, cross_color, (cx - cw//2, cy - ch//2, cw, ch), border_radius=2)
-            pygame.draw.rect(screen, cross_color, (cx - ch//2, cy - cw//2, ch, cw), border_radius=2)
-            
-            # لمعان
-            pygame.draw.ellipse(screen, (255, 255, 255), (dx + 4, dy + 4, 12, 8))
-            
-        elif self.kind == "shotgun_ammo" or self.kind == "grenade_ammo":
-            # 📦 صندوق ذخيرة عسكري 3D
-            if self.kind == "shotgun_ammo":
-                main_color = (180, 40, 40)      # أحمر للخرطوش
-                light_color = (220, 60, 60)
-                dark_color = (120, 30, 30)
-                icon_color = (255, 200, 50)     # ذهبي
-                label = "SHELLS"
-            else: # grenade_ammo
-                main_color = (50, 80, 50)       # أخضر عسكري
-                light_color = (70, 100, 70)
-                dark_color = (30, 50, 30)
-                icon_color = (200, 200, 200)    # فضي
-                label = "NADES"
-
-            # الظل
-            shadow_width = w + int(math.sin(t*3)*2)
-            pygame.draw.ellipse(screen, (0, 0, 0, 80), 
-                              (dx + (w-shadow_width)//2, dy + h + 5 - bob_offset, shadow_width, 8))
-
-            # الوجه الخلفي
-            pygame.draw.rect(screen, dark_color, (dx + 4, dy - 4, w, h), border_radius=4)
-            # الوجه الأمامي
-            rect = pygame.Rect(dx, dy, w, h)
-            pygame.draw.rect(screen, main_color, rect, border_radius=4)
-            
-            # تفاصيل الإطار
-            pygame.draw.rect(screen, light_color, rect, width=2, border_radius=4)
-            corner_len = 8
-            corner_color = (180, 180, 180)
-            pygame.draw.line(screen, corner_color, (dx, dy), (dx + corner_len, dy), 2)
-            pygame.draw.line(screen, corner_color, (dx, dy), (dx, dy + corner_len), 2)
-            pygame.draw.line(screen, corner_color, (dx + w, dy + h), (dx + w - corner_len, dy + h), 2)
-            pygame.draw.line(screen, corner_color, (dx + w, dy + h), (dx + w, dy + h - corner_len), 2)
-            
-            # الرمز
-            font = pygame.font.SysFont("arial", 9, bold=True)
-            text_surf = font.render(label, True, icon_color)
-            text_rect = text_surf.get_rect(center=rect.center)
-            bg_text_rect = text_rect.inflate(4, 2)
-            pygame.draw.rect(screen, (0, 0, 0, 100), bg_text_rect, border_radius=2)
-            screen.blit(text_surf, text_rect)
-            
-        else:
-            # 📦 صندوق غامض (Mystery Crate) - فقط للأنواع غير المعروفة
-            box_color = (100, 80, 60)
-            tape_color = (200, 180, 140)
-            
-            # الظل
-            pygame.draw.ellipse(screen, (0, 0, 0, 80), (dx + 2, dy + h + 2, w - 4, 8))
-            
-            # الصندوق
-            rect = pygame.Rect(dx, dy, w, h)
-            pygame.draw.rect(screen, box_color, rect, border_radius=4)
-            pygame.draw.rect(screen, (80, 60, 40), rect, width=2, border_radius=4)
-            
-            # شريط لاصق
-            pygame.draw.line(screen, tape_color, (dx + w//2, dy), (dx + w//2, dy + h), 4)
-            pygame.draw.line(screen, tape_color, (dx, dy + h//2), (dx + w, dy + h//2), 4)
+        shadow_freq = 3 if self.kind in ("shotgun_ammo", "grenade_ammo") else 1
+        pickup_strip(self.kind, shadow_freq).blit(screen, t, (dx, dy))
 
     def to_dict(self):
         return { 'id': self.id, 'x': self.x, 'y': self.y, 'kind': self.kind, 'alive': self.alive }
@@ -645,66 +598,19 @@ def find_door_location(walls: list[pygame.Rect], player_x: float, player_y: floa
 def generate_background_effects(level: int, effects_dict: dict, W: int, H: int):
     """
     ينشئ ويخزن المؤثرات البرمجية (نجوم، شقوق، بقع) للخلفية.
-    يرسمها مسبقاً على سطح واحد كبير لتحقيق أقصى أداء.
+    خلفية مقسمة لبلاطات تُرسم عند أول ظهور فقط.
     """
     effects_dict.clear() 
-    rng = random.Random(level) 
-    
-    bg_surf = pygame.Surface((W, H)).convert() 
-    
-    base_col = LEVEL_COLORS.get(level, (166, 98, 42))
-    bg_surf.fill(base_col)
-
-    if level == 2: # مدينة - شبكة بلاط
-        tile_size = 80
-        grid_color = (100, 100, 100)
-        for x in range(0, W, tile_size):
-            pygame.draw.line(bg_surf, grid_color, (x, 0), (x, H), 1)
-        for y in range(0, H, tile_size):
-            pygame.draw.line(bg_surf, grid_color, (0, y), (W, y), 1)
-
-    elif level == 3: # غابة
-        for _ in range(400):
-            x = rng.randint(0, W); y = rng.randint(0, H)
-            r = rng.randint(15, 45)
-            col_darken = rng.randint(5, 20)
-            col = (
-                max(0, LEVEL_COLORS[3][0] - col_darken),
-                max(0, LEVEL_COLORS[3][1] - col_darken),
-                max(0, LEVEL_COLORS[3][2] - col_darken)
-            )
-            pygame.draw.circle(bg_surf, col, (x, y), r)
-            
-    elif level == 4: # فضاء
-        for _ in range(1000):
-            x = rng.randint(0, W); y = rng.randint(0, H)
-            r = rng.randint(1, 3)
-            brightness = rng.randint(150, 255)
-            col = (brightness, brightness, brightness)
-            pygame.draw.circle(bg_surf, col, (x, y), r)
-
-    elif level == 5: # بركان
-        crack_color = (20, 10, 10)
-        for _ in range(150):
-            x1 = rng.randint(0, W); y1 = rng.randint(0, H)
-            angle = rng.uniform(0, 2 * math.pi)
-            length = rng.randint(50, 200)
-            x2 = x1 + int(math.cos(angle) * length)
-            y2 = y1 + int(math.sin(angle) * length)
-            width = rng.randint(2, 5)
-            pygame.draw.line(bg_surf, crack_color, (x1, y1), (x2, y2), width)
-
-    effects_dict["pre_rendered_bg"] = bg_surf
+    effects_dict["tiled_bg"] = TiledBackground(level, W, H, LEVEL_COLORS.get(level, (166, 98, 42)))
 
 def draw_level_background(screen: pygame.Surface, level: int, cam: Camera, effects_dict: dict):
     """
-    يرسم الخلفية: يستخدم "اللوحة" المرسومة مسبقاً.
+    يرسم الخلفية: البلاطات التي تتقاطع مع الكاميرا فقط.
     """
-    bg_surf = effects_dict.get("pre_rendered_bg")
+    tiled_bg = effects_dict.get("tiled_bg")
     
-    if bg_surf:
-        visible_area = pygame.Rect(int(cam.x), int(cam.y), WINDOW_W, WINDOW_H)
-        screen.blit(bg_surf, (0, 0), area=visible_area)
+    if tiled_bg:
+        tiled_bg.draw(screen, int(cam.x), int(cam.y), WINDOW_W, WINDOW_H)
     else:
         # (كود احتياطي إذا فشل التحميل)
         current_bg_color = LEVEL_COLORS.get(level, (166, 98, 42)) 
@@ -817,6 +723,84 @@ class MultiplayerVictoryScene:
         self.golden_overlay.set_alpha(20)
         # خلفية تدرّج ذهبية مرسومة مسبقاً
         self.gradient_bg = create_victory_gradient_m(self.W, self.H)
+        # 🔥 الطبقات الثابتة تُبنى مرة واحدة (الأشعة والكونفيتي والنبض فقط تتحرك)
+        self._build_layers()
+    
+    def _build_layers(self):
+        """الخلفية المضيئة، التوهج المركزي، النصوص ولوحة الإحصائيات"""
+        W, H = self.W, self.H
+        cx, cy = W // 2, int(H * 0.38)
+        
+        # الصورة + تعزيز السطوع بإضافة طفيفة بيضاء/ذهبية
+        self.static_bg = None
+        if self.bg_image:
+            self.static_bg = pygame.Surface((W, H))
+            self.static_bg.blit(self.bg_image, (self.bg_x, self.bg_y))
+            brighten = pygame.Surface((W, H))
+            brighten.fill((255, 255, 255))
+            brighten.set_alpha(50)
+            self.static_bg.blit(brighten, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+        
+        # سطح الأشعة يُعاد استخدامه كل إطار
+        self.rays = pygame.Surface((W, H), pygame.SRCALPHA)
+        
+        # توهج مركزي (Bloom) بحجم دائرته فقط
+        self.bloom = pygame.Surface((640, 640), pygame.SRCALPHA)
+        for r in range(320, 0, -24):
+            a = max(0, 60 - (320 - r) // 6)
+            pygame.draw.circle(self.bloom, (255, 255, 220, a), (320, 320), r)
+        self.bloom_pos = (cx - 320, cy - 320)
+        
+        # نص VICTORY (لون التوهج ثابت - الشفافية في لون render لا تؤثر)
+        font_large = pygame.font.Font(None, 82)
+        self.title_surf = font_large.render("VICTORY!", True, (255, 215, 0))
+        self.title_rect = self.title_surf.get_rect(center=(W // 2, H // 3 - 60))
+        self.title_glow = font_large.render("VICTORY!", True, (255, 255, 150))
+        
+        font_medium = pygame.font.Font(None, 36)
+        subtext_surf = font_medium.render("All Levels Completed!", True, (0, 0, 0))
+        self.texts = [(subtext_surf, subtext_surf.get_rect(center=(W // 2, H // 3 + 10)))]
+        
+        # مربع الإحصائيات (فاتح وذهبي)
+        stats_y = H // 3 + 70
+        stats_bg = pygame.Rect(W // 2 - 200, stats_y - 20, 400, 140)
+        panel = pygame.Surface((stats_bg.width, stats_bg.height), pygame.SRCALPHA)
+        for py in range(panel.get_height()):
+            prog = py / panel.get_height()
+            col = (255, int(245 - 30 * prog), int(200 - 60 * prog), 90)
+            pygame.draw.line(panel, col, (0, py), (panel.get_width(), py))
+        pygame.draw.rect(panel, (255, 215, 0, 180), panel.get_rect(), 3, border_radius=15)
+        self.texts.append((panel, stats_bg))
+        
+        # النقاط النهائية والقتلى والإنجاز
+        score_font = pygame.font.Font(None, 32)
+        your_score = int(self.score_by_player.get(self.player_id, 0))
+        other_id = 2 if self.player_id == 1 else 1
+        other_score = int(self.score_by_player.get(other_id, 0))
+        your_kills = int(self.kills_by_player.get(self.player_id, 0))
+        other_kills = int(self.kills_by_player.get(other_id, 0))
+        lines = [
+            (f"P{self.player_id} Score: {your_score}", 10),
+            (f"P{other_id} Score: {other_score}", 35),
+            (f"P{self.player_id} Kills: {your_kills}", 65),
+            (f"P{other_id} Kills: {other_kills}", 90),
+            ("You are the ultimate survivors!", 125),
+        ]
+        for text, dy in lines:
+            surf = score_font.render(text, True, (0, 0, 0))
+            self.texts.append((surf, surf.get_rect(center=(W // 2, stats_y + dy))))
+        
+        self._confetti_cache = {}
+    
+    def _confetti_sprite(self, size: int, color, rotation: float) -> pygame.Surface:
+        """مربع ملون مدوّر (المربع متماثل كل 90 درجة: 90 نسخة لكل حجم ولون)"""
+        key = (size, color, int(rotation) % 90)
+        rotated = self._confetti_cache.get(key)
+        if rotated is None:
+            particle_surf = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.rect(particle_surf, color, (0, 0, size, size))
+            rotated = self._confetti_cache[key] = pygame.transform.rotate(particle_surf, key[2])
+        return rotated
     
     def _create_confetti_particles(self):
         """إنشاء جزيئات احتفالية (كونفيتي)"""
@@ -866,44 +850,34 @@ class MultiplayerVictoryScene:
         screen = self.screen
         
         # خلفية
-        if self.bg_image:
-            screen.blit(self.bg_image, (self.bg_x, self.bg_y))
-            # تعزيز السطوع بإضافة طفيفة بيضاء/ذهبية
-            brighten = pygame.Surface((self.W, self.H))
-            brighten.fill((255, 255, 255))
-            brighten.set_alpha(50)
-            screen.blit(brighten, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+        if self.static_bg:
+            screen.blit(self.static_bg, (0, 0))
         else:
             # خلفية ذهبية فاخرة عند عدم توفر الصورة
             screen.blit(self.gradient_bg, (0, 0))
         
         # رسم الكونفيتي
         for particle in self.confetti_particles:
-            particle_surf = pygame.Surface((particle['size'], particle['size']), pygame.SRCALPHA)
-            pygame.draw.rect(particle_surf, particle['color'], (0, 0, particle['size'], particle['size']))
-            rotated = pygame.transform.rotate(particle_surf, particle['rotation'])
+            rotated = self._confetti_sprite(particle['size'], particle['color'], particle['rotation'])
             rect = rotated.get_rect(center=(particle['x'], particle['y']))
             screen.blit(rotated, rect.topleft)
         
         # أشعة شعاعية ذهبية ساطعة
-        rays = pygame.Surface((self.W, self.H), pygame.SRCALPHA)
+        rays = self.rays
+        rays.fill((0, 0, 0, 0))
         cx, cy = self.W // 2, int(self.H * 0.38)
         ray_count = 36
         base_angle = self.text_glow_timer * 0.5
+        length = max(self.W, self.H) * 1.2
         for i in range(ray_count):
             ang = base_angle + (i / ray_count) * (2 * math.pi)
-            length = max(self.W, self.H) * 1.2
             x2 = cx + math.cos(ang) * length
             y2 = cy + math.sin(ang) * length
             pygame.draw.line(rays, (255, 240, 180, 60), (cx, cy), (x2, y2), 28)
         screen.blit(rays, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
 
         # توهج مركزي (Bloom) لإبراز السطوع
-        bloom = pygame.Surface((self.W, self.H), pygame.SRCALPHA)
-        for r in range(320, 0, -24):
-            a = max(0, 60 - (320 - r) // 6)
-            pygame.draw.circle(bloom, (255, 255, 220, a), (cx, cy), r)
-        screen.blit(bloom, (0, 0), special_flags=pygame.BLEND_ADD)
+        screen.blit(self.bloom, self.bloom_pos, special_flags=pygame.BLEND_ADD)
 
         # طبقة ذهبية نابضة قوية
         pulse = (math.sin(self.text_glow_timer * 1.2) + 1) * 0.5
@@ -911,64 +885,13 @@ class MultiplayerVictoryScene:
         screen.blit(self.golden_overlay, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
         
         # نص VICTORY مع تأثير التوهج
-        glow_intensity = (math.sin(self.text_glow_timer * 3) + 1) * 0.3 + 0.4
-        main_color = (255, 215, 0)
-        glow_color = (255, 255, 150, int(200 * glow_intensity))
-
-        font_large = pygame.font.Font(None, 82)
-        text_surf = font_large.render("VICTORY!", True, main_color)
-        text_rect = text_surf.get_rect(center=(self.W // 2, self.H // 3 - 60))
-
-        glow_surf = font_large.render("VICTORY!", True, glow_color)
+        text_rect = self.title_rect
         for offset in [(2,2), (-2,2), (2,-2), (-2,-2), (0,3), (0,-3), (3,0), (-3,0)]:
-            screen.blit(glow_surf, (text_rect.x + offset[0], text_rect.y + offset[1]))
-        screen.blit(text_surf, text_rect)
+            screen.blit(self.title_glow, (text_rect.x + offset[0], text_rect.y + offset[1]))
+        screen.blit(self.title_surf, text_rect)
 
-        # رسالة التهنئة
-        font_medium = pygame.font.Font(None, 36)
-        subtext_surf = font_medium.render("All Levels Completed!", True, (0, 0, 0))
-        subtext_rect = subtext_surf.get_rect(center=(self.W // 2, self.H // 3 + 10))
-        screen.blit(subtext_surf, subtext_rect)
-
-        # مربع الإحصائيات (فاتح وذهبي)
-        stats_y = self.H // 3 + 70
-        stats_bg = pygame.Rect(self.W // 2 - 200, stats_y - 20, 400, 140)
-        panel = pygame.Surface((stats_bg.width, stats_bg.height), pygame.SRCALPHA)
-        for py in range(panel.get_height()):
-            prog = py / panel.get_height()
-            col = (255, int(245 - 30 * prog), int(200 - 60 * prog), 90)
-            pygame.draw.line(panel, col, (0, py), (panel.get_width(), py))
-        pygame.draw.rect(panel, (255, 215, 0, 180), panel.get_rect(), 3, border_radius=15)
-        screen.blit(panel, stats_bg.topleft)
-
-        # النقاط النهائية
-        score_font = pygame.font.Font(None, 32)
-        your_score = int(self.score_by_player.get(self.player_id, 0))
-        other_id = 2 if self.player_id == 1 else 1
-        other_score = int(self.score_by_player.get(other_id, 0))
-
-        score_surf = score_font.render(f"P{self.player_id} Score: {your_score}", True, (0, 0, 0))
-        score_rect = score_surf.get_rect(center=(self.W // 2, stats_y + 10))
-        screen.blit(score_surf, score_rect)
-
-        other_score_surf = score_font.render(f"P{other_id} Score: {other_score}", True, (0, 0, 0))
-        other_score_rect = other_score_surf.get_rect(center=(self.W // 2, stats_y + 35))
-        screen.blit(other_score_surf, other_score_rect)
-
-        your_kills = int(self.kills_by_player.get(self.player_id, 0))
-        other_kills = int(self.kills_by_player.get(other_id, 0))
-        kills_surf = score_font.render(f"P{self.player_id} Kills: {your_kills}", True, (0, 0, 0))
-        kills_rect = kills_surf.get_rect(center=(self.W // 2, stats_y + 65))
-        screen.blit(kills_surf, kills_rect)
-
-        other_kills_surf = score_font.render(f"P{other_id} Kills: {other_kills}", True, (0, 0, 0))
-        other_kills_rect = other_kills_surf.get_rect(center=(self.W // 2, stats_y + 90))
-        screen.blit(other_kills_surf, other_kills_rect)
-
-        # إنجاز
-        achievement_surf = score_font.render("You are the ultimate survivors!", True, (0, 0, 0))
-        achievement_rect = achievement_surf.get_rect(center=(self.W // 2, stats_y + 125))
-        screen.blit(achievement_surf, achievement_rect)
+        # رسالة التهنئة، لوحة الإحصائيات ونصوصها
+        screen.blits(self.texts, doreturn=False)
 
         # الأزرار
         self.play_again_btn.draw(screen)
@@ -1097,6 +1020,57 @@ class MultiplayerGameOverScene:
         
         # 🔥 صوت الموت
         self.death_sound_played = False
+        
+        # 🔥 الطبقات الثابتة تُبنى مرة واحدة
+        self._build_layers()
+    
+    def _build_layers(self):
+        """التدرج، الطبقة الداكنة، الحواف، النصوص الثابتة وذاكرة العنوان"""
+        W, H = self.W, self.H
+        
+        # خلفية متدرجة داكنة (عمود واحد محجّم بدل خط لكل صفين)
+        def color_at(y):
+            progress = y / H
+            return (int(40 + 30 * progress), int(10 + 15 * progress), int(15 + 20 * progress))
+        self.gradient = vertical_gradient(W, H, color_at, step=2, key="mp_game_over")
+        
+        self.dark_overlay = pygame.Surface((W, H), pygame.SRCALPHA)
+        self.dark_overlay.fill((0, 0, 0, 180))
+        # الخلفية الكاملة بعد انتهاء الاهتزاز (تُبنى عند أول حاجة)
+        self.static_bg = None
+        
+        # حواف سوداء متدرجة
+        self.vignette = pygame.Surface((W, H), pygame.SRCALPHA)
+        for i in range(80):
+            alpha = int((80 - i) * 2.5)
+            pygame.draw.rect(self.vignette, (0, 0, 0, alpha), (i, i, W - 2*i, H - 2*i), 2)
+        
+        # تأثير أحمر في الأعلى
+        self.red_overlay = pygame.Surface((W, 60), pygame.SRCALPHA)
+        for y in range(60):
+            alpha = int(40 * (1 - y / 60))
+            pygame.draw.line(self.red_overlay, (150, 0, 0, alpha), (0, y), (W, y))
+        
+        # النصوص الثابتة (الشفافية تُطبق عند الرسم)
+        font_medium = pygame.font.Font(None, 32)
+        self.sub_surf = font_medium.render("☠ Both warriors have fallen... ☠", True, (255, 200, 200))
+        font_stats = pygame.font.Font(None, 36)
+        font_label = pygame.font.Font(None, 24)
+        self.stats_surfs = [
+            (font_label.render("🏆 FINAL SCORE", True, (200, 180, 150)), -35),
+            (font_stats.render(f"{self.score:,}", True, (255, 220, 100)), -5),
+            (font_label.render(f"📍 Reached Level {self.level}", True, (150, 200, 255)), 30),
+        ]
+        font = pygame.font.Font(None, 22)
+        self.control_surfs = [
+            (key, action, font.render(key, True, (255, 255, 255)), font.render(action, True, (180, 180, 180)))
+            for key, action in (("R", "Play Again"), ("M", "Main Menu"), ("ESC", "Quit"))
+        ]
+        
+        # العنوان: نسخ لكل حجم (أثناء التكبير) ولكل لون نبض
+        self._title_fonts = {}
+        self._title_cache = {}
+        self._panels = {}
     
     def _create_particles(self):
         """إنشاء جزيئات بصرية متنوعة"""
@@ -1111,6 +1085,12 @@ class MultiplayerGameOverScene:
                 'alpha': random.randint(150, 255),
                 'color': (random.randint(150, 255), random.randint(0, 50), random.randint(0, 30))
             })
+        # 🔥 هالة كل جزيء تُرسم مرة واحدة (الحجم واللون ثابتان)
+        for particle in self.blood_particles:
+            glow_size = particle['size'] + 4
+            glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surf, (*particle['color'], 50), (glow_size, glow_size), glow_size)
+            particle['glow'] = glow_surf
         
         # جماجم متساقطة صغيرة
         for _ in range(8):
@@ -1180,27 +1160,25 @@ class MultiplayerGameOverScene:
         shake_x = random.randint(-int(self.shake_intensity), int(self.shake_intensity)) if self.initial_shake else 0
         shake_y = random.randint(-int(self.shake_intensity), int(self.shake_intensity)) if self.initial_shake else 0
         
-        # 🔥 خلفية متدرجة داكنة
-        for y in range(0, self.H, 2):
-            progress = y / self.H
-            r = int(40 + 30 * progress)
-            g = int(10 + 15 * progress)
-            b = int(15 + 20 * progress)
-            pygame.draw.line(screen, (r, g, b), (0, y), (self.W, y))
-        
-        # صورة الخلفية
-        if self.bg_image:
+        # 🔥 خلفية متدرجة داكنة + صورة الخلفية وطبقتها الداكنة
+        if not self.bg_image:
+            screen.blit(self.gradient, (0, 0))
+        elif self.initial_shake:
+            screen.blit(self.gradient, (0, 0))
             screen.blit(self.bg_image, (self.bg_x + shake_x, self.bg_y + shake_y))
-            # طبقة داكنة
-            dark_overlay = pygame.Surface((self.W, self.H), pygame.SRCALPHA)
-            dark_overlay.fill((0, 0, 0, 180))
-            screen.blit(dark_overlay, (0, 0))
+            screen.blit(self.dark_overlay, (0, 0))
+        else:
+            # بعد الاهتزاز الخلفية ثابتة: blit واحد لطبقة مدمجة
+            if self.static_bg is None:
+                self.static_bg = self.gradient.copy()
+                self.static_bg.blit(self.bg_image, (self.bg_x, self.bg_y))
+                self.static_bg.blit(self.dark_overlay, (0, 0))
+            screen.blit(self.static_bg, (0, 0))
         
         # 🔥 جزيئات الدم
         for particle in self.blood_particles:
-            glow_size = particle['size'] + 4
-            glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, (*particle['color'], 50), (glow_size, glow_size), glow_size)
+            glow_surf = particle['glow']
+            glow_size = glow_surf.get_width() // 2
             screen.blit(glow_surf, (int(particle['x'] - glow_size), int(particle['y'] - glow_size)))
             pygame.draw.circle(screen, particle['color'], (int(particle['x']), int(particle['y'])), particle['size'])
         
@@ -1215,10 +1193,7 @@ class MultiplayerGameOverScene:
         # 🔥 رسالة ثانوية
         if self.animation_timer > 0.3:
             alpha = min(255, int((self.animation_timer - 0.3) * 500))
-            font_medium = pygame.font.Font(None, 32)
-            pulse = 1 + 0.05 * math.sin(self.pulse_timer * 2)
-            sub_text = "☠ Both warriors have fallen... ☠"
-            sub_surf = font_medium.render(sub_text, True, (255, 200, 200))
+            sub_surf = self.sub_surf
             sub_surf.set_alpha(alpha)
             sub_rect = sub_surf.get_rect(center=(self.W // 2, title_y + 80))
             screen.blit(sub_surf, sub_rect)
@@ -1252,35 +1227,22 @@ class MultiplayerGameOverScene:
         base_size = int(90 * scale)
         if base_size < 10:
             return
-            
-        font_large = pygame.font.Font(None, base_size)
         
-        # 🔥 تأثير التوهج الخلفي
-        glow_colors = [
-            (255, 50, 50, int(30 * self.glow_intensity)),
-            (255, 80, 80, int(20 * self.glow_intensity)),
-            (255, 100, 100, int(10 * self.glow_intensity))
-        ]
+        font_large = self._title_fonts.get(base_size)
+        if font_large is None:
+            font_large = self._title_fonts[base_size] = pygame.font.Font(None, base_size)
         
-        for i, (r, g, b, a) in enumerate(glow_colors):
-            offset = (i + 1) * 4
-            glow_surf = font_large.render("GAME OVER", True, (r, g, b))
-            glow_rect = glow_surf.get_rect(center=(x, y))
-            for dx in [-offset, 0, offset]:
-                for dy in [-offset, 0, offset]:
-                    screen.blit(glow_surf, glow_rect.move(dx, dy))
+        # 🔥 تأثير التوهج الخلفي + الظل (ألوان ثابتة: طبقة واحدة لكل حجم)
+        glow = self._title_cache.get(base_size)
+        if glow is None:
+            glow = self._title_cache[base_size] = self._bake_title_glow(font_large)
+        screen.blit(glow, glow.get_rect(center=(x + 2, y + 2)))
         
         # 🔥 النص الرئيسي مع تأثير النبض
-        pulse = 1 + 0.03 * math.sin(self.pulse_timer * 4)
         main_color = (255, int(50 + 30 * self.glow_intensity), int(50 + 30 * self.glow_intensity))
-        
-        # ظل
-        shadow_surf = font_large.render("GAME OVER", True, (80, 0, 0))
-        shadow_rect = shadow_surf.get_rect(center=(x + 4, y + 4))
-        screen.blit(shadow_surf, shadow_rect)
-        
-        # النص
-        text_surf = font_large.render("GAME OVER", True, main_color)
+        text_surf = self._title_cache.get((base_size, main_color))
+        if text_surf is None:
+            text_surf = self._title_cache[(base_size, main_color)] = font_large.render("GAME OVER", True, main_color)
         text_rect = text_surf.get_rect(center=(x, y))
         screen.blit(text_surf, text_rect)
         
@@ -1292,47 +1254,46 @@ class MultiplayerGameOverScene:
         pygame.draw.circle(screen, (255, 100, 100), (x - line_width//2, line_y), 5)
         pygame.draw.circle(screen, (255, 100, 100), (x + line_width//2, line_y), 5)
     
+    def _bake_title_glow(self, font_large):
+        """ثلاث حلقات توهج (9 نسخ لكل منها) + الظل في سطح واحد"""
+        glow_colors = [(255, 50, 50), (255, 80, 80), (255, 100, 100)]
+        tw, th = font_large.size("GAME OVER")
+        pad = 12
+        surf = pygame.Surface((tw + pad * 2 + 4, th + pad * 2 + 4), pygame.SRCALPHA)
+        for i, color in enumerate(glow_colors):
+            offset = (i + 1) * 4
+            glow_surf = font_large.render("GAME OVER", True, color)
+            for dx in [-offset, 0, offset]:
+                for dy in [-offset, 0, offset]:
+                    surf.blit(glow_surf, (pad + dx, pad + dy))
+        # ظل
+        surf.blit(font_large.render("GAME OVER", True, (80, 0, 0)), (pad + 4, pad + 4))
+        return surf
+    
     def _draw_stats_panel(self, screen, x, y):
         """رسم لوحة الإحصائيات"""
         panel_width, panel_height = 400, 120
         panel_rect = pygame.Rect(x - panel_width//2, y - panel_height//2, panel_width, panel_height)
         
-        # خلفية اللوحة مع شفافية
-        panel_surf = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        
-        # تدرج الخلفية
-        for py in range(panel_height):
-            progress = py / panel_height
-            alpha = int(180 - 30 * progress)
-            pygame.draw.line(panel_surf, (30, 20, 25, alpha), (0, py), (panel_width, py))
-        
-        # حدود متوهجة
-        border_color = (255, int(80 + 40 * self.glow_intensity), int(80 + 40 * self.glow_intensity))
-        pygame.draw.rect(panel_surf, border_color, (0, 0, panel_width, panel_height), 3, border_radius=15)
+        # حدود متوهجة (اللوحة تُخزن لكل درجة توهج)
+        glow = int(80 + 40 * self.glow_intensity)
+        panel_surf = self._panels.get(glow)
+        if panel_surf is None:
+            panel_surf = self._panels[glow] = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+            # تدرج الخلفية
+            for py in range(panel_height):
+                progress = py / panel_height
+                alpha = int(180 - 30 * progress)
+                pygame.draw.line(panel_surf, (30, 20, 25, alpha), (0, py), (panel_width, py))
+            pygame.draw.rect(panel_surf, (255, glow, glow), (0, 0, panel_width, panel_height), 3, border_radius=15)
         
         panel_surf.set_alpha(self.stats_alpha)
         screen.blit(panel_surf, panel_rect)
         
-        # 🔥 الإحصائيات
-        font_stats = pygame.font.Font(None, 36)
-        font_label = pygame.font.Font(None, 24)
-        
-        # النتيجة
-        score_text = f"🏆 FINAL SCORE"
-        score_surf = font_label.render(score_text, True, (200, 180, 150))
-        score_surf.set_alpha(self.stats_alpha)
-        screen.blit(score_surf, score_surf.get_rect(center=(x, y - 35)))
-        
-        score_value = f"{self.score:,}"
-        value_surf = font_stats.render(score_value, True, (255, 220, 100))
-        value_surf.set_alpha(self.stats_alpha)
-        screen.blit(value_surf, value_surf.get_rect(center=(x, y - 5)))
-        
-        # المستوى
-        level_text = f"📍 Reached Level {self.level}"
-        level_surf = font_label.render(level_text, True, (150, 200, 255))
-        level_surf.set_alpha(self.stats_alpha)
-        screen.blit(level_surf, level_surf.get_rect(center=(x, y + 30)))
+        # 🔥 الإحصائيات: النتيجة وقيمتها والمستوى
+        for surf, dy in self.stats_surfs:
+            surf.set_alpha(self.stats_alpha)
+            screen.blit(surf, surf.get_rect(center=(x, y + dy)))
     
     def _draw_skull(self, screen, x, y, size, rotation):
         """رسم جمجمة صغيرة"""
@@ -1346,18 +1307,13 @@ class MultiplayerGameOverScene:
     
     def _draw_controls(self, screen, alpha):
         """رسم تعليمات التحكم"""
-        font = pygame.font.Font(None, 22)
-        controls = [
-            ("R", "Play Again"),
-            ("M", "Main Menu"),
-            ("ESC", "Quit")
-        ]
+        controls = self.control_surfs
         
         y = self.H - 35
         total_width = sum(len(c[0]) * 12 + len(c[1]) * 8 + 40 for c in controls)
         start_x = (self.W - total_width) // 2
         
-        for key, action in controls:
+        for key, action, key_surf, action_surf in controls:
             # خلفية المفتاح
             key_width = len(key) * 12 + 16
             key_rect = pygame.Rect(start_x, y - 10, key_width, 22)
@@ -1365,34 +1321,19 @@ class MultiplayerGameOverScene:
             pygame.draw.rect(screen, (100, 100, 120), key_rect, 1, border_radius=4)
             
             # النص
-            key_surf = font.render(key, True, (255, 255, 255))
             key_surf.set_alpha(alpha)
             screen.blit(key_surf, key_surf.get_rect(center=key_rect.center))
             
             # الإجراء
-            action_surf = font.render(action, True, (180, 180, 180))
             action_surf.set_alpha(alpha)
             screen.blit(action_surf, (start_x + key_width + 8, y - 6))
             
             start_x += key_width + len(action) * 8 + 35
     
     def _draw_vignette(self, screen):
-        """تأثير الحواف الداكنة"""
-        vignette = pygame.Surface((self.W, self.H), pygame.SRCALPHA)
-        
-        # حواف سوداء متدرجة
-        for i in range(80):
-            alpha = int((80 - i) * 2.5)
-            pygame.draw.rect(vignette, (0, 0, 0, alpha), (i, i, self.W - 2*i, self.H - 2*i), 2)
-        
-        # تأثير أحمر في الأعلى
-        red_overlay = pygame.Surface((self.W, 60), pygame.SRCALPHA)
-        for y in range(60):
-            alpha = int(40 * (1 - y / 60))
-            pygame.draw.line(red_overlay, (150, 0, 0, alpha), (0, y), (self.W, y))
-        screen.blit(red_overlay, (0, 0))
-        
-        screen.blit(vignette, (0, 0))
+        """تأثير الحواف الداكنة (الطبقتان مرسومتان مسبقاً)"""
+        screen.blit(self.red_overlay, (0, 0))
+        screen.blit(self.vignette, (0, 0))
     
     def handle_event(self, event) -> str | None:
         """معالجة الأحداث"""
@@ -1426,6 +1367,12 @@ class GlowButton:
         self.hover = False
         self.hover_scale = 1.0
         self.glow_timer = 0
+        # 🔥 النص بلونيه (عادي / تمرير) يُرسم مرة واحدة
+        font = pygame.font.Font(None, 28)
+        self.text_surfs = {
+            False: font.render(text, True, (220, 220, 220)),
+            True: font.render(text, True, (255, 255, 255)),
+        }
         
     def update(self, dt, mouse_pos):
         self.glow_timer += dt * 3
@@ -1467,9 +1414,7 @@ class GlowButton:
         pygame.draw.rect(screen, border_color, scaled_rect, 2, border_radius=10)
         
         # النص
-        font = pygame.font.Font(None, 28)
-        text_color = (255, 255, 255) if self.hover else (220, 220, 220)
-        text_surf = font.render(self.text, True, text_color)
+        text_surf = self.text_surfs[self.hover]
         text_rect = text_surf.get_rect(center=scaled_rect.center)
         screen.blit(text_surf, text_rect)
 
@@ -1563,6 +1508,16 @@ def _wait_enter_or_quit(clock: pygame.time.Clock) -> bool:
 
 # ---------------- Multiplayer Game Loop (OPTIMIZED) ----------------
 def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=DEFAULT_SKIN, character_type="player"):
+    """حلقة اللعب الجماعي؛ الغلاف يضمن تنظيف المحلل والمؤشرات عند أي خروج (return أو استثناء)"""
+    prof = FrameProfiler.from_env("mp")  # 🔥 قياس مراحل الإطار (F3)
+    try:
+        return _run_multiplayer_game(screen, clock, network, player_id, version, skin_id, character_type, prof)
+    finally:
+        prof.close()
+        MONITOR.set_gauges({})  # 🔥 المؤشرات lambdas تمسك متغيرات الحلقة (المشهد كله) بعد الخروج
+
+
+def _run_multiplayer_game(screen, clock, network, player_id, version, skin_id, character_type, prof):
     print(f"[GAME] Starting multiplayer as Player {player_id}")
     _maybe_music()
 
@@ -1605,14 +1560,25 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
     boost_time = 4.0
     boost_t = 0.0
 
-    walls = create_walls_for_level(level_no, WORLD_W, WORLD_H, tile=64)
-    # 🔥 (جديد) - إنشاء الخلفية للمستوى 1
-    generate_background_effects(level_no, BG_EFFECTS, WORLD_W, WORLD_H)
-
-    if player_id == 1:
-        p_spawn_x, p_spawn_y = find_free_spawn(walls, WORLD_W, WORLD_H, 36, 36)
-    else:
-        p_spawn_x, p_spawn_y = find_free_spawn(walls, WORLD_W, WORLD_H, 36, 36)
+    # 🔥 تحضير المستوى التالي في الخلفية (ميزانية ~2ms لكل إطار)
+    prefetch = LevelPrefetcher(
+        WORLD_W, WORLD_H,
+        level_color=lambda lvl: LEVEL_COLORS.get(lvl, (166, 98, 42)),
+        spawn_fn=lambda w: find_free_spawn(w, WORLD_W, WORLD_H, 36, 36),
+        door_fn=lambda w, x, y: find_door_location(w, x, y, WORLD_W, WORLD_H),
+        view_size=(WINDOW_W, WINDOW_H),
+    )
+    prep = prefetch.take(level_no)
+    walls = list(prep.walls)
+    wall_grid = prep.wall_grid  # 🔥 broadphase للجدران
+    global LEVEL_PVS
+    LEVEL_PVS = prep.pvs
+    # 🔥 (جديد) - الخلفية للمستوى 1
+    BG_EFFECTS.clear()
+    BG_EFFECTS["tiled_bg"] = prep.background
+
+    p_spawn_x, p_spawn_y = prep.spawn
+    if player_id != 1:
         if p_spawn_x < WORLD_W / 2: p_spawn_x += 200
         else: p_spawn_x -= 200
         
@@ -1672,7 +1638,7 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
     FULL_STATE_INTERVAL = 0.25
     
     pending_actions = []
-    ai_update_counter = 0 
+    ai_sched = AIScheduler(budget_ms=4.0)  # 🔥 جدولة ذكاء الزومبي (للمضيف)
 
     # 🔥 === أنظمة جديدة: الأسلحة، الدردشة، الخريطة ===
     weapon_manager = None
@@ -1691,9 +1657,13 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
         # نظام الخريطة المصغرة
         minimap_system = Minimap(WORLD_W, WORLD_H, WINDOW_W, WINDOW_H, 160)
         minimap_system.set_walls(walls)
+        prefetch.minimap = minimap_system
         
         print("[OK] Weapons, Chat, and Minimap systems initialized!") 
 
+    if level_no + 1 in LEVELS:
+        prefetch.start(level_no + 1)
+
     def send_player_data():
         player_data = {
             "type": "player_update",
@@ -1749,9 +1719,11 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
             pending_actions.clear()
 
     def reset_level_multiplayer(new_level: int):
-        nonlocal level_no, kills, score, kills_by_player, score_by_player, walls, level_door, enemies_dict, pickups_dict, crates_dict, game_state, p, spawn_t, pk_timer, crate_t, is_dead, death_timer, health, other_players_last_seen
+        nonlocal level_no, kills, score, kills_by_player, score_by_player, walls, wall_grid, level_door, enemies_dict, pickups_dict, crates_dict, game_state, p, spawn_t, pk_timer, crate_t, is_dead, death_timer, health, other_players_last_seen
         
         print(f"--- PLAYER {player_id} RESETTING TO LEVEL {new_level} ---")
+        # 🔥 لقطة ذاكرة عند كل انتقال مستوى (قبل التنظيف: المؤشرات تعكس نهاية المستوى السابق)
+        MONITOR.snapshot(f"mp level {new_level}")
         
         level_no = new_level
         kills = 0
@@ -1773,17 +1745,23 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
         death_timer = 0.0
         health = hearts_max
         
-        walls[:] = create_walls_for_level(new_level, WORLD_W, WORLD_H, tile=64)
-        generate_background_effects(new_level, BG_EFFECTS, WORLD_W, WORLD_H)
+        # 🔥 بيانات المستوى محضّرة مسبقاً أثناء اللعب (بدون توقف عند الباب)
+        prep = prefetch.take(new_level)
+        walls[:] = prep.walls
+        wall_grid = prep.wall_grid
+        global LEVEL_PVS
+        LEVEL_PVS = prep.pvs
+        BG_EFFECTS.clear()
+        BG_EFFECTS["tiled_bg"] = prep.background
         
         # 🔥 تحديث الخريطة المصغرة لتعكس المستوى الجديد
         if minimap_system:
-            minimap_system.set_walls(walls)
+            minimap_system.set_walls(walls, prep.minimap_walls)
         
         if player_id == 1:
-            p.x, p.y = find_free_spawn(walls, WORLD_W, WORLD_H, 36, 36)
+            p.x, p.y = prep.spawn
         else:
-            p_spawn_x, p_spawn_y = find_free_spawn(walls, WORLD_W, WORLD_H, 36, 36)
+            p_spawn_x, p_spawn_y = prep.spawn
             if p_spawn_x < WORLD_W / 2: p.x = p_spawn_x + 200
             else: p.x = p_spawn_x - 200
             p.y = p_spawn_y
@@ -1791,7 +1769,7 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
         cam.follow(p.rect, lerp=1.0) 
 
         if is_host and game_state:
-            door_x, door_y = find_door_location(walls, p.x, p.y, WORLD_W, WORLD_H)
+            door_x, door_y = prep.door
             level_door = LevelDoor(door_x, door_y, new_level)
             
             game_state.level = new_level
@@ -1809,6 +1787,10 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
             })
         elif not is_host:
             level_door = None
+        
+        # 🔥 بدء تحضير المستوى التالي على دفعات
+        if new_level + 1 in LEVELS:
+            prefetch.start(new_level + 1)
 
     def process_received_data():
         nonlocal other_players, enemies_dict, pickups_dict, crates_dict, level_door, kills, kills_by_player, score, level_no, can_respawn, other_players_last_seen
@@ -1855,6 +1837,7 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
                                 rem_p = remote_players_visuals[other_id]
                                 if rem_p.sprite_prefix != r_char:
                                     print(f"[SYNC] Recreating remote player {other_id}: {rem_p.sprite_prefix} -> {r_char}")
+                                    MONITOR.count("remote_player_rebuilds")
                                     remote_players_visuals[other_id] = Player(
                                         x=data["x"], y=data["y"],
                                         skin_color=r_color, enable_skin=r_enable,
@@ -1898,6 +1881,7 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
                                     sprite_prefix=r_char
                                 )
                                 print(f"[SYNC] Recreated P{other_id} visual with character: {r_char}")
+                                MONITOR.count("remote_player_rebuilds")
 
             
                 # 🔥 معالجة الدردشة
@@ -2082,7 +2066,7 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
                             
                                 # تشغيل صوت ومؤثرات
                                 bx, by = en.x + en.w/2, en.y + en.h/2
-                                for _ in range(3): blood_fx.append(BloodParticle(bx, by))
+                                for _ in range(game_settings.scale_count(3, "blood_particles")): blood_fx.append(BloodParticle(bx, by))
                                 if snd_hit: snd_hit.play()
                             
                                 if en.hp <= 0:
@@ -2105,7 +2089,7 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
                                         score_by_player = dict(game_state.score_by_player)
                                         score = int(game_state.score_by_player.get(player_id, score))
                                         send_stats_update()
-                                    for _ in range(5): blood_fx.append(BloodParticle(bx, by))
+                                    for _ in range(game_settings.scale_count(5, "blood_particles")): blood_fx.append(BloodParticle(bx, by))
                                 
                                     enemies_dict.pop(z_id, None)
                                     game_state.zombies = enemies_dict
@@ -2114,7 +2098,7 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
                 print(f"[ERR] Error processing message: {e}")
 
     if is_host:
-        door_x, door_y = find_door_location(walls, p.x, p.y, WORLD_W, WORLD_H)
+        door_x, door_y = prep.door
         level_door = LevelDoor(door_x, door_y, level_no)
         game_state.door = level_door
         
@@ -2299,8 +2283,22 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
             next_index = (current_index + 1) % len(active_player_ids)
             spectating_player_id = active_player_ids[next_index]
 
+    # 🔥 مؤشرات الذاكرة + لقطة المستوى الأول
+    MONITOR.set_gauges({
+        "zombies": lambda: len(enemies_dict),
+        "blood_fx": lambda: len(blood_fx),
+        "explosions": lambda: len(weapon_manager.explosions) if weapon_manager else 0,
+        "bullets": lambda: len(weapon_manager.bullets) if weapon_manager else 0,
+        "remote_players": lambda: len(remote_players_visuals),
+        "bg_bytes": lambda: surface_bytes(BG_EFFECTS),
+        "prefetch_bytes": lambda: surface_bytes(prefetch.pending.background if prefetch.pending else None),
+    })
+    MONITOR.snapshot(f"mp level {level_no}")
+
     running = True
     while running:
+        prof.begin_frame()
+        prof.phase("network")
         dt = clock.get_time() / 1000.0
         dt = min(dt, 0.1) 
         
@@ -2321,8 +2319,11 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
         process_received_data()
 
         # Events
+        prof.phase("input")
         for e in pygame.event.get():
             if e.type == pygame.QUIT: return None
+            if not (chat_system and chat_system.is_typing()) and (prof.handle_event(e) or MONITOR.handle_event(e)):
+                continue
             
             # 🔥 معالجة الدردشة أولاً (لها الأولوية عند الكتابة)
             if chat_system and chat_system.is_typing():
@@ -2378,6 +2379,7 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
                 if e.button == 1: fire_pistol()
                 elif e.button == 3: fire_shotgun()
 
+        prof.phase("update")
         if pistol_cd > 0: pistol_cd -= dt
         if shotgun_cd > 0: shotgun_cd -= dt
         if damage_cd > 0: damage_cd -= dt
@@ -2412,6 +2414,7 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
             if (0 <= new_rect_y.top) and (new_rect_y.bottom <= WORLD_H) and not collide_rect_list(new_rect_y, walls):
                 p.y = new_rect_y.y
 
+        prof.phase("ai")
         player_center = pygame.Vector2(p.x + p.w/2, p.y + p.h/2)
 
         if is_host:
@@ -2459,20 +2462,25 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
 
             # 🔥 (ZOMBIE & BULLET UPDATE REMOVED - will be handled below)
             # فقط تحديث الزومبي هنا (بدون الرصاص)
+            # 🔥 جدولة LOD: التكرار حسب البعد عن أقرب لاعب مع ميزانية زمنية لكل إطار
             all_zombies_list = list(enemies_dict.values())
-            ai_update_counter += 1
-            frame_mod = ai_update_counter % 3
-            
-            for i, en in enumerate(all_zombies_list):
-                if i % 3 == frame_mod:
-                    nearby = []
-                    for other in all_zombies_list:
-                        if other is en: continue
-                        if (other.x - en.x)**2 + (other.y - en.y)**2 < 10000:
-                            nearby.append(other)
-                    en.update_host(player_center, walls, dt, nearby)
-                else:
-                    en.bob_t += dt * 6.0 
+            neighbor_grid = SpatialHash(128)
+            for en in all_zombies_list:
+                neighbor_grid.insert(en, en.rect)
+
+            def _ai_update(en, step_dt):
+                nearby = [other for other, _r in neighbor_grid.query_box(en.x - 100, en.y - 100, en.x + 100, en.y + 100)
+                          if other is not en and (other.x - en.x)**2 + (other.y - en.y)**2 < 10000]
+                en.update_host(player_center, walls, step_dt, nearby, HOST_ZOMBIE_PACE)
+
+            def _ai_idle(en, idle_dt):
+                en.bob_t += idle_dt * 6.0
+
+            ai_players = [(player_center.x, player_center.y)]
+            for o_data in other_players.values():
+                if "x" in o_data and "y" in o_data and not o_data.get("is_dead", False):
+                    ai_players.append((float(o_data["x"]), float(o_data["y"])))
+            ai_sched.run(all_zombies_list, ai_players, dt, _ai_update, _ai_idle, view=cam.view_rect())
 
             # تنظيف الزومبي الميتين
             dead_zombie_ids = set()
@@ -2488,6 +2496,7 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
             # (bullets_dict Removed)
 
         # (تفعيل الباب - 'kills' متزامن من المضيف)
+        prof.phase("gameplay")
         if level_door and not level_door.active and kills >= goal_kills:
             print(f"PLAYER {player_id}: Door Active! Kills: {kills}/{goal_kills}")
             level_door.activate()
@@ -2642,10 +2651,15 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
         # -------- Render (الرسم) --------
         
         # 🔥 رسم الخلفية الديناميكية
+        prof.phase("background")
         draw_level_background(screen, level_no, cam, BG_EFFECTS)
 
         # رسم الجدران
-        for r in walls:
+        prof.phase("entities")
+        # 🔥 تمرير الرؤية: الجدران من الشبكة المكانية، والكيانات مقابل مستطيل الكاميرا
+        CULL.begin(cam)
+        BATCH.begin_frame()
+        for r in CULL.walls(wall_grid, walls):
             sr = cam.apply_rect(r)
             pygame.draw.rect(screen, (92,55,24), sr, border_radius=8)
             pygame.draw.rect(screen, (40,26,15), sr, width=2, border_radius=8)
@@ -2653,11 +2667,13 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
             if inner.w > 0 and inner.h > 0:
                 pygame.draw.rect(screen, (26,90,58), inner, width=1, border_radius=6)
 
-        for pfx in blood_fx: pfx.draw(screen, cam)
+        for pfx in CULL.items("blood", blood_fx, 8, 8): pfx.draw(screen, cam, BATCH)
+        BATCH.flush(screen, "blood")
         
-        for pk in pickups_dict.values(): pk.draw(screen, cam)
-        for cr in crates_dict.values(): cr.draw(screen, cam)
-        for en in enemies_dict.values(): en.draw(screen, cam)
+        for pk in CULL.items("pickups", pickups_dict.values(), 48, 48): pk.draw(screen, cam)
+        for cr in CULL.items("crates", crates_dict.values(), CRATE_H * 2, CRATE_H): cr.draw(screen, cam)
+        for en in CULL.items("zombies", enemies_dict.values(), ZOMBIE_SIZE, ZOMBIE_SIZE): en.draw(screen, cam, BATCH)
+        BATCH.flush(screen, "zombies", "zombie_ui")
         
         # 🔥 رسم اللاعبين النشطين فقط (الذين لم ينقطع اتصالهم)
         current_time = time.time()
@@ -2676,7 +2692,10 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
                 char_type = other_data.get("character_type", "player")
 
                 # التأكد من تطابق نوع الشخصية (إعادة إنشاء إذا تغير)
+                # 🔥 نفس ترتيب player_update (sprite_prefix أولاً) حتى لا يتذبذب الكائن ويُعاد إنشاؤه كل إطار
+                char_type = other_data.get("sprite_prefix") or char_type
                 if rem_p.sprite_prefix != char_type:
+                     MONITOR.count("remote_player_rebuilds")
                      r_color = get_skin_color(skin_id)
                      r_enable = (skin_id != "none")
                      remote_players_visuals[other_id] = Player(
@@ -2686,6 +2705,10 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
                     )
                      rem_p = remote_players_visuals[other_id]
 
+                # 🔥 خارج الكاميرا: لا رسم (الاسم فوق الشخصية بـ 28px)
+                if not CULL.contains(rem_p.x, rem_p.y - 28, rem_p.w + 40, rem_p.h + 40):
+                    continue
+
                 # تحديث الموقع (مع الكاميرا) ولكن Player.draw يرسم في world coords
                 # لكن Player.draw لا تأخذ كاميرا... لحظة، Player.draw في character.py ترسم في self.rect?
                 # لا، Player.draw تأخذ screen وترسم في self.rect (world coords).
@@ -2731,6 +2754,8 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
                 pygame.draw.rect(screen, border_color, border_rect, width=2, border_radius=4)
             else:
                 # خيار احتياطي (الرسم القديم)
+                if not CULL.contains(other_data["x"], other_data["y"], 36, 36):
+                    continue
                 other_x, other_y = cam.apply_xy(other_data["x"], other_data["y"])
                 pygame.draw.rect(screen, (200, 200, 200), (other_x, other_y, 36, 36))
 
@@ -2790,6 +2815,7 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
         pass
 
         # HUD
+        prof.phase("hud")
         if show_hud:
             hud_x, hud_y = 16, 14
             draw_shadow_text(screen, f"Kills: {kills}/{goal_kills}", (hud_x, hud_y), size=28, color=(0,0,0))
@@ -2867,6 +2893,10 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
             conn_color = (0, 255, 0) if network.connected else (255, 0, 0)
             draw_text(screen, conn_status, (WINDOW_W-120, 10), size=18, color=conn_color)
             draw_text(screen, f"{int(clock.get_fps())} FPS", (WINDOW_W-120, 30), size=18, color=(220,220,220))
+            if RENDER_SCALE.scale < 1.0:
+                draw_text(screen, RENDER_SCALE.label(), (WINDOW_W-120, 68), size=14, color=(170,170,170))
+            if is_host and prof.visible:  # سطر تشخيص LOD مع طبقة F3 فقط
+                draw_text(screen, ai_sched.stats_text(), (WINDOW_W-300, 50), size=14, color=(170,170,170))
             
             # 🔥 رسم سهم التوجيه (فقط للاعبين الأحياء أو الميتين الذين لديهم لاعب نشط للمشاهدة)
             current_time = time.time()
@@ -2906,81 +2936,92 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
                 )
         
         # 🔥 رسم الدردشة (دائماً مرئية)
+        prof.phase("chat")
         if chat_system:
             chat_system.update(dt)
             chat_system.draw(screen)
         
         # 🔥 تحديث نظام الأسلحة
+        prof.phase("collisions")
         if weapon_manager:
             # 🔥 (FIX) معالجة تصادم الرصاص قبل التحديث (لمنع اختراق الزومبي)
             dead_zombie_ids = set()
+            # 🔥 اختبار مستمر (swept) من الموقع السابق للحالي مع broadphase للزومبي
+            zombie_grid = SpatialHash(128)
+            for z_id, en in enemies_dict.items():
+                if en.hp > 0:
+                    zombie_grid.insert(z_id, en.rect)
             
             for b in weapon_manager.bullets:
                 if not b.alive:
                     continue
+                x0, y0, x1, y1 = b.prev_x, b.prev_y, b.x, b.y
                     
                 # 1. تصادم مع الجدران (للجميع لتجنب اختراق الجدران بصرياً)
-                b_rect = pygame.Rect(int(b.x)-4, int(b.y)-4, 8, 8)
-                if collide_rect_list(b_rect, walls):
-                    b.alive = False
-                    continue
+                t_wall, _ = sweep_first_hit(x0, y0, x1, y1, wall_grid, pad=4)
                 
                 # 2. تصادم مع الزومبي (للجميع - بصرياً ومنطقياً)
                 # السماح للعميل أيضاً بحساب الإصابة لقتل الرصاصة بصرياً
-                for z_id, en in list(enemies_dict.items()):
-                    if en.hp > 0 and en.rect.colliderect(b_rect):
-                        # 🔥 إيقاف الرصاصة فوراً عند الإصابة (للكل)
-                        b.alive = False
-                        
-                        # تشغيل الصوت والمؤثرات (للكل)
-                        if snd_hit: snd_hit.play()
-                        
-                        bx, by = en.x + en.w/2, en.y + en.h/2
-                        for _ in range(3): blood_fx.append(BloodParticle(bx, by))
-
-                        # (للمضيف فقط - Authority) تطبيق الضرر وحساب النقاط
-                        if is_host:
-                            # حساب الضرر من نوع السلاح
-                            damage = getattr(b, 'damage', 1)
-                            en.hp -= damage
-                            
-                            # الموت
-                            if en.hp <= 0:
-                                dead_zombie_ids.add(z_id)
-                                # تحديث الإحصائيات
-                                if game_state:
-                                    killer = int(getattr(b, 'owner_id', 0) or 0)
-                                    if killer not in (1, 2):
-                                        killer = 1
-                                    if killer not in game_state.kills_by_player:
-                                        game_state.kills_by_player[killer] = 0
-                                    game_state.kills_by_player[killer] += 1
-                                    game_state.total_kills += 1
-                                    kills = game_state.total_kills
-                                    kills_by_player = dict(game_state.kills_by_player)
-
-                                    points = 10 + (en.level * 5)
-                                    if killer not in game_state.score_by_player:
-                                        game_state.score_by_player[killer] = 0
-                                    game_state.score_by_player[killer] += points
-                                    score_by_player = dict(game_state.score_by_player)
-                                    score = int(game_state.score_by_player.get(player_id, score))
-                                    send_stats_update()
-                                
-                                # تأثير الدم الكبير عند الموت
-                                for _ in range(5): blood_fx.append(BloodParticle(bx, by))
-                        else:
-                            # 🔥 (للعميل) إرسال تقرير إصابة للمضيف
-                            bullet_owner = int(getattr(b, 'owner_id', 0) or 0)
-                            if bullet_owner == int(player_id):
-                                damage = getattr(b, 'damage', 1)
-                                send_player_action("zombie_hit", {
-                                    "zombie_id": z_id,
-                                    "damage": damage
-                                })
+                t_hit, hit_id = sweep_first_hit(
+                    x0, y0, x1, y1, zombie_grid, pad=4,
+                    accept=lambda zid: zid in enemies_dict and enemies_dict[zid].hp > 0)
+                
+                if t_wall is not None and (t_hit is None or t_wall <= t_hit):
+                    b.alive = False
+                    continue
+                
+                if t_hit is None:
+                    continue
+                z_id, en = hit_id, enemies_dict[hit_id]
+                # 🔥 إيقاف الرصاصة فوراً عند الإصابة (للكل)
+                b.alive = False
+                
+                # تشغيل الصوت والمؤثرات (للكل)
+                if snd_hit: snd_hit.play()
+                
+                bx, by = en.x + en.w/2, en.y + en.h/2
+                for _ in range(game_settings.scale_count(3, "blood_particles")): blood_fx.append(BloodParticle(bx, by))
+
+                # (للمضيف فقط - Authority) تطبيق الضرر وحساب النقاط
+                if is_host:
+                    # حساب الضرر من نوع السلاح
+                    damage = getattr(b, 'damage', 1)
+                    en.hp -= damage
+                    
+                    # الموت
+                    if en.hp <= 0:
+                        dead_zombie_ids.add(z_id)
+                        # تحديث الإحصائيات
+                        if game_state:
+                            killer = int(getattr(b, 'owner_id', 0) or 0)
+                            if killer not in (1, 2):
+                                killer = 1
+                            if killer not in game_state.kills_by_player:
+                                game_state.kills_by_player[killer] = 0
+                            game_state.kills_by_player[killer] += 1
+                            game_state.total_kills += 1
+                            kills = game_state.total_kills
+                            kills_by_player = dict(game_state.kills_by_player)
+
+                            points = 10 + (en.level * 5)
+                            if killer not in game_state.score_by_player:
+                                game_state.score_by_player[killer] = 0
+                            game_state.score_by_player[killer] += points
+                            score_by_player = dict(game_state.score_by_player)
+                            score = int(game_state.score_by_player.get(player_id, score))
+                            send_stats_update()
                         
-                        # 🔥 الخروج من حلقة الزومبي (رصاصة واحدة = زومبي واحد)
-                        break
+                        # تأثير الدم الكبير عند الموت
+                        for _ in range(game_settings.scale_count(5, "blood_particles")): blood_fx.append(BloodParticle(bx, by))
+                else:
+                    # 🔥 (للعميل) إرسال تقرير إصابة للمضيف
+                    bullet_owner = int(getattr(b, 'owner_id', 0) or 0)
+                    if bullet_owner == int(player_id):
+                        damage = getattr(b, 'damage', 1)
+                        send_player_action("zombie_hit", {
+                            "zombie_id": z_id,
+                            "damage": damage
+                        })
             
             # تنظيف الزومبي الميتين (للمضيف)
             if is_host and dead_zombie_ids:
@@ -2990,38 +3031,35 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
                     game_state.zombies = enemies_dict
             
             # 🔥 تحديث نظام الأسلحة بعد التصادم
+            prof.phase("weapons")
             explosions = weapon_manager.update(dt)
 
             # معالجة الانفجارات (ضرر الزومبي)
+            # (نفس شبكة الزومبي: المحذوفون أو الميتون يتم تجاهلهم داخل resolve_explosion)
             for ex, ey, radius, damage, owner_id in explosions:
-                for z_id, zombie in list(enemies_dict.items()):
-                    if hasattr(zombie, 'hp') and zombie.hp > 0:
-                        dist = math.sqrt((zombie.x - ex)**2 + (zombie.y - ey)**2)
-                        if dist < radius:
-                            dmg = int(damage * (1 - dist/radius))
-                            zombie.hp -= dmg
-                            if zombie.hp <= 0:
-                                if is_host:
-                                    dead_zombie_ids.add(z_id)
-                                    if game_state:
-                                        killer = int(owner_id or 0)
-                                        if killer not in (1, 2):
-                                            killer = 1
-                                        if killer not in game_state.kills_by_player:
-                                            game_state.kills_by_player[killer] = 0
-                                        game_state.kills_by_player[killer] += 1
-                                        game_state.total_kills += 1
-                                        kills = game_state.total_kills
-                                        kills_by_player = dict(game_state.kills_by_player)
+                _hits, killed = resolve_explosion(ex, ey, radius, damage, zombie_grid, enemies_dict, wall_grid)
+                for z_id in killed:
+                    if is_host:
+                        dead_zombie_ids.add(z_id)
+                        if game_state:
+                            killer = int(owner_id or 0)
+                            if killer not in (1, 2):
+                                killer = 1
+                            if killer not in game_state.kills_by_player:
+                                game_state.kills_by_player[killer] = 0
+                            game_state.kills_by_player[killer] += 1
+                            game_state.total_kills += 1
+                            kills = game_state.total_kills
+                            kills_by_player = dict(game_state.kills_by_player)
+
+                            points = 15
+                            if killer not in game_state.score_by_player:
+                                game_state.score_by_player[killer] = 0
+                            game_state.score_by_player[killer] += points
+                            score_by_player = dict(game_state.score_by_player)
+                            score = int(game_state.score_by_player.get(player_id, score))
+                            send_stats_update()
 
-                                        points = 15
-                                        if killer not in game_state.score_by_player:
-                                            game_state.score_by_player[killer] = 0
-                                        game_state.score_by_player[killer] += points
-                                        score_by_player = dict(game_state.score_by_player)
-                                        score = int(game_state.score_by_player.get(player_id, score))
-                                        send_stats_update()
-            
             # تنظيف إضافي للزومبي من الانفجارات
             if is_host and dead_zombie_ids:
                 for z_id in dead_zombie_ids:
@@ -3029,7 +3067,14 @@ def run_multiplayer_game(screen, clock, network, player_id, version="", skin_id=
                 if game_state:
                     game_state.zombies = enemies_dict
 
+        prof.draw(screen)
+        prof.phase("flip")
         pygame.display.flip()
+        prof.phase("prefetch")
+        prefetch.step()
+        prof.phase("idle")
         clock.tick(FPS)
+        RENDER_SCALE.update(clock.get_rawtime())  # 🔥 دقة المؤثرات حسب زمن العمل الفعلي
+        prof.end_frame()
 
     return "menu"
\ No newline at end of file
@@ -0,0 +1,334 @@
+# profiler.py - Frame-phase profiler for Zombie Shooter
+"""
+قياس زمن كل مرحلة في الإطار (perf_counter_ns):
+- prof.begin_frame() في بداية الحلقة و prof.end_frame() بعد clock.tick
+- prof.phase("ai") يبدأ مرحلة جديدة وينهي السابقة (بدون إعادة مسافات الكود)
+- with prof.scope("name"): لقياس كتلة محددة داخل مرحلة
+- F3 لإظهار/إخفاء الطبقة: ms لكل مرحلة + p50/p95/p99 + رسم زمن الإطار
+- ZS_PROFILE=1 لإظهار الطبقة من البداية
+- ZS_PROFILE_CSV=path لحفظ أزمنة كل إطار في ملف CSV للتحليل لاحقاً
+  (جدول واحد بأعمدة ثابتة CSV_PHASES للفردي والجماعي؛ الإضافة لآخر الملف وسطر العناوين
+  فقط إذا كان فارغاً؛ عمود session يفصل جلسات اللعب و mode بين sp/mp؛ close() عند الخروج)
+
+مُعايِن المكدس (StackSampler):
+- F4 داخل اللعبة أو ZS_SAMPLE=<ثواني> عند التشغيل
+- خيط خلفي يأخذ عينات sys._current_frames() كل بضعة ms
+- يكتب profiles/stacks_*.txt بصيغة collapsed (جاهزة لـ flamegraph.pl / speedscope)
+"""
+
+import csv
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+import numpy as np
+import pygame
+
+TOGGLE_KEY = pygame.K_F3
+SAMPLE_KEY = pygame.K_F4
+SAMPLE_SECONDS = 10.0
+PROFILES_DIR = "profiles"
+
+# أعمدة CSV الثابتة: مراحل حلقتي اللعب (الفردي والجماعي) وأسماء prof.scope.
+# أي اسم غير مُعلن هنا يُجمع في عمود other - أضف أي مرحلة/scope جديدة لهذه القائمة
+CSV_PHASES = ("network", "input", "update", "ai", "weapons", "collisions", "gameplay",
+              "background", "entities", "hud", "chat", "flip", "prefetch", "idle")
+CSV_HEADER = ["session", "mode", "frame", "total_ms"] + [f"{n}_ms" for n in CSV_PHASES] + ["other_ms"]
+
+# ألوان المراحل في الرسم البياني (بالترتيب الذي تظهر به)
+_PHASE_COLORS = [
+    (90, 170, 255), (255, 170, 60), (120, 220, 120), (230, 90, 90),
+    (200, 120, 255), (250, 230, 90), (90, 220, 220), (255, 120, 190),
+    (170, 170, 170), (140, 100, 60),
+]
+
+
+class _Scope:
+    __slots__ = ("prof", "name", "start")
+
+    def __init__(self, prof: "FrameProfiler", name: str):
+        self.prof = prof
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.prof._add(self.name, time.perf_counter_ns() - self.start)
+        return False
+
+
+class FrameProfiler:
+    """مُحلل أزمنة مراحل الإطار مع طبقة عرض داخل اللعبة"""
+
+    def __init__(self, history: int = 240, csv_path: Optional[str] = None, visible: bool = False,
+                 mode: str = ""):
+        self.history = history
+        self.visible = visible
+        self.frame_ms: Deque[float] = deque(maxlen=history)
+        self.phase_hist: Dict[str, Deque[float]] = {}
+        self.phase_order: List[str] = []
+        self._scopes: Dict[str, _Scope] = {}
+        self._current: Dict[str, int] = {}
+        self._frame_start = 0
+        self._phase_name: Optional[str] = None
+        self._phase_start = 0
+        self._font: Optional[pygame.font.Font] = None
+        self.frame_no = 0
+
+        self._csv_file = None
+        self._csv = None
+        self._session = time.strftime("%Y%m%d_%H%M%S") + f".{int(time.time() * 1000) % 1000:03d}"
+        self._mode = mode
+        if csv_path:
+            try:
+                self._csv_file = open(csv_path, "a", newline="", buffering=1)
+                self._csv = csv.writer(self._csv_file)
+                if self._csv_file.tell() == 0:
+                    self._csv.writerow(CSV_HEADER)
+                else:
+                    with open(csv_path, newline="") as f:
+                        if next(csv.reader(f), None) != CSV_HEADER:
+                            print(f"[PROFILE] {csv_path} has different columns; use a new file for analysis")
+            except OSError as e:
+                print(f"[PROFILE] Cannot open CSV {csv_path}: {e}")
+
+    @classmethod
+    def from_env(cls, mode: str = "") -> "FrameProfiler":
+        return cls(csv_path=os.environ.get("ZS_PROFILE_CSV") or None,
+                   visible=os.environ.get("ZS_PROFILE", "") not in ("", "0"), mode=mode)
+
+    # ---------- القياس ----------
+    def _add(self, name: str, ns: int):
+        self._current[name] = self._current.get(name, 0) + ns
+
+    def begin_frame(self):
+        # إطار لم يُغلق (مثل continue) يُهمل
+        self._current = {}
+        self._phase_name = None
+        self._frame_start = time.perf_counter_ns()
+
+    def phase(self, name: str):
+        """إنهاء المرحلة الحالية وبدء مرحلة جديدة"""
+        now = time.perf_counter_ns()
+        if self._phase_name is not None:
+            self._add(self._phase_name, now - self._phase_start)
+        self._phase_name = name
+        self._phase_start = now
+
+    def scope(self, name: str) -> _Scope:
+        sc = self._scopes.get(name)
+        if sc is None:
+            sc = self._scopes[name] = _Scope(self, name)
+        return sc
+
+    def end_frame(self):
+        if self._frame_start == 0:
+            return
+        now = time.perf_counter_ns()
+        if self._phase_name is not None:
+            self._add(self._phase_name, now - self._phase_start)
+            self._phase_name = None
+        total_ms = (now - self._frame_start) / 1e6
+        self.frame_ms.append(total_ms)
+        for name, ns in self._current.items():
+            hist = self.phase_hist.get(name)
+            if hist is None:
+                hist = self.phase_hist[name] = deque(maxlen=self.history)
+                self.phase_order.append(name)
+            hist.append(ns / 1e6)
+        # المراحل التي لم تعمل هذا الإطار = 0
+        for name in self.phase_order:
+            if name not in self._current:
+                self.phase_hist[name].append(0.0)
+        if self._csv is not None:
+            self._write_csv(total_ms)
+        self.frame_no += 1
+        self._frame_start = 0
+
+    def _write_csv(self, total_ms: float):
+        current = self._current
+        other = sum(ns for name, ns in current.items() if name not in CSV_PHASES)
+        row = [self._session, self._mode, self.frame_no, f"{total_ms:.3f}"]
+        row += [f"{current.get(n, 0) / 1e6:.3f}" for n in CSV_PHASES]
+        row.append(f"{other / 1e6:.3f}")
+        self._csv.writerow(row)
+
+    def close(self):
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv = None
+
+    # ---------- الإحصائيات ----------
+    def percentiles(self) -> tuple:
+        if not self.frame_ms:
+            return (0.0, 0.0, 0.0)
+        p50, p95, p99 = np.percentile(np.fromiter(self.frame_ms, dtype=np.float64), (50, 95, 99))
+        return (float(p50), float(p95), float(p99))
+
+    def phase_avg(self, name: str, window: int = 60) -> float:
+        hist = self.phase_hist.get(name)
+        if not hist:
+            return 0.0
+        n = min(window, len(hist))
+        return sum(list(hist)[-n:]) / n
+
+    # ---------- الإدخال والعرض ----------
+    def handle_event(self, e) -> bool:
+        if e.type == pygame.KEYDOWN and e.key == TOGGLE_KEY:
+            self.visible = not self.visible
+            return True
+        if e.type == pygame.KEYDOWN and e.key == SAMPLE_KEY:
+            SAMPLER.start(SAMPLE_SECONDS)
+            return True
+        return False
+
+    def draw(self, screen: pygame.Surface, x: int = 10, y: int = 120):
+        if not self.visible:
+            return
+        if self._font is None:
+            self._font = pygame.font.Font(None, 18)
+        font = self._font
+        graph_w, graph_h = 240, 60
+        line_h = 15
+        rows = len(self.phase_order) + 2
+        panel = pygame.Rect(x, y, graph_w + 20, rows * line_h + graph_h + 24)
+        bg = pygame.Surface(panel.size, pygame.SRCALPHA)
+        bg.fill((0, 0, 0, 170))
+        screen.blit(bg, panel.topleft)
+
+        p50, p95, p99 = self.percentiles()
+        ty = y + 6
+        screen.blit(font.render(f"frame p50 {p50:.1f}  p95 {p95:.1f}  p99 {p99:.1f} ms",
+                                True, (255, 255, 255)), (x + 8, ty))
+        ty += line_h + 2
+        for i, name in enumerate(self.phase_order):
+            col = _PHASE_COLORS[i % len(_PHASE_COLORS)]
+            pygame.draw.rect(screen, col, (x + 8, ty + 3, 8, 8))
+            screen.blit(font.render(f"{name:<12} {self.phase_avg(name):6.2f} ms", True, (220, 220, 220)),
+                        (x + 22, ty))
+            ty += line_h
+
+        # رسم زمن الإطار: أعمدة مكدسة لكل مرحلة، وخط 16.7ms
+        gx, gy = x + 10, ty + 6
+        pygame.draw.rect(screen, (40, 40, 40), (gx, gy, graph_w, graph_h))
+        scale = graph_h / 33.3
+        frames = list(self.frame_ms)[-graph_w:]
+        n = len(frames)
+        hists = [list(self.phase_hist[name])[-n:] for name in self.phase_order]
+        for k in range(n):
+            bx = gx + graph_w - n + k
+            base = gy + graph_h
+            for i, hist in enumerate(hists):
+                if k >= len(hist):
+                    continue
+                h = int(hist[k] * scale)
+                if h <= 0:
+                    continue
+                top = max(gy, base - h)
+                pygame.draw.line(screen, _PHASE_COLORS[i % len(_PHASE_COLORS)], (bx, base), (bx, top))
+                base = top
+            # الجزء غير المُسمّى من الإطار
+            total_top = max(gy, gy + graph_h - int(frames[k] * scale))
+            if total_top < base:
+                pygame.draw.line(screen, (90, 90, 90), (bx, base), (bx, total_top))
+        budget_y = gy + graph_h - int(16.7 * scale)
+        pygame.draw.line(screen, (255, 80, 80), (gx, budget_y), (gx + graph_w, budget_y))
+
+
+# ============== Sampling Profiler ==============
+class StackSampler:
+    """مُعايِن مكدس منخفض التكلفة يعمل في خيط خلفي"""
+
+    def __init__(self, interval: float = 0.005, out_dir: str = PROFILES_DIR):
+        self.interval = interval
+        self.out_dir = out_dir
+        self.counts: Dict[str, int] = {}
+        self.samples = 0
+        self.last_path: Optional[str] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, seconds: float, all_threads: bool = False) -> bool:
+        """بدء أخذ العينات لمدة محددة (يتجاهل الطلب إذا كان يعمل)"""
+        if self.running:
+            return False
+        self.counts = {}
+        self.samples = 0
+        self._stop.clear()
+        target = None if all_threads else threading.main_thread().ident
+        self._thread = threading.Thread(target=self._run, args=(seconds, target),
+                                        name="StackSampler", daemon=True)
+        self._thread.start()
+        print(f"[PROFILE] Sampling stacks for {seconds:.0f}s ...")
+        return True
+
+    def stop(self):
+        self._stop.set()
+
+    @staticmethod
+    def _collapse(frame) -> str:
+        names = []
+        while frame is not None:
+            co = frame.f_code
+            names.append(f"{os.path.basename(co.co_filename)}:{co.co_name}")
+            frame = frame.f_back
+        names.reverse()
+        return ";".join(names)
+
+    def _run(self, seconds: float, target: Optional[int]):
+        me = threading.get_ident()
+        thread_names = {t.ident: t.name for t in threading.enumerate()}
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline and not self._stop.is_set():
+            for tid, frame in sys._current_frames().items():
+                if tid == me or (target is not None and tid != target):
+                    continue
+                stack = self._collapse(frame)
+                if target is None:
+                    stack = f"{thread_names.get(tid, tid)};{stack}"
+                self.counts[stack] = self.counts.get(stack, 0) + 1
+            self.samples += 1
+            time.sleep(self.interval)
+        self.write()
+
+    def write(self) -> Optional[str]:
+        if not self.counts:
+            return None
+        try:
+            os.makedirs(self.out_dir, exist_ok=True)
+            path = os.path.join(self.out_dir, time.strftime("stacks_%Y%m%d_%H%M%S.txt"))
+            with open(path, "w", encoding="utf-8") as f:
+                for stack, n in sorted(self.counts.items(), key=lambda kv: -kv[1]):
+                    f.write(f"{stack} {n}\n")
+        except OSError as e:
+            print(f"[PROFILE] Could not write stacks: {e}")
+            return None
+        self.last_path = path
+        print(f"[PROFILE] {self.samples} samples -> {path}")
+        return path
+
+
+SAMPLER = StackSampler()
+
+
+def start_sampler_from_env() -> bool:
+    """ZS_SAMPLE=<ثواني> يبدأ أخذ العينات فوراً (ZS_SAMPLE_ALL=1 لكل الخيوط)"""
+    value = os.environ.get("ZS_SAMPLE", "")
+    if not value:
+        return False
+    try:
+        seconds = float(value)
+    except ValueError:
+        seconds = SAMPLE_SECONDS
+    return SAMPLER.start(seconds, all_threads=os.environ.get("ZS_SAMPLE_ALL", "") not in ("", "0"))
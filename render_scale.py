@@ -0,0 +1,117 @@
+# render_scale.py - Frame-time driven render scale for Zombie Shooter
+"""
+دقة رسم ديناميكية حسب زمن الإطار:
+- RENDER_SCALE.update(ms) بعد كل clock.tick (زمن العمل فقط: clock.get_rawtime)
+- إذا تجاوز متوسط الإطار الميزانية لفترة: 100% ← 75% ← 50%، وإذا انخفض بوضوح يعود للأعلى
+- طبقة المؤثرات (الانفجارات) تُرسم على سطح داخلي بحجم scale ثم تُكبَّر للشاشة
+- الواجهة (HUD) تبقى بالدقة الأصلية دائماً
+- افتراضياً مثبتة على 100%: بـ blitters المعالج في pygame لم تكن 75%/50% أرخص من 100% في كل
+  أعمار الانفجار (تكبير الطبقة ودمجها يكلف 2-4 ms)؛ ZS_RENDER_SCALE=auto لتفعيل التكيّف
+- ZS_RENDER_SCALE=0.5 / 0.75 / 1 لتثبيت الدقة (بدون تكيّف)
+"""
+
+import os
+from typing import Dict, Optional, Sequence, Tuple
+
+import pygame
+
+LEVELS: Tuple[float, ...] = (1.0, 0.75, 0.5)
+TARGET_MS = 1000.0 / 60
+
+
+class DynamicResolution:
+    """اختيار مستوى الدقة من زمن الإطار مع تخميد (hysteresis) لتجنب التذبذب"""
+
+    def __init__(self, levels: Sequence[float] = LEVELS, target_ms: float = TARGET_MS,
+                 down_frames: int = 45, up_frames: int = 180, pinned: Optional[float] = None):
+        self.levels = tuple(levels)
+        self.target_ms = target_ms
+        self.down_frames = down_frames     # إطارات فوق الميزانية قبل خفض الدقة
+        self.up_frames = up_frames         # إطارات مريحة قبل رفعها (أبطأ عمداً)
+        self.pinned = pinned
+        self.index = 0
+        self.avg_ms = 0.0
+        self._over = 0
+        self._under = 0
+        self._scratch: Dict[Tuple[str, int, int], pygame.Surface] = {}
+        self.pin(pinned)
+
+    @classmethod
+    def from_env(cls) -> "DynamicResolution":
+        value = os.environ.get("ZS_RENDER_SCALE", "")
+        if value == "auto":
+            return cls()
+        try:
+            pinned = float(value) if value else 1.0
+        except ValueError:
+            pinned = 1.0
+        return cls(pinned=pinned)
+
+    @property
+    def scale(self) -> float:
+        return self.levels[self.index]
+
+    def pin(self, scale: Optional[float]):
+        """تثبيت الدقة على أقرب مستوى لـ scale (None = تكيّف حسب زمن الإطار)"""
+        self.pinned = scale
+        if scale is not None:
+            self.index = min(range(len(self.levels)), key=lambda i: abs(self.levels[i] - scale))
+        self._scratch.clear()
+
+    def reset(self):
+        """بداية مستوى/مشهد جديد: نبدأ بالمتوسط من جديد (بدون تغيير الدقة)"""
+        self.avg_ms = 0.0
+        self._over = 0
+        self._under = 0
+
+    def update(self, frame_ms: float) -> bool:
+        """تغذية زمن عمل الإطار؛ True إذا تغيرت الدقة"""
+        if self.pinned is not None:
+            return False
+        # متوسط متحرك أسي (~0.25 ثانية)
+        self.avg_ms = frame_ms if self.avg_ms == 0.0 else self.avg_ms * 0.9 + frame_ms * 0.1
+        if self.avg_ms > self.target_ms * 1.05:
+            self._over += 1
+            self._under = 0
+        elif self.avg_ms < self.target_ms * 0.6:
+            self._under += 1
+            self._over = 0
+        else:
+            self._over = self._under = 0
+
+        if self._over >= self.down_frames and self.index < len(self.levels) - 1:
+            self.index += 1
+        elif self._under >= self.up_frames and self.index > 0:
+            self.index -= 1
+        else:
+            return False
+        self._over = self._under = 0
+        self._scratch.clear()
+        print(f"[RENDER] scale {int(self.scale * 100)}% (avg {self.avg_ms:.1f} ms)")
+        return True
+
+    # ---------- الطبقة الداخلية ----------
+    def scratch(self, w: int, h: int, slot: str = "layer") -> pygame.Surface:
+        """سطح SRCALPHA داخلي مُعاد الاستخدام (مقاس مقرب لأعلى لمضاعفات 32؛ slot يفصل الاستخدامات المتزامنة)"""
+        key = (slot, (w + 31) // 32 * 32, (h + 31) // 32 * 32)
+        surf = self._scratch.get(key)
+        if surf is None:
+            if len(self._scratch) > 32:
+                self._scratch.clear()
+            surf = self._scratch[key] = pygame.Surface(key[1:], pygame.SRCALPHA)
+        surf.fill((0, 0, 0, 0), (0, 0, w, h))
+        return surf
+
+    def present(self, screen: pygame.Surface, layer: pygame.Surface, w: int, h: int,
+                dest: Tuple[int, int], size: Tuple[int, int], special_flags: int = 0):
+        """تكبير الجزء (0, 0, w, h) من الطبقة الداخلية إلى size ورسمه عند dest"""
+        if w <= 0 or h <= 0:
+            return
+        part = layer.subsurface((0, 0, w, h))
+        screen.blit(pygame.transform.scale(part, size), dest, special_flags=special_flags)
+
+    def label(self) -> str:
+        return f"render {int(self.scale * 100)}%" + ("" if self.pinned is None else " (pinned)")
+
+
+RENDER_SCALE = DynamicResolution.from_env()
@@ -0,0 +1,78 @@
+# scene_layers.py - Static layers and dirty-rect presentation for menus and end screens
+"""
+أدوات المشاهد شبه الثابتة (القائمة، شاشات النهاية):
+- vertical_gradient(w, h, color_at, step, key): تدرج عمودي مرسوم مرة واحدة
+  (بدل pygame.draw.line لكل صف في كل إطار)
+- DirtyRects: عرض الأجزاء المتغيرة فقط عبر pygame.display.update(rects)
+  - rects الإطار الحالي + السابق (ما اختفى يجب مسحه أيضاً)
+  - full() يفرض flip كاملاً (أول إطار، تغير كل الشاشة)
+  - إذا تجاوزت المساحة المتسخة FULL_RATIO من الشاشة يُستخدم flip (أرخص من تحديثات كثيرة)
+- DirtyRects.pixels: البكسلات المرسلة في الإطار الأخير (للقياس)
+"""
+
+from typing import Callable, Dict, List, Tuple
+
+import pygame
+
+FULL_RATIO = 0.5
+
+Color = Tuple[int, int, int]
+
+_gradients: Dict[tuple, pygame.Surface] = {}
+
+
+def vertical_gradient(w: int, h: int, color_at: Callable[[int], Color], step: int = 1,
+                      key=None) -> pygame.Surface:
+    """
+    تدرج عمودي: color_at(y) لون الصف y، كل step صفوف بلون الصف الأول منها.
+    عمود بعرض بكسل واحد ثم تحجيم أفقي؛ مع key يُخزن ويُشارك بين المشاهد.
+    """
+    if key is not None:
+        cached = _gradients.get((key, w, h, step))
+        if cached is not None:
+            return cached
+    column = pygame.Surface((1, max(1, h)))
+    for y in range(0, h, step):
+        column.fill(color_at(y), (0, y, 1, step))
+    surf = pygame.transform.scale(column, (max(1, w), max(1, h)))
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert()
+    if key is not None:
+        _gradients[(key, w, h, step)] = surf
+    return surf
+
+
+class DirtyRects:
+    """تجميع المستطيلات المتغيرة في الإطار وإرسالها للشاشة"""
+
+    def __init__(self, size: Tuple[int, int], full_ratio: float = FULL_RATIO):
+        self.area = max(1, size[0] * size[1])
+        self.full_ratio = full_ratio
+        self._rects: List[pygame.Rect] = []
+        self._prev: List[pygame.Rect] = []
+        self._full = True
+        self.pixels = 0
+
+    def full(self):
+        self._full = True
+
+    def add(self, rect):
+        self._rects.append(pygame.Rect(rect))
+
+    def extend(self, rects):
+        for r in rects:
+            self._rects.append(pygame.Rect(r))
+
+    def present(self):
+        rects = self._rects + self._prev
+        pixels = sum(r.w * r.h for r in rects)
+        if self._full or pixels > self.area * self.full_ratio:
+            pygame.display.flip()
+            self.pixels = self.area
+        else:
+            if rects:
+                pygame.display.update(rects)
+            self.pixels = pixels
+        self._prev = self._rects
+        self._rects = []
+        self._full = False
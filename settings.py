@@ -1,13 +1,43 @@
 # settings.py
 """
 Game Settings Module
-Manages game settings including volume, resolution, and key bindings.
-Settings are persisted to settings.json.
+Manages game settings including volume, resolution, key bindings and
+graphics quality presets. Settings are persisted to settings.json.
 """
 import os
 import json
 import pygame
 
+# Graphics quality presets: multipliers / toggles for effect budgets.
+# "custom" uses the values stored under performance.custom in settings.json.
+QUALITY_PRESETS = {
+    "low": {
+        "explosion_particles": 0.35,   # fire / smoke / sparks / debris per explosion
+        "blood_particles": 0.4,        # blood particles per kill
+        "background_detail": 0.5,      # stars, grass blobs and cracks per level
+        "glow_layers": 1,              # shield / dash glow layers (1-4)
+        "menu_fog_layers": 0,
+        "menu_lightning": False,
+    },
+    "medium": {
+        "explosion_particles": 0.65,
+        "blood_particles": 0.7,
+        "background_detail": 0.75,
+        "glow_layers": 2,
+        "menu_fog_layers": 1,
+        "menu_lightning": True,
+    },
+    "high": {
+        "explosion_particles": 1.0,
+        "blood_particles": 1.0,
+        "background_detail": 1.0,
+        "glow_layers": 4,
+        "menu_fog_layers": 2,
+        "menu_lightning": True,
+    },
+}
+QUALITY_NAMES = ["low", "medium", "high", "custom"]
+
 # Default settings
 DEFAULT_SETTINGS = {
     "music_volume": 0.3,
@@ -22,7 +52,13 @@ DEFAULT_SETTINGS = {
         "weapon_1": [pygame.K_1],
         "weapon_2": [pygame.K_2],
         "weapon_3": [pygame.K_3],
-    }
+    },
+    "performance": {
+        "preset": "high",
+        "calibrated": False,
+        "calibration_ms": None,
+        "custom": dict(QUALITY_PRESETS["high"]),
+    },
 }
 
 # Available resolutions
@@ -58,6 +94,11 @@ class GameSettings:
         self.sfx_volume = DEFAULT_SETTINGS["sfx_volume"]
         self.resolution = tuple(DEFAULT_SETTINGS["resolution"])
         self.key_bindings = dict(DEFAULT_SETTINGS["key_bindings"])
+        perf = DEFAULT_SETTINGS["performance"]
+        self.quality_preset = perf["preset"]
+        self.quality_custom = dict(perf["custom"])
+        self.calibrated = perf["calibrated"]
+        self.calibration_ms = perf["calibration_ms"]
         
         # Load saved settings if they exist
         self.load()
@@ -69,6 +110,12 @@ class GameSettings:
             "sfx_volume": self.sfx_volume,
             "resolution": list(self.resolution),
             "key_bindings": self.key_bindings,
+            "performance": {
+                "preset": self.quality_preset,
+                "calibrated": self.calibrated,
+                "calibration_ms": self.calibration_ms,
+                "custom": self.quality_custom,
+            },
         }
         try:
             with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
@@ -94,6 +141,18 @@ class GameSettings:
             
             if "key_bindings" in data:
                 self.key_bindings = data["key_bindings"]
+            
+            perf = data.get("performance")
+            if isinstance(perf, dict):
+                if perf.get("preset") in QUALITY_NAMES:
+                    self.quality_preset = perf["preset"]
+                self.calibrated = bool(perf.get("calibrated", False))
+                self.calibration_ms = perf.get("calibration_ms")
+                custom = perf.get("custom")
+                if isinstance(custom, dict):
+                    for key, default in QUALITY_PRESETS["high"].items():
+                        if key in custom:
+                            self.quality_custom[key] = type(default)(custom[key])
                 
         except Exception as e:
             print(f"Error loading settings: {e}")
@@ -132,6 +191,27 @@ class GameSettings:
             print(f"Error applying resolution: {e}")
             return screen
     
+    def set_quality_preset(self, name: str):
+        """Select a graphics quality preset (low / medium / high / custom)."""
+        if name in QUALITY_NAMES:
+            self.quality_preset = name
+    
+    def quality(self, key: str):
+        """Current value of one effect budget for the active preset."""
+        if self.quality_preset == "custom":
+            return self.quality_custom.get(key, QUALITY_PRESETS["high"][key])
+        return QUALITY_PRESETS.get(self.quality_preset, QUALITY_PRESETS["high"])[key]
+    
+    def scale_count(self, count: int, key: str) -> int:
+        """Scale an effect count by the active preset (never below 1)."""
+        return max(1, int(round(count * self.quality(key))))
+    
+    def set_calibration(self, preset: str, frame_ms: float):
+        """Store the result of the first-run calibration."""
+        self.set_quality_preset(preset)
+        self.calibrated = True
+        self.calibration_ms = round(frame_ms, 2)
+    
     def is_key_for_action(self, key: int, action: str) -> bool:
         """Check if a key is bound to an action."""
         if action in self.key_bindings:
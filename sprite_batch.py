@@ -0,0 +1,164 @@
+# sprite_batch.py - Batched sprite submission for Zombie Shooter
+"""
+تجميع أوامر الرسم بدل blit منفصل لكل كيان:
+- أثناء تمرير الرسم: BATCH.layer("blood").append((surf, (x, y))) أو BATCH.add(...)
+- بعد كل فئة: BATCH.flush(screen, "blood") يرسل الطبقة كلها باستدعاء واحد
+  (Surface.fblits إذا توفرت - pygame-ce - وإلا Surface.blits(doreturn=False))
+- سبرايتات مشتركة مخزنة بدل إنشاء Surface / نص لكل كيان كل إطار:
+  circle_sprite (جزيئات الدم)، text_sprite (مستوى الزومبي)، bar_sprite (شريط الصحة)،
+  bullet_sprite (الرصاصة مع ذيلها، الاتجاه مُكمّم إلى 32 زاوية)،
+  premul_sprite (دائرة/مربع بألفا مضروبة مسبقاً لطبقة المؤثرات المصغرة - BLEND_PREMULTIPLIED)
+- BATCH.submitted / BATCH.calls: عدد السبرايتات وعدد الاستدعاءات في الإطار الأخير
+"""
+
+import math
+from typing import Dict, List, Tuple
+
+import pygame
+
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+_MAX_CACHE = 2048
+_ANGLES = 32
+
+
+class SpriteBatch:
+    """طبقات من أزواج (surface, dest) تُرسل دفعة واحدة"""
+
+    def __init__(self):
+        self._layers: Dict[str, List[Tuple[pygame.Surface, Tuple[float, float]]]] = {}
+        self.submitted = 0
+        self.calls = 0
+
+    def layer(self, name: str) -> list:
+        """قائمة الطبقة مباشرة (append داخل الحلقات بدون استدعاء دالة إضافي)"""
+        items = self._layers.get(name)
+        if items is None:
+            items = self._layers[name] = []
+        return items
+
+    def add(self, name: str, surf: pygame.Surface, dest: Tuple[float, float]):
+        self.layer(name).append((surf, dest))
+
+    def flush(self, screen: pygame.Surface, *names: str) -> int:
+        """إرسال الطبقات بالترتيب المعطى ثم تفريغها"""
+        n = 0
+        for name in names:
+            items = self._layers.get(name)
+            if not items:
+                continue
+            if _HAS_FBLITS:
+                screen.fblits(items)
+            else:
+                screen.blits(items, doreturn=False)
+            n += len(items)
+            self.calls += 1
+            items.clear()
+        self.submitted += n
+        return n
+
+    def begin_frame(self):
+        self.submitted = 0
+        self.calls = 0
+        for items in self._layers.values():
+            items.clear()
+
+
+# ---------- سبرايتات مشتركة ----------
+_circles: Dict[tuple, pygame.Surface] = {}
+_texts: Dict[tuple, pygame.Surface] = {}
+_bars: Dict[tuple, pygame.Surface] = {}
+_bullets: Dict[tuple, Tuple[pygame.Surface, int]] = {}
+_premul: Dict[tuple, pygame.Surface] = {}
+_fonts: Dict[int, pygame.font.Font] = {}
+
+
+def _remember(cache: dict, key, value):
+    if len(cache) >= _MAX_CACHE:
+        cache.clear()
+    cache[key] = value
+    return value
+
+
+def circle_sprite(size: int, radius: int, color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+    """دائرة شفافة في سطح size×size (الشفافية مُكمّمة لخطوات 8 لتقليل عدد النسخ)"""
+    alpha = min(255, (int(alpha) + 4) // 8 * 8)
+    key = (size, radius, color, alpha)
+    surf = _circles.get(key)
+    if surf is None:
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (*color, alpha), (size // 2, size // 2), radius)
+        surf = _remember(_circles, key, surf)
+    return surf
+
+
+def premul_sprite(radius: int, color: Tuple[int, int, int], alpha: int, square: bool = False) -> pygame.Surface:
+    """دائرة (أو مربع) في سطح 2r×2r بألوان مضروبة مسبقاً في الشفافية (مُكمّمة لخطوات 8)"""
+    alpha = min(255, (int(alpha) + 4) // 8 * 8)
+    key = (radius, color, alpha, square)
+    surf = _premul.get(key)
+    if surf is None:
+        surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        rgba = (color[0] * alpha // 255, color[1] * alpha // 255, color[2] * alpha // 255, alpha)
+        if square:
+            surf.fill(rgba)
+        else:
+            pygame.draw.circle(surf, rgba, (radius, radius), radius)
+        surf = _remember(_premul, key, surf)
+    return surf
+
+
+def text_sprite(text: str, size: int, color: Tuple[int, int, int],
+                bg: Tuple[int, int, int, int] = None, pad: Tuple[int, int] = (6, 2)) -> pygame.Surface:
+    """نص بالخط الافتراضي (مع خلفية شبه شفافة اختيارية)"""
+    key = (text, size, color, bg, pad)
+    surf = _texts.get(key)
+    if surf is None:
+        font = _fonts.get(size)
+        if font is None:
+            font = _fonts[size] = pygame.font.Font(None, size)
+        label = font.render(text, True, color)
+        if bg is None:
+            surf = label
+        else:
+            surf = pygame.Surface((label.get_width() + pad[0], label.get_height() + pad[1]), pygame.SRCALPHA)
+            surf.fill(bg)
+            surf.blit(label, (pad[0] // 2, pad[1] // 2))
+        surf = _remember(_texts, key, surf)
+    return surf
+
+
+def bar_sprite(width: int, height: int, ratio: float,
+               back: Tuple[int, int, int] = (50, 50, 50), fill: Tuple[int, int, int] = (0, 255, 0)) -> pygame.Surface:
+    """شريط صحة (الجزء الممتلئ بدقة بكسل)"""
+    filled = max(0, min(width, int(width * ratio)))
+    key = (width, height, filled, back, fill)
+    surf = _bars.get(key)
+    if surf is None:
+        surf = pygame.Surface((width, height))
+        surf.fill(back)
+        if filled:
+            surf.fill(fill, (0, 0, filled, height))
+        surf = _remember(_bars, key, surf)
+    return surf
+
+
+def bullet_sprite(vx: float, vy: float, radius: int, color: Tuple[int, int, int]) -> Tuple[pygame.Surface, int]:
+    """رصاصة عادية مع ذيل (نفس draw_bullet_shape)؛ يرجع (السطح، إزاحة المركز)"""
+    angle = math.atan2(vy, vx)
+    length = math.hypot(vx, vy) * 8
+    bucket = int(round(angle / (2 * math.pi) * _ANGLES)) % _ANGLES
+    key = (bucket, int(round(length)), radius, color)
+    cached = _bullets.get(key)
+    if cached is None:
+        a = bucket * 2 * math.pi / _ANGLES
+        tail = int(round(length))
+        half = max(radius, tail) + 2
+        surf = pygame.Surface((half * 2 + 1, half * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(surf, color, (half, half), radius)
+        pygame.draw.line(surf, color, (half, half),
+                         (half - int(math.cos(a) * tail), half - int(math.sin(a) * tail)), 2)
+        cached = _remember(_bullets, key, (surf, half))
+    return cached
+
+
+BATCH = SpriteBatch()
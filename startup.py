@@ -0,0 +1,75 @@
+# startup.py - Cold-start timeline and lazy module loading
+"""
+قياس زمن البدء حتى أول إطار:
+- startup.mark(name): نقطة على الخط الزمني منذ بدء main.py
+- startup.load("game"): استيراد عند أول استخدام مع تسجيل زمنه
+- startup.first_frame(): تُستدعى بعد أول flip للقائمة وتطبع التقرير مرة واحدة
+- ZS_STARTUP=1 لتقرير مفصل (المراحل + أبطأ الوحدات المستوردة قبل أول إطار)
+  لشجرة الاستيراد الكاملة: python -X importtime main.py
+"""
+
+import importlib
+import os
+import sys
+import time
+from typing import Dict, List, Tuple
+
+T0 = time.perf_counter()
+
+_marks: List[Tuple[str, float]] = []
+_loads: Dict[str, float] = {}
+_first_frame_ms = None
+
+
+def _ms(t: float) -> float:
+    return (t - T0) * 1000.0
+
+
+def mark(name: str):
+    _marks.append((name, time.perf_counter()))
+
+
+def load(name: str):
+    """استيراد وحدة عند أول استخدام (الاستدعاءات التالية مجانية)"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    t0 = time.perf_counter()
+    module = importlib.import_module(name)
+    ms = (time.perf_counter() - t0) * 1000.0
+    _loads[name] = ms
+    print(f"[STARTUP] loaded {name} on first use in {ms:.0f} ms")
+    return module
+
+
+def first_frame():
+    global _first_frame_ms
+    if _first_frame_ms is not None:
+        return
+    mark("first frame")
+    _first_frame_ms = _ms(_marks[-1][1])
+    print(f"[STARTUP] time to first frame: {_first_frame_ms:.0f} ms")
+    if os.environ.get("ZS_STARTUP", "") not in ("", "0"):
+        report()
+
+
+def _project_modules() -> List[str]:
+    """وحدات المشروع المحملة (ملفات .py في مجلد اللعبة)"""
+    root = os.path.dirname(os.path.abspath(__file__))
+    names = []
+    for name, mod in list(sys.modules.items()):
+        path = getattr(mod, "__file__", None) or ""
+        if path and os.path.dirname(os.path.abspath(path)) == root:
+            names.append(name)
+    return sorted(names)
+
+
+def report():
+    print("[STARTUP] timeline (ms since main.py start):")
+    prev = T0
+    for name, t in _marks:
+        print(f"[STARTUP]   {_ms(t):8.1f}  (+{(t - prev) * 1000.0:7.1f})  {name}")
+        prev = t
+    print(f"[STARTUP] project modules loaded before first frame: {', '.join(_project_modules())}")
+    for name, ms in _loads.items():
+        print(f"[STARTUP]   lazy {name}: {ms:.1f} ms")
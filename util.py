@@ -2,6 +2,8 @@
 import os
 import pygame
 
+from fonts import get_font
+
 COLORS = {
     "white": (255, 255, 255),
     "black": (0, 0, 0),
@@ -18,7 +20,7 @@ SND_DIR = "sounds"
 
 
 def draw_text(surface, text, pos, *, size=24, color=(255, 255, 255), bold=False, center=False):
-    font = pygame.font.SysFont("arial", size, bold=bold)
+    font = get_font(size, bold=bold)
     srf = font.render(text, True, color)
     if center:
         rect = srf.get_rect(center=pos)
@@ -28,7 +30,7 @@ def draw_text(surface, text, pos, *, size=24, color=(255, 255, 255), bold=False,
 
 def draw_shadow_text(surface, text, pos, *, size=32, color=(0, 0, 0),
                      shadow=(235, 235, 235), offset=2, bold=True):
-    font = pygame.font.SysFont("arial", size, bold=bold)
+    font = get_font(size, bold=bold)
     x, y = pos
     srf_sh = font.render(text, True, shadow)
     surface.blit(srf_sh, (x + offset, y + offset))
@@ -40,37 +42,57 @@ def draw_shadow_text(surface, text, pos, *, size=32, color=(0, 0, 0),
 def clamp(v, lo, hi):
     return max(lo, min(hi, v))
 
-def load_image(name, *, scale=None):
+# 🔥 كاش الأصول: الصور المحولة (convert_alpha) والأصوات - يملؤه assets.AssetPreloader أو أول تحميل
+_IMAGES = {}
+_SOUNDS = {}
+
+
+def _shared_image(name):
+    """السطح المحول المشترك (لا تعدله مباشرة)"""
+    img = _IMAGES.get(name)
+    if img is not None:
+        return img
     path = os.path.join(IMG_DIR, name)
     if not os.path.isfile(path):
         return None
     try:
         img = pygame.image.load(path).convert_alpha()
-        if scale is not None:
-            w, h = img.get_size()
-            img = pygame.transform.smoothscale(img, (int(w * scale), int(h * scale)))
-        return img
     except Exception:
         return None
+    _IMAGES[name] = img
+    return img
+
+def load_image(name, *, scale=None):
+    img = _shared_image(name)
+    if img is None:
+        return None
+    if scale is not None:
+        w, h = img.get_size()
+        return pygame.transform.smoothscale(img, (int(w * scale), int(h * scale)))
+    return img.copy()
 
 def load_image_to_height(name, height):
-    surf = load_image(name)
+    surf = _shared_image(name)
     if not surf:
         return None
     w, h = surf.get_size()
-    if h <= 0:
-        return surf
+    if h <= 0 or h == height:
+        return surf.copy()
     new_w = int(w * (height / h))
     return pygame.transform.smoothscale(surf, (new_w, height))
 
 def load_sound(name):
+    snd = _SOUNDS.get(name)
+    if snd is not None:
+        return snd
     path = os.path.join(SND_DIR, name)
     if not os.path.isfile(path):
         return None
     try:
         if not pygame.mixer.get_init():
             pygame.mixer.init()
-        return pygame.mixer.Sound(path)
+        snd = _SOUNDS[name] = pygame.mixer.Sound(path)
+        return snd
     except Exception:
         return None
 
@@ -137,7 +159,7 @@ class Button:
         pygame.draw.rect(surface, border_color, self.rect, width=border_width, border_radius=8)
         
         # 🔥 CLEAR READABLE FONT - Arial Bold for best readability
-        font = pygame.font.SysFont("arial", 24, bold=True)
+        font = get_font(24, bold=True)
         txt = font.render(self.label, True, text_color)
         
         # 🔥 BLACK OUTLINE for text clarity (renders text readable on any background)
@@ -221,7 +243,7 @@ class Slider:
         
         # Label and value text
         if self.label:
-            font = pygame.font.SysFont("arial", 18, bold=True)
+            font = get_font(18, bold=True)
             label_surf = font.render(self.label, True, (220, 210, 210))
             surface.blit(label_surf, (self.rect.x, self.rect.y - 22))
             
@@ -302,7 +324,7 @@ class Dropdown:
         pygame.draw.rect(surface, border_color, self.rect, width=2, border_radius=6)
         
         # Selected text
-        font = pygame.font.SysFont("arial", 18, bold=True)
+        font = get_font(18, bold=True)
         if 0 <= self.selected_index < len(self.options):
             text = self.options[self.selected_index]
         else:
@@ -0,0 +1,220 @@
+# visibility.py - Precomputed potentially-visible-set (PVS) between world cells
+"""
+مجموعة الرؤية المحسوبة مسبقاً:
+- العالم مقسم لخلايا (64px افتراضياً)، ولكل زوج خلايا بت any_clear:
+  خط واحد على الأقل من خطوط العينة (5 نقاط لكل خلية) بين الخليتين خالٍ من الجدران
+- إذا لم يكن أي خط خالياً: الخليتان تُعتبران محجوبتين؛ وإلا query ترجع None والاختبار الدقيق يقرر.
+  هذا الرفض تقريبي أيضاً: خط حقيقي عبر فتحة بين خطوط العينة يفوته (~0.2-0.6% من أجوبة False)
+  (بت "كل الخطوط خالية" لا يُحفظ: جدار رفيع بين خطوط العينة يفوته فلا يصلح جواباً)
+- الحساب مرة واحدة لكل مستوى (numpy)، ثم يُحفظ في cache/ حسب المستوى وحجم العالم
+- build_steps: كل خطوة بحدود STEP_TESTS اختبار (قطعة × جدار) ≈ 1ms حتى بدون كاش،
+  والحفظ بعد البناء التدريجي بدون ضغط (~1ms بدل 15-40ms لـ zlib؛ ~0.45MB لكل مستوى)
+"""
+
+import hashlib
+import os
+from typing import Generator, Iterator, List, Optional
+
+import numpy as np
+import pygame
+
+CACHE_DIR = "cache"
+PVS_VERSION = 2
+# نقاط العينة داخل كل خلية: المركز + 4 زوايا مُزاحة للداخل
+_SAMPLE_INSET = 8
+# اختبارات (قطعة × جدار) في كل خطوة من build_steps
+STEP_TESTS = 30_000
+# صفوف نسخ النصف السفلي (التماثل) في كل خطوة
+_MIRROR_ROWS = 64
+
+
+def _segments_blocked(x0, y0, x1, y1, walls: np.ndarray) -> np.ndarray:
+    """
+    اختبار slab مُتجه: هل كل قطعة تقطع أي جدار؟
+    x0..y1: مصفوفات بنفس الشكل، walls: (W, 4) = left, top, right, bottom
+    """
+    blocked = np.zeros(np.shape(x0), dtype=bool)
+    for _ in _segments_blocked_steps(x0, y0, x1, y1, walls, blocked, len(walls) or 1):
+        pass
+    return blocked
+
+
+def _segments_blocked_steps(x0, y0, x1, y1, walls: np.ndarray, blocked: np.ndarray,
+                            walls_per_step: int) -> Iterator[None]:
+    """مثل _segments_blocked (النتيجة في blocked) مع yield بعد كل walls_per_step جدار"""
+    if walls.size == 0:
+        return
+    dx = x1 - x0
+    dy = y1 - y0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inv_dx = 1.0 / dx
+        inv_dy = 1.0 / dy
+        for w, (left, top, right, bottom) in enumerate(walls.tolist(), 1):
+            ta = (left - x0) * inv_dx
+            tb = (right - x0) * inv_dx
+            # fmin/fmax تتجاهل NaN (قطعة موازية تبدأ على الحافة)
+            t_enter = np.fmax(np.fmin(ta, tb), 0.0)
+            t_exit = np.fmin(np.fmax(ta, tb), 1.0)
+            ta = (top - y0) * inv_dy
+            tb = (bottom - y0) * inv_dy
+            np.fmax(t_enter, np.fmin(ta, tb), out=t_enter)
+            np.fmin(t_exit, np.fmax(ta, tb), out=t_exit)
+            blocked |= t_enter <= t_exit
+            if w % walls_per_step == 0 and w < len(walls):
+                yield
+
+
+def _walls_key(walls: List[pygame.Rect]) -> str:
+    h = hashlib.sha1()
+    for r in walls:
+        h.update(f"{r.x},{r.y},{r.w},{r.h};".encode())
+    return h.hexdigest()[:12]
+
+
+class VisibilitySet:
+    """جدول رؤية خلية-لخلية مضغوط كبتّات (any_clear فقط)"""
+
+    def __init__(self, world_w: int, world_h: int, cell: int = 64):
+        self.world_w = world_w
+        self.world_h = world_h
+        self.cell = cell
+        self.cols = (world_w + cell - 1) // cell
+        self.rows = (world_h + cell - 1) // cell
+        self.n = self.cols * self.rows
+        self.any_clear: Optional[np.ndarray] = None   # packbits
+
+    # ---------- البناء ----------
+    def _cell_samples(self) -> np.ndarray:
+        """(n, 5, 2) نقاط العينة لكل خلية"""
+        c = self.cell
+        ix = np.arange(self.n) % self.cols
+        iy = np.arange(self.n) // self.cols
+        x0 = ix * c
+        y0 = iy * c
+        x1 = np.minimum(x0 + c, self.world_w)
+        y1 = np.minimum(y0 + c, self.world_h)
+        ins = _SAMPLE_INSET
+        pts = np.stack([
+            np.stack([(x0 + x1) / 2, (y0 + y1) / 2], axis=-1),
+            np.stack([x0 + ins, y0 + ins], axis=-1),
+            np.stack([x1 - ins, y0 + ins], axis=-1),
+            np.stack([x0 + ins, y1 - ins], axis=-1),
+            np.stack([x1 - ins, y1 - ins], axis=-1),
+        ], axis=1)
+        return pts.astype(np.float32)
+
+    def build(self, walls: List[pygame.Rect]):
+        for _ in self.build_steps(walls):
+            pass
+
+    def build_steps(self, walls: List[pygame.Rect]) -> Iterator[None]:
+        """
+        نفس build لكن على دفعات للتحضير المسبق أثناء اللعب: عدد الصفوف في كل كتلة
+        (وعدد الجدران بين كل yield) محسوب لتبقى الخطوة بحدود STEP_TESTS اختبار
+        """
+        n = self.n
+        wall_arr = np.array([(r.left, r.top, r.right, r.bottom) for r in walls], dtype=np.float32).reshape(-1, 4)
+        n_walls = max(1, len(wall_arr))
+        pts = self._cell_samples()
+        samples = pts.shape[1]
+        any_clear = np.zeros((n, n), dtype=bool)
+        yield
+        a0 = 0
+        while a0 < n:
+            m = n - a0
+            # الكتلة تصغر كلما قلّ عدد الأعمدة المتبقية؛ صف واحد على الأقل
+            a1 = min(n, a0 + max(1, STEP_TESTS // (m * samples * n_walls)))
+            walls_per_step = max(1, STEP_TESTS // ((a1 - a0) * m * samples))
+            # الرؤية متماثلة: نحسب فقط الأعمدة من a0 فصاعداً ثم نعكس
+            src = pts[a0:a1][:, None, :, :]    # (k, 1, 5, 2)
+            dst = pts[None, a0:, :, :]         # (1, m, 5, 2)
+            shape = (a1 - a0, m, samples)
+            blocked = np.zeros(shape, dtype=bool)
+            yield from _segments_blocked_steps(
+                np.broadcast_to(src[..., 0], shape), np.broadcast_to(src[..., 1], shape),
+                np.broadcast_to(dst[..., 0], shape), np.broadcast_to(dst[..., 1], shape),
+                wall_arr, blocked, walls_per_step)   # (k, m, 5)
+            any_clear[a0:a1, a0:] = ~blocked.all(axis=2)
+            a0 = a1
+            yield
+        # النصف السفلي = منقول النصف العلوي (على دفعات، والكتلة القطرية بقناع مثلثي)
+        upper = np.triu(np.ones((_MIRROR_ROWS, _MIRROR_ROWS), dtype=bool))
+        for r0 in range(0, n, _MIRROR_ROWS):
+            r1 = min(n, r0 + _MIRROR_ROWS)
+            mask = upper[:r1 - r0, :r1 - r0]
+            any_clear[r0:r1, :r0] = any_clear[:r0, r0:r1].T
+            diag = any_clear[r0:r1, r0:r1]
+            diag[...] = np.where(mask, diag, diag.T)
+            yield
+        self.any_clear = np.packbits(any_clear, axis=None)
+
+    # ---------- الكاش ----------
+    def cache_path(self, level: int, walls: List[pygame.Rect]) -> str:
+        name = f"pvs_v{PVS_VERSION}_L{level}_{self.world_w}x{self.world_h}_c{self.cell}_{_walls_key(walls)}.npz"
+        return os.path.join(CACHE_DIR, name)
+
+    def load(self, path: str) -> bool:
+        try:
+            with np.load(path) as data:
+                if int(data["n"]) != self.n:
+                    return False
+                self.any_clear = data["any_clear"]
+            return True
+        except Exception:
+            return False
+
+    def save(self, path: str, compress: bool = True):
+        """حفظ في الكاش؛ compress=False أسرع بكثير (للحفظ أثناء اللعب)"""
+        try:
+            folder = os.path.dirname(path)
+            os.makedirs(folder, exist_ok=True)
+            savez = np.savez_compressed if compress else np.savez
+            savez(path, n=self.n, any_clear=self.any_clear)
+            # كاش الإصدارات الأقدم لن يُقرأ مجدداً
+            for name in os.listdir(folder):
+                if name.startswith("pvs_v") and not name.startswith(f"pvs_v{PVS_VERSION}_"):
+                    os.remove(os.path.join(folder, name))
+        except Exception as e:
+            print(f"[PVS] Could not save cache: {e}")
+
+    @classmethod
+    def for_level(cls, level: int, walls: List[pygame.Rect], world_w: int, world_h: int,
+                  cell: int = 64) -> "VisibilitySet":
+        """تحميل من الكاش أو الحساب ثم الحفظ"""
+        pvs = cls(world_w, world_h, cell)
+        path = pvs.cache_path(level, walls)
+        if not pvs.load(path):
+            pvs.build(walls)
+            pvs.save(path)
+        return pvs
+
+    @classmethod
+    def for_level_steps(cls, level: int, walls: List[pygame.Rect], world_w: int, world_h: int,
+                        cell: int = 64) -> Generator[None, None, "VisibilitySet"]:
+        """مثل for_level لكن كمولّد: البناء (إذا لم يوجد كاش) يتوزع على عدة خطوات"""
+        pvs = cls(world_w, world_h, cell)
+        path = pvs.cache_path(level, walls)
+        if not pvs.load(path):
+            yield from pvs.build_steps(walls)
+            yield
+            pvs.save(path, compress=False)
+        return pvs
+
+    # ---------- الاستعلام ----------
+    def _cell_index(self, x: float, y: float) -> int:
+        cx = min(self.cols - 1, max(0, int(x) // self.cell))
+        cy = min(self.rows - 1, max(0, int(y) // self.cell))
+        return cy * self.cols + cx
+
+    @staticmethod
+    def _bit(bits: np.ndarray, i: int) -> bool:
+        return bool((bits[i >> 3] >> (7 - (i & 7))) & 1)
+
+    def query(self, ax: float, ay: float, bx: float, by: float) -> Optional[bool]:
+        """False = محجوب (حسب خطوط العينة - تقريبي)، None = غير مؤكد (استخدم الاختبار الدقيق)"""
+        if self.any_clear is None:
+            return None
+        i = self._cell_index(ax, ay) * self.n + self._cell_index(bx, by)
+        if not self._bit(self.any_clear, i):
+            return False
+        return None
@@ -11,8 +11,15 @@ from enum import Enum
 from typing import List, Optional, Tuple
 import math
 import random
+import numpy as np
 import pygame
 
+from fonts import get_font
+from render_scale import RENDER_SCALE
+from sprite_batch import BATCH, bullet_sprite, premul_sprite
+from hud import Widget
+from settings import game_settings
+
 # ============== Weapon Types ==============
 class WeaponType(Enum):
     PISTOL = 1
@@ -117,77 +124,298 @@ class WeaponBullet:
     def draw(self, screen: pygame.Surface, cam_offset: Tuple[int, int] = (0, 0)):
         if not self.alive:
             return
-            
-        draw_x = int(self.x - cam_offset[0])
-        draw_y = int(self.y - cam_offset[1])
+        draw_bullet_shape(screen, self.x, self.y, self.vx, self.vy, self.radius,
+                          self.color, self.is_grenade, self.fuse_time, cam_offset)
+
+
+def draw_bullet_shape(screen: pygame.Surface, x: float, y: float, vx: float, vy: float,
+                      radius: int, color: Tuple[int, int, int], is_grenade: bool,
+                      fuse_time: float, cam_offset: Tuple[int, int] = (0, 0)):
+    """رسم رصاصة أو قنبلة (مشترك بين WeaponBullet و BulletPool)"""
+    draw_x = int(x - cam_offset[0])
+    draw_y = int(y - cam_offset[1])
+    
+    if is_grenade:
+        # 🔥 رسم قنبلة احترافية
+        # جسم القنبلة المعدني
+        grenade_body_color = (60, 70, 60)  # أخضر داكن معدني
+        grenade_highlight = (90, 105, 85)  # لمعان
+        grenade_shadow = (35, 45, 35)  # ظل
         
-        if self.is_grenade:
-            # 🔥 رسم قنبلة احترافية
-            # جسم القنبلة المعدني
-            grenade_body_color = (60, 70, 60)  # أخضر داكن معدني
-            grenade_highlight = (90, 105, 85)  # لمعان
-            grenade_shadow = (35, 45, 35)  # ظل
-            
-            # الجسم الرئيسي (شكل بيضاوي)
-            body_w = self.radius * 2 + 4
-            body_h = self.radius * 2 + 8
-            body_rect = pygame.Rect(draw_x - body_w//2, draw_y - body_h//2, body_w, body_h)
-            
-            # ظل القنبلة
-            shadow_rect = body_rect.move(3, 3)
-            pygame.draw.ellipse(screen, (20, 20, 20, 100), shadow_rect)
-            
-            # جسم القنبلة
-            pygame.draw.ellipse(screen, grenade_body_color, body_rect)
-            # لمعان على الجانب
-            highlight_rect = pygame.Rect(draw_x - body_w//4, draw_y - body_h//2 + 2, body_w//3, body_h - 4)
-            pygame.draw.ellipse(screen, grenade_highlight, highlight_rect)
-            
-            # الحلقة العلوية (مقبض)
-            pygame.draw.rect(screen, (80, 80, 80), (draw_x - 4, draw_y - body_h//2 - 6, 8, 8))
-            pygame.draw.rect(screen, (100, 100, 100), (draw_x - 3, draw_y - body_h//2 - 5, 6, 6))
-            
-            # الرافعة (lever)
-            lever_color = (140, 140, 130)
-            pygame.draw.rect(screen, lever_color, (draw_x + 2, draw_y - body_h//2 - 4, 3, body_h//2 + 4))
-            
-            # خطوط التفاصيل على الجسم
-            for i in range(3):
-                line_y = draw_y - body_h//4 + i * 6
-                pygame.draw.line(screen, grenade_shadow, (draw_x - body_w//3, line_y), (draw_x + body_w//3, line_y), 1)
-            
-            # 🔥 مؤشر الفتيل المتوهج
-            fuse_ratio = max(0, self.fuse_time / 1.2)
-            pulse = abs(math.sin(pygame.time.get_ticks() * 0.015)) * 0.5 + 0.5
-            
-            # توهج حول القنبلة قبل الانفجار
-            if fuse_ratio < 0.5:
-                glow_intensity = int((1 - fuse_ratio * 2) * 150 * pulse)
-                glow_size = int(self.radius * 2 * (1 + (1 - fuse_ratio) * 0.5))
-                glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, (255, 100, 0, glow_intensity), (glow_size, glow_size), glow_size)
-                screen.blit(glow_surf, (draw_x - glow_size, draw_y - glow_size))
-            
-            # ضوء الفتيل العلوي
-            fuse_glow = int(255 * pulse * (1 - fuse_ratio * 0.7))
-            fuse_color_inner = (255, min(255, 100 + fuse_glow), 0)
-            fuse_color_outer = (255, 50, 0)
-            pygame.draw.circle(screen, fuse_color_outer, (draw_x, draw_y - body_h//2 - 2), 5)
-            pygame.draw.circle(screen, fuse_color_inner, (draw_x, draw_y - body_h//2 - 2), 3)
-            
-            # شرارات صغيرة
-            if fuse_ratio < 0.7:
-                for _ in range(2):
-                    spark_x = draw_x + random.randint(-6, 6)
-                    spark_y = draw_y - body_h//2 - 2 + random.randint(-4, 4)
-                    pygame.draw.circle(screen, (255, 255, 150), (spark_x, spark_y), 1)
-        else:
-            # رصاصة عادية مع ذيل
-            pygame.draw.circle(screen, self.color, (draw_x, draw_y), self.radius)
-            # ذيل الرصاصة
-            tail_x = draw_x - int(self.vx * 8)
-            tail_y = draw_y - int(self.vy * 8)
-            pygame.draw.line(screen, self.color, (draw_x, draw_y), (tail_x, tail_y), 2)
+        # الجسم الرئيسي (شكل بيضاوي)
+        body_w = radius * 2 + 4
+        body_h = radius * 2 + 8
+        body_rect = pygame.Rect(draw_x - body_w//2, draw_y - body_h//2, body_w, body_h)
+        
+        # ظل القنبلة
+        shadow_rect = body_rect.move(3, 3)
+        pygame.draw.ellipse(screen, (20, 20, 20, 100), shadow_rect)
+        
+        # جسم القنبلة
+        pygame.draw.ellipse(screen, grenade_body_color, body_rect)
+        # لمعان على الجانب
+        highlight_rect = pygame.Rect(draw_x - body_w//4, draw_y - body_h//2 + 2, body_w//3, body_h - 4)
+        pygame.draw.ellipse(screen, grenade_highlight, highlight_rect)
+        
+        # الحلقة العلوية (مقبض)
+        pygame.draw.rect(screen, (80, 80, 80), (draw_x - 4, draw_y - body_h//2 - 6, 8, 8))
+        pygame.draw.rect(screen, (100, 100, 100), (draw_x - 3, draw_y - body_h//2 - 5, 6, 6))
+        
+        # الرافعة (lever)
+        lever_color = (140, 140, 130)
+        pygame.draw.rect(screen, lever_color, (draw_x + 2, draw_y - body_h//2 - 4, 3, body_h//2 + 4))
+        
+        # خطوط التفاصيل على الجسم
+        for i in range(3):
+            line_y = draw_y - body_h//4 + i * 6
+            pygame.draw.line(screen, grenade_shadow, (draw_x - body_w//3, line_y), (draw_x + body_w//3, line_y), 1)
+        
+        # 🔥 مؤشر الفتيل المتوهج
+        fuse_ratio = max(0, fuse_time / 1.2)
+        pulse = abs(math.sin(pygame.time.get_ticks() * 0.015)) * 0.5 + 0.5
+        
+        # توهج حول القنبلة قبل الانفجار
+        if fuse_ratio < 0.5:
+            glow_intensity = int((1 - fuse_ratio * 2) * 150 * pulse)
+            glow_size = int(radius * 2 * (1 + (1 - fuse_ratio) * 0.5))
+            glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surf, (255, 100, 0, glow_intensity), (glow_size, glow_size), glow_size)
+            screen.blit(glow_surf, (draw_x - glow_size, draw_y - glow_size))
+        
+        # ضوء الفتيل العلوي
+        fuse_glow = int(255 * pulse * (1 - fuse_ratio * 0.7))
+        fuse_color_inner = (255, min(255, 100 + fuse_glow), 0)
+        fuse_color_outer = (255, 50, 0)
+        pygame.draw.circle(screen, fuse_color_outer, (draw_x, draw_y - body_h//2 - 2), 5)
+        pygame.draw.circle(screen, fuse_color_inner, (draw_x, draw_y - body_h//2 - 2), 3)
+        
+        # شرارات صغيرة
+        if fuse_ratio < 0.7:
+            for _ in range(2):
+                spark_x = draw_x + random.randint(-6, 6)
+                spark_y = draw_y - body_h//2 - 2 + random.randint(-4, 4)
+                pygame.draw.circle(screen, (255, 255, 150), (spark_x, spark_y), 1)
+    else:
+        # رصاصة عادية مع ذيل
+        pygame.draw.circle(screen, color, (draw_x, draw_y), radius)
+        # ذيل الرصاصة
+        tail_x = draw_x - int(vx * 8)
+        tail_y = draw_y - int(vy * 8)
+        pygame.draw.line(screen, color, (draw_x, draw_y), (tail_x, tail_y), 2)
+
+# ============== Bullet Pool ==============
+# 🔥 رصاص بمصفوفات مسبقة الحجز (Structure of Arrays):
+# الحذف بالتبديل مع آخر عنصر (swap-remove) والتحديث بعمليات numpy مجمعة
+_BULLET_FIELDS = {
+    "x": np.float64, "y": np.float64, "px": np.float64, "py": np.float64, "vx": np.float64, "vy": np.float64,
+    "speed": np.float64, "lifetime": np.float64, "fuse_time": np.float64,
+    "radius": np.int32, "damage": np.int32, "owner_id": np.int32,
+    "weapon_type": np.int8, "explosion_radius": np.int32,
+    "is_grenade": np.bool_, "alive": np.bool_,
+}
+
+
+class BulletView:
+    """مرجع خفيف لخانة داخل BulletPool (صالح حتى استدعاء update التالي)"""
+    __slots__ = ("_pool", "_i")
+
+    def __init__(self, pool: "BulletPool", index: int):
+        self._pool = pool
+        self._i = index
+
+    def _get(self, name):
+        return getattr(self._pool, name)[self._i].item()
+
+    def _set(self, name, value):
+        getattr(self._pool, name)[self._i] = value
+
+    x = property(lambda s: s._get("x"), lambda s, v: s._set("x", v))
+    y = property(lambda s: s._get("y"), lambda s, v: s._set("y", v))
+    # الموقع قبل آخر خطوة (لاختبار الاصطدام المستمر)
+    prev_x = property(lambda s: s._get("px"))
+    prev_y = property(lambda s: s._get("py"))
+    vx = property(lambda s: s._get("vx"), lambda s, v: s._set("vx", v))
+    vy = property(lambda s: s._get("vy"), lambda s, v: s._set("vy", v))
+    speed = property(lambda s: s._get("speed"), lambda s, v: s._set("speed", v))
+    lifetime = property(lambda s: s._get("lifetime"), lambda s, v: s._set("lifetime", v))
+    fuse_time = property(lambda s: s._get("fuse_time"), lambda s, v: s._set("fuse_time", v))
+    radius = property(lambda s: s._get("radius"), lambda s, v: s._set("radius", v))
+    damage = property(lambda s: s._get("damage"), lambda s, v: s._set("damage", v))
+    owner_id = property(lambda s: s._get("owner_id"), lambda s, v: s._set("owner_id", v))
+    explosion_radius = property(lambda s: s._get("explosion_radius"),
+                                lambda s, v: s._set("explosion_radius", v))
+    is_grenade = property(lambda s: s._get("is_grenade"))
+    alive = property(lambda s: s._get("alive"), lambda s, v: s._set("alive", bool(v)))
+
+    @property
+    def weapon_type(self) -> WeaponType:
+        return WeaponType(self._get("weapon_type"))
+
+    @property
+    def color(self) -> Tuple[int, int, int]:
+        return WEAPON_STATS[self.weapon_type]["bullet_color"]
+
+    def rect(self) -> pygame.Rect:
+        r = self.radius
+        return pygame.Rect(int(self.x - r), int(self.y - r), 2*r, 2*r)
+
+    def draw(self, screen: pygame.Surface, cam_offset: Tuple[int, int] = (0, 0)):
+        if self.alive:
+            self._pool.draw_one(self._i, screen, cam_offset)
+
+
+_CULL_PAD = 64  # هامش القص خارج الشاشة (ذيل الرصاصة، توهج القنبلة)
+
+
+class BulletPool:
+    """مخزن رصاص بمصفوفات numpy - الإضافة والحذف O(1) والتحديث مُتجه"""
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = max(16, int(capacity))
+        self.count = 0
+        for name, dtype in _BULLET_FIELDS.items():
+            setattr(self, name, np.zeros(self.capacity, dtype=dtype))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        # نسخة من العدد الحالي حتى لا تتأثر الحلقة بإضافة رصاص أثناءها
+        return (BulletView(self, i) for i in range(self.count))
+
+    def __getitem__(self, index: int) -> BulletView:
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("bullet index out of range")
+        return BulletView(self, index)
+
+    def _grow(self):
+        new_cap = self.capacity * 2
+        for name in _BULLET_FIELDS:
+            old = getattr(self, name)
+            arr = np.zeros(new_cap, dtype=old.dtype)
+            arr[:self.count] = old[:self.count]
+            setattr(self, name, arr)
+        self.capacity = new_cap
+
+    def spawn(self, x: float, y: float, vx: float, vy: float, weapon_type: WeaponType,
+              speed: float, lifetime: float, damage: int, radius: int, owner_id: int = 0,
+              is_grenade: bool = False, fuse_time: float = 0.0,
+              explosion_radius: int = 0) -> BulletView:
+        """إضافة رصاصة في آخر خانة، يرجع مرجعاً لها"""
+        if self.count >= self.capacity:
+            self._grow()
+        i = self.count
+        self.x[i] = x; self.y[i] = y
+        self.px[i] = x; self.py[i] = y
+        self.vx[i] = vx; self.vy[i] = vy
+        self.speed[i] = speed
+        self.lifetime[i] = lifetime
+        self.fuse_time[i] = fuse_time
+        self.radius[i] = radius
+        self.damage[i] = damage
+        self.owner_id[i] = owner_id
+        self.weapon_type[i] = weapon_type.value
+        self.explosion_radius[i] = explosion_radius
+        self.is_grenade[i] = is_grenade
+        self.alive[i] = True
+        self.count += 1
+        return BulletView(self, i)
+
+    def clear(self):
+        self.count = 0
+
+    def step(self, dt: float) -> List[Tuple[float, float, int, int, int]]:
+        """تحريك كل الرصاص دفعة واحدة، يرجع القنابل التي انفجرت"""
+        n = self.count
+        if n == 0:
+            return []
+        alive = self.alive[:n]
+        grenade = self.is_grenade[:n] & alive
+
+        # القنابل: العد التنازلي للفتيل ثم الانفجار (بدون حركة في إطار الانفجار)
+        fuse = self.fuse_time[:n]
+        fuse[grenade] -= dt
+        exploded = grenade & (fuse <= 0)
+        moving = alive & ~exploded
+        self.speed[:n][grenade & moving] *= 0.98
+
+        self.px[:n] = self.x[:n]
+        self.py[:n] = self.y[:n]
+        step = self.speed[:n] * dt
+        self.x[:n] += np.where(moving, self.vx[:n] * step, 0.0)
+        self.y[:n] += np.where(moving, self.vy[:n] * step, 0.0)
+        life = self.lifetime[:n]
+        life[moving] -= dt
+        alive &= ~exploded & (life > 0)
+
+        if not exploded.any():
+            return []
+        idx = np.flatnonzero(exploded)
+        return list(zip(self.x[idx].tolist(), self.y[idx].tolist(),
+                        self.explosion_radius[idx].tolist(),
+                        self.damage[idx].tolist(), self.owner_id[idx].tolist()))
+
+    def compact(self):
+        """حذف الرصاص الميت بنقل الرصاص الحي من الذيل إلى الفراغات (swap-remove)"""
+        n = self.count
+        if n == 0:
+            return
+        dead = ~self.alive[:n]
+        n_dead = int(dead.sum())
+        if n_dead == 0:
+            return
+        new_n = n - n_dead
+        # الفراغات داخل الجزء المتبقي، والمصادر الحية في الذيل
+        holes = np.flatnonzero(dead[:new_n])
+        sources = new_n + np.flatnonzero(~dead[new_n:])
+        if holes.size:
+            for name in _BULLET_FIELDS:
+                arr = getattr(self, name)
+                arr[holes] = arr[sources]
+        self.count = new_n
+
+    def draw_one(self, i: int, screen: pygame.Surface, cam_offset: Tuple[int, int] = (0, 0)):
+        draw_bullet_shape(screen, float(self.x[i]), float(self.y[i]),
+                          float(self.vx[i]), float(self.vy[i]), int(self.radius[i]),
+                          WEAPON_STATS[WeaponType(int(self.weapon_type[i]))]["bullet_color"],
+                          bool(self.is_grenade[i]), float(self.fuse_time[i]), cam_offset)
+
+    def draw(self, screen: pygame.Surface, cam_offset: Tuple[int, int] = (0, 0)):
+        # 🔥 قص متجه: فقط الرصاص داخل الشاشة (+ هامش للذيل والتوهج)
+        n = self.count
+        w, h = screen.get_size()
+        sx = self.x[:n] - cam_offset[0]
+        sy = self.y[:n] - cam_offset[1]
+        visible = self.alive[:n] & (sx > -_CULL_PAD) & (sx < w + _CULL_PAD) & (sy > -_CULL_PAD) & (sy < h + _CULL_PAD)
+        # القنابل ترسم مباشرة (قليلة ومتحركة)، والرصاص العادي كسبرايت مشترك في دفعة واحدة
+        grenade = self.is_grenade[:n]
+        for i in np.flatnonzero(visible & grenade).tolist():
+            self.draw_one(i, screen, cam_offset)
+        idx = np.flatnonzero(visible & ~grenade)
+        if idx.size == 0:
+            return
+        batch = BATCH.layer("bullets")
+        colors = {t.value: WEAPON_STATS[t]["bullet_color"] for t in WeaponType}
+        ox, oy = cam_offset
+        for x, y, vx, vy, r, wt in zip(self.x[idx].tolist(), self.y[idx].tolist(), self.vx[idx].tolist(),
+                                       self.vy[idx].tolist(), self.radius[idx].tolist(),
+                                       self.weapon_type[idx].tolist()):
+            surf, half = bullet_sprite(vx, vy, r, colors[wt])
+            batch.append((surf, (int(x - ox) - half, int(y - oy) - half)))
+        BATCH.flush(screen, "bullets")
+
+    def to_list(self) -> List[dict]:
+        """تحويل الرصاص الحي لقائمة قواميس (للشبكة)"""
+        idx = np.flatnonzero(self.alive[:self.count])
+        cols = {name: getattr(self, name)[idx].tolist() for name in
+                ("x", "y", "vx", "vy", "weapon_type", "damage", "is_grenade",
+                 "fuse_time", "explosion_radius")}
+        return [
+            {name: cols[name][k] for name in cols}
+            for k in range(idx.size)
+        ]
 
 # ============== Explosion Effect ==============
 class ExplosionEffect:
@@ -212,9 +440,10 @@ class ExplosionEffect:
         self._create_all_particles()
         
     def _create_all_particles(self):
-        """إنشاء جميع أنواع الجزيئات"""
+        """إنشاء جميع أنواع الجزيئات (العدد حسب إعداد جودة الرسوميات)"""
+        count = lambda n: game_settings.scale_count(n, "explosion_particles")
         # 🔥 جزيئات النار (اللب الحار)
-        for _ in range(45):
+        for _ in range(count(45)):
             angle = random.uniform(0, 2 * math.pi)
             speed = random.uniform(150, 400)
             self.fire_particles.append({
@@ -229,7 +458,7 @@ class ExplosionEffect:
             })
         
         # 💨 جزيئات الدخان (تصعد للأعلى)
-        for _ in range(25):
+        for _ in range(count(25)):
             angle = random.uniform(-math.pi * 0.8, -math.pi * 0.2)  # في الغالب للأعلى
             speed = random.uniform(40, 120)
             self.smoke_particles.append({
@@ -245,7 +474,7 @@ class ExplosionEffect:
             })
         
         # ✨ الشرارات المتطايرة
-        for _ in range(60):
+        for _ in range(count(60)):
             angle = random.uniform(0, 2 * math.pi)
             speed = random.uniform(200, 600)
             self.spark_particles.append({
@@ -269,7 +498,7 @@ class ExplosionEffect:
             })
         
         # 🧱 الحطام المتطاير
-        for _ in range(15):
+        for _ in range(count(15)):
             angle = random.uniform(0, 2 * math.pi)
             speed = random.uniform(100, 300)
             self.debris_particles.append({
@@ -343,9 +572,132 @@ class ExplosionEffect:
             p['vx'] *= 0.99
             p['life'] -= dt
             
+    def _bounds(self) -> Tuple[float, float, float, float]:
+        """حدود كل أجزاء الانفجار المرئية في إحداثيات العالم"""
+        reach = self.current_radius * 1.25 if self.alpha > 10 else 0
+        for ring in self.shockwave_rings:
+            if ring['started'] and ring['alpha'] > 0:
+                reach = max(reach, ring['radius'] + 5)
+        left, top = self.x - reach, self.y - reach
+        right, bottom = self.x + reach, self.y + reach
+        live = [p for group in (self.fire_particles, self.spark_particles, self.debris_particles,
+                                self.smoke_particles) for p in group if p['life'] > 0]
+        if live:
+            # هامش واحد بأكبر جزيء (أرخص من min/max لكل جزيء؛ الطبقة أكبر قليلاً فقط)
+            r = max(p.get('size', 3) for p in live) + 1
+            xs = [p['x'] for p in live]
+            ys = [p['y'] for p in live]
+            left, right = min(left, min(xs) - r), max(right, max(xs) + r)
+            top, bottom = min(top, min(ys) - r), max(bottom, max(ys) + r)
+        return left, top, right, bottom
+
+    def _draw_layer(self, layer: pygame.Surface, ox: float, oy: float, scale: float):
+        """
+        🔥 رسم الانفجار على طبقة المؤثرات الداخلية (أصلها عند ox, oy في العالم) بدقة scale.
+        كل العناصر بألوان مضروبة مسبقاً في الشفافية وتُدمج بـ BLEND_PREMULTIPLIED: الدخان فوق النار
+        يمتزج بدل أن يمسحها، والجزيئات سبرايتات مخزنة (premul_sprite) بدون Surface جديد لكل جزيء
+        """
+        blend = pygame.BLEND_PREMULTIPLIED
+
+        def at(x: float, y: float) -> Tuple[int, int]:
+            return int((x - ox) * scale), int((y - oy) * scale)
+
+        def rad(r: float) -> int:
+            return max(1, int(r * scale))
+
+        def premul(color, alpha: int) -> Tuple[int, int, int, int]:
+            return color[0] * alpha // 255, color[1] * alpha // 255, color[2] * alpha // 255, alpha
+
+        cx, cy = at(self.x, self.y)
+        # 1️⃣ حلقات الصدمة
+        for ring in self.shockwave_rings:
+            if ring['started'] and ring['radius'] > 0 and ring['alpha'] > 0:
+                ring_radius = rad(ring['radius'])
+                surf_size = max(10, ring_radius * 2 + 10)
+                center = surf_size // 2
+                safe_radius = min(ring_radius, center - 2)
+                if safe_radius > 0:
+                    ring_surf = RENDER_SCALE.scratch(surf_size, surf_size, "ring")
+                    width = rad(max(1, int(ring['thickness'])))
+                    pygame.draw.circle(ring_surf, premul((255, 200, 100), int(ring['alpha'])), (center, center),
+                                       safe_radius, width)
+                    # المربع الداخلي للحلقة فارغ: دمج الأشرطة الأربعة حوله فقط (~نصف المساحة)
+                    h = int((safe_radius - width) * 0.7) - 1
+                    x, y = cx - center, cy - center
+                    if h > 4:
+                        a, b = center - h, center + h
+                        layer.blits([(ring_surf, (x, y), (0, 0, surf_size, a), blend),
+                                     (ring_surf, (x, y + b), (0, b, surf_size, surf_size - b), blend),
+                                     (ring_surf, (x, y + a), (0, a, a, b - a), blend),
+                                     (ring_surf, (x + b, y + a), (b, a, surf_size - b, b - a), blend)],
+                                    doreturn=False)
+                    else:
+                        layer.blit(ring_surf, (x, y), (0, 0, surf_size, surf_size), special_flags=blend)
+        # 2️⃣ كرة النار (الطبقات الداخلية تستبدل الخارجية داخل سطحها كما في draw)
+        if self.current_radius > 0 and self.alpha > 10:
+            surf_size = max(10, int(self.current_radius * scale * 2.5))
+            explosion_surf = RENDER_SCALE.scratch(surf_size, surf_size, "fireball")
+            center = surf_size // 2
+            for color, a_mult, r_mult in (((200, 60, 0), 0.4, 1.1), ((255, 120, 20), 0.6, 0.8),
+                                          ((255, 200, 50), 0.8, 0.5), ((255, 255, 200), 0.9, 0.25)):
+                radius = min(center - 1, rad(self.current_radius * r_mult))
+                pygame.draw.circle(explosion_surf, premul(color, int(self.alpha * a_mult)), (center, center), radius)
+            layer.blit(explosion_surf, (cx - center, cy - center), (0, 0, surf_size, surf_size), special_flags=blend)
+        batch = []
+        add = batch.append
+        # 3️⃣ جزيئات النار (درجة اللون مُكمّمة لثُمن حتى تبقى نسخ السبرايت قليلة)
+        for p in self.fire_particles:
+            if p['life'] > 0 and p['size'] > 0:
+                life_ratio = max(0.0, min(1.0, p['life'] / max(0.001, p['max_life'])))
+                phase = round(p['color_phase'] * 8) / 8
+                if life_ratio > 0.7:
+                    color = (255, 255, int(200 * phase))
+                elif life_ratio > 0.4:
+                    color = (255, int(150 + 100 * phase), 0)
+                else:
+                    color = (int(200 + 55 * phase), int(50 * phase), 0)
+                alpha = int(255 * life_ratio)
+                if alpha > 0:
+                    r = max(1, int(p['size'] * scale))
+                    add((premul_sprite(r, color, alpha),
+                         (int((p['x'] - ox) * scale) - r, int((p['y'] - oy) * scale) - r)))
+        # 4️⃣ الشرارات
+        for p in self.spark_particles:
+            life = p['life']
+            if life > 0:
+                r = max(1, int(max(2, int(7.5 * life)) * scale))
+                add((premul_sprite(r, p['color'], min(255, int(637.5 * life))),
+                     (int((p['x'] - ox) * scale) - r, int((p['y'] - oy) * scale) - r)))
+        # 5️⃣ الحطام
+        for p in self.debris_particles:
+            life = p['life']
+            if life > 0:
+                r = max(1, int(p['size'] * scale))
+                add((premul_sprite(r, p['color'], int(318.75 * life), square=True),
+                     (int((p['x'] - ox) * scale) - r, int((p['y'] - oy) * scale) - r)))
+        # 6️⃣ الدخان (في المقدمة)
+        for p in self.smoke_particles:
+            if p['life'] > 0 and p['alpha'] > 5 and p['size'] > 0:
+                gray = p['gray']
+                r = max(1, int(p['size'] * scale))
+                add((premul_sprite(r, (gray, gray, gray), min(255, int(p['alpha']))),
+                     (int((p['x'] - ox) * scale) - r, int((p['y'] - oy) * scale) - r)))
+        layer.blits([(surf, dest, None, blend) for surf, dest in batch], doreturn=False)
+
+    def on_screen(self, cam_offset: Tuple[int, int], w: int, h: int) -> bool:
+        """هل يمكن أن يظهر أي جزء من الانفجار (الحلقات حتى 2×، والجزيئات حتى ~260px)"""
+        reach = self.max_radius * 2 + 260
+        sx = self.x - cam_offset[0]
+        sy = self.y - cam_offset[1]
+        return -reach < sx < w + reach and -reach < sy < h + reach
+
     def draw(self, screen: pygame.Surface, cam_offset: Tuple[int, int] = (0, 0)):
         if not self.alive:
             return
+        # 🔥 دقة رسم منخفضة عندما يكون الإطار بطيئاً (render_scale)
+        if RENDER_SCALE.scale < 1.0:
+            draw_effects_scaled(screen, [self], cam_offset, RENDER_SCALE.scale)
+            return
             
         draw_x = int(self.x - cam_offset[0])
         draw_y = int(self.y - cam_offset[1])
@@ -461,6 +813,40 @@ class ExplosionEffect:
                     pygame.draw.circle(smoke_surf, (gray, gray, gray, alpha), (size, size), size)
                     screen.blit(smoke_surf, (px - size, py - size))
 
+def draw_explosions(screen: pygame.Surface, effects: List[ExplosionEffect], cam_offset: Tuple[int, int]):
+    """رسم الانفجارات الظاهرة؛ تحت 100% كلها على طبقة داخلية واحدة (تكبير ودمج مرة واحدة للإطار)"""
+    w, h = screen.get_size()
+    visible = [exp for exp in effects if exp.alive and exp.on_screen(cam_offset, w, h)]
+    if RENDER_SCALE.scale < 1.0:
+        draw_effects_scaled(screen, visible, cam_offset, RENDER_SCALE.scale)
+        return
+    for exp in visible:
+        exp.draw(screen, cam_offset)
+
+
+def draw_effects_scaled(screen: pygame.Surface, effects: List[ExplosionEffect],
+                        cam_offset: Tuple[int, int], scale: float):
+    """رسم الانفجارات على طبقة داخلية مشتركة بدقة scale (مقصوصة على الشاشة) ثم تكبيرها مرة واحدة"""
+    view = screen.get_rect()
+    sx0, sy0, sx1, sy1 = view.right, view.bottom, view.left, view.top
+    for exp in effects:
+        left, top, right, bottom = exp._bounds()
+        sx0 = min(sx0, int(left - cam_offset[0]))
+        sy0 = min(sy0, int(top - cam_offset[1]))
+        sx1 = max(sx1, int(right - cam_offset[0]) + 1)
+        sy1 = max(sy1, int(bottom - cam_offset[1]) + 1)
+    sx0, sy0 = max(view.left, sx0), max(view.top, sy0)
+    sx1, sy1 = min(view.right, sx1), min(view.bottom, sy1)
+    if sx1 <= sx0 or sy1 <= sy0:
+        return
+    lw = max(1, int((sx1 - sx0) * scale))
+    lh = max(1, int((sy1 - sy0) * scale))
+    layer = RENDER_SCALE.scratch(lw, lh)
+    for exp in effects:
+        exp._draw_layer(layer, cam_offset[0] + sx0, cam_offset[1] + sy0, scale)
+    RENDER_SCALE.present(screen, layer, lw, lh, (sx0, sy0), (sx1 - sx0, sy1 - sy0),
+                         special_flags=pygame.BLEND_PREMULTIPLIED)
+
 # ============== Weapon Manager ==============
 class WeaponManager:
     """مدير الأسلحة الرئيسي"""
@@ -477,8 +863,9 @@ class WeaponManager:
             WeaponType.SHOTGUN: 0.0,
             WeaponType.GRENADE: 0.0,
         }
-        self.bullets: List[WeaponBullet] = []
+        self.bullets = BulletPool()
         self.explosions: List[ExplosionEffect] = []
+        self._hud = Widget((0, 0), self._render_hud)   # 🔥 واجهة السلاح المخزنة
         
     def switch_weapon(self, weapon_type: WeaponType) -> bool:
         """تبديل السلاح"""
@@ -513,7 +900,7 @@ class WeaponManager:
             
         return True
     
-    def fire(self, start_x: float, start_y: float, target_x: float, target_y: float) -> List[WeaponBullet]:
+    def fire(self, start_x: float, start_y: float, target_x: float, target_y: float) -> List[BulletView]:
         """إطلاق النار، يرجع قائمة الرصاصات الجديدة"""
         if not self.can_fire():
             return []
@@ -546,31 +933,28 @@ class WeaponManager:
             vx = base_vx * cos_a - base_vy * sin_a
             vy = base_vx * sin_a + base_vy * cos_a
             
-            bullet = WeaponBullet(
+            if weapon == WeaponType.GRENADE:
+                radius, lifetime = 10, 3.0
+            elif weapon == WeaponType.SHOTGUN:
+                radius, lifetime = 4, 0.8
+            else:
+                radius, lifetime = 5, 1.2
+            
+            bullet = self.bullets.spawn(
                 x=start_x,
                 y=start_y,
                 vx=vx,
                 vy=vy,
                 weapon_type=weapon,
                 speed=stats["bullet_speed"],
+                lifetime=lifetime,
                 damage=stats["damage"],
-                color=stats["bullet_color"],
+                radius=radius,
                 owner_id=self.player_id,
                 is_grenade=(weapon == WeaponType.GRENADE),
                 fuse_time=stats.get("fuse_time", 0),
                 explosion_radius=stats.get("explosion_radius", 0),
             )
-            
-            if weapon == WeaponType.GRENADE:
-                bullet.radius = 10
-                bullet.lifetime = 3.0
-            elif weapon == WeaponType.SHOTGUN:
-                bullet.radius = 4
-                bullet.lifetime = 0.8
-            else:
-                bullet.radius = 5
-                bullet.lifetime = 1.2
-                
             new_bullets.append(bullet)
         
         # تحديث الذخيرة والانتظار
@@ -578,7 +962,6 @@ class WeaponManager:
             self.ammo[weapon] -= 1
         self.cooldowns[weapon] = stats["fire_rate"]
         
-        self.bullets.extend(new_bullets)
         return new_bullets
     
     def add_ammo(self, weapon_type: WeaponType, amount: int):
@@ -599,22 +982,12 @@ class WeaponManager:
             if self.cooldowns[weapon] > 0:
                 self.cooldowns[weapon] -= dt
         
-        # تحديث الرصاصات
-        for bullet in self.bullets[:]:
-            exploded = bullet.update(dt)
-            if exploded:
-                # قنبلة انفجرت!
-                self.explosions.append(ExplosionEffect(
-                    bullet.x, bullet.y, bullet.explosion_radius
-                ))
-                explosions_data.append((
-                    bullet.x, bullet.y, 
-                    bullet.explosion_radius, 
-                    bullet.damage,
-                    bullet.owner_id
-                ))
-            if not bullet.alive:
-                self.bullets.remove(bullet)
+        # تحديث الرصاصات (دفعة واحدة) ثم حذف الميت منها
+        for ex, ey, radius, damage, owner_id in self.bullets.step(dt):
+            # قنبلة انفجرت!
+            self.explosions.append(ExplosionEffect(ex, ey, radius))
+            explosions_data.append((ex, ey, radius, damage, owner_id))
+        self.bullets.compact()
         
         # تحديث تأثيرات الانفجار
         for exp in self.explosions[:]:
@@ -626,61 +999,58 @@ class WeaponManager:
     
     def draw_bullets(self, screen: pygame.Surface, cam_offset: Tuple[int, int] = (0, 0)):
         """رسم جميع الرصاصات"""
-        for bullet in self.bullets:
-            bullet.draw(screen, cam_offset)
+        self.bullets.draw(screen, cam_offset)
     
     def draw_explosions(self, screen: pygame.Surface, cam_offset: Tuple[int, int] = (0, 0)):
-        """رسم تأثيرات الانفجار"""
-        for exp in self.explosions:
-            exp.draw(screen, cam_offset)
+        """رسم تأثيرات الانفجار (الظاهرة على الشاشة فقط)"""
+        draw_explosions(screen, self.explosions, cam_offset)
     
     def draw_hud(self, screen: pygame.Surface, x: int, y: int):
-        """رسم واجهة السلاح"""
-        stats = WEAPON_STATS[self.current_weapon]
+        """رسم واجهة السلاح (تُعاد رسمها فقط عند تبديل السلاح أو تغير الذخيرة)"""
+        self._hud.pos = (x, y)
+        self._hud.set(self.current_weapon, self.ammo[self.current_weapon])
+        self._hud.draw(screen)
+
+    def _render_hud(self, weapon: "WeaponType", ammo: int) -> pygame.Surface:
+        stats = WEAPON_STATS[weapon]
+        surf = pygame.Surface((200, 60), pygame.SRCALPHA)
         
-        # خلفية
-        hud_rect = pygame.Rect(x, y, 200, 60)
-        pygame.draw.rect(screen, (0, 0, 0, 180), hud_rect, border_radius=8)
-        pygame.draw.rect(screen, (100, 100, 100), hud_rect, width=2, border_radius=8)
+        # خلفية (كانت ترسم معتمة على الشاشة مباشرة)
+        hud_rect = surf.get_rect()
+        pygame.draw.rect(surf, (0, 0, 0), hud_rect, border_radius=8)
+        pygame.draw.rect(surf, (100, 100, 100), hud_rect, width=2, border_radius=8)
         
         # اسم السلاح
         font = pygame.font.Font(None, 28)
         name_surf = font.render(stats["name"], True, (255, 255, 255))
-        screen.blit(name_surf, (x + 10, y + 8))
+        surf.blit(name_surf, (10, 8))
         
         # الذخيرة
         ammo_font = pygame.font.Font(None, 24)
         if stats["ammo"] == -1:
             ammo_text = "∞"
         else:
-            ammo_text = f"{self.ammo[self.current_weapon]} / {stats['max_ammo']}"
+            ammo_text = f"{ammo} / {stats['max_ammo']}"
         ammo_surf = ammo_font.render(ammo_text, True, (200, 200, 100))
-        screen.blit(ammo_surf, (x + 10, y + 35))
+        surf.blit(ammo_surf, (10, 35))
         
         # مؤشر السلاح الحالي (1, 2, 3)
         keys = {WeaponType.PISTOL: "1", WeaponType.SHOTGUN: "2", WeaponType.GRENADE: "3"}
         for i, (wtype, key) in enumerate(keys.items()):
-            indicator_x = x + 130 + i * 25
-            indicator_y = y + 10
-            color = (255, 200, 50) if wtype == self.current_weapon else (100, 100, 100)
-            pygame.draw.rect(screen, color, (indicator_x, indicator_y, 20, 20), border_radius=4)
+            indicator_x = 130 + i * 25
+            indicator_y = 10
+            color = (255, 200, 50) if wtype == weapon else (100, 100, 100)
+            pygame.draw.rect(surf, color, (indicator_x, indicator_y, 20, 20), border_radius=4)
             key_surf = ammo_font.render(key, True, (0, 0, 0))
-            screen.blit(key_surf, (indicator_x + 5, indicator_y + 2))
+            surf.blit(key_surf, (indicator_x + 5, indicator_y + 2))
+        return surf
     
     def to_dict(self) -> dict:
         """تحويل لإرسال عبر الشبكة"""
         return {
             "current_weapon": self.current_weapon.value,
             "ammo": {k.value: v for k, v in self.ammo.items()},
-            "bullets": [
-                {
-                    "x": b.x, "y": b.y, "vx": b.vx, "vy": b.vy,
-                    "weapon_type": b.weapon_type.value,
-                    "damage": b.damage, "is_grenade": b.is_grenade,
-                    "fuse_time": b.fuse_time, "explosion_radius": b.explosion_radius,
-                }
-                for b in self.bullets
-            ]
+            "bullets": self.bullets.to_list()
         }
     
     @staticmethod
@@ -769,7 +1139,7 @@ class AmmoPickup:
         pygame.draw.line(screen, corner_color, (draw_x + w, draw_y + h), (draw_x + w, draw_y + h - corner_len), 2)
         
         # الرمز/الأيقونة في المنتصف
-        font = pygame.font.SysFont("arial", 10, bold=True)
+        font = get_font(10, bold=True)
         text_surf = font.render(label, True, icon_color)
         text_rect = text_surf.get_rect(center=rect.center)
         